@@ -54,6 +54,18 @@ class LoggerConfig:
         if "testcase_log_index" in log_dict:
             self.testcase_log_index = log_dict["testcase_log_index"]
 
+        self.compress_testcase_logs = False
+        if "compress_testcase_logs" in log_dict:
+            self.compress_testcase_logs = log_dict["compress_testcase_logs"]
+
+        self.log_queue_size = 10000
+        if "log_queue_size" in log_dict:
+            self.log_queue_size = log_dict["log_queue_size"]
+
+        self.log_keyword_timings = False
+        if "log_keyword_timings" in log_dict:
+            self.log_keyword_timings = log_dict["log_keyword_timings"]
+
     def get_log_location(self) -> str:
         """
         Getter for the folder where we want to store the log files.
@@ -128,6 +140,30 @@ class LoggerConfig:
         """
         self.testcase_log_index += 1
 
+    def get_compress_testcase_logs(self) -> bool:
+        """
+        Getter to see if the log of each test case should be written with gzip compression.
+
+        Returns: Boolean indicating if the test case logs are written to log.txt.gz rather than log.txt.
+        """
+        return self.compress_testcase_logs
+
+    def get_log_queue_size(self) -> int:
+        """
+        Getter for the number of log records that can wait to be written before logging blocks.
+
+        Returns: The size of the log queue.
+        """
+        return self.log_queue_size
+
+    def get_log_keyword_timings(self) -> bool:
+        """
+        Getter to see if the time spent in each keyword should be recorded and exported at the end of the session.
+
+        Returns: Boolean indicating if the keyword timings are written to keyword_timings.json in the log folder.
+        """
+        return self.log_keyword_timings
+
     def to_log_strings(self) -> List[str]:
         """
         This function will return a list of strings that can be logged to show all the logger configs.
@@ -1,12 +1,20 @@
+import os
+import threading
 from contextlib import contextmanager
+from typing import Iterator
 
 import psycopg2
 from config.configuration_manager import ConfigurationManager
+from framework.database.connection.database_connection_pool import DatabaseConnectionPool
+from psycopg2.extensions import make_dsn
 
 
 class DatabaseConnectionManager:
     """Manages a connection to a specific database."""
 
+    connection_pools: dict[tuple, DatabaseConnectionPool] = {}
+    connection_pools_lock = threading.Lock()
+
     def __init__(self, database_name: str = None):
         """Initializes the connection manager for a specific database.
 
@@ -24,32 +32,64 @@ class DatabaseConnectionManager:
         self.user = db_entry.get_user_name()
         self.password = db_entry.get_password()
 
-    @contextmanager
-    def open_conn_and_get_cur(
-        self,
-        autocommit=True,
-        close_cur=True,
-        close_conn=True,
-        cursor_factory=None,
-    ):
-        """This function will establish a connection to the database. It can be used in a
-        'with open_conn_and_get_cur' statement to keep the connection alive for the duration
-        of the block.
+    def get_connection_pool(self) -> DatabaseConnectionPool:
+        """Gets the connection pool of this database, shared by every manager of the process connecting to it.
+
+        The pools are keyed by process id as well, so that a forked worker opens its own connections instead of
+        sharing the sockets of its parent.
+
+        Returns:
+            DatabaseConnectionPool: The connection pool.
         """
+        pool_key = (os.getpid(), self.host, self.db_port, self.dbname, self.user)
+        with DatabaseConnectionManager.connection_pools_lock:
+            connection_pool = DatabaseConnectionManager.connection_pools.get(pool_key)
+            if connection_pool is None:
+                dsn = make_dsn(dbname=self.dbname, port=self.db_port, user=self.user, host=self.host, password=self.password)
+                connection_pool = DatabaseConnectionPool(dsn)
+                DatabaseConnectionManager.connection_pools[pool_key] = connection_pool
+            return connection_pool
+
+    @classmethod
+    def close_connection_pools(cls):
+        """Closes the idle connections of every pool and forgets the pools."""
+        with cls.connection_pools_lock:
+            for connection_pool in cls.connection_pools.values():
+                connection_pool.close_all()
+            cls.connection_pools.clear()
+
+    @contextmanager
+    def open_conn_and_get_cur(self, autocommit: bool = True, cursor_factory: type = None) -> Iterator[psycopg2.extensions.cursor]:
+        """Checks out a pooled connection to the database and gets a cursor on it.
+
+        It can be used in a 'with open_conn_and_get_cur' statement to keep the connection for the duration of the
+        block.
+
+        When autocommit is False, the statements of the block run in a single transaction, committed when the block
+        completes and rolled back if it raises.
 
-        conn = cursor = None
+        Args:
+            autocommit (bool): False to run the statements of the block in a transaction.
+            cursor_factory (type): set to RealDictCursor to allow for selecting name columns
+
+        Yields:
+            psycopg2.extensions.cursor: The cursor.
+        """
+        connection_pool = self.get_connection_pool()
+        conn = connection_pool.get_connection(autocommit=autocommit)
+        discard = False
         try:
-            conn = psycopg2.connect(
-                f"dbname='{self.dbname}' port={self.db_port} user='{self.user}' host='{self.host}' password='{self.password}'",
-                connect_timeout=60,
-                cursor_factory=cursor_factory,
-            )
-            if autocommit:
-                conn.set_session(autocommit=True)
-            cursor = conn.cursor()
-            yield cursor
+            with conn.cursor(cursor_factory=cursor_factory) as cursor:
+                yield cursor
+            if not autocommit:
+                conn.commit()
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            # The connection itself failed, so it can't be trusted with the next query.
+            discard = True
+            raise
+        except BaseException:
+            if not autocommit and conn.closed == 0:
+                conn.rollback()
+            raise
         finally:
-            if close_cur and cursor is not None:
-                cursor.close()
-            if close_conn and conn is not None:
-                conn.close()
+            connection_pool.release_connection(conn, discard=discard)
@@ -0,0 +1,161 @@
+import re
+import threading
+import time
+
+import psycopg2
+
+from framework.logging.automation_logger import get_logger
+
+
+class DatabaseConnectionPool:
+    """
+    Pool of open connections to one database, shared by every thread of the process.
+
+    Connections are opened on first use and kept open once released, so that a query only pays for the TCP and
+    authentication handshakes when no idle connection is left. Checking out a connection blocks while max_connections
+    are in use instead of failing, and a connection that sat idle for a while is health checked before being handed
+    out, so that one dropped by the server or a firewall is replaced rather than failing the query. Each connection
+    also keeps the names of the statements prepared on it.
+    """
+
+    HEALTH_CHECK_IDLE_SECONDS = 30
+
+    def __init__(self, dsn: str, max_connections: int = 8, connect_timeout: int = 60):
+        """
+        Constructor
+
+        Args:
+            dsn (str): The libpq connection string of the database.
+            max_connections (int): The maximum number of connections open at the same time.
+            connect_timeout (int): The timeout in seconds to open a connection.
+        """
+        self.dsn = dsn
+        self.connect_timeout = connect_timeout
+        self.available_connections = threading.BoundedSemaphore(max_connections)
+        self.lock = threading.Lock()
+        self.idle_connections: list[psycopg2.extensions.connection] = []
+        self.last_used_times: dict[int, float] = {}
+        self.prepared_statements: dict[int, dict[str, str]] = {}
+
+    def get_connection(self, autocommit: bool = True) -> psycopg2.extensions.connection:
+        """
+        Checks out a healthy connection, waiting for one to be released if they are all in use.
+
+        Args:
+            autocommit (bool): False to run the statements on the connection in a transaction.
+
+        Returns:
+            psycopg2.extensions.connection: The connection, to give back with release_connection.
+        """
+        self.available_connections.acquire()
+        try:
+            while True:
+                with self.lock:
+                    connection = self.idle_connections.pop() if self.idle_connections else None
+                if connection is None:
+                    connection = psycopg2.connect(self.dsn, connect_timeout=self.connect_timeout)
+                    break
+                if self._is_healthy(connection):
+                    break
+                get_logger().log_debug("Replacing a database connection that failed its health check.")
+                self._put_connection(connection, discard=True)
+            connection.autocommit = autocommit
+            return connection
+        except Exception:
+            self.available_connections.release()
+            raise
+
+    def release_connection(self, connection: psycopg2.extensions.connection, discard: bool = False):
+        """
+        Gives back a connection checked out with get_connection.
+
+        Args:
+            connection (psycopg2.extensions.connection): The connection.
+            discard (bool): True to close the connection rather than keep it for reuse, e.g. after it failed.
+        """
+        try:
+            self._put_connection(connection, discard=discard or connection.closed != 0)
+        finally:
+            self.available_connections.release()
+
+    def get_prepared_query(self, cursor: psycopg2.extensions.cursor, query: str, number_of_params: int) -> str:
+        """
+        Gets the query executing the prepared version of the given query, preparing it on the connection the first time.
+
+        Args:
+            cursor (psycopg2.extensions.cursor): A cursor of the connection to execute the query on.
+            query (str): The query, with %s placeholders for its parameters.
+            number_of_params (int): The number of parameters of the query.
+
+        Returns:
+            str: The EXECUTE query, with one %s placeholder per parameter.
+        """
+        connection_statements = self.prepared_statements.setdefault(id(cursor.connection), {})
+        statement_name = connection_statements.get(query)
+        if statement_name is None:
+            statement_name = f"automation_statement_{len(connection_statements)}"
+            positions = iter(range(1, number_of_params + 1))
+            positional_query = re.sub(r"%[s%]", lambda match: "%" if match.group() == "%%" else f"${next(positions)}", query)
+            cursor.execute(f"PREPARE {statement_name} AS {positional_query}")
+            connection_statements[query] = statement_name
+        placeholders = ", ".join(["%s"] * number_of_params)
+        return f"EXECUTE {statement_name} ({placeholders})"
+
+    def close_all(self):
+        """
+        Closes every connection of the pool.
+        """
+        with self.lock:
+            for connection in self.idle_connections:
+                connection.close()
+            self.idle_connections.clear()
+            self.last_used_times.clear()
+            self.prepared_statements.clear()
+
+    def _is_healthy(self, connection: psycopg2.extensions.connection) -> bool:
+        """
+        Checks that an idle connection is still open, and still answers if it sat idle for a while.
+
+        Args:
+            connection (psycopg2.extensions.connection): The connection.
+
+        Returns:
+            bool: True if the connection can be used.
+        """
+        if connection.closed != 0:
+            return False
+        if time.monotonic() - self.last_used_times[id(connection)] < self.HEALTH_CHECK_IDLE_SECONDS:
+            return True
+        try:
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _put_connection(self, connection: psycopg2.extensions.connection, discard: bool):
+        """
+        Puts a connection back with the idle ones, or closes it.
+
+        A connection left in a transaction is rolled back first, and one in an unknown state is closed.
+
+        Args:
+            connection (psycopg2.extensions.connection): The connection.
+            discard (bool): True to close the connection.
+        """
+        if not discard:
+            try:
+                if connection.info.transaction_status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                    connection.rollback()
+            except psycopg2.Error:
+                discard = True
+        with self.lock:
+            if discard:
+                self.last_used_times.pop(id(connection), None)
+                self.prepared_statements.pop(id(connection), None)
+            else:
+                self.last_used_times[id(connection)] = time.monotonic()
+                self.idle_connections.append(connection)
+        if discard:
+            connection.close()
@@ -1,4 +1,6 @@
+from contextlib import contextmanager
 from time import sleep
+from typing import Iterator, Mapping, Sequence
 
 import psycopg2.extras
 from framework.database.connection.database_connection_manager import DatabaseConnectionManager
@@ -16,24 +18,25 @@ class DatabaseOperationManager:
         """
         self.database_connection_manager = DatabaseConnectionManager(database_name)
 
-    def execute_query(self, query, cursor_factory=None, expect_results=True):
-        """This function will open up a connection to the database and execute the
-        specified query.
+    def execute_query(self, query: str, params: Sequence | Mapping = None, cursor_factory: type = None, expect_results: bool = True, prepare: bool = False) -> list | None:
+        """Checks out a pooled connection to the database and executes the specified query.
 
         Args:
-            query: The query that we want to execute.
-            cursor_factory: set to RealDictCursor to allow for selecting name columns
-            expect_results: set to false if nothing is returned by the query ex. updates
+            query (str): The query that we want to execute, with %s placeholders for its parameters.
+            params (Sequence | Mapping): The parameters of the query, passed to the server separately from the query text.
+            cursor_factory (type): set to RealDictCursor to allow for selecting name columns
+            expect_results (bool): set to false if nothing is returned by the query ex. updates
+            prepare (bool): set to true for queries run over and over, so that the server only parses and plans them
+                once per connection.
 
         Returns:
-            The result of the query if any.
+            list | None: The result of the query if any.
         """
-
         # Loop until we get something or the error is not a DNS error
         while True:
             try:
                 with self.database_connection_manager.open_conn_and_get_cur(cursor_factory=cursor_factory) as cursor:
-                    cursor.execute(query)
+                    self._execute(cursor, query, params, prepare)
                     if expect_results:
                         rows = cursor.fetchall()
                         return rows
@@ -49,16 +52,117 @@ class DatabaseOperationManager:
                     get_logger().log_error('DNS error: sleeping for 60 secs and will try again')
                     sleep(60)
 
-    def execute_values(self, query, data):
+    @contextmanager
+    def transaction(self, cursor_factory: type = None) -> Iterator["DatabaseTransaction"]:
+        """Runs the statements of a 'with transaction' block in a single transaction on one pooled connection.
+
+        The transaction is committed when the block completes and rolled back if it raises. Unlike execute_query,
+        errors are raised to the caller, since the statements run before the failure are rolled back.
+
+        Args:
+            cursor_factory (type): set to RealDictCursor to allow for selecting name columns
+
+        Yields:
+            DatabaseTransaction: The transaction, to execute the statements with.
+        """
+        try:
+            with self.database_connection_manager.open_conn_and_get_cur(autocommit=False, cursor_factory=cursor_factory) as cursor:
+                yield DatabaseTransaction(self, cursor)
+        except Exception as e:
+            get_logger().log_error("Rolled back a database transaction.")
+            get_logger().log_error(e)
+            raise
+
+    def execute_values(self, query: str, data: Sequence[Sequence], fetch: bool = False) -> list | None:
         """Executes a batch insert/update using psycopg2 execute_values.
 
         Args:
-            query: The query template with a VALUES placeholder.
-            data: The data to insert.
+            query (str): The query template with a VALUES placeholder.
+            data (Sequence[Sequence]): The data to insert.
+            fetch (bool): set to true to get the rows returned by a RETURNING clause.
+
+        Returns:
+            list | None: The rows returned by the query when fetch is set, in the order of the data.
         """
         try:
             with self.database_connection_manager.open_conn_and_get_cur() as cursor:
-                psycopg2.extras.execute_values(cursor, query, data, template=None)
+                return psycopg2.extras.execute_values(cursor, query, data, template=None, fetch=fetch)
         except Exception as e:
             get_logger().log_error(f"Failed to execute query: {query}")
             get_logger().log_error(e)
+            return None
+
+    def execute_batch(self, query: str, data: Sequence[Sequence]):
+        """Executes the same statement for each row of data, sending them to the server in pages rather than one by one.
+
+        Args:
+            query (str): The query, with %s placeholders for its parameters.
+            data (Sequence[Sequence]): The parameters of each execution of the query.
+        """
+        try:
+            with self.database_connection_manager.open_conn_and_get_cur(autocommit=False) as cursor:
+                psycopg2.extras.execute_batch(cursor, query, data)
+        except Exception as e:
+            get_logger().log_error(f"Failed to execute query: {query}")
+            get_logger().log_error(e)
+
+    def _execute(self, cursor: psycopg2.extensions.cursor, query: str, params: Sequence | Mapping, prepare: bool):
+        """Executes a query on the given cursor, through a statement prepared on its connection if asked to.
+
+        Only queries with positional parameters are prepared, others are executed as they are.
+
+        Args:
+            cursor (psycopg2.extensions.cursor): The cursor.
+            query (str): The query, with %s placeholders for its parameters.
+            params (Sequence | Mapping): The parameters of the query.
+            prepare (bool): True to execute the query through a prepared statement.
+        """
+        if prepare and isinstance(params, (list, tuple)) and params:
+            prepared_query = self.database_connection_manager.get_connection_pool().get_prepared_query(cursor, query, len(params))
+            cursor.execute(prepared_query, params)
+        else:
+            cursor.execute(query, params)
+
+
+class DatabaseTransaction:
+    """Statements executed in the transaction of DatabaseOperationManager.transaction."""
+
+    def __init__(self, database_operation_manager: DatabaseOperationManager, cursor: psycopg2.extensions.cursor):
+        """Initializes the transaction on the cursor of its connection.
+
+        Args:
+            database_operation_manager (DatabaseOperationManager): The manager that opened the transaction.
+            cursor (psycopg2.extensions.cursor): The cursor of the connection the transaction runs on.
+        """
+        self.database_operation_manager = database_operation_manager
+        self.cursor = cursor
+
+    def execute_query(self, query: str, params: Sequence | Mapping = None, expect_results: bool = True, prepare: bool = False) -> list | None:
+        """Executes a query in the transaction.
+
+        Args:
+            query (str): The query that we want to execute, with %s placeholders for its parameters.
+            params (Sequence | Mapping): The parameters of the query.
+            expect_results (bool): set to false if nothing is returned by the query ex. updates
+            prepare (bool): set to true to execute the query through a statement prepared on the connection.
+
+        Returns:
+            list | None: The result of the query if any.
+        """
+        self.database_operation_manager._execute(self.cursor, query, params, prepare)
+        if expect_results:
+            return self.cursor.fetchall()
+        return None
+
+    def execute_values(self, query: str, data: Sequence[Sequence], fetch: bool = False) -> list | None:
+        """Executes a batch insert/update in the transaction using psycopg2 execute_values.
+
+        Args:
+            query (str): The query template with a VALUES placeholder.
+            data (Sequence[Sequence]): The data to insert.
+            fetch (bool): set to true to get the rows returned by a RETURNING clause.
+
+        Returns:
+            list | None: The rows returned by the query when fetch is set, in the order of the data.
+        """
+        return psycopg2.extras.execute_values(self.cursor, query, data, template=None, fetch=fetch)
@@ -35,6 +35,16 @@ class TestCaseResult:
         """
         return self.test_id
 
+    def set_test_id(self, test_id: int):
+        """
+        Setter for test id
+
+        Args:
+            test_id (int): the test_info id of the test case
+
+        """
+        self.test_id = test_id
+
     def get_result(self) -> str:
         """
         Getter for result
@@ -224,3 +234,23 @@ class TestCaseResult:
 
         """
         return self.log_location
+
+    def set_log_hostname(self, log_hostname: str):
+        """
+        Setter for log hostname
+
+        Args:
+            log_hostname (str): the ip of the host that holds the logs of this test case
+
+        """
+        self.log_hostname = log_hostname
+
+    def set_log_location(self, log_location: str):
+        """
+        Setter for log location
+
+        Args:
+            log_location (str): the directory that holds the logs of this test case
+
+        """
+        self.log_location = log_location
@@ -24,9 +24,9 @@ class CapabilityOperation:
         Returns:
             Capability: A Capability object with the capability_id generated from the database.
         """
-        insert_query = f"INSERT INTO capability (capability_name, capability_marker) " f"VALUES ('{capability_name}', '{capability_marker}') " f"returning capability_id"
+        insert_query = "INSERT INTO capability (capability_name, capability_marker) VALUES (%s, %s) returning capability_id"
 
-        results = self.database_operation_manager.execute_query(insert_query, cursor_factory=RealDictCursor)
+        results = self.database_operation_manager.execute_query(insert_query, (capability_name, capability_marker), cursor_factory=RealDictCursor)
         if results:  # can only ever be 1 result
             capability = Capability(results[0]["capability_id"], capability_name, capability_marker)
             return capability
@@ -43,8 +43,8 @@ class CapabilityOperation:
         Returns:
             Capability: The capability object if found, -1 if no capability is found.
         """
-        get_capability_query = f"SELECT * FROM capability where capability_marker='{capability_marker}'"
-        results = self.database_operation_manager.execute_query(get_capability_query, cursor_factory=RealDictCursor)
+        get_capability_query = "SELECT * FROM capability where capability_marker=%s"
+        results = self.database_operation_manager.execute_query(get_capability_query, (capability_marker,), cursor_factory=RealDictCursor)
 
         if results:
             if len(results) > 1:
@@ -56,3 +56,32 @@ class CapabilityOperation:
         else:
             get_logger().log_warning(f"There is no capability with the name {capability_marker}")
             return -1
+
+    def get_all_capabilities(self) -> list[Capability]:
+        """
+        Getter for all the capabilities in the database
+
+        Returns:
+            list[Capability]: The capabilities.
+        """
+        results = self.database_operation_manager.execute_query("SELECT * FROM capability", cursor_factory=RealDictCursor)
+
+        return [Capability(result["capability_id"], result["capability_name"], result["capability_marker"]) for result in results or []]
+
+    def insert_capabilities(self, capability_markers: list[str]) -> list[Capability]:
+        """
+        Inserts into the database a new capability for each marker, named after the marker, with a single statement.
+
+        Args:
+            capability_markers (list[str]): the markers of the new capabilities
+
+        Returns:
+            list[Capability]: The Capability objects with the capability_id generated from the database.
+        """
+        insert_query = "INSERT INTO capability (capability_name, capability_marker) VALUES %s returning capability_id, capability_name, capability_marker"
+
+        results = self.database_operation_manager.execute_values(insert_query, [(capability_marker, capability_marker) for capability_marker in capability_markers], fetch=True)
+        if results is None:
+            raise ValueError(f"Unable to insert the capabilities {capability_markers}.")
+
+        return [Capability(capability_id, capability_name, capability_marker) for capability_id, capability_name, capability_marker in results]
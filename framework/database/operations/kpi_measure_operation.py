@@ -47,9 +47,6 @@ class KpiMeasureOperation:
             collected_at = datetime.now(timezone.utc).isoformat()
 
         details_json = json.dumps(kpi_measure_details) if kpi_measure_details else '{}'
-        test_case_result_id = f"'{test_case_result_id}'" if test_case_result_id is not None else "NULL"
-        baseline_val = f"{kpi_baseline_id}" if kpi_baseline_id is not None else "NULL"
-        notes_val = f"'{notes}'" if notes is not None else "NULL"
 
         insert_query = (
             "INSERT INTO kpi_measure ("
@@ -57,13 +54,14 @@ class KpiMeasureOperation:
             "kpi_value, kpi_measure_details, "
             "kpi_baseline_id, collected_at, is_displayed, notes"
             ") VALUES ("
-            f"{kpi_id}, '{session_id}', {test_case_result_id}, "
-            f"{kpi_value}, '{details_json}', "
-            f"{baseline_val}, '{collected_at}', true, {notes_val}"
+            "%s, %s, %s, "
+            "%s, %s, "
+            "%s, %s, true, %s"
             ") RETURNING kpi_measure_id"
         )
+        params = (kpi_id, session_id, test_case_result_id, kpi_value, details_json, kpi_baseline_id, collected_at, notes)
 
-        results = self.database_operation_manager.execute_query(insert_query)
+        results = self.database_operation_manager.execute_query(insert_query, params, prepare=True)
 
         if results:
             return results[0][0]
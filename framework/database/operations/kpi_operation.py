@@ -1,5 +1,7 @@
 from typing import Optional
 
+import psycopg2
+
 from framework.database.connection.database_operation_manager import DatabaseOperationManager
 
 
@@ -46,39 +48,38 @@ class KpiOperation:
         # Try to find existing KPI
         select_query = (
             "SELECT kpi_id FROM kpi "
-            f"WHERE product = '{product}' "
-            f"AND kpi_category = '{kpi_category}' "
-            f"AND kpi_name = '{kpi_name}' "
-            f"AND kpi_node_role = '{kpi_node_role}' "
-            f"AND kpi_detail = '{kpi_detail}' "
+            "WHERE product = %s "
+            "AND kpi_category = %s "
+            "AND kpi_name = %s "
+            "AND kpi_node_role = %s "
+            "AND kpi_detail = %s "
             "LIMIT 1"
         )
 
-        results = self.database_operation_manager.execute_query(select_query)
-
-        if results:
-            return results[0][0]
-
-        # KPI not found — create it
-        kpi_unit_val = f"'{kpi_unit}'" if kpi_unit is not None else "NULL"
-        kpi_owner_val = f"'{kpi_owner_team}'" if kpi_owner_team is not None else "NULL"
-        kpi_desc_val = f"'{kpi_description}'" if kpi_description is not None else "NULL"
-
         insert_query = (
             "INSERT INTO kpi ("
             "product, kpi_category, kpi_name, "
             "kpi_node_role, kpi_detail, kpi_group, kpi_unit, "
             "kpi_owner_team, kpi_description"
             ") VALUES ("
-            f"'{product}', '{kpi_category}', '{kpi_name}', "
-            f"'{kpi_node_role}', '{kpi_detail}', '{kpi_group}', {kpi_unit_val}, "
-            f"{kpi_owner_val}, {kpi_desc_val}"
+            "%s, %s, %s, "
+            "%s, %s, %s, %s, "
+            "%s, %s"
             ") RETURNING kpi_id"
         )
 
-        results = self.database_operation_manager.execute_query(insert_query)
+        # The lookup and the insert run in one transaction on one connection.
+        try:
+            with self.database_operation_manager.transaction() as transaction:
+                results = transaction.execute_query(select_query, (product, kpi_category, kpi_name, kpi_node_role, kpi_detail), prepare=True)
+                if results:
+                    return results[0][0]
 
-        if results:
-            return results[0][0]
+                # KPI not found — create it
+                results = transaction.execute_query(insert_query, (product, kpi_category, kpi_name, kpi_node_role, kpi_detail, kpi_group, kpi_unit, kpi_owner_team, kpi_description))
+                if results:
+                    return results[0][0]
+        except psycopg2.Error as e:
+            raise ValueError("Unable to get or create KPI.") from e
 
         raise ValueError("Unable to get or create KPI.")
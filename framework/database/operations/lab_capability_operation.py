@@ -22,8 +22,8 @@ class LabCapabilityOperation:
 
         """
 
-        insert_query = f"INSERT INTO capability_lab (lab_info_id, capability_id) " f"VALUES ({lab_capability.get_lab_info_id()},{lab_capability.get_capability_id()})"
-        self.database_operation_manager.execute_query(insert_query, expect_results=False)
+        insert_query = "INSERT INTO capability_lab (lab_info_id, capability_id) VALUES (%s, %s)"
+        self.database_operation_manager.execute_query(insert_query, (lab_capability.get_lab_info_id(), lab_capability.get_capability_id()), expect_results=False)
 
     def delete_all_lab_capabilities(self, lab_info_id):
         """
@@ -35,9 +35,9 @@ class LabCapabilityOperation:
 
         """
 
-        delete_query = f"DELETE FROM capability_lab WHERE lab_info_id={lab_info_id}"
+        delete_query = "DELETE FROM capability_lab WHERE lab_info_id=%s"
 
-        self.database_operation_manager.execute_query(delete_query, expect_results=False)
+        self.database_operation_manager.execute_query(delete_query, (lab_info_id,), expect_results=False)
 
     def get_lab_capabilities(self, lab_info_id: int) -> [Capability]:
         """
@@ -48,9 +48,9 @@ class LabCapabilityOperation:
         Returns:
 
         """
-        query = "SELECT * from capability_lab " "JOIN capability using (capability_id) " f"WHERE lab_info_id={lab_info_id}"
+        query = "SELECT * from capability_lab " "JOIN capability using (capability_id) " "WHERE lab_info_id=%s"
         capabilities = []
-        results = self.database_operation_manager.execute_query(query, RealDictCursor)
+        results = self.database_operation_manager.execute_query(query, (lab_info_id,), RealDictCursor)
         for result in results:
             capability = Capability(result['capability_id'], result['capability_name'], result['capability_marker'])
             capabilities.append(capability)
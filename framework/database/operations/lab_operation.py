@@ -19,8 +19,8 @@ class LabOperation:
         Returns: True if it exists, False otherwise
 
         """
-        get_lab_id_query = f"SELECT lab_info_id FROM lab_info where lab_name='{lab_name}'"
-        result = self.database_operation_manager.execute_query(get_lab_id_query)
+        get_lab_id_query = "SELECT lab_info_id FROM lab_info where lab_name=%s"
+        result = self.database_operation_manager.execute_query(get_lab_id_query, (lab_name,))
 
         return len(result) > 0
 
@@ -35,8 +35,8 @@ class LabOperation:
         """
         if not self.does_lab_exist(lab_name):  # Only add the lab if it doesn't exist.
 
-            create_lab_query = f"INSERT INTO lab_info (lab_name) VALUES ('{lab_name}') RETURNING lab_info_id"
-            result = self.database_operation_manager.execute_query(create_lab_query)
+            create_lab_query = "INSERT INTO lab_info (lab_name) VALUES (%s) RETURNING lab_info_id"
+            result = self.database_operation_manager.execute_query(create_lab_query, (lab_name,))
             return result[0][0]
         else:
             get_logger().log_error(f"WARNING: This lab is already in the database! Lab Name: {lab_name}")
@@ -50,9 +50,9 @@ class LabOperation:
         Returns: The id associated with the lab.
         """
         # Get the lab id from the database.
-        get_lab_id_query = f"SELECT lab_info_id FROM lab_info where lab_name='{lab_name}'"
+        get_lab_id_query = "SELECT lab_info_id FROM lab_info where lab_name=%s"
 
-        result = self.database_operation_manager.execute_query(get_lab_id_query)
+        result = self.database_operation_manager.execute_query(get_lab_id_query, (lab_name,))
         if result:
             if len(result) > 1:
                 get_logger().log_info(f"WARNING: We have found more than one result matching the Lab Name: {lab_name}")
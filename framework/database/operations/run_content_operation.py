@@ -27,12 +27,12 @@ class RunContentOperation:
             "join session_info using (test_plan_id) "
             "join session_info_content using (session_info_id) "
             "join test_info using (test_info_id) "
-            f"where test_plan_id={test_plan_id} "
+            "where test_plan_id=%s "
             "and session_info.enabled=true "
             "and session_info_content.enabled=true"
         )
 
-        results = self.database_operation_manager.execute_query(test_plan_content_query, RealDictCursor)
+        results = self.database_operation_manager.execute_query(test_plan_content_query, (test_plan_id,), RealDictCursor)
 
         test_run_contents = []
         for result in results:
@@ -68,10 +68,10 @@ class RunContentOperation:
             "GROUP BY test_info_id, session_info_id) as full_capabilities "
             "USING (test_info_id, session_info_id) "
             "LEFT JOIN test_info using (test_info_id) "
-            f"WHERE run_id={run_id}"
+            "WHERE run_id=%s"
         )
 
-        results = self.database_operation_manager.execute_query(full_query, RealDictCursor)
+        results = self.database_operation_manager.execute_query(full_query, (run_id,), RealDictCursor)
 
         tests = []
         if results:
@@ -123,6 +123,18 @@ class RunContentOperation:
         Returns:
 
         """
-        update_execution_status_query = "UPDATE run_content " f"SET run_content_execution_status='{execution_result}' " f"WHERE run_content_id={run_content_id}"
+        update_execution_status_query = "UPDATE run_content SET run_content_execution_status=%s WHERE run_content_id=%s"
 
-        self.database_operation_manager.execute_query(update_execution_status_query, expect_results=False)
+        self.database_operation_manager.execute_query(update_execution_status_query, (execution_result, run_content_id), expect_results=False, prepare=True)
+
+    def update_execution_statuses(self, execution_statuses: list[tuple[int, str]]):
+        """
+        Update the execution result of many run contents, sending the updates to the database in pages
+
+        Args:
+            execution_statuses (list[tuple[int, str]]): the run content id and execution result of each run content
+
+        """
+        update_execution_status_query = "UPDATE run_content SET run_content_execution_status=%s WHERE run_content_id=%s"
+
+        self.database_operation_manager.execute_batch(update_execution_status_query, [(execution_result, run_content_id) for run_content_id, execution_result in execution_statuses])
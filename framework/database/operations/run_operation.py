@@ -21,9 +21,9 @@ class RunOperation:
         Returns:
 
         """
-        insert_query = "INSERT INTO run " "(run_name, run_type_id, release) " f"VALUES ('{run_name}',{run_type_id},'{release}') RETURNING run_id"
+        insert_query = "INSERT INTO run " "(run_name, run_type_id, release) " "VALUES (%s, %s, %s) RETURNING run_id"
 
-        results = self.database_operation_manager.execute_query(insert_query, cursor_factory=RealDictCursor)
+        results = self.database_operation_manager.execute_query(insert_query, (run_name, run_type_id, release), cursor_factory=RealDictCursor)
 
         if results:
             return results[0]['run_id']  # can only ever be 1 result
@@ -58,12 +58,12 @@ class RunOperation:
             "INSERT INTO run ("
             "run_name, run_type_id, product, build_info_id, platform_build_info_id"
             ") VALUES ("
-            f"'{run_name}', {run_type_id}, '{product}', "
-            f"{build_info_id}, {platform_build_info_id}"
+            "%s, %s, %s, "
+            "%s, %s"
             ") RETURNING run_id"
         )
 
-        results = self.database_operation_manager.execute_query(insert_query)
+        results = self.database_operation_manager.execute_query(insert_query, (run_name, run_type_id, product, build_info_id, platform_build_info_id))
 
         if results:
             return results[0][0]
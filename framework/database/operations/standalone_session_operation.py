@@ -48,9 +48,6 @@ class StandaloneSessionOperation:
         created_at = datetime.now(timezone.utc).isoformat()
 
         session_info_id = session_info_id if session_info_id is not None else -1
-        sys_type = f"'{sys_type}'" if sys_type is not None else "NULL"
-        kubernetes_version = f"'{kubernetes_version}'" if kubernetes_version is not None else "NULL"
-        ceph_version = f"'{ceph_version}'" if ceph_version is not None else "NULL"
 
         insert_query = (
             "INSERT INTO test_session ("
@@ -58,13 +55,14 @@ class StandaloneSessionOperation:
             "sys_type, kubernetes_version, ceph_version, "
             "lab_runtime_config_id, created_at"
             ") VALUES ("
-            f"'{session_id}', {run_id}, {lab_id}, {session_info_id}, '{tag}', "
-            f"{sys_type}, {kubernetes_version}, {ceph_version}, "
-            f"{lab_runtime_config_id}, '{created_at}'"
+            "%s, %s, %s, %s, %s, "
+            "%s, %s, %s, "
+            "%s, %s"
             ") RETURNING id"
         )
+        params = (session_id, run_id, lab_id, session_info_id, tag, sys_type, kubernetes_version, ceph_version, lab_runtime_config_id, created_at)
 
-        results = self.database_operation_manager.execute_query(insert_query)
+        results = self.database_operation_manager.execute_query(insert_query, params)
 
         if results:
             return str(results[0][0])
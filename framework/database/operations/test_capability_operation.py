@@ -23,9 +23,9 @@ class TestCapabilityOperation:
         Returns: The id associated with the capability.
         """
         # Get the test id from the database.
-        get_capability_test_id_query = "SELECT capability_test_id FROM capability_test where " f"capability_id='{capability_id}' and test_info_id='{test_info_id}'"
+        get_capability_test_id_query = "SELECT capability_test_id FROM capability_test where capability_id=%s and test_info_id=%s"
 
-        result = self.database_operation_manager.execute_query(get_capability_test_id_query)
+        result = self.database_operation_manager.execute_query(get_capability_test_id_query, (capability_id, test_info_id))
         if result:
             if len(result) > 1:
                 get_logger().log_error(f"WARNING: We have found more than one result matching the Capability Name:" f" {capability_id} and {test_info_id}")
@@ -43,8 +43,8 @@ class TestCapabilityOperation:
         Returns: The id of the newly created mapping
         """
 
-        create_capability_mapping_query = "INSERT INTO capability_test " "(capability_id, test_info_id) " f"VALUES ({capability_id}, {test_info_id}) " "RETURNING capability_test_id"
-        result = self.database_operation_manager.execute_query(create_capability_mapping_query, cursor_factory=RealDictCursor)
+        create_capability_mapping_query = "INSERT INTO capability_test " "(capability_id, test_info_id) " "VALUES (%s, %s) " "RETURNING capability_test_id"
+        result = self.database_operation_manager.execute_query(create_capability_mapping_query, (capability_id, test_info_id), cursor_factory=RealDictCursor)
         return result[0]['capability_test_id']
 
     def get_capabilities_for_test(self, test_info_id) -> [Capability]:
@@ -57,9 +57,9 @@ class TestCapabilityOperation:
 
         """
 
-        get_capabilities_query = f"Select * FROM capability_test " "join capability using (capability_id) " f"where test_info_id={test_info_id}"
+        get_capabilities_query = "Select * FROM capability_test " "join capability using (capability_id) " "where test_info_id=%s"
 
-        results = self.database_operation_manager.execute_query(get_capabilities_query, cursor_factory=RealDictCursor)
+        results = self.database_operation_manager.execute_query(get_capabilities_query, (test_info_id,), cursor_factory=RealDictCursor)
 
         capabilities_list = []
 
@@ -85,6 +85,43 @@ class TestCapabilityOperation:
             get_logger().log_error(f"Unable to find a mapping with " f"required capability id = {capability_id} or test_id = {test_info_id}")
             return -1
 
-        delete_capabilities_query = f"Delete FROM capability_test where capability_test_id={mapping_id}"
+        delete_capabilities_query = "Delete FROM capability_test where capability_test_id=%s"
 
-        self.database_operation_manager.execute_query(delete_capabilities_query, expect_results=False)
+        self.database_operation_manager.execute_query(delete_capabilities_query, (mapping_id,), expect_results=False)
+
+    def get_capability_markers_for_tests(self, test_info_ids: list[int]) -> list[tuple[int, int, str]]:
+        """
+        Gets the capability mappings in the db for these tests, with a single query
+
+        Args:
+            test_info_ids (list[int]): the ids of the tests
+
+        Returns:
+            list[tuple[int, int, str]]: the capability_test_id, test_info_id and capability_marker of each mapping
+        """
+        get_capabilities_query = "Select capability_test_id, test_info_id, capability_marker FROM capability_test " "join capability using (capability_id) " "where test_info_id = ANY(%s)"
+
+        results = self.database_operation_manager.execute_query(get_capabilities_query, (list(test_info_ids),))
+
+        return results or []
+
+    def create_new_mappings(self, capability_test_ids: list[tuple[int, int]]):
+        """
+        Adds the given capability mappings to the database with a single statement
+
+        Args:
+            capability_test_ids (list[tuple[int, int]]): the capability_id and test_info_id of each mapping
+        """
+        create_capability_mapping_query = "INSERT INTO capability_test (capability_id, test_info_id) VALUES %s"
+        self.database_operation_manager.execute_values(create_capability_mapping_query, capability_test_ids)
+
+    def delete_capability_tests(self, capability_test_ids: list[int]):
+        """
+        Deletes the given capability mappings with a single statement
+
+        Args:
+            capability_test_ids (list[int]): the ids of the mappings
+        """
+        delete_capabilities_query = "Delete FROM capability_test where capability_test_id = ANY(%s)"
+
+        self.database_operation_manager.execute_query(delete_capabilities_query, (list(capability_test_ids),), expect_results=False)
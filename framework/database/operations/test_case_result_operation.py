@@ -23,7 +23,7 @@ class TestCaseResultOperation:
         """
         # A standalone run has no session, so the column has to be left NULL rather than
         # given the string 'None', which is not a valid uuid.
-        session_id = f"'{test_case_result.get_session_id()}'" if test_case_result.get_session_id() else "NULL"
+        session_id = test_case_result.get_session_id() or None
 
         # duration is deliberately absent from the column list. Setting
         # start_time and end_time is what populates it.
@@ -31,17 +31,96 @@ class TestCaseResultOperation:
         create_test_case_result = (
             "INSERT INTO test_case_result (test_id, session_id, result, start_time, end_time, log_hostname, log_location, "
             "jenkins_log_location, failure_file_name, failure_function_name, failure_line_number) "
-            f"VALUES ({test_case_result.get_test_id()}, {session_id}, '{test_case_result.get_result()}', "
-            f"'{test_case_result.get_start_time()}', '{test_case_result.get_end_time()}', "
-            f"'{test_case_result.get_log_hostname()}', '{test_case_result.get_log_location()}', "
-            f"'{test_case_result.get_jenkins_log_location()}', '{test_case_result.get_failure_file_name()}', "
-            f"'{test_case_result.get_failure_function_name()}', '{test_case_result.get_failure_line_number()}') "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) "
             "RETURNING test_case_result_id"
         )
+        params = (
+            test_case_result.get_test_id(),
+            session_id,
+            test_case_result.get_result(),
+            test_case_result.get_start_time(),
+            test_case_result.get_end_time(),
+            test_case_result.get_log_hostname(),
+            test_case_result.get_log_location(),
+            test_case_result.get_jenkins_log_location(),
+            test_case_result.get_failure_file_name(),
+            test_case_result.get_failure_function_name(),
+            test_case_result.get_failure_line_number(),
+        )
 
-        result = self.database_operation_manager.execute_query(create_test_case_result)
+        result = self.database_operation_manager.execute_query(create_test_case_result, params, prepare=True)
         return result[0][0]
 
+    def create_test_case_results(self, test_case_results: list[TestCaseResult]) -> list[int]:
+        """
+        Creates many test case results in the database with a single statement
+
+        Unlike create_test_case_result, a failure of the database is raised, so that the caller can try again later.
+
+        Args:
+            test_case_results (list[TestCaseResult]): the test case results, which are given their test case result id
+
+        Returns:
+            list[int]: the test case result ids, in the order of the test case results
+
+        """
+        # fmt: off
+        create_test_case_results = (
+            "INSERT INTO test_case_result (test_id, session_id, result, start_time, end_time, log_hostname, log_location, "
+            "jenkins_log_location, failure_file_name, failure_function_name, failure_line_number) "
+            "VALUES %s RETURNING test_case_result_id"
+        )
+        values = [
+            (
+                test_case_result.get_test_id(),
+                test_case_result.get_session_id() or None,
+                test_case_result.get_result(),
+                test_case_result.get_start_time(),
+                test_case_result.get_end_time(),
+                test_case_result.get_log_hostname(),
+                test_case_result.get_log_location(),
+                test_case_result.get_jenkins_log_location(),
+                test_case_result.get_failure_file_name(),
+                test_case_result.get_failure_function_name(),
+                test_case_result.get_failure_line_number(),
+            )
+            for test_case_result in test_case_results
+        ]
+
+        with self.database_operation_manager.transaction() as transaction:
+            results = transaction.execute_values(create_test_case_results, values, fetch=True)
+
+        test_case_result_ids = [result[0] for result in results]
+        for test_case_result, test_case_result_id in zip(test_case_results, test_case_result_ids):
+            test_case_result.set_test_case_result_id(test_case_result_id)
+        return test_case_result_ids
+
+    def get_average_durations(self, test_ids: list[int], number_of_results: int = 10) -> dict[int, float]:
+        """
+        Gets the average duration of the most recent results of each of the given test cases
+
+        Args:
+            test_ids (list[int]): the test_info ids of the test cases
+            number_of_results (int): the number of most recent results to average for each test case
+
+        Returns:
+            dict[int, float]: the average duration in seconds, by test_info id, for the test cases that have results
+
+        """
+        # fmt: off
+        get_average_durations = (
+            "SELECT test_id, EXTRACT(EPOCH FROM AVG(end_time - start_time)) "
+            "FROM (SELECT test_id, start_time, end_time, "
+            "ROW_NUMBER() OVER (PARTITION BY test_id ORDER BY start_time DESC) AS result_number "
+            "FROM test_case_result "
+            "WHERE test_id = ANY(%s) AND start_time IS NOT NULL AND end_time IS NOT NULL) AS recent_results "
+            "WHERE result_number <= %s "
+            "GROUP BY test_id"
+        )
+
+        results = self.database_operation_manager.execute_query(get_average_durations, (list(test_ids), number_of_results))
+        return {test_id: float(average_duration) for test_id, average_duration in results or []}
+
     def update_test_case_result(self, test_case_result: TestCaseResult):
         """
         Updates a test case result in the database
@@ -53,12 +132,20 @@ class TestCaseResultOperation:
         # fmt: off
         create_test_case_result = (
             "UPDATE test_case_result "
-            f"SET result='{test_case_result.get_result()}', "
-            f"log_hostname='{test_case_result.log_hostname}', "
-            f"log_location='{test_case_result.log_location}', "
-            f"start_time='{test_case_result.start_time}', "
-            f"end_time='{test_case_result.end_time}' "
-            f"WHERE test_case_result_id={test_case_result.get_test_case_result_id()}"
+            "SET result=%s, "
+            "log_hostname=%s, "
+            "log_location=%s, "
+            "start_time=%s, "
+            "end_time=%s "
+            "WHERE test_case_result_id=%s"
+        )
+        params = (
+            test_case_result.get_result(),
+            test_case_result.log_hostname,
+            test_case_result.log_location,
+            test_case_result.start_time,
+            test_case_result.end_time,
+            test_case_result.get_test_case_result_id(),
         )
 
-        self.database_operation_manager.execute_query(create_test_case_result, expect_results=False)
+        self.database_operation_manager.execute_query(create_test_case_result, params, expect_results=False, prepare=True)
@@ -27,9 +27,9 @@ class TestInfoOperation:
             int: The id associated with the test.
         """
         # Get the test id from the database.
-        get_test_id_query = f"SELECT test_info_id FROM test_info where test_name='{test_name}'" f" and test_suite='{test_suite}' and repository='{repository}'"
+        get_test_id_query = "SELECT test_info_id FROM test_info where test_name=%s and test_suite=%s and repository=%s"
 
-        result = self.database_operation_manager.execute_query(get_test_id_query, cursor_factory=RealDictCursor)
+        result = self.database_operation_manager.execute_query(get_test_id_query, (test_name, test_suite, repository), cursor_factory=RealDictCursor, prepare=True)
         if result:
             if len(result) > 1:
                 get_logger().log_info(f"WARNING: We have found more than one result matching the Test Name: {test_name}")
@@ -37,6 +37,28 @@ class TestInfoOperation:
 
         return None
 
+    def get_info_test_ids(self, test_keys: list[tuple[str, str, str]]) -> dict[tuple[str, str, str], int]:
+        """Transforms many (test_name, test_suite, repository) keys into their test ids with a single query.
+
+        Unlike get_info_test_id, a failure of the database is raised rather than reported as a missing test.
+
+        Args:
+            test_keys (list[tuple[str, str, str]]): The test name, test suite and repository of each test.
+
+        Returns:
+            dict[tuple[str, str, str], int]: The id of each key found, the first one when a key matches several tests.
+        """
+        get_test_ids_query = "SELECT test_name, test_suite, repository, test_info_id FROM test_info JOIN unnest(%s::text[], %s::text[], %s::text[]) AS test_key(test_name, test_suite, repository) USING (test_name, test_suite, repository) ORDER BY test_info_id"
+        params = ([test_key[0] for test_key in test_keys], [test_key[1] for test_key in test_keys], [test_key[2] for test_key in test_keys])
+
+        with self.database_operation_manager.transaction() as transaction:
+            results = transaction.execute_query(get_test_ids_query, params)
+
+        test_ids = {}
+        for test_name, test_suite, repository, test_info_id in results:
+            test_ids.setdefault((test_name, test_suite, repository), test_info_id)
+        return test_ids
+
     def get_test_info(self, test_info_id: str) -> TestCase:
         """Gets the TestInfo associated with the test_info_id specified.
 
@@ -46,9 +68,9 @@ class TestInfoOperation:
         Returns:
             TestCase: The test case info from the database.
         """
-        test_case_info_query = f"select * from test_info where test_info_id={test_info_id}"
+        test_case_info_query = "select * from test_info where test_info_id=%s"
 
-        results = self.database_operation_manager.execute_query(test_case_info_query, RealDictCursor)
+        results = self.database_operation_manager.execute_query(test_case_info_query, (test_info_id,), RealDictCursor, prepare=True)
 
         if results:
             # This query returns at maximum one result.
@@ -76,11 +98,13 @@ class TestInfoOperation:
             list[TestCase]: List of active testcases.
         """
         if repository:
-            test_case_info_query = f"select * from test_info where is_active=true and repository='{repository}'"
+            test_case_info_query = "select * from test_info where is_active=true and repository=%s"
+            params = (repository,)
         else:
             test_case_info_query = "select * from test_info where is_active=true"
+            params = None
 
-        results = self.database_operation_manager.execute_query(test_case_info_query, RealDictCursor)
+        results = self.database_operation_manager.execute_query(test_case_info_query, params, RealDictCursor)
 
         test_info_list = []
         if not results:
@@ -97,6 +121,35 @@ class TestInfoOperation:
             test_info_list.append(test_info)
         return test_info_list
 
+    def get_all_tests(self, repository: str) -> list[TestCase]:
+        """Gets all the testcases of a repository in the db, active or not, in the order they were inserted.
+
+        A failure of the database is raised instead of being returned as an empty list, since the callers would take
+        every test of the repository for a new one.
+
+        Args:
+            repository (str): The repository that owns the tests.
+
+        Returns:
+            list[TestCase]: List of testcases, empty if there are none.
+        """
+        test_case_info_query = "select * from test_info where repository=%s order by test_info_id"
+
+        with self.database_operation_manager.transaction(RealDictCursor) as transaction:
+            results = transaction.execute_query(test_case_info_query, (repository,))
+
+        test_info_list = []
+        for result in results:
+            test_info: TestCase = TestCase(result["test_name"], result["test_suite"], result["priority"], result["test_path"], result["pytest_node_id"])
+
+            test_info.set_test_info_id(result["test_info_id"])
+            test_info.set_test_case_group_id(result["test_case_group_id"])
+            test_info.set_is_active(result["is_active"])
+            test_info.set_repository(result["repository"])
+
+            test_info_list.append(test_info)
+        return test_info_list
+
     def insert_test(self, testcase: TestCase) -> int:
         """Inserts the given testcase.
 
@@ -109,15 +162,64 @@ class TestInfoOperation:
         Returns:
             int: The test info id.
         """
-        insert_query = f"INSERT INTO test_info (test_name, test_suite, priority, test_path," f" pytest_node_id, test_case_group_id, is_active, repository)" f" VALUES('{testcase.get_test_name()}', '{testcase.get_test_suite()}'," f" '{testcase.get_priority()}', '{testcase.get_test_path()}'," f" '{testcase.get_pytest_node_id()}', {testcase.get_test_case_group_id()}," f" {testcase.is_testcase_active()}, '{testcase.get_repository()}') RETURNING test_info_id"
-
-        result = self.database_operation_manager.execute_query(insert_query, cursor_factory=RealDictCursor)
+        insert_query = "INSERT INTO test_info (test_name, test_suite, priority, test_path," " pytest_node_id, test_case_group_id, is_active, repository)" " VALUES(%s, %s, %s, %s, %s, %s, %s, %s) RETURNING test_info_id"
+        params = (
+            testcase.get_test_name(),
+            testcase.get_test_suite(),
+            testcase.get_priority(),
+            testcase.get_test_path(),
+            testcase.get_pytest_node_id(),
+            testcase.get_test_case_group_id(),
+            testcase.is_testcase_active(),
+            testcase.get_repository(),
+        )
+
+        result = self.database_operation_manager.execute_query(insert_query, params, cursor_factory=RealDictCursor)
 
         if result:
             return result[0]["test_info_id"]
         else:
             raise ValueError(f"Unable to insert testcase with name {testcase.get_test_name()}")
 
+    def insert_tests(self, testcases: list[TestCase]) -> dict[tuple[str, str], int]:
+        """Inserts the given testcases with a single statement.
+
+        Args:
+            testcases (list[TestCase]): The testcases to insert.
+
+        Returns:
+            dict[tuple[str, str], int]: The test info ids of the inserted testcases, by test name and test suite.
+        """
+        insert_query = "INSERT INTO test_info (test_name, test_suite, priority, test_path," " pytest_node_id, test_case_group_id, is_active, repository)" " VALUES %s RETURNING test_name, test_suite, test_info_id"
+        values = [
+            (
+                testcase.get_test_name(),
+                testcase.get_test_suite(),
+                testcase.get_priority(),
+                testcase.get_test_path(),
+                testcase.get_pytest_node_id(),
+                testcase.get_test_case_group_id(),
+                testcase.is_testcase_active(),
+                testcase.get_repository(),
+            )
+            for testcase in testcases
+        ]
+
+        results = self.database_operation_manager.execute_values(insert_query, values, fetch=True)
+        if results is None:
+            raise ValueError(f"Unable to insert {len(testcases)} testcases")
+        return {(test_name, test_suite): test_info_id for test_name, test_suite, test_info_id in results}
+
+    def update_tests(self, testcases: list[TestCase]):
+        """Updates the priority, test_path and pytest_node_id of the given testcases, and sets them active.
+
+        Args:
+            testcases (list[TestCase]): The testcases, with the test_info_id of their entry in the db.
+        """
+        update_query = "update test_info set priority=%s, test_path=%s, pytest_node_id=%s, is_active=true where test_info_id=%s"
+        values = [(testcase.get_priority(), testcase.get_test_path(), testcase.get_pytest_node_id(), testcase.get_test_info_id()) for testcase in testcases]
+        self.database_operation_manager.execute_batch(update_query, values)
+
     def update_priority(self, test_info_id: int, priority: str):
         """Updates the priority of the test.
 
@@ -125,8 +227,8 @@ class TestInfoOperation:
             test_info_id (int): The test id.
             priority (str): The priority.
         """
-        update_priority_query = f"update test_info set priority='{priority}' where test_info_id={test_info_id}"
-        self.database_operation_manager.execute_query(update_priority_query, expect_results=False)
+        update_priority_query = "update test_info set priority=%s where test_info_id=%s"
+        self.database_operation_manager.execute_query(update_priority_query, (priority, test_info_id), expect_results=False)
 
     def update_test_path(self, test_info_id: int, test_path: str):
         """Updates the test_path of this test case.
@@ -135,8 +237,8 @@ class TestInfoOperation:
             test_info_id (int): The test id.
             test_path (str): The test_path.
         """
-        update_test_path_query = f"update test_info set test_path='{test_path}' where test_info_id={test_info_id}"
-        self.database_operation_manager.execute_query(update_test_path_query, expect_results=False)
+        update_test_path_query = "update test_info set test_path=%s where test_info_id=%s"
+        self.database_operation_manager.execute_query(update_test_path_query, (test_path, test_info_id), expect_results=False)
 
     def update_pytest_node_id(self, test_info_id: int, pytest_node_id: str):
         """Updates the pytest_node_id of this test case.
@@ -145,8 +247,8 @@ class TestInfoOperation:
             test_info_id (int): The test_info_id.
             pytest_node_id (str): The pytest_node_id.
         """
-        update_pytest_node_id_query = f"update test_info set pytest_node_id='{pytest_node_id}' where test_info_id={test_info_id}"
-        self.database_operation_manager.execute_query(update_pytest_node_id_query, expect_results=False)
+        update_pytest_node_id_query = "update test_info set pytest_node_id=%s where test_info_id=%s"
+        self.database_operation_manager.execute_query(update_pytest_node_id_query, (pytest_node_id, test_info_id), expect_results=False)
 
     def update_repository(self, test_info_id: int, repository: str):
         """Updates the repository of this test case.
@@ -155,8 +257,8 @@ class TestInfoOperation:
             test_info_id (int): The test_info_id.
             repository (str): The repository name.
         """
-        update_repository_query = f"update test_info set repository='{repository}' where test_info_id={test_info_id}"
-        self.database_operation_manager.execute_query(update_repository_query, expect_results=False)
+        update_repository_query = "update test_info set repository=%s where test_info_id=%s"
+        self.database_operation_manager.execute_query(update_repository_query, (repository, test_info_id), expect_results=False)
 
     def set_test_active(self, test_info_id: int):
         """Sets the given test to be active.
@@ -164,8 +266,8 @@ class TestInfoOperation:
         Args:
             test_info_id (int): The test id.
         """
-        set_active_query = f"UPDATE test_info SET is_active=true where test_info_id={test_info_id}"
-        self.database_operation_manager.execute_query(set_active_query, expect_results=False)
+        set_active_query = "UPDATE test_info SET is_active=true where test_info_id=%s"
+        self.database_operation_manager.execute_query(set_active_query, (test_info_id,), expect_results=False)
 
     def set_tests_inactive(self, test_ids: list[int]):
         """Sets the given tests to be inactive.
@@ -173,7 +275,6 @@ class TestInfoOperation:
         Args:
             test_ids (list[int]): The list of test ids.
         """
-        list_of_ids = ",".join(map(str, test_ids))
-        set_inactive_query = f"UPDATE test_info SET is_active=false where test_info_id in ({list_of_ids})"
+        set_inactive_query = "UPDATE test_info SET is_active=false where test_info_id = ANY(%s)"
 
-        self.database_operation_manager.execute_query(set_inactive_query, expect_results=False)
+        self.database_operation_manager.execute_query(set_inactive_query, (list(test_ids),), expect_results=False)
@@ -22,9 +22,9 @@ class TestPlanOperation:
 
         """
 
-        query = f"SELECT * FROM test_plan WHERE test_plan_id={test_plan_id}"
+        query = "SELECT * FROM test_plan WHERE test_plan_id=%s"
 
-        results = self.database_operation_manager.execute_query(query, cursor_factory=RealDictCursor)
+        results = self.database_operation_manager.execute_query(query, (test_plan_id,), cursor_factory=RealDictCursor)
 
         if results:
             if len(results) > 1:
@@ -25,15 +25,27 @@ class UpgradeEventOperation:
             "INSERT INTO upgrade_event (test_session_id, event_name, retry, operation, entity, "
             "is_upgrade, is_patch, timestamp, is_rollback, duration, from_version, to_version, "
             "snapshot, subcloud, build_id) "
-            f"VALUES ('{session_id}', '{upgrade_event.event_name}', "
-            f"{upgrade_event.retry}, '{upgrade_event.operation}', '{upgrade_event.entity}', "
-            f"{upgrade_event.is_upgrade}, {upgrade_event.is_patch}, '{upgrade_event.timestamp}', "
-            f"{upgrade_event.is_rollback}, {upgrade_event.duration}, '{upgrade_event.from_version}', "
-            f"'{upgrade_event.to_version}', {upgrade_event.snapshot}, '{upgrade_event.subcloud}', "
-            f"'{upgrade_event.build_id}') RETURNING upgrade_event_id"
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s) RETURNING upgrade_event_id"
+        )
+        params = (
+            session_id,
+            upgrade_event.event_name,
+            upgrade_event.retry,
+            upgrade_event.operation,
+            upgrade_event.entity,
+            upgrade_event.is_upgrade,
+            upgrade_event.is_patch,
+            upgrade_event.timestamp,
+            upgrade_event.is_rollback,
+            upgrade_event.duration,
+            upgrade_event.from_version,
+            upgrade_event.to_version,
+            upgrade_event.snapshot,
+            upgrade_event.subcloud,
+            upgrade_event.build_id,
         )
 
-        result = self.database_operation_manager.execute_query(create_upgrade_event_query)
+        result = self.database_operation_manager.execute_query(create_upgrade_event_query, params)
         if result:
             upgrade_event.set_upgrade_event_id(result[0][0])
 
@@ -47,9 +59,9 @@ class UpgradeEventOperation:
         Returns:
             list[UpgradeEvent]: List of UpgradeEvent objects
         """
-        get_upgrade_events_query = "SELECT * FROM upgrade_event " f"WHERE test_session_id='{session_id}'"
+        get_upgrade_events_query = "SELECT * FROM upgrade_event WHERE test_session_id=%s"
 
-        results = self.database_operation_manager.execute_query(get_upgrade_events_query, RealDictCursor)
+        results = self.database_operation_manager.execute_query(get_upgrade_events_query, (session_id,), RealDictCursor)
 
         upgrade_events = []
         if results:
@@ -78,20 +90,36 @@ class UpgradeEventOperation:
         # fmt: off
         update_upgrade_event_query = (
             "UPDATE upgrade_event "
-            f"SET event_name='{upgrade_event.event_name}', "
-            f"retry={upgrade_event.retry}, "
-            f"operation='{upgrade_event.operation}', "
-            f"entity='{upgrade_event.entity}', "
-            f"is_upgrade={upgrade_event.is_upgrade}, "
-            f"is_patch={upgrade_event.is_patch}, "
-            f"is_rollback={upgrade_event.is_rollback}, "
-            f"duration={upgrade_event.duration}, "
-            f"from_version='{upgrade_event.from_version}', "
-            f"to_version='{upgrade_event.to_version}', "
-            f"snapshot={upgrade_event.snapshot}, "
-            f"subcloud='{upgrade_event.subcloud}', "
-            f"build_id='{upgrade_event.build_id}' "
-            f"WHERE upgrade_event_id={upgrade_event.get_upgrade_event_id()}"
+            "SET event_name=%s, "
+            "retry=%s, "
+            "operation=%s, "
+            "entity=%s, "
+            "is_upgrade=%s, "
+            "is_patch=%s, "
+            "is_rollback=%s, "
+            "duration=%s, "
+            "from_version=%s, "
+            "to_version=%s, "
+            "snapshot=%s, "
+            "subcloud=%s, "
+            "build_id=%s "
+            "WHERE upgrade_event_id=%s"
+        )
+        params = (
+            upgrade_event.event_name,
+            upgrade_event.retry,
+            upgrade_event.operation,
+            upgrade_event.entity,
+            upgrade_event.is_upgrade,
+            upgrade_event.is_patch,
+            upgrade_event.is_rollback,
+            upgrade_event.duration,
+            upgrade_event.from_version,
+            upgrade_event.to_version,
+            upgrade_event.snapshot,
+            upgrade_event.subcloud,
+            upgrade_event.build_id,
+            upgrade_event.get_upgrade_event_id(),
         )
 
-        self.database_operation_manager.execute_query(update_upgrade_event_query, expect_results=False)
+        self.database_operation_manager.execute_query(update_upgrade_event_query, params, expect_results=False)
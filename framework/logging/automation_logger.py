@@ -1,15 +1,17 @@
+import atexit
 import logging
 import os
+import queue
 from time import strftime
 
 from config.configuration_manager import ConfigurationManager
 from config.logger.objects.logger_config import LoggerConfig
-from framework.logging.log_exception_filter import LogExceptionFilter
-from framework.logging.log_non_exception_filter import LogNonExceptionFilter
+from framework.logging.log_writer import LogQueueHandler, LogWriter
 
 # Singleton instance of the logger
 # This instance should never be accessed directly, but instead get_logger() should be used.
 _LOGGER = None
+_LOG_WRITER = None
 
 
 class AutomationLogger(logging.getLoggerClass()):
@@ -114,6 +116,20 @@ class AutomationLogger(logging.getLoggerClass()):
         """
         self._log(logging.INFO, message, None, stacklevel=2, extra={"source": "KPI"})
 
+    def is_level_logged(self, level: int) -> bool:
+        """
+        Checks if a record of the given level would be written to any log file or the console.
+
+        This lets the callers skip building messages that would be dropped, e.g. the keyword calls when no log is at DEBUG level.
+
+        Args:
+            level (int): The level of the record.
+
+        Returns:
+            bool: False if every log file and the console are set to a higher level.
+        """
+        return _LOG_WRITER is None or level >= _LOG_WRITER.get_lowest_level()
+
     def get_log_folder(self) -> str:
         """
         Getter for log folder.
@@ -230,7 +246,7 @@ def configure_logger() -> None:
         raise ValueError("You must define a Logger Configuration before using the logger.")
 
     logging.setLoggerClass(AutomationLogger)
-    global _LOGGER
+    global _LOGGER, _LOG_WRITER
     _LOGGER = logging.getLogger("automation_log")
 
     _LOGGER.log_folder = logger_config.get_log_location()
@@ -238,34 +254,28 @@ def configure_logger() -> None:
         _LOGGER.log_folder = os.path.join(_LOGGER.log_folder, lab_configuration.get_lab_name(), strftime("%Y%m%d%H%M"))
     os.makedirs(_LOGGER.log_folder, exist_ok=True)
 
+    # The records are formatted and written by the LogWriter thread, so that logging never waits on the disk or the console.
+    log_queue = queue.Queue(logger_config.get_log_queue_size())
+    _LOG_WRITER = LogWriter(log_queue, _LOGGER.GENERAL_LOGGER_FORMAT, _LOGGER.EXCEPTION_LOGGER_FORMAT)
+    _LOGGER.addHandler(LogQueueHandler(log_queue))
+    atexit.register(flush_logs)
+
     log_file = os.path.join(_LOGGER.get_log_folder(), "full_logs.txt")
     _configure_general_log_handlers(logger_config, log_file)
-    _configure_exception_log_handlers(logger_config, log_file)
     _LOGGER.log_info(f"LOG File Location: {log_file}")
 
 
 @staticmethod
 def _configure_general_log_handlers(logger_config: LoggerConfig, log_file: str) -> None:
     """
-    This function will add the console and file handlers for general logging.
+    This function will add the console and file to write the general logs, and the exceptions and stack traces, to.
 
     Args:
         logger_config (LoggerConfig): LoggerConfig object.
         log_file (str): Full path where we want to store the logs.
     """
-    log_formatter = logging.Formatter(_LOGGER.GENERAL_LOGGER_FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
-
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setFormatter(log_formatter)
-    file_handler.addFilter(LogNonExceptionFilter())
-    file_handler.setLevel(logger_config.get_file_log_level_value())
-    _LOGGER.addHandler(file_handler)
-
-    console_handler = logging.StreamHandler()
-    console_handler.setFormatter(log_formatter)
-    console_handler.addFilter(LogNonExceptionFilter())
-    console_handler.setLevel(logger_config.get_console_log_level_value())
-    _LOGGER.addHandler(console_handler)
+    _LOG_WRITER.add_file(log_file, logger_config.get_file_log_level_value())
+    _LOG_WRITER.add_console(logger_config.get_console_log_level_value())
 
 
 def configure_testcase_log_handler(logger_config: LoggerConfig, log_file: str) -> None:
@@ -281,61 +291,37 @@ def configure_testcase_log_handler(logger_config: LoggerConfig, log_file: str) -
     logger_config.increment_testcase_log_index()
     numbered_folder_name = f"{folder_number:03d}_{log_file}"
 
-    log_formatter = logging.Formatter(_LOGGER.GENERAL_LOGGER_FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
     _LOGGER.test_case_log_dir = os.path.join(_LOGGER.get_log_folder(), numbered_folder_name)
     os.makedirs(_LOGGER.test_case_log_dir, exist_ok=True)
     full_log_file_path = os.path.join(_LOGGER.test_case_log_dir, "log.txt")
     system_log = os.path.join(_LOGGER.test_case_log_dir, "system_logs")
     os.makedirs(system_log, exist_ok=True)
 
-    file_handler = logging.FileHandler(full_log_file_path)
-    file_handler.setFormatter(log_formatter)
-    file_handler.addFilter(LogNonExceptionFilter())
-    file_handler.setLevel(logger_config.get_file_log_level_value())
-    _LOGGER.addHandler(file_handler)
-
-    exception_formatter = logging.Formatter(_LOGGER.EXCEPTION_LOGGER_FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
-    exception_file_handler = logging.FileHandler(full_log_file_path)
-    exception_file_handler.setFormatter(exception_formatter)
-    exception_file_handler.addFilter(LogExceptionFilter())
-    exception_file_handler.setLevel(logger_config.get_file_log_level_value())
-    _LOGGER.addHandler(exception_file_handler)
+    if logger_config.get_compress_testcase_logs():
+        _LOG_WRITER.add_file(f"{full_log_file_path}.gz", logger_config.get_file_log_level_value(), compress=True)
+    else:
+        _LOG_WRITER.add_file(full_log_file_path, logger_config.get_file_log_level_value())
 
 
 def remove_testcase_handler(test_name: str) -> None:
     """
-    Remove the testcase handler for the given test.
+    Stop writing to the log of the given test, once everything logged so far is in it, and close it.
 
     Args:
-        test_name (str): The test name whose log handler should be removed.
+        test_name (str): The test name whose log should be closed.
     """
-    for handler in _LOGGER.handlers:
-        if hasattr(handler, "baseFilename") and test_name in handler.baseFilename:
-            _LOGGER.removeHandler(handler)
+    _LOG_WRITER.remove_files(test_name)
 
 
-@staticmethod
-def _configure_exception_log_handlers(logger_config: LoggerConfig, log_file: str) -> None:
+def flush_logs(timeout: float = 30) -> None:
     """
-    This function will add the console and file handlers for Exception and stack trace logging.
+    Wait for everything logged so far to be written to the log files and the console.
 
     Args:
-        logger_config (LoggerConfig): LoggerConfig object.
-        log_file (str): Full path where we want to store the logs.
+        timeout (float): The maximum number of seconds to wait for.
     """
-    exception_formatter = logging.Formatter("%(message)s", datefmt="%Y-%m-%d %H:%M:%S")
-
-    exception_file_handler = logging.FileHandler(log_file)
-    exception_file_handler.setFormatter(exception_formatter)
-    exception_file_handler.addFilter(LogExceptionFilter())
-    exception_file_handler.setLevel(logger_config.get_file_log_level_value())
-    _LOGGER.addHandler(exception_file_handler)
-
-    exception_console_handler = logging.StreamHandler()
-    exception_console_handler.setFormatter(exception_formatter)
-    exception_console_handler.addFilter(LogExceptionFilter())
-    exception_console_handler.setLevel(logger_config.get_console_log_level_value())
-    _LOGGER.addHandler(exception_console_handler)
+    if _LOG_WRITER:
+        _LOG_WRITER.flush(timeout)
 
 
 @staticmethod
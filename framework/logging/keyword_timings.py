@@ -0,0 +1,102 @@
+import json
+import threading
+
+from config.configuration_manager import ConfigurationManager
+
+
+class KeywordTimingsClass:
+    """
+    Singleton class that records the time spent in each keyword, as a histogram per keyword.
+
+    The timings are only recorded when log_keyword_timings is set in the logger config, and they add up over all the
+    pytest sessions of the process.
+    """
+
+    # The upper bound, in seconds, of each bucket of the histograms. The last bucket holds the longer calls.
+    BUCKET_UPPER_BOUNDS = [0.001, 0.01, 0.1, 1, 10, 60, 600]
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.is_timing_enabled: bool | None = None
+        self.keyword_timings: dict[str, dict] = {}
+
+    def is_enabled(self) -> bool:
+        """
+        Checks if the keyword timings are recorded, according to the logger config.
+
+        Returns:
+            bool: True if the keyword timings are recorded. False until the configs are loaded.
+        """
+        if self.is_timing_enabled is None:
+            logger_config = ConfigurationManager.get_logger_config()
+            if not logger_config:
+                return False
+            self.is_timing_enabled = logger_config.get_log_keyword_timings()
+        return self.is_timing_enabled
+
+    def set_enabled(self, is_timing_enabled: bool):
+        """
+        Setter to record the keyword timings or not, whatever the logger config says.
+
+        Args:
+            is_timing_enabled (bool): True to record the keyword timings.
+        """
+        self.is_timing_enabled = is_timing_enabled
+
+    def record(self, keyword_name: str, duration: float):
+        """
+        Records a call to a keyword.
+
+        Args:
+            keyword_name (str): The name of the keyword, as Class.method.
+            duration (float): The time spent in the call, in seconds.
+        """
+        bucket_index = next((index for index, upper_bound in enumerate(self.BUCKET_UPPER_BOUNDS) if duration < upper_bound), len(self.BUCKET_UPPER_BOUNDS))
+        with self.lock:
+            keyword_timing = self.keyword_timings.get(keyword_name)
+            if keyword_timing is None:
+                keyword_timing = {"calls": 0, "total_seconds": 0.0, "max_seconds": 0.0, "buckets": [0] * (len(self.BUCKET_UPPER_BOUNDS) + 1)}
+                self.keyword_timings[keyword_name] = keyword_timing
+            keyword_timing["calls"] += 1
+            keyword_timing["total_seconds"] += duration
+            keyword_timing["max_seconds"] = max(keyword_timing["max_seconds"], duration)
+            keyword_timing["buckets"][bucket_index] += 1
+
+    def get_keyword_timings(self) -> dict[str, dict]:
+        """
+        Getter for the timings of each keyword, the ones with the most time spent in them first.
+
+        Returns:
+            dict[str, dict]: The number of calls, total and maximum seconds, and the number of calls in each bucket, by keyword name.
+        """
+        with self.lock:
+            return {keyword_name: dict(keyword_timing, buckets=list(keyword_timing["buckets"])) for keyword_name, keyword_timing in sorted(self.keyword_timings.items(), key=lambda item: item[1]["total_seconds"], reverse=True)}
+
+    def get_summary(self, number_of_keywords: int = 20) -> list[str]:
+        """
+        Gets a summary of the keywords with the most time spent in them.
+
+        Args:
+            number_of_keywords (int): The number of keywords to summarize.
+
+        Returns:
+            list[str]: One line per keyword.
+        """
+        summary = []
+        for keyword_name, keyword_timing in list(self.get_keyword_timings().items())[:number_of_keywords]:
+            average_seconds = keyword_timing["total_seconds"] / keyword_timing["calls"]
+            summary.append(f"{keyword_name}: {keyword_timing['calls']} calls, {keyword_timing['total_seconds']:.3f}s total, {average_seconds:.3f}s average, {keyword_timing['max_seconds']:.3f}s max")
+        return summary
+
+    def export(self, file_name: str):
+        """
+        Writes the timings of each keyword to a JSON file.
+
+        Args:
+            file_name (str): The name of the file.
+        """
+        with open(file_name, "w") as file:
+            json.dump({"bucket_upper_bounds_seconds": self.BUCKET_UPPER_BOUNDS, "keywords": self.get_keyword_timings()}, file, indent=4)
+
+
+KeywordTimings = KeywordTimingsClass()
@@ -0,0 +1,254 @@
+import gzip
+import logging
+import queue
+import sys
+import threading
+from logging.handlers import QueueHandler
+from typing import Callable, TextIO
+
+
+class LogTarget:
+    """
+    A file or console that the log records of a given level and above are written to.
+    """
+
+    def __init__(self, stream: TextIO, level: int, file_name: str | None = None):
+        """
+        Constructor
+
+        Args:
+            stream (TextIO): The stream to write to.
+            level (int): The lowest level of the records written to the stream.
+            file_name (str | None): The name of the file of the stream, None for the console.
+        """
+        self.stream = stream
+        self.level = level
+        self.file_name = file_name
+
+    def close(self):
+        """
+        Closes the stream, unless it is the console.
+        """
+        if self.file_name:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Handler that hands the log records over to the LogWriter thread, leaving the formatting and writing to it.
+
+    The queue is bounded, and a full queue blocks the logging thread until the writer catches up, rather than dropping
+    the record or growing without limit.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Prepares a record for the queue, without formatting it.
+
+        Args:
+            record (logging.LogRecord): The record.
+
+        Returns:
+            logging.LogRecord: The record, with its arguments merged into its message so that they can't change while queued.
+        """
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        """
+        Queues a record, waiting for room in the queue if it is full.
+
+        Args:
+            record (logging.LogRecord): The record.
+        """
+        self.queue.put(record)
+
+
+class LogWriter:
+    """
+    Writes the log records queued by a LogQueueHandler to the log files and the console, from a thread of its own.
+
+    Each record is formatted once, whatever the number of files it goes to, and the records are written in batches
+    through buffered files that are flushed once the queue is drained. Adding or removing a file is queued along with
+    the records, so that a file gets every record logged after it was added and before it was removed.
+    """
+
+    BATCH_SIZE = 1000
+    FILE_BUFFER_SIZE = 1024 * 1024
+
+    def __init__(self, log_queue: queue.Queue, general_format: str, exception_format: str):
+        """
+        Constructor
+
+        Args:
+            log_queue (queue.Queue): The queue of the LogQueueHandler.
+            general_format (str): The format of the records.
+            exception_format (str): The format of the records of exceptions and stack traces.
+        """
+        self.log_queue = log_queue
+        self.general_formatter = logging.Formatter(general_format, datefmt="%Y-%m-%d %H:%M:%S")
+        self.exception_formatter = logging.Formatter(exception_format, datefmt="%Y-%m-%d %H:%M:%S")
+        self.targets: list[LogTarget] = []
+        self.lowest_level = logging.CRITICAL + 1
+        self.writer_thread = threading.Thread(target=self._write_queued_records, name="log-writer", daemon=True)
+        self.writer_thread.start()
+
+    def add_file(self, file_name: str, level: int, compress: bool = False):
+        """
+        Starts writing the records of the given level and above to a file.
+
+        Args:
+            file_name (str): The name of the file, which is appended to if it exists.
+            level (int): The lowest level of the records to write.
+            compress (bool): True to write the file with gzip compression.
+        """
+        if compress:
+            stream = gzip.open(file_name, "at", encoding="utf-8")
+        else:
+            stream = open(file_name, "a", encoding="utf-8", buffering=self.FILE_BUFFER_SIZE)
+        self._run_in_writer_thread(lambda: self._add_target(LogTarget(stream, level, file_name)))
+
+    def add_console(self, level: int):
+        """
+        Starts writing the records of the given level and above to the console.
+
+        Args:
+            level (int): The lowest level of the records to write.
+        """
+        stream = sys.stderr
+        self._run_in_writer_thread(lambda: self._add_target(LogTarget(stream, level)))
+
+    def get_lowest_level(self) -> int:
+        """
+        Getter for the lowest level of the records written anywhere, to skip building records that would be dropped.
+
+        Returns:
+            int: The lowest level of the files and console, above CRITICAL if there are none.
+        """
+        return self.lowest_level
+
+    def remove_files(self, file_name_part: str):
+        """
+        Stops writing to the files whose name contains the given string, once the records queued so far are written, and closes them.
+
+        Args:
+            file_name_part (str): The string to look for in the name of the files.
+        """
+        self._run_in_writer_thread(lambda: self._remove_targets(lambda target: target.file_name is not None and file_name_part in target.file_name))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Waits for the records queued so far to be written.
+
+        Args:
+            timeout (float | None): The maximum number of seconds to wait for, None to wait as long as it takes.
+
+        Returns:
+            bool: True if the records were written in time.
+        """
+        return self._run_in_writer_thread(lambda: None, timeout)
+
+    def _run_in_writer_thread(self, function: Callable[[], None], timeout: float | None = None) -> bool:
+        """
+        Queues a function to run on the writer thread, after the records queued before it are written, and waits for it to run.
+
+        Args:
+            function (Callable[[], None]): The function.
+            timeout (float | None): The maximum number of seconds to wait for, None to wait as long as it takes.
+
+        Returns:
+            bool: True if the function ran in time.
+        """
+        if not self.writer_thread.is_alive():
+            function()
+            return True
+        function_done = threading.Event()
+        self.log_queue.put((function, function_done))
+        return function_done.wait(timeout)
+
+    def _add_target(self, target: LogTarget):
+        """
+        Starts writing to a target.
+
+        Args:
+            target (LogTarget): The target.
+        """
+        self.targets.append(target)
+        self.lowest_level = min(self.lowest_level, target.level)
+
+    def _remove_targets(self, is_target_removed: Callable[[LogTarget], bool]):
+        """
+        Flushes and closes the targets matching the given condition, and stops writing to them.
+
+        Args:
+            is_target_removed (Callable[[LogTarget], bool]): The condition.
+        """
+        for target in [target for target in self.targets if is_target_removed(target)]:
+            self.targets.remove(target)
+            try:
+                target.close()
+            except OSError as exception:
+                print(f"Unable to close the log file {target.file_name}: {exception}", file=sys.__stderr__)
+        self.lowest_level = min([target.level for target in self.targets], default=logging.CRITICAL + 1)
+
+    def _write_queued_records(self):
+        """
+        Writes the queued records in batches, running the queued functions in between, and flushes the targets whenever the queue is drained.
+        """
+        while True:
+            items = [self.log_queue.get()]
+            while len(items) < self.BATCH_SIZE:
+                try:
+                    items.append(self.log_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for item in items:
+                if isinstance(item, logging.LogRecord):
+                    self._write_record(item)
+                else:
+                    function, function_done = item
+                    self._flush_targets()
+                    try:
+                        function()
+                    except Exception as exception:
+                        print(f"Unable to update the log files: {exception}", file=sys.__stderr__)
+                    finally:
+                        function_done.set()
+            if self.log_queue.empty():
+                self._flush_targets()
+
+    def _write_record(self, record: logging.LogRecord):
+        """
+        Formats a record once, and writes it to every target of its level.
+
+        Args:
+            record (logging.LogRecord): The record.
+        """
+        formatted_record = None
+        for target in self.targets:
+            if record.levelno < target.level:
+                continue
+            try:
+                if formatted_record is None:
+                    # Exceptions and stack traces, logged by log_exception with an 'EXC' source, have a trivial format.
+                    formatter = self.exception_formatter if "EXC" in getattr(record, "source", "") else self.general_formatter
+                    formatted_record = formatter.format(record) + "\n"
+                target.stream.write(formatted_record)
+            except Exception as exception:
+                print(f"Unable to write a log record to {target.file_name or 'the console'}: {exception}", file=sys.__stderr__)
+
+    def _flush_targets(self):
+        """
+        Flushes the buffered records of every target.
+        """
+        for target in self.targets:
+            try:
+                target.stream.flush()
+            except (OSError, ValueError):
+                # As in logging.shutdown, a stream closed from under us, e.g. by pytest's capture at exit, is ignored.
+                pass
@@ -0,0 +1,65 @@
+from typing import Any, Optional
+
+from framework.database.objects.testcase import TestCase
+from framework.logging.automation_logger import get_logger
+from framework.pytest_plugins.collection_plugin import CollectionPlugin
+from framework.runner.objects.test_capability_matcher import TestCapabilityMatcher
+
+
+class CapabilityFilterPlugin:
+    """
+    Plugin that deselects the tests the lab can't run while pytest collects them.
+
+    This lets a single pytest session both collect and run the tests, rather than running a collect only pass first
+    to work out which tests to give it.
+    """
+
+    def __init__(self, repo_root: str, test_capability_matcher: TestCapabilityMatcher, capabilities: list[str], node_ids: Optional[list[str]] = None):
+        """
+        Constructor.
+
+        Args:
+            repo_root (str): The Absolute path to the root of the repo.
+            test_capability_matcher (TestCapabilityMatcher): The matcher checking the markers of the tests.
+            capabilities (list[str]): The capabilities of the lab.
+            node_ids (Optional[list[str]]): The node ids, relative to the repo root, of the only tests to keep. None to keep any test the lab can run.
+        """
+        self.collection_plugin = CollectionPlugin(repo_root)
+        self.test_capability_matcher = test_capability_matcher
+        self.capabilities = capabilities
+        self.node_ids = set(node_ids) if node_ids is not None else None
+        self.tests: list[TestCase] = []
+
+    def pytest_collection_modifyitems(self, config: Any, items: Any):
+        """
+        Run after collection, keeps the tests that were asked for and whose markers the lab has.
+
+        Args:
+            config (Any): The pytest config.
+            items (Any): list of Pytest test items, modified in place.
+        """
+        selected_items = []
+        deselected_items = []
+        for item in items:
+            test = self.collection_plugin.get_testcase(item)
+            if self.node_ids is not None and test.get_pytest_node_id() not in self.node_ids:
+                deselected_items.append(item)
+            elif not self.test_capability_matcher.is_test_runnable(test, self.capabilities):
+                get_logger().log_info(f"Skipping {test.get_pytest_node_id()}, the lab is missing some of its capabilities: {test.get_markers()}")
+                deselected_items.append(item)
+            else:
+                selected_items.append(item)
+                self.tests.append(test)
+
+        if deselected_items:
+            config.hook.pytest_deselected(items=deselected_items)
+            items[:] = selected_items
+
+    def get_tests(self) -> list[TestCase]:
+        """
+        Returns the tests that were kept.
+
+        Returns:
+            list[TestCase]: List of test cases kept during pytest collection.
+        """
+        return self.tests
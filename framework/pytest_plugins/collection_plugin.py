@@ -51,15 +51,27 @@ class CollectionPlugin:
             items (Any): list of Pytest test items.
         """
         for test in items:
-            markers = list(map(lambda marker: marker.name, test.own_markers))
-            priority = self.get_testcase_priority(markers)
-            if priority:
-                markers.remove(priority)
-
-            full_node_id = self._get_full_nodeid(test)
-            testcase = TestCase(test.name, os.path.basename(test.location[0]), priority, test.location[0], full_node_id)
-            testcase.set_markers(markers)
-            self.tests.append(testcase)
+            self.tests.append(self.get_testcase(test))
+
+    def get_testcase(self, test: Any) -> TestCase:
+        """
+        Gets the test case of a collected pytest item.
+
+        Args:
+            test (Any): The pytest test item.
+
+        Returns:
+            TestCase: The test case, with its markers other than the priority one.
+        """
+        markers = list(map(lambda marker: marker.name, test.own_markers))
+        priority = self.get_testcase_priority(markers)
+        if priority:
+            markers.remove(priority)
+
+        full_node_id = self._get_full_nodeid(test)
+        testcase = TestCase(test.name, os.path.basename(test.location[0]), priority, test.location[0], full_node_id)
+        testcase.set_markers(markers)
+        return testcase
 
     def get_tests(self) -> list[TestCase]:
         """
@@ -7,9 +7,8 @@ import pytest
 from config.configuration_manager import ConfigurationManager
 from framework.database.objects.test_case_result import TestCaseResult
 from framework.database.objects.testcase import TestCase
-from framework.database.operations.test_case_result_operation import TestCaseResultOperation
-from framework.database.operations.test_info_operation import TestInfoOperation
 from framework.logging.automation_logger import get_logger
+from framework.runner.objects.result_publisher import ResultPublisher
 from framework.runner.objects.run_context_manager import RunContextManager
 from framework.runner.objects.test_executor_summary import TestExecutorSummary
 
@@ -17,16 +16,38 @@ from framework.runner.objects.test_executor_summary import TestExecutorSummary
 class ResultCollector:
     """
     Pytest plugin that allows us to get results and add them to the test summary object
+
+    One collector can account for every test of a pytest session; the start time and failure location are reset as
+    each test starts.
     """
 
-    def __init__(self, test_executor_summary: TestExecutorSummary, test: TestCase):
+    def __init__(self, test_executor_summary: TestExecutorSummary, tests: list[TestCase] | None = None):
         self.test_executor_summary = test_executor_summary
-        self.test = test
+        self.tests: dict[tuple[str, str], TestCase] = {(test.get_test_name(), test.get_test_suite()): test for test in tests or []}
+        self.test: TestCase | None = None
         self.start_time = datetime.now()  # start time for the test
         self.failure_file_name = ""
         self.failure_function_name = ""
         self.failure_line_number = ""
 
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item: any):
+        """
+        Called before the setup of a pytest test, we then start accounting for it
+
+        Args:
+            item (any): the test
+
+        """
+        test_suite = os.path.basename(item.location[0])
+        self.test = self.tests.get((item.name, test_suite))
+        if not self.test:
+            self.test = TestCase(item.name, test_suite, None, item.location[0], item.nodeid)
+        self.start_time = datetime.now()
+        self.failure_file_name = ""
+        self.failure_function_name = ""
+        self.failure_line_number = ""
+
     @pytest.hookimpl(tryfirst=True, hookwrapper=True)
     def pytest_runtest_makereport(self, item: any, call: any):
         """
@@ -56,6 +77,7 @@ class ResultCollector:
                 self.test_executor_summary.set_last_result(report.outcome.upper())
             self.test_executor_summary.increment_test_index()
             self.test_executor_summary.append_tests_summary(f"{self.test_executor_summary.get_last_result()}      " f"{item.nodeid}")
+            self.test_executor_summary.append_test_result(self.test, self.test_executor_summary.get_last_result())
 
             # update db if configured
             if ConfigurationManager.get_database_config().use_database():
@@ -92,33 +114,12 @@ class ResultCollector:
         except Exception as exception:
             get_logger().log_error(f"Unable to parse the failure location of {self.test.get_test_name()}: {exception}")
 
-    def get_test_id(self) -> int:
-        """
-        Resolves the id that the database holds for the test case that just ran.
-
-        The test_info row is written by the test scanner rather than by the run, so the id has to
-        be looked up in whichever database we have been pointed at.
-
-        Not every database labels these test cases with the same repository, so a lookup that
-        misses is retried under 'ace' before it is given up on.
-
-        Returns:
-            int: the test_info id of the test case, None if the database has no entry for it.
-
-        """
-        test_info_operation = TestInfoOperation()
-        repository = RunContextManager.get_repository()
-
-        test_id = test_info_operation.get_info_test_id(self.test.get_test_name(), self.test.get_test_suite(), repository)
-        if test_id or repository == "ace":
-            return test_id
-
-        get_logger().log_warning(f"{self.test.get_test_suite()}::{self.test.get_test_name()} is not in the database under the repository {repository}. Looking it up under 'ace' instead.")
-        return test_info_operation.get_info_test_id(self.test.get_test_name(), self.test.get_test_suite(), "ace")
-
     def update_result_in_database(self, outcome: any) -> None:
         """
-        Inserts the result of the test case into the database
+        Hands the result of the test case to the ResultPublisher, which inserts it into the database in the background
+
+        The test_info row is written by the test scanner rather than by the run, so the publisher looks its id up in
+        whichever database we have been pointed at.
 
         Args:
             outcome (any): the result of the test
@@ -134,16 +135,11 @@ class ResultCollector:
         else:
             outcome = "FAIL"
 
-        test_id = self.get_test_id()
-        if not test_id:
-            get_logger().log_error(f"There is no test_info entry for {self.test.get_test_suite()}::{self.test.get_test_name()}. The result of this test case was not recorded.")
-            return
-
-        test_case_result = TestCaseResult(test_id, outcome, self.start_time, datetime.now())
+        test_case_result = TestCaseResult(None, outcome, self.start_time, datetime.now())
         test_case_result.set_session_id(RunContextManager.get_session_id())
         test_case_result.set_jenkins_log_location(RunContextManager.get_jenkins_log_location() or "")
         test_case_result.set_failure_file_name(self.failure_file_name)
         test_case_result.set_failure_function_name(self.failure_function_name)
         test_case_result.set_failure_line_number(self.failure_line_number)
 
-        TestCaseResultOperation().create_test_case_result(test_case_result)
+        ResultPublisher.publish(test_case_result, self.test.get_test_name(), self.test.get_test_suite(), RunContextManager.get_repository())
@@ -1,34 +1,37 @@
 import socket
 import threading
 
-import paramiko
+from config.host.objects.host_configuration import HostConfiguration
+from framework.ssh.jump_host_transport_manager import JumpHostTransportManager
 
 
 class _ParamikoForwardServer(threading.Thread):
     """Local TCP server that forwards connections through a paramiko channel.
 
     Listens on a local port and for each accepted connection opens a
-    direct-tcpip channel through the jump host to the target host:port,
-    then shuttles data between the two sockets.
+    direct-tcpip channel through the shared jump host transport to the
+    target host:port, then shuttles data between the two sockets.
     """
 
-    def __init__(self, local_port: int, remote_host: str, remote_port: int, jump_transport: paramiko.Transport):
+    def __init__(self, local_port: int, remote_host: str, remote_port: int, jump_host_config: HostConfiguration, local_bind_address: str = "127.0.0.1"):
         """Initialize the forward server.
 
         Args:
             local_port (int): Local port to listen on.
             remote_host (str): Remote host to forward to.
             remote_port (int): Remote port to forward to.
-            jump_transport (paramiko.Transport): Paramiko transport of the jump host connection.
+            jump_host_config (HostConfiguration): Jump host whose shared transport is used to open the channels.
+            local_bind_address (str): Local address to listen on.
         """
         super().__init__(daemon=True)
         self._local_port = local_port
         self._remote_host = remote_host
         self._remote_port = remote_port
-        self._jump_transport = jump_transport
-        self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._jump_host_config = jump_host_config
+        address_family = socket.AF_INET6 if ":" in local_bind_address else socket.AF_INET
+        self._server_socket = socket.socket(address_family, socket.SOCK_STREAM)
         self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self._server_socket.bind(("127.0.0.1", local_port))
+        self._server_socket.bind((local_bind_address, local_port))
         self._server_socket.listen(5)
         self._server_socket.settimeout(1.0)
         self._stop_event = threading.Event()
@@ -51,11 +54,7 @@ class _ParamikoForwardServer(threading.Thread):
             client_sock (socket.socket): The accepted local client socket.
         """
         try:
-            channel = self._jump_transport.open_channel(
-                "direct-tcpip",
-                (self._remote_host, self._remote_port),
-                ("127.0.0.1", 0),
-            )
+            channel = JumpHostTransportManager.open_channel(self._jump_host_config, self._remote_host, self._remote_port)
         except Exception:
             client_sock.close()
             return
@@ -2,11 +2,14 @@ import requests
 from urllib3.exceptions import InsecureRequestWarning
 
 from framework.rest.rest_response import RestResponse
+from framework.rest.rest_session_pool import RestSessionPool
 
 
 class RestClient:
     """
     Rest client used for making any rest calls
+
+    The calls go through the RestSessionPool, which keeps the connections to each base URL alive between calls.
     """
 
     def __init__(self):
@@ -22,7 +25,7 @@ class RestClient:
         Returns:
             RestResponse: An object representing the response of the GET request.
         """
-        response = requests.get(url, headers=headers, verify=False)
+        response = RestSessionPool.request("GET", url, headers=headers)
         return RestResponse(response)
 
     def post(self, url: str, data: dict | str | None = None, headers: dict | list | None = None) -> RestResponse:
@@ -36,7 +39,7 @@ class RestClient:
         Returns:
             RestResponse: An object containing the response from the request.
         """
-        response = requests.post(url, headers=headers, data=data, verify=False)
+        response = RestSessionPool.request("POST", url, headers=headers, data=data)
         return RestResponse(response)
 
     def delete(self, url: str, headers: dict | None = None) -> RestResponse:
@@ -50,7 +53,7 @@ class RestClient:
         Returns:
             RestResponse: The response from the DELETE request.
         """
-        response = requests.delete(url, headers=headers, verify=False)
+        response = RestSessionPool.request("DELETE", url, headers=headers)
         return RestResponse(response)
 
     def patch(self, url: str, data: dict | str | None = None, headers: dict | None = None) -> RestResponse:
@@ -65,7 +68,7 @@ class RestClient:
         Returns:
             RestResponse: The response from the PATCH request.
         """
-        response = requests.patch(url, headers=headers, json=data, verify=False)
+        response = RestSessionPool.request("PATCH", url, headers=headers, json=data)
         return RestResponse(response)
 
     def put(self, url: str, data: dict | str | None = None, headers: dict | None = None) -> RestResponse:
@@ -80,5 +83,5 @@ class RestClient:
         Returns:
             RestResponse: The response from the PUT request.
         """
-        response = requests.put(url, headers=headers, json=data, verify=False)
+        response = RestSessionPool.request("PUT", url, headers=headers, json=data)
         return RestResponse(response)
@@ -1,6 +1,8 @@
 import json
 from requests import Response
 
+from framework.rest.rest_session_pool import RestSessionPool
+
 
 class RestResponse:
     """
@@ -32,4 +34,20 @@ class RestResponse:
 
         Returns: the headers
         """
-        return self.response.headers
\ No newline at end of file
+        return self.response.headers
+
+    def get_elapsed_time(self) -> float:
+        """
+        Gets the time taken by the request, from sending it to receiving the response headers
+
+        Returns: the number of seconds
+        """
+        return self.response.elapsed.total_seconds()
+
+    def get_endpoint(self) -> str:
+        """
+        Gets the endpoint of the request, the one its latency is recorded under in the RestSessionPool
+
+        Returns: the method and path of the request, with the ids in the path replaced by {id}
+        """
+        return RestSessionPool.get_endpoint(self.response.request.method, self.response.url)
@@ -0,0 +1,164 @@
+import json
+import re
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class RestSessionPoolClass:
+    """
+    Singleton class that keeps one requests session per base URL, so that the rest calls reuse their connections.
+
+    Each session keeps up to POOL_SIZE connections alive to its host, which saves a TCP and TLS handshake per call,
+    and through the jump host a new direct-tcpip channel per call. The idempotent methods are retried on connection
+    errors and on the gateway errors of a platform that is restarting its services. The sessions are shared by all the
+    clients of the process, so they reject cookies: a call never sends a cookie set by another client. The latency of
+    the calls is kept per endpoint, with the ids in their path replaced by {id}.
+    """
+
+    POOL_SIZE = 10
+    CONNECT_TIMEOUT_SECONDS = 30
+    READ_TIMEOUT_SECONDS = 300
+    RETRIES = 3
+    RETRY_BACKOFF_FACTOR = 0.5
+    RETRY_STATUSES = (502, 503, 504)
+    IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+    # UUIDs, Keystone ids and numbers in the path of a URL.
+    ID_PATTERN = re.compile(r"^([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{32}|\d+)$", re.IGNORECASE)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sessions: dict[str, requests.Session] = {}
+        self.latency_metrics: dict[str, dict] = {}
+
+    def request(self, method: str, url: str, **kwargs: object) -> requests.Response:
+        """
+        Runs a request through the session of the base URL of the given url.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL for the request.
+            **kwargs (object): The arguments of requests.Session.request, e.g. headers, data or json.
+
+        Returns:
+            requests.Response: The response.
+        """
+        kwargs.setdefault("timeout", (self.CONNECT_TIMEOUT_SECONDS, self.READ_TIMEOUT_SECONDS))
+        response = self.get_session(url).request(method, url, verify=False, **kwargs)
+        self.record_latency(self.get_endpoint(method, url), response.elapsed.total_seconds())
+        return response
+
+    def get_session(self, url: str) -> requests.Session:
+        """
+        Gets the session of the base URL of the given url, creating it on first use.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            requests.Session: The session.
+        """
+        base_url = self.get_base_url(url)
+        with self.lock:
+            session = self.sessions.get(base_url)
+            if session is None:
+                session = requests.Session()
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                retry = Retry(
+                    total=self.RETRIES,
+                    backoff_factor=self.RETRY_BACKOFF_FACTOR,
+                    status_forcelist=self.RETRY_STATUSES,
+                    allowed_methods=self.IDEMPOTENT_METHODS,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.POOL_SIZE, max_retries=retry)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self.sessions[base_url] = session
+            return session
+
+    def close_sessions(self, url: str | None = None):
+        """
+        Closes the sessions and their connections.
+
+        Args:
+            url (str | None): A URL whose base URL session is closed. None to close all of them.
+        """
+        with self.lock:
+            base_urls = [self.get_base_url(url)] if url else list(self.sessions.keys())
+            for base_url in base_urls:
+                session = self.sessions.pop(base_url, None)
+                if session:
+                    session.close()
+
+    def get_base_url(self, url: str) -> str:
+        """
+        Gets the base URL of the given url.
+
+        Args:
+            url (str): The URL.
+
+        Returns:
+            str: The scheme and network location of the URL.
+        """
+        parsed_url = urlparse(url)
+        return f"{parsed_url.scheme}://{parsed_url.netloc}"
+
+    def get_endpoint(self, method: str, url: str) -> str:
+        """
+        Gets the endpoint of a call, to aggregate the latency of the calls to the same resource.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL.
+
+        Returns:
+            str: The method and path of the URL, with the ids in the path replaced by {id}.
+        """
+        path_segments = ["{id}" if self.ID_PATTERN.match(segment) else segment for segment in urlparse(url).path.split("/")]
+        return f"{method.upper()} {'/'.join(path_segments)}"
+
+    def record_latency(self, endpoint: str, elapsed_time: float):
+        """
+        Records the latency of a call.
+
+        Args:
+            endpoint (str): The endpoint of the call.
+            elapsed_time (float): The time taken by the call, in seconds.
+        """
+        with self.lock:
+            latency_metric = self.latency_metrics.get(endpoint)
+            if latency_metric is None:
+                latency_metric = {"calls": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+                self.latency_metrics[endpoint] = latency_metric
+            latency_metric["calls"] += 1
+            latency_metric["total_seconds"] += elapsed_time
+            latency_metric["max_seconds"] = max(latency_metric["max_seconds"], elapsed_time)
+
+    def get_latency_metrics(self) -> dict[str, dict]:
+        """
+        Getter for the latency of each endpoint, the ones with the most time spent in them first.
+
+        Returns:
+            dict[str, dict]: The number of calls, total and maximum seconds, by endpoint.
+        """
+        with self.lock:
+            return {endpoint: dict(latency_metric) for endpoint, latency_metric in sorted(self.latency_metrics.items(), key=lambda item: item[1]["total_seconds"], reverse=True)}
+
+    def export_latency_metrics(self, file_name: str):
+        """
+        Writes the latency of each endpoint to a JSON file.
+
+        Args:
+            file_name (str): The name of the file.
+        """
+        with open(file_name, "w") as file:
+            json.dump(self.get_latency_metrics(), file, indent=4)
+
+
+RestSessionPool = RestSessionPoolClass()
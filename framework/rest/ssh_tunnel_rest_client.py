@@ -1,5 +1,4 @@
 import threading
-import time
 from urllib.parse import urlparse
 
 import paramiko
@@ -7,23 +6,28 @@ import requests
 from urllib3.exceptions import InsecureRequestWarning
 
 from config.configuration_manager import ConfigurationManager
+from config.host.objects.host_configuration import HostConfiguration
 from framework.rest.paramiko_forward_server import _find_free_port, _ParamikoForwardServer
 from framework.rest.rest_response import RestResponse
+from framework.rest.rest_session_pool import RestSessionPool
+from framework.ssh.jump_host_transport_manager import JumpHostTransportManager
 
 
 class SSHTunnelRestClient:
     """REST client that routes HTTP requests through a paramiko-based port forwarder.
 
-    Uses the same paramiko jump host connection mechanism as SSHConnection
+    Uses the same shared jump host transport as SSHConnection and SSHTunnel
     (direct-tcpip channels) rather than the sshtunnel library, which is
     incompatible with this jump host configuration.
 
     One forwarder is created per unique remote port and reused for all
-    subsequent requests to that port.
+    subsequent requests to that port. The RestSessionPool keeps the
+    connections to the forwarder alive, so that the requests also reuse
+    their direct-tcpip channels.
     """
 
     # Class-level state shared across all instances
-    _jump_client: paramiko.SSHClient = None
+    _jump_host_config: HostConfiguration = None  # Set while the shared jump host transport is held
     _forwarders: dict = {}  # remote_port -> (forwarder, local_port)
     _lock = threading.Lock()
 
@@ -34,6 +38,8 @@ class SSHTunnelRestClient:
     def _get_jump_transport(cls) -> paramiko.Transport:
         """Return a live paramiko transport to the jump host, connecting if needed.
 
+        The transport is the one shared with every other user of the jump host.
+
         Returns:
             paramiko.Transport: Active transport for the jump host connection.
 
@@ -41,37 +47,13 @@ class SSHTunnelRestClient:
             Exception: If the jump host connection cannot be established.
         """
         with cls._lock:
-            if cls._jump_client and cls._jump_client.get_transport() and cls._jump_client.get_transport().is_active():
-                return cls._jump_client.get_transport()
-
-            config = ConfigurationManager.get_lab_config()
-            jump_host_config = config.get_jump_host_configuration()
+            if not cls._jump_host_config:
+                jump_host_config = ConfigurationManager.get_lab_config().get_jump_host_configuration()
+                transport = JumpHostTransportManager.acquire(jump_host_config)
+                cls._jump_host_config = jump_host_config
+                return transport
 
-            client = paramiko.SSHClient()
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy)
-
-            retries = 3
-            retry_delay = 5
-            last_exception = None
-            for attempt in range(1, retries + 1):
-                try:
-                    client.connect(
-                        jump_host_config.get_host(),
-                        port=jump_host_config.get_ssh_port(),
-                        username=jump_host_config.get_credentials().get_user_name(),
-                        password=jump_host_config.get_credentials().get_password(),
-                        timeout=30,
-                        allow_agent=True,
-                        look_for_keys=True,
-                    )
-                    cls._jump_client = client
-                    return client.get_transport()
-                except Exception as exception:
-                    last_exception = exception
-                    if attempt < retries:
-                        time.sleep(retry_delay)
-
-            raise last_exception
+            return JumpHostTransportManager.get_transport(cls._jump_host_config)
 
     @classmethod
     def _get_forwarder_for_port(cls, remote_host: str, remote_port: int) -> int:
@@ -93,10 +75,11 @@ class SSHTunnelRestClient:
                 if forwarder.is_alive():
                     return local_port
                 forwarder.stop()
+                cls._close_forwarder_sessions(local_port)
                 del cls._forwarders[remote_port]
 
         # Get transport outside the lock to avoid deadlock with _get_jump_transport
-        transport = cls._get_jump_transport()
+        cls._get_jump_transport()
 
         with cls._lock:
             # Double-check after acquiring lock
@@ -107,11 +90,21 @@ class SSHTunnelRestClient:
                     return local_port
 
             local_port = _find_free_port()
-            forwarder = _ParamikoForwardServer(local_port, remote_host, remote_port, transport)
+            forwarder = _ParamikoForwardServer(local_port, remote_host, remote_port, cls._jump_host_config)
             forwarder.start()
             cls._forwarders[remote_port] = (forwarder, local_port)
             return local_port
 
+    @staticmethod
+    def _close_forwarder_sessions(local_port: int) -> None:
+        """Close the pooled sessions whose connections go through the forwarder listening on the given local port.
+
+        Args:
+            local_port (int): The local port of the forwarder.
+        """
+        for scheme in ("https", "http"):
+            RestSessionPool.close_sessions(f"{scheme}://127.0.0.1:{local_port}")
+
     def _rewrite_url(self, url: str) -> str:
         """Rewrite a URL to route through the paramiko port forwarder.
 
@@ -186,7 +179,7 @@ class SSHTunnelRestClient:
         """
         headers_dict = self._normalize_headers(headers)
         modified_url = self._rewrite_url(url)
-        response = requests.get(modified_url, headers=headers_dict, verify=False)
+        response = RestSessionPool.request("GET", modified_url, headers=headers_dict)
         return RestResponse(response)
 
     def post(self, url: str, data: str | bytes | dict, headers: dict | list | None) -> RestResponse:
@@ -202,7 +195,7 @@ class SSHTunnelRestClient:
         """
         headers_dict = self._normalize_headers(headers)
         modified_url = self._rewrite_url(url)
-        response = requests.post(modified_url, headers=headers_dict, data=data, verify=False)
+        response = RestSessionPool.request("POST", modified_url, headers=headers_dict, data=data)
         return RestResponse(response)
 
     def delete(self, url: str, headers: dict | list | None = None) -> RestResponse:
@@ -217,7 +210,7 @@ class SSHTunnelRestClient:
         """
         headers_dict = self._normalize_headers(headers)
         modified_url = self._rewrite_url(url)
-        response = requests.delete(modified_url, headers=headers_dict, verify=False)
+        response = RestSessionPool.request("DELETE", modified_url, headers=headers_dict)
         return RestResponse(response)
 
     def patch(self, url: str, data: dict | str | None = None, headers: dict | list | None = None) -> RestResponse:
@@ -233,7 +226,7 @@ class SSHTunnelRestClient:
         """
         headers_dict = self._normalize_headers(headers)
         modified_url = self._rewrite_url(url)
-        response = requests.patch(modified_url, headers=headers_dict, json=data, verify=False)
+        response = RestSessionPool.request("PATCH", modified_url, headers=headers_dict, json=data)
         return RestResponse(response)
 
     def put(self, url: str, data: dict | str | None = None, headers: dict | list | None = None) -> RestResponse:
@@ -249,18 +242,20 @@ class SSHTunnelRestClient:
         """
         headers_dict = self._normalize_headers(headers)
         modified_url = self._rewrite_url(url)
-        response = requests.put(modified_url, headers=headers_dict, json=data, verify=False)
+        response = RestSessionPool.request("PUT", modified_url, headers=headers_dict, json=data)
         return RestResponse(response)
 
     def close(self) -> None:
-        """Stop all port forwarders and close the jump host connection."""
+        """Stop all port forwarders and release the shared jump host transport."""
         with SSHTunnelRestClient._lock:
-            for _, (forwarder, _) in list(SSHTunnelRestClient._forwarders.items()):
+            for _, (forwarder, local_port) in list(SSHTunnelRestClient._forwarders.items()):
                 forwarder.stop()
+                # The connections kept alive to the forwarder go with it; its sessions are created again on the next request.
+                SSHTunnelRestClient._close_forwarder_sessions(local_port)
             SSHTunnelRestClient._forwarders.clear()
-            if SSHTunnelRestClient._jump_client:
+            if SSHTunnelRestClient._jump_host_config:
                 try:
-                    SSHTunnelRestClient._jump_client.close()
+                    JumpHostTransportManager.release(SSHTunnelRestClient._jump_host_config)
                 except Exception:
                     pass
-                SSHTunnelRestClient._jump_client = None
+                SSHTunnelRestClient._jump_host_config = None
@@ -0,0 +1,68 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Hashable
+
+
+class TokenCacheClass:
+    """
+    Singleton class that shares the authentication tokens of the process, so that they are only requested again once they are about to expire.
+
+    The tokens are kept by a key identifying the credentials and scope they were issued for. Each key has its own lock,
+    so that the threads asking for the same token at the same time wait for a single request of it.
+    """
+
+    # Tokens are renewed this long before they expire, so that a call never goes out with an expired token.
+    REFRESH_MARGIN = timedelta(minutes=5)
+    # The lifetime of the tokens whose expiry is not known, the default of Keystone.
+    DEFAULT_TOKEN_LIFETIME = timedelta(hours=1)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.key_locks: dict[Hashable, threading.Lock] = {}
+        self.tokens: dict[Hashable, tuple[str, datetime]] = {}
+
+    def get_token(self, key: Hashable, request_token: Callable[[], tuple[str | None, datetime | None]], stale_token: str | None = None) -> str | None:
+        """
+        Gets the token of the given key, requesting it if it is not cached, about to expire or stale.
+
+        Args:
+            key (Hashable): The key identifying the credentials and scope of the token.
+            request_token (Callable[[], tuple[str | None, datetime | None]]): The function requesting a token, returning it with its expiry, None for a failed request.
+            stale_token (str | None): A token that was refused, to request a new one unless another thread already did.
+
+        Returns:
+            str | None: The token, None if it could not be requested.
+        """
+        with self.lock:
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            cached_token = self.tokens.get(key)
+            if cached_token:
+                token, expires_at = cached_token
+                if token != stale_token and datetime.now(timezone.utc) < expires_at - self.REFRESH_MARGIN:
+                    return token
+
+            token, expires_at = request_token()
+            with self.lock:
+                if token:
+                    self.tokens[key] = (token, expires_at or datetime.now(timezone.utc) + self.DEFAULT_TOKEN_LIFETIME)
+                else:
+                    self.tokens.pop(key, None)
+            return token
+
+    def invalidate(self, key: Hashable | None = None):
+        """
+        Forgets the cached tokens, e.g. after the credentials were changed.
+
+        Args:
+            key (Hashable | None): The key of the token to forget. None to forget all of them.
+        """
+        with self.lock:
+            if key is None:
+                self.tokens.clear()
+            else:
+                self.tokens.pop(key, None)
+
+
+TokenCache = TokenCacheClass()
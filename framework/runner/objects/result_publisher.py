@@ -0,0 +1,347 @@
+import glob
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from config.configuration_manager import ConfigurationManager
+from framework.database.objects.test_case_result import TestCaseResult
+from framework.database.operations.test_case_result_operation import TestCaseResultOperation
+from framework.database.operations.test_info_operation import TestInfoOperation
+from framework.logging.automation_logger import get_logger
+
+
+class ResultPublisherClass:
+    """
+    Singleton class that writes the results of the test cases to the database from a background thread.
+
+    A published result is appended to a spool file before it is queued, and only removed from the spool once it is in
+    the database. The results of a run therefore survive a database outage or a crash of the run: the spool files left
+    behind by a run that is no longer alive are replayed by the next one. The results are inserted in batches, and the
+    test cases never wait on the database.
+    """
+
+    QUEUE_SIZE = 1000
+    BATCH_SIZE = 50
+    BATCH_WAIT_SECONDS = 1
+    RETRY_INTERVAL_SECONDS = 30
+    SPOOL_FOLDER_NAME = "result_spool"
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.result_queue: queue.Queue = queue.Queue(self.QUEUE_SIZE)
+        self.pending_results: dict[str, dict] = {}
+        self.publishing_record_ids: set[str] = set()
+        self.spool_folder: str | None = None
+        self.publisher_thread: threading.Thread | None = None
+        self.stop_event = threading.Event()
+
+    def get_spool_folder(self) -> str:
+        """
+        Getter for the folder holding the spool files, under the log location of the logger config by default.
+
+        Returns:
+            str: the spool folder
+
+        """
+        if self.spool_folder is None:
+            self.spool_folder = os.path.join(ConfigurationManager.get_logger_config().get_log_location(), self.SPOOL_FOLDER_NAME)
+        return self.spool_folder
+
+    def set_spool_folder(self, spool_folder: str):
+        """
+        Setter for the folder holding the spool files
+
+        Args:
+            spool_folder (str): the spool folder
+
+        """
+        self.spool_folder = spool_folder
+
+    def get_spool_file(self) -> str:
+        """
+        Getter for the spool file of this process
+
+        Returns:
+            str: the spool file, holding one JSON result per line
+
+        """
+        return os.path.join(self.get_spool_folder(), f"result_spool_{os.getpid()}.jsonl")
+
+    def get_pending_results_count(self) -> int:
+        """
+        Getter for the number of results that are not in the database yet
+
+        Returns:
+            int: the number of pending results
+
+        """
+        with self.lock:
+            return len(self.pending_results)
+
+    def publish(self, test_case_result: TestCaseResult, test_name: str, test_suite: str, repository: str):
+        """
+        Spools the result of a test case and queues it to be written to the database, without waiting on the database.
+
+        Args:
+            test_case_result (TestCaseResult): the result, whose test id is looked up when it is written
+            test_name (str): the name of the test case
+            test_suite (str): the suite of the test case
+            repository (str): the repository that owns the test case
+
+        """
+        record = {
+            "record_id": str(uuid.uuid4()),
+            "test_name": test_name,
+            "test_suite": test_suite,
+            "repository": repository,
+            "result": test_case_result.get_result(),
+            "start_time": test_case_result.get_start_time().isoformat(),
+            "end_time": test_case_result.get_end_time().isoformat(),
+            "session_id": test_case_result.get_session_id(),
+            "log_hostname": test_case_result.get_log_hostname(),
+            "log_location": test_case_result.get_log_location(),
+            "jenkins_log_location": test_case_result.get_jenkins_log_location(),
+            "failure_file_name": test_case_result.get_failure_file_name(),
+            "failure_function_name": test_case_result.get_failure_function_name(),
+            "failure_line_number": test_case_result.get_failure_line_number(),
+        }
+        with self.lock:
+            self._start()
+            self.pending_results[record["record_id"]] = record
+            with open(self.get_spool_file(), "a") as spool_file:
+                spool_file.write(json.dumps(record) + "\n")
+                spool_file.flush()
+                os.fsync(spool_file.fileno())
+
+        try:
+            self.result_queue.put_nowait(record["record_id"])
+        except queue.Full:
+            get_logger().log_warning(f"The result queue is full. The result of {test_suite}::{test_name} is kept in the spool until the next flush.")
+
+    def flush(self, timeout: int = 300) -> int:
+        """
+        Waits for the queued results to be written, then tries once more to write the results left in the spool.
+
+        The results that still could not be written stay in the spool, to be replayed by the next run.
+
+        Args:
+            timeout (int): the maximum number of seconds to wait for
+
+        Returns:
+            int: the number of results left in the spool
+
+        """
+        end_time = time.monotonic() + timeout
+        with self.lock:
+            publisher_thread = self.publisher_thread
+            self.publisher_thread = None
+        if publisher_thread:
+            # From now on, a failed batch is left for the sweep below instead of being retried by the thread.
+            self.stop_event.set()
+            try:
+                self.result_queue.put(None, timeout=max(0, end_time - time.monotonic()))
+                publisher_thread.join(max(0, end_time - time.monotonic()))
+            except queue.Full:
+                get_logger().log_warning("Timed out waiting for the result publisher to catch up.")
+            self.stop_event.clear()
+
+        with self.lock:
+            record_ids = [record_id for record_id in self.pending_results if record_id not in self.publishing_record_ids]
+        for index in range(0, len(record_ids), self.BATCH_SIZE):
+            if time.monotonic() >= end_time or not self._publish_records(record_ids[index : index + self.BATCH_SIZE]):
+                break
+
+        pending_results_count = self.get_pending_results_count()
+        if pending_results_count:
+            get_logger().log_warning(f"{pending_results_count} results could not be written to the database. They are kept in {self.get_spool_file()} and will be replayed by the next run.")
+        return pending_results_count
+
+    def _start(self):
+        """
+        Starts the publisher thread if it isn't running, after loading the spool files of the runs that are no longer alive.
+
+        Must be called with the lock held.
+        """
+        if self.publisher_thread and self.publisher_thread.is_alive():
+            return
+        os.makedirs(self.get_spool_folder(), exist_ok=True)
+
+        replayed_record_ids = []
+        claimed_spool_file_names = []
+        for spool_file_name in glob.glob(os.path.join(self.get_spool_folder(), "result_spool_*.jsonl")):
+            claimed_spool_file_name = self._claim_spool_file(spool_file_name)
+            if claimed_spool_file_name is None:
+                continue
+            with open(claimed_spool_file_name) as spool_file:
+                records = [json.loads(line) for line in spool_file if line.endswith("\n")]
+            for record in records:
+                if record["record_id"] not in self.pending_results:
+                    self.pending_results[record["record_id"]] = record
+                    replayed_record_ids.append(record["record_id"])
+            if claimed_spool_file_name != self.get_spool_file():
+                claimed_spool_file_names.append(claimed_spool_file_name)
+        if replayed_record_ids:
+            get_logger().log_info(f"Replaying {len(replayed_record_ids)} results left in the spool by a previous run.")
+            self._write_spool()
+        # The claimed files are only removed once their results are in the spool file of this process.
+        for claimed_spool_file_name in claimed_spool_file_names:
+            os.remove(claimed_spool_file_name)
+
+        self.publisher_thread = threading.Thread(target=self._publish_queued_results, name="result-publisher", daemon=True)
+        self.publisher_thread.start()
+        for record_id in replayed_record_ids:
+            try:
+                self.result_queue.put_nowait(record_id)
+            except queue.Full:
+                break
+
+    def _claim_spool_file(self, spool_file_name: str) -> str | None:
+        """
+        Takes over the spool file of a run that is no longer alive.
+
+        Args:
+            spool_file_name (str): the spool file
+
+        Returns:
+            str | None: the name of the spool file once claimed, None if it belongs to a live run or another run
+            claimed it first. The spool file of this process is returned as is.
+
+        """
+        owner_pid = int(os.path.basename(spool_file_name)[len("result_spool_") : -len(".jsonl")])
+        if owner_pid == os.getpid():
+            return spool_file_name
+        try:
+            os.kill(owner_pid, 0)
+            return None
+        except ProcessLookupError:
+            pass
+        except PermissionError:
+            return None
+
+        # Renaming is atomic, so only one of several runs starting at the same time gets the file.
+        claimed_spool_file_name = f"{self.get_spool_file()}.claimed-{owner_pid}"
+        try:
+            os.rename(spool_file_name, claimed_spool_file_name)
+        except FileNotFoundError:
+            return None
+        return claimed_spool_file_name
+
+    def _write_spool(self):
+        """
+        Rewrites the spool file of this process with the pending results.
+
+        Must be called with the lock held.
+        """
+        temporary_spool_file_name = f"{self.get_spool_file()}.tmp"
+        with open(temporary_spool_file_name, "w") as spool_file:
+            for record in self.pending_results.values():
+                spool_file.write(json.dumps(record) + "\n")
+            spool_file.flush()
+            os.fsync(spool_file.fileno())
+        os.replace(temporary_spool_file_name, self.get_spool_file())
+
+    def _publish_queued_results(self):
+        """
+        Writes the queued results in batches until the stop sentinel is queued, retrying the batches that fail.
+        """
+        is_stopping = False
+        while not is_stopping:
+            record_ids = []
+            batch_end_time = None
+            while len(record_ids) < self.BATCH_SIZE:
+                try:
+                    record_id = self.result_queue.get(timeout=None if batch_end_time is None else max(0, batch_end_time - time.monotonic()))
+                except queue.Empty:
+                    break
+                if record_id is None:
+                    is_stopping = True
+                    break
+                if batch_end_time is None:
+                    batch_end_time = time.monotonic() + self.BATCH_WAIT_SECONDS
+                record_ids.append(record_id)
+
+            while not self._publish_records(record_ids) and not self.stop_event.wait(self.RETRY_INTERVAL_SECONDS):
+                pass
+
+    def _publish_records(self, record_ids: list[str]) -> bool:
+        """
+        Writes the given pending results to the database, and removes them from the spool once they are in.
+
+        Args:
+            record_ids (list[str]): the ids of the results
+
+        Returns:
+            bool: False if the database could not be reached, in which case the results are kept in the spool
+
+        """
+        with self.lock:
+            records = [self.pending_results[record_id] for record_id in record_ids if record_id in self.pending_results and record_id not in self.publishing_record_ids]
+            self.publishing_record_ids.update(record["record_id"] for record in records)
+        if not records:
+            return True
+
+        try:
+            test_keys = {(record["test_name"], record["test_suite"], repository) for record in records for repository in (record["repository"], "ace")}
+            test_ids = TestInfoOperation().get_info_test_ids(list(test_keys))
+
+            test_case_results = []
+            for record in records:
+                test_case_result = self._get_test_case_result(record, test_ids)
+                if test_case_result:
+                    test_case_results.append(test_case_result)
+            if test_case_results:
+                TestCaseResultOperation().create_test_case_results(test_case_results)
+        except Exception as exception:
+            get_logger().log_error(f"Unable to write {len(records)} results to the database, they are kept in the spool: {exception}")
+            with self.lock:
+                self.publishing_record_ids.difference_update(record["record_id"] for record in records)
+            return False
+
+        with self.lock:
+            for record in records:
+                self.publishing_record_ids.discard(record["record_id"])
+                self.pending_results.pop(record["record_id"], None)
+            self._write_spool()
+        return True
+
+    def _get_test_case_result(self, record: dict, test_ids: dict[tuple[str, str, str], int]) -> TestCaseResult | None:
+        """
+        Gets the test case result of a spooled result.
+
+        Not every database labels the test cases with the same repository, so a lookup that misses is retried under
+        'ace' before it is given up on.
+
+        Args:
+            record (dict): the spooled result
+            test_ids (dict[tuple[str, str, str], int]): the test_info ids, by test name, test suite and repository
+
+        Returns:
+            TestCaseResult | None: the test case result, None if the database has no entry for its test case
+
+        """
+        test_name = record["test_name"]
+        test_suite = record["test_suite"]
+        test_id = test_ids.get((test_name, test_suite, record["repository"]))
+        if not test_id and record["repository"] != "ace":
+            get_logger().log_warning(f"{test_suite}::{test_name} is not in the database under the repository {record['repository']}. Looking it up under 'ace' instead.")
+            test_id = test_ids.get((test_name, test_suite, "ace"))
+        if not test_id:
+            get_logger().log_error(f"There is no test_info entry for {test_suite}::{test_name}. The result of this test case was not recorded.")
+            return None
+
+        test_case_result = TestCaseResult(test_id, record["result"], datetime.fromisoformat(record["start_time"]), datetime.fromisoformat(record["end_time"]))
+        test_case_result.set_session_id(record["session_id"])
+        test_case_result.set_log_hostname(record["log_hostname"])
+        test_case_result.set_log_location(record["log_location"])
+        test_case_result.set_jenkins_log_location(record["jenkins_log_location"])
+        test_case_result.set_failure_file_name(record["failure_file_name"])
+        test_case_result.set_failure_function_name(record["failure_function_name"])
+        test_case_result.set_failure_line_number(record["failure_line_number"])
+        return test_case_result
+
+
+ResultPublisher = ResultPublisherClass()
@@ -1,12 +1,10 @@
-import pytest
-
 from config.lab.objects.lab_config import LabConfig
 from framework.database.objects.testcase import TestCase
 from framework.database.operations.lab_capability_operation import LabCapabilityOperation
 from framework.database.operations.lab_operation import LabOperation
 from framework.database.operations.run_content_operation import RunContentOperation
-from framework.pytest_plugins.collection_plugin import CollectionPlugin
 from framework.resources.resource_finder import get_stx_repo_root
+from framework.scanning.objects.collection_index import CollectionIndex
 
 
 class TestCapabilityMatcher:
@@ -35,7 +33,7 @@ class TestCapabilityMatcher:
         Returns:
             list[TestCase]: List of tests that can be run.
         """
-        tests = self._get_all_tests_in_folder(test_case_folder)
+        tests = self.get_all_tests_in_folder(test_case_folder)
         capabilities = self.lab_config.get_lab_capabilities()
 
         return self._filter_tests(tests, capabilities)
@@ -54,13 +52,34 @@ class TestCapabilityMatcher:
         run_content_operation = RunContentOperation()
         tests = run_content_operation.get_tests_from_run_content(run_id)
 
+        return self._filter_tests(tests, self.get_lab_capabilities_from_db())
+
+    def get_lab_capabilities_from_db(self) -> list[str]:
+        """
+        Getter for the capabilities of this lab in the database.
+
+        Returns:
+            list[str]: The capability markers of the lab.
+        """
         lab_operation = LabOperation()
         lab_id = lab_operation.get_lab_id(self.lab_config.get_lab_name())
 
         lab_capability_operation = LabCapabilityOperation()
-        capabilities = list(map(lambda capability: capability.get_capability_marker(), lab_capability_operation.get_lab_capabilities(lab_id)))
+        return list(map(lambda capability: capability.get_capability_marker(), lab_capability_operation.get_lab_capabilities(lab_id)))
 
-        return self._filter_tests(tests, capabilities)
+    def is_test_runnable(self, test: TestCase, capabilities: list[str]) -> bool:
+        """
+        Checks if the given test can run on a lab with the given capabilities.
+
+        Args:
+            test (TestCase): The test case.
+            capabilities (list[str]): The capabilities.
+
+        Returns:
+            bool: True if the lab has every capability marker of the test.
+        """
+        markers = self._get_markers(test)
+        return not markers or set(markers).issubset(capabilities)
 
     def _filter_tests(self, tests: list[TestCase], capabilities: list[str]) -> list[TestCase]:
         """
@@ -75,12 +94,11 @@ class TestCapabilityMatcher:
         """
         tests_to_run = []
         for test in tests:
-            markers = self._get_markers(test)
-            if not markers or set(markers).issubset(capabilities):
+            if self.is_test_runnable(test, capabilities):
                 tests_to_run.append(test)
         return tests_to_run
 
-    def _get_all_tests_in_folder(self, test_case_folder: str) -> list[TestCase]:
+    def get_all_tests_in_folder(self, test_case_folder: str) -> list[TestCase]:
         """
         Gets all tests in the testcase folder.
 
@@ -90,10 +108,7 @@ class TestCapabilityMatcher:
         Returns:
             list[TestCase]: List of test cases found in the folder.
         """
-        repo_root = get_stx_repo_root()
-        collection_plugin = CollectionPlugin(repo_root)
-        pytest.main(["--collect-only", test_case_folder], plugins=[collection_plugin])
-        return collection_plugin.get_tests()
+        return CollectionIndex(get_stx_repo_root()).get_tests(test_case_folder)
 
     def _get_markers(self, test: TestCase) -> list[str]:
         """
@@ -1,3 +1,6 @@
+from framework.database.objects.testcase import TestCase
+
+
 class TestExecutorSummary:
     """
     Test Executor class
@@ -7,6 +10,7 @@ class TestExecutorSummary:
         self.test_index: int = 1
         self.tests_summary: list[str] = []
         self.last_result: str | None = None
+        self.test_results: list[tuple[TestCase, str]] = []
 
     def increment_test_index(self):
         """
@@ -76,3 +80,24 @@ class TestExecutorSummary:
 
         """
         return self.last_result
+
+    def append_test_result(self, test: TestCase, result: str):
+        """
+        Adds the final result of a test case
+
+        Args:
+            test (TestCase): the test case
+            result (str): its result, such as PASSED or FAILED
+
+        """
+        self.test_results.append((test, result))
+
+    def get_test_results(self) -> list[tuple[TestCase, str]]:
+        """
+        Getter for the final results of the test cases, in the order they ran
+
+        Returns:
+            list[tuple[TestCase, str]]: the test case and result of each test
+
+        """
+        return self.test_results
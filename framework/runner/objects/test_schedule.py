@@ -0,0 +1,88 @@
+from framework.database.objects.testcase import TestCase
+
+
+class TestSchedule:
+    """
+    The split of the tests of a run across several labs, with the time each lab is expected to take.
+    """
+
+    def __init__(self, lab_config_files: list[str]):
+        self.lab_tests: dict[str, list[TestCase]] = {lab_config_file: [] for lab_config_file in lab_config_files}
+        self.planned_durations: dict[str, float] = {lab_config_file: 0.0 for lab_config_file in lab_config_files}
+        self.unassigned_tests: list[TestCase] = []
+
+    def assign_test(self, lab_config_file: str, test: TestCase, duration: float):
+        """
+        Assigns a test to a lab
+
+        Args:
+            lab_config_file (str): the lab config file of the lab
+            test (TestCase): the test
+            duration (float): the expected duration of the test, in seconds
+
+        """
+        self.lab_tests[lab_config_file].append(test)
+        self.planned_durations[lab_config_file] += duration
+
+    def add_unassigned_test(self, test: TestCase):
+        """
+        Adds a test that none of the labs can run
+
+        Args:
+            test (TestCase): the test
+
+        """
+        self.unassigned_tests.append(test)
+
+    def get_lab_config_files(self) -> list[str]:
+        """
+        Getter for the lab config files of the labs, in the order they were given
+
+        Returns:
+            list[str]: the lab config files
+        """
+        return list(self.lab_tests.keys())
+
+    def get_lab_tests(self, lab_config_file: str) -> list[TestCase]:
+        """
+        Getter for the tests assigned to a lab
+
+        Args:
+            lab_config_file (str): the lab config file of the lab
+
+        Returns:
+            list[TestCase]: the tests, longest first
+        """
+        return self.lab_tests[lab_config_file]
+
+    def get_planned_duration(self, lab_config_file: str) -> float:
+        """
+        Getter for the time a lab is expected to take to run its tests
+
+        Args:
+            lab_config_file (str): the lab config file of the lab
+
+        Returns:
+            float: the sum of the expected durations of its tests, in seconds
+        """
+        return self.planned_durations[lab_config_file]
+
+    def get_unassigned_tests(self) -> list[TestCase]:
+        """
+        Getter for the tests that none of the labs can run
+
+        Returns:
+            list[TestCase]: the tests
+        """
+        return self.unassigned_tests
+
+    def get_summary(self) -> list[str]:
+        """
+        Gets a summary of the schedule, with one line per lab and one per test no lab can run
+
+        Returns:
+            list[str]: the summary lines
+        """
+        summary = [f"{lab_config_file}: {len(tests)} tests, planned duration {round(self.planned_durations[lab_config_file])}s" for lab_config_file, tests in self.lab_tests.items()]
+        summary.extend(f"No lab can run {test.get_pytest_node_id()}, missing capabilities: {test.get_markers()}" for test in self.unassigned_tests)
+        return summary
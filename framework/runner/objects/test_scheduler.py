@@ -0,0 +1,98 @@
+import heapq
+
+from config.lab.objects.lab_config import LabConfig
+from framework.database.objects.testcase import TestCase
+from framework.database.operations.test_case_result_operation import TestCaseResultOperation
+from framework.runner.objects.test_capability_matcher import TestCapabilityMatcher
+from framework.runner.objects.test_schedule import TestSchedule
+
+
+class TestScheduler:
+    """
+    Class to split the tests of a run across several labs, so that they all finish at about the same time.
+
+    The tests are assigned longest first, each to the lab that can run it with the least work assigned so far, using
+    the durations of their recent results in the database.
+    """
+
+    DEFAULT_TEST_DURATION_SECONDS = 300
+
+    def __init__(self, lab_config_files: list[str]):
+        """
+        Constructor
+
+        Args:
+            lab_config_files (list[str]): The lab config files of the labs to run the tests on.
+        """
+        self.lab_configs: dict[str, LabConfig] = {lab_config_file: LabConfig(lab_config_file) for lab_config_file in lab_config_files}
+
+    def get_lab_capabilities(self, use_database: bool) -> dict[str, list[str]]:
+        """
+        Getter for the capabilities of each lab.
+
+        Args:
+            use_database (bool): True to get the capabilities of the labs from the database rather than from their config.
+
+        Returns:
+            dict[str, list[str]]: The capability markers, by lab config file.
+        """
+        lab_capabilities = {}
+        for lab_config_file, lab_config in self.lab_configs.items():
+            if use_database:
+                lab_capabilities[lab_config_file] = TestCapabilityMatcher(lab_config).get_lab_capabilities_from_db()
+            else:
+                lab_capabilities[lab_config_file] = lab_config.get_lab_capabilities()
+        return lab_capabilities
+
+    def get_test_durations(self, tests: list[TestCase]) -> dict[int, float]:
+        """
+        Getter for the durations of the recent results of the given tests in the database.
+
+        Args:
+            tests (list[TestCase]): The tests.
+
+        Returns:
+            dict[int, float]: The average duration in seconds, by test_info id, of the tests that have results.
+        """
+        test_info_ids = {test.get_test_info_id() for test in tests if test.get_test_info_id() != -1}
+        if not test_info_ids:
+            return {}
+        return TestCaseResultOperation().get_average_durations(list(test_info_ids))
+
+    def create_schedule(self, tests: list[TestCase], lab_capabilities: dict[str, list[str]], test_durations: dict[int, float]) -> TestSchedule:
+        """
+        Assigns the tests to the labs, longest first, each to the lab with the least work that can run it.
+
+        Args:
+            tests (list[TestCase]): The tests to run.
+            lab_capabilities (dict[str, list[str]]): The capability markers, by lab config file.
+            test_durations (dict[int, float]): The expected duration in seconds, by test_info id. The tests without one
+                are expected to take the average of the others.
+
+        Returns:
+            TestSchedule: The tests of each lab.
+        """
+        test_schedule = TestSchedule(list(self.lab_configs.keys()))
+        default_duration = sum(test_durations.values()) / len(test_durations) if test_durations else self.DEFAULT_TEST_DURATION_SECONDS
+
+        test_capability_matchers = {lab_config_file: TestCapabilityMatcher(lab_config) for lab_config_file, lab_config in self.lab_configs.items()}
+        # The labs are kept in a heap by the work assigned so far, then by the order they were given in.
+        lab_loads = [(0.0, lab_index, lab_config_file) for lab_index, lab_config_file in enumerate(self.lab_configs.keys())]
+
+        timed_tests = [(test_durations.get(test.get_test_info_id(), default_duration), test) for test in tests]
+        for duration, test in sorted(timed_tests, key=lambda timed_test: timed_test[0], reverse=True):
+            postponed_labs = []
+            while lab_loads:
+                lab_load = heapq.heappop(lab_loads)
+                lab_config_file = lab_load[2]
+                if test_capability_matchers[lab_config_file].is_test_runnable(test, lab_capabilities[lab_config_file]):
+                    test_schedule.assign_test(lab_config_file, test, duration)
+                    heapq.heappush(lab_loads, (lab_load[0] + duration, lab_load[1], lab_config_file))
+                    break
+                postponed_labs.append(lab_load)
+            else:
+                test_schedule.add_unassigned_test(test)
+            for lab_load in postponed_labs:
+                heapq.heappush(lab_loads, lab_load)
+
+        return test_schedule
@@ -1,6 +1,8 @@
+import multiprocessing
 import os
 import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from optparse import OptionParser
 from typing import Optional
 
@@ -12,10 +14,14 @@ from framework.database.objects.testcase import TestCase
 from framework.database.operations.run_content_operation import RunContentOperation
 from framework.database.operations.run_operation import RunOperation
 from framework.database.operations.test_plan_operation import TestPlanOperation
-from framework.logging.automation_logger import get_logger
+from framework.logging.automation_logger import flush_logs, get_logger
+from framework.pytest_plugins.capability_filter_plugin import CapabilityFilterPlugin
 from framework.pytest_plugins.result_collector import ResultCollector
+from framework.resources.resource_finder import get_stx_repo_root
+from framework.runner.objects.result_publisher import ResultPublisher
 from framework.runner.objects.test_capability_matcher import TestCapabilityMatcher
 from framework.runner.objects.test_executor_summary import TestExecutorSummary
+from framework.runner.objects.test_scheduler import TestScheduler
 from testcases.conftest import log_configuration
 
 
@@ -31,17 +37,213 @@ def execute_test(test: TestCase, test_executor_summary: TestExecutorSummary, ses
         repository (Optional[str], optional): The repository that owns this test case. Defaults to None.
 
     """
-    result_collector = ResultCollector(test_executor_summary, test)
+    result_collector = ResultCollector(test_executor_summary, [test])
+    pytest_args = get_pytest_args([test.get_pytest_node_id()], session_id, jenkins_log_location, repository)
+
+    pytest.main(pytest_args, plugins=[result_collector])
+
+
+def execute_tests_in_single_session(
+    test_locations: list[str],
+    capability_filter_plugin: CapabilityFilterPlugin,
+    test_executor_summary: TestExecutorSummary,
+    tests: Optional[list[TestCase]] = None,
+    session_id: Optional[str] = None,
+    jenkins_log_location: Optional[str] = None,
+    repository: Optional[str] = None,
+):
+    """
+    Executes the test cases in a single pytest session, which collects them only once.
+
+    Args:
+        test_locations (list[str]): The test files or folders to collect the test cases from.
+        capability_filter_plugin (CapabilityFilterPlugin): The plugin selecting the test cases to run among the collected ones.
+        test_executor_summary (TestExecutorSummary): The test executor summary object.
+        tests (Optional[list[TestCase]], optional): The test cases from the database, if they come from there. Defaults to None.
+        session_id (Optional[str], optional): The session that the results of these test cases belong to. Defaults to None.
+        jenkins_log_location (Optional[str], optional): The URL of the jenkins job that started this run. Defaults to None.
+        repository (Optional[str], optional): The repository that owns these test cases. Defaults to None.
+
+    """
+    result_collector = ResultCollector(test_executor_summary, tests)
+    pytest_args = get_pytest_args(test_locations, session_id, jenkins_log_location, repository)
+
+    pytest.main(pytest_args, plugins=[capability_filter_plugin, result_collector])
+
+
+def get_pytest_args(test_locations: list[str], session_id: Optional[str] = None, jenkins_log_location: Optional[str] = None, repository: Optional[str] = None) -> list[str]:
+    """
+    Gets the pytest arguments to run the given test cases with.
+
+    Args:
+        test_locations (list[str]): The node ids, files or folders of the test cases.
+        session_id (Optional[str], optional): The session that the results belong to. Defaults to None.
+        jenkins_log_location (Optional[str], optional): The URL of the jenkins job that started this run. Defaults to None.
+        repository (Optional[str], optional): The repository that owns the test cases. Defaults to None.
+
+    Returns:
+        list[str]: The pytest arguments.
+
+    """
     pytest_args = ConfigurationManager.get_config_pytest_args()
-    pytest_args.append(test.get_pytest_node_id())
+    pytest_args.extend(test_locations)
     if session_id:
         pytest_args.append(f"--session_id={session_id}")
     if jenkins_log_location:
         pytest_args.append(f"--jenkins_log_location={jenkins_log_location}")
     if repository:
         pytest_args.append(f"--repository={repository}")
+    return pytest_args
 
-    pytest.main(pytest_args, plugins=[result_collector])
+
+def get_test_files(tests: list[TestCase]) -> list[str]:
+    """
+    Gets the files holding the given test cases, skipping the ones that no longer exist.
+
+    A single node id that pytest can't find fails the whole session, so the session is given the files and the test
+    cases are picked from them as they are collected.
+
+    Args:
+        tests (list[TestCase]): The test cases.
+
+    Returns:
+        list[str]: The full paths of the test files.
+
+    """
+    test_files = []
+    for test in tests:
+        test_file = os.path.join(get_stx_repo_root(), test.get_pytest_node_id().split("::")[0])
+        if test_file in test_files:
+            continue
+        if not os.path.isfile(test_file):
+            get_logger().log_warning(f"Skipping {test.get_pytest_node_id()}, {test_file} does not exist.")
+            continue
+        test_files.append(test_file)
+    return test_files
+
+
+def execute_lab_shard(
+    configuration_locations_manager: ConfigurationFileLocationsManager,
+    lab_config_file: str,
+    tests: list[TestCase],
+    capabilities: list[str],
+    single_session: bool = False,
+    session_id: Optional[str] = None,
+    jenkins_log_location: Optional[str] = None,
+    repository: Optional[str] = None,
+) -> TestExecutorSummary:
+    """
+    Executes the test cases assigned to one lab of a sharded run. This runs in a worker process of its own.
+
+    Args:
+        configuration_locations_manager (ConfigurationFileLocationsManager): The config files of the run.
+        lab_config_file (str): The lab config file of the lab to run the test cases on.
+        tests (list[TestCase]): The test cases assigned to the lab.
+        capabilities (list[str]): The capabilities of the lab.
+        single_session (bool): True to run the test cases in a single pytest session. Defaults to False.
+        session_id (Optional[str], optional): The session that the results of these test cases belong to. Defaults to None.
+        jenkins_log_location (Optional[str], optional): The URL of the jenkins job that started this run. Defaults to None.
+        repository (Optional[str], optional): The repository that owns these test cases. Defaults to None.
+
+    Returns:
+        TestExecutorSummary: The results of the test cases of the lab.
+
+    """
+    configuration_locations_manager.set_lab_config_file(lab_config_file)
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    test_executor_summary = TestExecutorSummary()
+
+    if single_session:
+        capability_filter_plugin = CapabilityFilterPlugin(get_stx_repo_root(), TestCapabilityMatcher(ConfigurationManager.get_lab_config()), capabilities, [test.get_pytest_node_id() for test in tests])
+        execute_tests_in_single_session(get_test_files(tests), capability_filter_plugin, test_executor_summary, tests, session_id, jenkins_log_location, repository)
+    else:
+        for test in tests:
+            execute_test(test, test_executor_summary, session_id, jenkins_log_location, repository)
+
+    if ConfigurationManager.get_database_config().use_database():
+        ResultPublisher.flush()
+    return test_executor_summary
+
+
+def execute_sharded_run(
+    lab_config_files: list[str],
+    configuration_locations_manager: ConfigurationFileLocationsManager,
+    test_executor_summary: TestExecutorSummary,
+    run_id: Optional[int] = None,
+    tests_location: Optional[str] = None,
+    single_session: bool = False,
+    session_id: Optional[str] = None,
+    jenkins_log_location: Optional[str] = None,
+    repository: Optional[str] = None,
+):
+    """
+    Splits the test cases across several labs and runs them in parallel, with one worker process per lab.
+
+    Args:
+        lab_config_files (list[str]): The lab config files of the labs.
+        configuration_locations_manager (ConfigurationFileLocationsManager): The config files of the run.
+        test_executor_summary (TestExecutorSummary): The test executor summary object, given the results of every lab.
+        run_id (Optional[int], optional): The run of the database to get the test cases from. Defaults to None.
+        tests_location (Optional[str], optional): The folder to get the test cases from, if there is no run_id. Defaults to None.
+        single_session (bool): True to run the test cases of each lab in a single pytest session. Defaults to False.
+        session_id (Optional[str], optional): The session that the results of these test cases belong to. Defaults to None.
+        jenkins_log_location (Optional[str], optional): The URL of the jenkins job that started this run. Defaults to None.
+        repository (Optional[str], optional): The repository that owns these test cases. Defaults to None.
+
+    """
+    use_database = ConfigurationManager.get_database_config().use_database()
+    test_scheduler = TestScheduler(lab_config_files)
+    if run_id is not None:
+        tests = RunContentOperation().get_tests_from_run_content(run_id)
+    else:
+        tests = TestCapabilityMatcher(ConfigurationManager.get_lab_config()).get_all_tests_in_folder(tests_location)
+
+    lab_capabilities = test_scheduler.get_lab_capabilities(use_database)
+    test_durations = test_scheduler.get_test_durations(tests) if use_database else {}
+    test_schedule = test_scheduler.create_schedule(tests, lab_capabilities, test_durations)
+    for summary_line in test_schedule.get_summary():
+        get_logger().log_info(summary_line)
+
+    lab_summaries: dict[str, TestExecutorSummary] = {}
+    scheduled_lab_config_files = [lab_config_file for lab_config_file in test_schedule.get_lab_config_files() if test_schedule.get_lab_tests(lab_config_file)]
+    if scheduled_lab_config_files:
+        # The configs are loaded once per process, so every lab needs a process of its own rather than a thread.
+        with ProcessPoolExecutor(max_workers=len(scheduled_lab_config_files), mp_context=multiprocessing.get_context("spawn")) as executor:
+            futures = {}
+            for lab_config_file in scheduled_lab_config_files:
+                future = executor.submit(
+                    execute_lab_shard,
+                    configuration_locations_manager,
+                    lab_config_file,
+                    test_schedule.get_lab_tests(lab_config_file),
+                    lab_capabilities[lab_config_file],
+                    single_session,
+                    session_id,
+                    jenkins_log_location,
+                    repository,
+                )
+                futures[future] = lab_config_file
+            for future in as_completed(futures):
+                try:
+                    lab_summaries[futures[future]] = future.result()
+                except Exception as exception:
+                    get_logger().log_error(f"The tests of {futures[future]} did not complete: {exception}")
+
+    for lab_config_file in scheduled_lab_config_files:
+        test_executor_summary.append_tests_summary(f"{lab_config_file}:")
+        lab_summary = lab_summaries.get(lab_config_file)
+        if not lab_summary:
+            test_executor_summary.append_tests_summary("The tests of this lab did not complete, see the log above.")
+            continue
+        for summary_line in lab_summary.get_tests_summary():
+            test_executor_summary.append_tests_summary(summary_line)
+        for test, result in lab_summary.get_test_results():
+            test_executor_summary.append_test_result(test, result)
+
+    for test in test_schedule.get_unassigned_tests():
+        test_executor_summary.append_tests_summary(f"NOT RUN      {test.get_pytest_node_id()} (no lab has the capabilities {test.get_markers()})")
+    if not tests:
+        test_executor_summary.append_tests_summary("There is no available test case to run.")
 
 
 def log_summary(test_executor_summary: TestExecutorSummary):
@@ -92,6 +294,20 @@ def main():
 
     parser.add_option("--jenkins_log_location", action="store", type="str", dest="jenkins_log_location", help="the URL of the jenkins job that started this run")
     parser.add_option("--repository", action="store", type="str", dest="repository", help="the repository that owns the test cases of this run")
+    parser.add_option(
+        "--single_session",
+        action="store_true",
+        dest="single_session",
+        default=False,
+        help="run all the test cases in a single pytest session rather than starting one per test case",
+    )
+    parser.add_option(
+        "--lab_config_files",
+        action="store",
+        type="str",
+        dest="lab_config_files",
+        help="a comma separated list of lab config files of equivalent labs to split the test cases across",
+    )
 
     configuration_locations_manager = ConfigurationFileLocationsManager()
     configuration_locations_manager.set_configs_from_options_parser(parser)
@@ -108,7 +324,9 @@ def main():
     repository = options.repository
 
     test_capability_matcher = TestCapabilityMatcher(ConfigurationManager.get_lab_config())
+    test_executor_summary = TestExecutorSummary()
 
+    run_id = None
     if ConfigurationManager.get_database_config().use_database() and not session_id:
         if not options.test_plan_id:
             raise "You must specify a --test_plan_id that points to the test plan to run from"
@@ -116,21 +334,43 @@ def main():
         test_plan = TestPlanOperation().get_test_plan(options.test_plan_id)
         run_id = RunOperation().create_run(test_plan.get_test_plan_name(), test_plan.get_run_type_id(), "24.09")  # need to decide on where this comes from
         RunContentOperation().create_run_content(options.test_plan_id, run_id)
+    elif not options.tests_location:
+        raise "You must specify a --tests_location that points to the folder for the tests"
 
-        tests = test_capability_matcher.get_list_of_tests_from_db(run_id)
+    if options.lab_config_files:
+        lab_config_files = [lab_config_file.strip() for lab_config_file in options.lab_config_files.split(",")]
+        execute_sharded_run(lab_config_files, configuration_locations_manager, test_executor_summary, run_id, options.tests_location, options.single_session, session_id, jenkins_log_location, repository)
     else:
-        if not options.tests_location:
-            raise "You must specify a --tests_location that points to the folder for the tests"
-        tests = test_capability_matcher.get_list_of_tests(options.tests_location)
-
-    test_executor_summary = TestExecutorSummary()
-
-    if not tests:
-        test_executor_summary.append_tests_summary("There is no available test case to run that match the lab's capabilities.")
-        test_executor_summary.append_tests_summary("Please review your lab configuration file.")
-
-    for test in tests:
-        execute_test(test, test_executor_summary, session_id, jenkins_log_location, repository)
+        if run_id is not None:
+            tests = test_capability_matcher.get_list_of_tests_from_db(run_id)
+            if options.single_session and tests:
+                # The markers of the database are checked again against the ones collected, in case they are out of date.
+                capability_filter_plugin = CapabilityFilterPlugin(get_stx_repo_root(), test_capability_matcher, test_capability_matcher.get_lab_capabilities_from_db(), [test.get_pytest_node_id() for test in tests])
+                execute_tests_in_single_session(get_test_files(tests), capability_filter_plugin, test_executor_summary, tests, session_id, jenkins_log_location, repository)
+                tests = capability_filter_plugin.get_tests()
+        elif options.single_session:
+            capability_filter_plugin = CapabilityFilterPlugin(get_stx_repo_root(), test_capability_matcher, ConfigurationManager.get_lab_config().get_lab_capabilities())
+            execute_tests_in_single_session([options.tests_location], capability_filter_plugin, test_executor_summary, None, session_id, jenkins_log_location, repository)
+            tests = capability_filter_plugin.get_tests()
+        else:
+            tests = test_capability_matcher.get_list_of_tests(options.tests_location)
+
+        if not tests:
+            test_executor_summary.append_tests_summary("There is no available test case to run that match the lab's capabilities.")
+            test_executor_summary.append_tests_summary("Please review your lab configuration file.")
+
+        if not options.single_session:
+            for test in tests:
+                execute_test(test, test_executor_summary, session_id, jenkins_log_location, repository)
+
+    if run_id is not None:
+        execution_statuses = [(test.get_run_content_id(), "PASS" if result == "PASSED" else "FAIL") for test, result in test_executor_summary.get_test_results() if test.get_run_content_id() != -1]
+        if execution_statuses:
+            RunContentOperation().update_execution_statuses(execution_statuses)
+
+    # The results are written to the database in the background, so wait for the last ones before exiting.
+    if ConfigurationManager.get_database_config().use_database():
+        ResultPublisher.flush()
 
     log_summary(test_executor_summary)
 
@@ -138,6 +378,8 @@ def main():
     def force_exit_timer():
         time.sleep(10)
         get_logger().log_warning("Process did not exit naturally, forcing exit...")
+        # os._exit skips the exit handlers, so the logs still queued have to be written first.
+        flush_logs()
         os._exit(0)
 
     timer_thread = threading.Thread(target=force_exit_timer, daemon=True)
@@ -0,0 +1,266 @@
+import ast
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from framework.database.objects.testcase import TestCase
+from framework.logging.automation_logger import get_logger
+from framework.pytest_plugins.collection_plugin import CollectionPlugin
+
+
+class CollectionIndex:
+    """
+    Persistent index of the tests of the repo, to avoid importing every test module to find out which tests it holds.
+
+    The index keeps the tests of each test file with the size, modification time and hash of the file, so that only
+    the files that changed are read again. The tests of a changed file are read from its syntax tree when it only uses
+    plain test functions and @mark decorators; the other files are collected by pytest, in a single session.
+    """
+
+    INDEX_VERSION = 1
+    INDEX_FILE = os.path.join(".pytest_cache", "collection_index.json")
+    IGNORED_FOLDERS = {"__pycache__", "build", "dist", "node_modules", "venv", "CVS", "_darcs", "{arch}"}
+
+    def __init__(self, repo_root: str):
+        """
+        Constructor.
+
+        Args:
+            repo_root (str): The Absolute path to the root of the repo.
+        """
+        self.repo_root = repo_root
+        self.index_file = os.path.join(repo_root, self.INDEX_FILE)
+        self.collection_plugin = CollectionPlugin(repo_root)
+
+    def get_tests(self, test_location: str) -> list[TestCase]:
+        """
+        Gets the tests in the given folder or file, reading only the test files that changed since the last call.
+
+        Args:
+            test_location (str): The folder or file of the tests, relative to the current folder or absolute. A pytest node id is collected by pytest.
+
+        Returns:
+            list[TestCase]: The tests, in the order pytest collects them.
+        """
+        if "::" in test_location:
+            return self._collect_with_pytest([test_location])
+
+        indexed_files = self._load_index()
+        is_index_changed = False
+        test_files = self._get_test_files(os.path.abspath(test_location))
+        files_to_collect: dict[str, dict] = {}
+
+        for test_file in test_files:
+            relative_path = Path(test_file).relative_to(self.repo_root).as_posix()
+            file_stat = os.stat(test_file)
+            indexed_file = indexed_files.get(relative_path)
+            if indexed_file and indexed_file["mtime_ns"] == file_stat.st_mtime_ns and indexed_file["size"] == file_stat.st_size:
+                continue
+
+            with open(test_file, "rb") as file:
+                source = file.read()
+            file_entry = {"mtime_ns": file_stat.st_mtime_ns, "size": file_stat.st_size, "sha256": hashlib.sha256(source).hexdigest()}
+            if indexed_file and indexed_file["sha256"] == file_entry["sha256"]:
+                file_entry["tests"] = indexed_file["tests"]
+            else:
+                file_entry["tests"] = self._get_tests_from_source(relative_path, source)
+                if file_entry["tests"] is None:
+                    files_to_collect[test_file] = file_entry
+                    continue
+            indexed_files[relative_path] = file_entry
+            is_index_changed = True
+
+        if files_to_collect:
+            get_logger().log_debug(f"Collecting {len(files_to_collect)} test files with pytest")
+            collected_tests: dict[str, list[dict]] = {}
+            for test in self._collect_with_pytest(list(files_to_collect.keys())):
+                test_entry = self._get_test_entry(test)
+                collected_tests.setdefault(test_entry["test_path"], []).append(test_entry)
+            for test_file, file_entry in files_to_collect.items():
+                relative_path = Path(test_file).relative_to(self.repo_root).as_posix()
+                # A file that pytest could not collect is not indexed, so that it is collected again next time.
+                if relative_path in collected_tests:
+                    file_entry["tests"] = collected_tests[relative_path]
+                    indexed_files[relative_path] = file_entry
+                    is_index_changed = True
+
+        for relative_path in list(indexed_files.keys()):
+            if not os.path.isfile(os.path.join(self.repo_root, relative_path)):
+                del indexed_files[relative_path]
+                is_index_changed = True
+        if is_index_changed:
+            self._save_index(indexed_files)
+
+        tests = []
+        for test_file in test_files:
+            relative_path = Path(test_file).relative_to(self.repo_root).as_posix()
+            for test_entry in indexed_files.get(relative_path, {}).get("tests", []):
+                tests.append(self._get_testcase(test_entry))
+        return tests
+
+    def _get_test_files(self, test_location: str) -> list[str]:
+        """
+        Gets the test files pytest would collect in the given folder, in the order it would collect them.
+
+        Args:
+            test_location (str): The absolute path of the folder or file.
+
+        Returns:
+            list[str]: The absolute paths of the test files.
+        """
+        if os.path.isfile(test_location):
+            return [test_location]
+
+        test_files = []
+        for entry in sorted(os.scandir(test_location), key=lambda directory_entry: directory_entry.name):
+            if entry.is_dir():
+                if not entry.name.startswith(".") and entry.name not in self.IGNORED_FOLDERS and not entry.name.endswith(".egg"):
+                    test_files.extend(self._get_test_files(entry.path))
+            elif entry.name.endswith(".py") and (entry.name.startswith("test_") or entry.name.endswith("_test.py")):
+                test_files.append(entry.path)
+        return test_files
+
+    def _get_tests_from_source(self, relative_path: str, source: bytes) -> list[dict] | None:
+        """
+        Reads the tests of a test file from its syntax tree, without importing it.
+
+        Args:
+            relative_path (str): The path of the file, relative to the repo root.
+            source (bytes): The content of the file.
+
+        Returns:
+            list[dict] | None: The index entries of the tests, None if the file has to be collected by pytest, e.g. because of test classes, parametrized tests or module level markers.
+        """
+        try:
+            module = ast.parse(source)
+        except SyntaxError:
+            return None
+
+        test_markers: dict[str, list[str]] = {}
+        for node in module.body:
+            if isinstance(node, (ast.If, ast.Try, ast.With, ast.For, ast.While)):
+                return None
+            if isinstance(node, ast.ClassDef) and node.name.startswith("Test"):
+                return None
+            if isinstance(node, ast.ImportFrom) and any((alias.asname or alias.name).startswith("test") for alias in node.names):
+                return None
+            if isinstance(node, (ast.Assign, ast.AnnAssign)):
+                targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+                if any(not isinstance(target, ast.Name) or target.id == "pytestmark" or target.id.startswith("test") for target in targets):
+                    return None
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name.startswith("test"):
+                markers = []
+                for decorator in node.decorator_list:
+                    marker = self._get_marker_name(decorator)
+                    if marker is None or marker == "parametrize":
+                        return None
+                    markers.append(marker)
+                # Decorators are applied bottom up, which is the order pytest gives the markers in.
+                markers.reverse()
+                test_markers[node.name] = markers
+
+        tests = []
+        for test_name, markers in test_markers.items():
+            priority = self.collection_plugin.get_testcase_priority(markers)
+            if priority:
+                markers.remove(priority)
+            tests.append({"test_name": test_name, "priority": priority, "test_path": relative_path, "pytest_node_id": f"{relative_path}::{test_name}", "markers": markers})
+        return tests
+
+    def _get_marker_name(self, decorator: ast.expr) -> str | None:
+        """
+        Gets the name of the marker a decorator applies.
+
+        Args:
+            decorator (ast.expr): The decorator.
+
+        Returns:
+            str | None: The name of the marker, None if the decorator is not a pytest.mark or mark one.
+        """
+        if isinstance(decorator, ast.Call):
+            decorator = decorator.func
+        if not isinstance(decorator, ast.Attribute):
+            return None
+        mark = decorator.value
+        if isinstance(mark, ast.Name) and mark.id == "mark":
+            return decorator.attr
+        if isinstance(mark, ast.Attribute) and mark.attr == "mark" and isinstance(mark.value, ast.Name) and mark.value.id == "pytest":
+            return decorator.attr
+        return None
+
+    def _collect_with_pytest(self, test_locations: list[str]) -> list[TestCase]:
+        """
+        Collects the tests of the given locations with pytest.
+
+        Args:
+            test_locations (list[str]): The files, folders or node ids.
+
+        Returns:
+            list[TestCase]: The tests.
+        """
+        collection_plugin = CollectionPlugin(self.repo_root)
+        pytest.main(["--collect-only"] + test_locations, plugins=[collection_plugin])
+        return collection_plugin.get_tests()
+
+    def _get_test_entry(self, test: TestCase) -> dict:
+        """
+        Gets the index entry of a test.
+
+        Args:
+            test (TestCase): The test.
+
+        Returns:
+            dict: The index entry.
+        """
+        # The test path pytest gives is relative to its rootdir, which depends on the locations it was given.
+        test_path = test.get_pytest_node_id().split("::")[0]
+        return {"test_name": test.get_test_name(), "priority": test.get_priority(), "test_path": test_path, "pytest_node_id": test.get_pytest_node_id(), "markers": test.get_markers()}
+
+    def _get_testcase(self, test_entry: dict) -> TestCase:
+        """
+        Gets the test of an index entry.
+
+        Args:
+            test_entry (dict): The index entry.
+
+        Returns:
+            TestCase: The test.
+        """
+        testcase = TestCase(test_entry["test_name"], os.path.basename(test_entry["test_path"]), test_entry["priority"], test_entry["test_path"], test_entry["pytest_node_id"])
+        testcase.set_markers(list(test_entry["markers"]))
+        return testcase
+
+    def _load_index(self) -> dict[str, dict]:
+        """
+        Loads the index, ignoring it if it is missing, unreadable or from another version of this class.
+
+        Returns:
+            dict[str, dict]: The index entries, by path of the test file relative to the repo root.
+        """
+        try:
+            with open(self.index_file) as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if index.get("version") != self.INDEX_VERSION:
+            return {}
+        return index["files"]
+
+    def _save_index(self, indexed_files: dict[str, dict]):
+        """
+        Saves the index, replacing the previous one atomically so that concurrent runs never read half of it.
+
+        Args:
+            indexed_files (dict[str, dict]): The index entries, by path of the test file relative to the repo root.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+            temporary_index_file = f"{self.index_file}.{os.getpid()}.tmp"
+            with open(temporary_index_file, "w") as file:
+                json.dump({"version": self.INDEX_VERSION, "files": indexed_files}, file)
+            os.replace(temporary_index_file, self.index_file)
+        except OSError as exception:
+            get_logger().log_warning(f"Unable to save the collection index to {self.index_file}: {exception}")
@@ -1,28 +1,42 @@
+import os
 from typing import List
 
-import pytest
-
 from framework.database.objects.testcase import TestCase
 from framework.database.operations.capability_operation import CapabilityOperation
 from framework.database.operations.test_capability_operation import TestCapabilityOperation
 from framework.database.operations.test_info_operation import TestInfoOperation
 from framework.logging.automation_logger import get_logger
-from framework.pytest_plugins.collection_plugin import CollectionPlugin
+from framework.scanning.objects.collection_index import CollectionIndex
+from framework.scanning.objects.test_sync_report import TestSyncReport
 
 
 class TestScannerUploader:
-    """Class for Scanning tests and uploading."""
+    """Class for Scanning tests and uploading.
+
+    The tests of the repo and of the database are matched on (test_name, test_suite), and the differences are written
+    with a handful of set-based statements rather than a few queries per test.
+    """
+
+    def __init__(self, test_folders: List[str], repository: str = "ace"):
+        """Constructor.
 
-    def __init__(self, test_folders: List[str]):
+        Args:
+            test_folders (List[str]): The folders of the repo to scan, relative to its root.
+            repository (str): The repository that owns the scanned tests in the database.
+        """
         self.test_folders = test_folders
+        self.repository = repository
 
-    def scan_and_upload_tests(self, repo_root: str):
+    def scan_and_upload_tests(self, repo_root: str, dry_run: bool = False) -> TestSyncReport:
         """Scans the repo and uploads the new tests to the database.
 
         Args:
             repo_root (str): The full path to the root of the repo.
+            dry_run (bool): True to only report the changes, without writing them to the database.
+
+        Returns:
+            TestSyncReport: The changes made, or to make on a dry run.
         """
-        test_info_operation = TestInfoOperation()
         scanned_tests: List[TestCase] = self.scan_for_tests(repo_root)
 
         # Filter to find only the test cases in the desired folders.
@@ -31,42 +45,16 @@ class TestScannerUploader:
             if any(test.get_pytest_node_id().startswith(test_folder) for test_folder in self.test_folders):
                 filtered_test_cases.append(test)
 
-        tests_in_db = test_info_operation.get_all_active_tests(repository="ace")
-
-        # get all tests in the repo, then compare with db list to get a list of tests that are not in the repo
-        tests_not_in_repo = []
-        for db_test in tests_in_db:
-            is_test_in_repo = False
-            for repo_test in filtered_test_cases:
-                if db_test.get_test_name() == repo_test.get_test_name() and db_test.get_test_suite() == repo_test.get_test_suite():
-                    is_test_in_repo = True
-                    break
-            if not is_test_in_repo:
-                tests_not_in_repo.append(db_test)
-
-        # mark all tests that do not appear in the repo as inactive
-        inactive_ids = list(map(lambda inactive_test: inactive_test.get_test_info_id(), tests_not_in_repo))
-        if inactive_ids:
-            test_info_operation.set_tests_inactive(inactive_ids)
-
-        # Upload/Update the test cases in the database
-        for test in filtered_test_cases:
-
-            print(f"Inserting/Updating - {test.get_test_suite()}::{test.get_test_name()}")
-            test_info_id = test_info_operation.get_info_test_id(test.get_test_name(), test.get_test_suite())
-            if not test_info_id:
-                test_info_id = test_info_operation.insert_test(test)
-            database_testcase = test_info_operation.get_test_info(test_info_id)
-
-            # check if any fields need updating
-            self.update_priority(test, database_testcase)
-            self.update_test_path(test, database_testcase)
-            self.update_pytest_node_id(test, database_testcase)
-            self.update_capability(test, database_testcase.get_test_info_id())
-            self.update_active(database_testcase)
+        test_sync_report = self.get_test_sync_report(filtered_test_cases)
+        for summary_line in test_sync_report.get_summary():
+            get_logger().log_info(summary_line)
+
+        if not dry_run:
+            self.apply_test_sync_report(test_sync_report)
+        return test_sync_report
 
     def scan_for_tests(self, repo_root: str) -> List[TestCase]:
-        """Scans for tests using pytest collection.
+        """Scans the test folders for tests, through the collection index.
 
         Args:
             repo_root (str): The full path to the root of the repo.
@@ -74,107 +62,129 @@ class TestScannerUploader:
         Returns:
             List[TestCase]: List of collected testcases.
         """
-        collection_plugin = CollectionPlugin(repo_root)
-        pytest.main(["--collect-only"], plugins=[collection_plugin])
-        return collection_plugin.get_tests()
+        collection_index = CollectionIndex(repo_root)
+        tests = []
+        for test_folder in self.test_folders:
+            tests.extend(collection_index.get_tests(os.path.join(repo_root, test_folder)))
+        return tests
 
-    def update_priority(self, test: TestCase, database_testcase: TestCase):
-        """Checks the current priority of the test, if it's changed, update it.
+    def get_test_sync_report(self, repo_tests: List[TestCase]) -> TestSyncReport:
+        """Compares the tests of the repo to the ones in the database, reading the database with three queries.
 
         Args:
-            test (TestCase): The test in the repo scan.
-            database_testcase (TestCase): The test in the database.
-        """
-        database_priority = database_testcase.get_priority()
-        local_priority = test.get_priority()
-        if local_priority and database_priority is not local_priority:
-            test_info_operation = TestInfoOperation()
-            test_info_operation.update_priority(database_testcase.get_test_info_id(), local_priority)
-
-    def update_test_path(self, test: TestCase, database_testcase: TestCase):
-        """Checks the current test_path of the test, if it's changed, update it.
-
-        Args:
-            test (TestCase): The test in the repo scan.
-            database_testcase (TestCase): The test in the database.
-        """
-        database_test_path = database_testcase.get_test_path()
-        actual_test_path = test.get_test_path().replace("\\", "/")
+            repo_tests (List[TestCase]): The tests in the repo scan.
 
-        if not database_test_path or database_test_path is not actual_test_path:
-            test_info_operation = TestInfoOperation()
-            test_info_operation.update_test_path(database_testcase.get_test_info_id(), actual_test_path)
-
-    def update_pytest_node_id(self, test: TestCase, database_testcase: TestCase):
-        """Checks the current pytest_node_id of the test, if it's changed, update it.
-
-        Args:
-            test (TestCase): The test in the repo scan.
-            database_testcase (TestCase): The test in the database.
+        Returns:
+            TestSyncReport: The changes to make to the database.
         """
-        current_pytest_node_id = database_testcase.get_pytest_node_id()
-        if not current_pytest_node_id or current_pytest_node_id is not test.get_pytest_node_id():
-            test_info_operation = TestInfoOperation()
-            test_info_operation.update_pytest_node_id(database_testcase.get_test_info_id(), test.get_pytest_node_id())
-
-    def update_capability(self, test: TestCase, test_info_id: int):
-        """Updates the test in the db with any capabilities it has.
+        test_sync_report = TestSyncReport()
+
+        # Only the first entry counts when the db or the scan has the same test twice, as get_info_test_id did.
+        database_tests: dict[tuple[str, str], TestCase] = {}
+        for database_test in TestInfoOperation().get_all_tests(self.repository):
+            database_tests.setdefault((database_test.get_test_name(), database_test.get_test_suite()), database_test)
+        synced_tests: dict[tuple[str, str], TestCase] = {}
+        for repo_test in repo_tests:
+            test_key = (repo_test.get_test_name(), repo_test.get_test_suite())
+            if test_key not in synced_tests:
+                synced_tests[test_key] = self._get_synced_testcase(repo_test, database_tests.get(test_key))
+
+        for test_key, database_test in database_tests.items():
+            if test_key not in synced_tests and database_test.is_testcase_active():
+                test_sync_report.tests_to_deactivate.append(database_test)
+
+        for test_key, synced_test in synced_tests.items():
+            database_test = database_tests.get(test_key)
+            if database_test is None:
+                test_sync_report.tests_to_insert.append(synced_test)
+            elif self._is_testcase_changed(synced_test, database_test):
+                test_sync_report.tests_to_update.append(synced_test)
+
+        capability_markers = {capability.get_capability_marker() for capability in CapabilityOperation().get_all_capabilities()}
+        existing_tests = {synced_test.get_test_info_id(): synced_test for synced_test in synced_tests.values() if synced_test.get_test_info_id() != -1}
+        database_markers: dict[int, dict[str, int]] = {}
+        for capability_test_id, test_info_id, capability_marker in TestCapabilityOperation().get_capability_markers_for_tests(list(existing_tests.keys())):
+            database_markers.setdefault(test_info_id, {})[capability_marker] = capability_test_id
+
+        for synced_test in synced_tests.values():
+            test_markers = database_markers.get(synced_test.get_test_info_id(), {})
+            for capability_marker in dict.fromkeys(synced_test.get_markers()):
+                if capability_marker not in capability_markers:
+                    test_sync_report.capabilities_to_insert.append(capability_marker)
+                    capability_markers.add(capability_marker)
+                if capability_marker not in test_markers:
+                    test_sync_report.capability_links_to_add.append((synced_test, capability_marker))
+            for capability_marker, capability_test_id in test_markers.items():
+                if capability_marker not in synced_test.get_markers():
+                    test_sync_report.capability_links_to_remove.append((synced_test, capability_marker, capability_test_id))
+
+        return test_sync_report
+
+    def apply_test_sync_report(self, test_sync_report: TestSyncReport):
+        """Writes the changes of the report to the database, with one statement per kind of change.
+
+        The tests inserted get the test_info_id generated by the database.
 
         Args:
-            test (TestCase): The test.
-            test_info_id (int): The id of the test to check.
+            test_sync_report (TestSyncReport): The changes to make.
         """
+        test_info_operation = TestInfoOperation()
         capability_operation = CapabilityOperation()
         capability_test_operation = TestCapabilityOperation()
 
-        # get all the capabilities associated with this test
-        capability_markers = test.get_markers()
-        for capability_marker in capability_markers:
+        if test_sync_report.get_tests_to_deactivate():
+            test_info_operation.set_tests_inactive([database_test.get_test_info_id() for database_test in test_sync_report.get_tests_to_deactivate()])
 
-            capability_object = capability_operation.get_capability_by_marker(capability_marker)
+        if test_sync_report.get_tests_to_insert():
+            test_info_ids = test_info_operation.insert_tests(test_sync_report.get_tests_to_insert())
+            for test in test_sync_report.get_tests_to_insert():
+                test.set_test_info_id(test_info_ids[(test.get_test_name(), test.get_test_suite())])
 
-            # If capability does not exist, insert it in the database and update the capability_object with the returned capability_id.
-            if capability_object == -1:
-                get_logger().log_info(f"Inserting a new Capability in the database for marker: {capability_marker}")
-                capability_object = capability_operation.insert_capability(capability_marker, capability_marker)
+        if test_sync_report.get_tests_to_update():
+            test_info_operation.update_tests(test_sync_report.get_tests_to_update())
 
-            capability_id = capability_object.get_capability_id()
+        capability_ids = {capability.get_capability_marker(): capability.get_capability_id() for capability in capability_operation.get_all_capabilities()}
+        capabilities_to_insert = [capability_marker for capability_marker in test_sync_report.get_capabilities_to_insert() if capability_marker not in capability_ids]
+        if capabilities_to_insert:
+            get_logger().log_info(f"Inserting new Capabilities in the database for markers: {capabilities_to_insert}")
+            for capability in capability_operation.insert_capabilities(capabilities_to_insert):
+                capability_ids[capability.get_capability_marker()] = capability.get_capability_id()
 
-            mapping_id = capability_test_operation.get_id(capability_id, test_info_id)
-            # mapping does not exist, add new one
-            if mapping_id == -1:
-                capability_test_operation.create_new_mapping(capability_id, test_info_id)
+        if test_sync_report.get_capability_links_to_add():
+            capability_test_operation.create_new_mappings([(capability_ids[capability_marker], test.get_test_info_id()) for test, capability_marker in test_sync_report.get_capability_links_to_add()])
 
-        self.check_for_capabilities_to_remove(test_info_id, capability_markers)
+        if test_sync_report.get_capability_links_to_remove():
+            capability_test_operation.delete_capability_tests([capability_test_id for _, _, capability_test_id in test_sync_report.get_capability_links_to_remove()])
 
-    def check_for_capabilities_to_remove(self, test_info_id: int, capability_markers: [str]):
-        """Checks for capabilities in the db that no longer exist on the test.
+    def _get_synced_testcase(self, test: TestCase, database_testcase: TestCase | None) -> TestCase:
+        """Gets the testcase as it should be in the database.
 
         Args:
-            test_info_id (int): The test_info_id.
-            capability_markers ([str]): The capability markers on the test.
-        """
-        # next we need to remove capabilities that are in the database but no longer on the test
-        capability_test_operation = TestCapabilityOperation()
-        db_capabilities = capability_test_operation.get_capabilities_for_test(test_info_id)
-
-        # get just the marker names to match with test capabilities
-        db_marker_names = map(lambda db_capability: db_capability.get_capability_marker(), db_capabilities)
-
-        # this will get the capabilities that exist in the db but not on the test itself
-        capabilities_to_be_removed = list(set(db_marker_names).difference(capability_markers))
-
-        for marker_name in capabilities_to_be_removed:
-            # find the correct db_capability
-            db_capability = next(filter(lambda x: x.get_capability_marker() == marker_name, db_capabilities))
-            capability_test_operation.delete_capability_test(db_capability.get_capability_id(), test_info_id)
+            test (TestCase): The test in the repo scan.
+            database_testcase (TestCase | None): The test in the database, None if it's not there yet.
 
-    def update_active(self, database_testcase: TestCase):
-        """Sets the test to active if it's currently inactive.
+        Returns:
+            TestCase: The test with the test_info_id of the database, and the database priority if it has none.
+        """
+        priority = test.get_priority()
+        if not priority and database_testcase:
+            priority = database_testcase.get_priority()
+        synced_testcase = TestCase(test.get_test_name(), test.get_test_suite(), priority, test.get_test_path().replace("\\", "/"), test.get_pytest_node_id())
+        synced_testcase.set_markers(test.get_markers())
+        synced_testcase.set_repository(self.repository)
+        if database_testcase:
+            synced_testcase.set_test_info_id(database_testcase.get_test_info_id())
+            synced_testcase.set_test_case_group_id(database_testcase.get_test_case_group_id())
+        return synced_testcase
+
+    def _is_testcase_changed(self, synced_testcase: TestCase, database_testcase: TestCase) -> bool:
+        """Checks if the test in the database needs updating.
 
         Args:
+            synced_testcase (TestCase): The test as it should be in the database.
             database_testcase (TestCase): The test in the database.
+
+        Returns:
+            bool: True if the priority, test_path or pytest_node_id changed, or the test is inactive.
         """
-        if not database_testcase.is_testcase_active():
-            test_info_operation = TestInfoOperation()
-            test_info_operation.set_test_active(database_testcase.get_test_info_id())
+        return synced_testcase.get_priority() != database_testcase.get_priority() or synced_testcase.get_test_path() != database_testcase.get_test_path() or synced_testcase.get_pytest_node_id() != database_testcase.get_pytest_node_id() or not database_testcase.is_testcase_active()
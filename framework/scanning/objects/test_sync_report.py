@@ -0,0 +1,99 @@
+from framework.database.objects.testcase import TestCase
+
+
+class TestSyncReport:
+    """
+    The changes to bring the test_info and capability tables of the database in line with the scanned tests.
+    """
+
+    def __init__(self):
+        self.tests_to_insert: list[TestCase] = []
+        self.tests_to_update: list[TestCase] = []
+        self.tests_to_deactivate: list[TestCase] = []
+        self.capabilities_to_insert: list[str] = []
+        self.capability_links_to_add: list[tuple[TestCase, str]] = []
+        self.capability_links_to_remove: list[tuple[TestCase, str, int]] = []
+
+    def get_tests_to_insert(self) -> list[TestCase]:
+        """
+        Getter for the scanned tests that are not in the database
+
+        Returns:
+            list[TestCase]: the tests to insert
+        """
+        return self.tests_to_insert
+
+    def get_tests_to_update(self) -> list[TestCase]:
+        """
+        Getter for the tests whose priority, test path or pytest node id changed, or that need to be set active again
+
+        Returns:
+            list[TestCase]: the tests to update, with the test_info_id of their entry in the database
+        """
+        return self.tests_to_update
+
+    def get_tests_to_deactivate(self) -> list[TestCase]:
+        """
+        Getter for the active tests of the database that are no longer in the repo
+
+        Returns:
+            list[TestCase]: the tests to set inactive
+        """
+        return self.tests_to_deactivate
+
+    def get_capabilities_to_insert(self) -> list[str]:
+        """
+        Getter for the markers of the scanned tests that have no capability in the database
+
+        Returns:
+            list[str]: the capability markers
+        """
+        return self.capabilities_to_insert
+
+    def get_capability_links_to_add(self) -> list[tuple[TestCase, str]]:
+        """
+        Getter for the capability markers of the scanned tests that are not mapped to them in the database
+
+        Returns:
+            list[tuple[TestCase, str]]: the test and capability marker of each missing mapping
+        """
+        return self.capability_links_to_add
+
+    def get_capability_links_to_remove(self) -> list[tuple[TestCase, str, int]]:
+        """
+        Getter for the capability mappings of the database that are no longer on the scanned tests
+
+        Returns:
+            list[tuple[TestCase, str, int]]: the test, capability marker and capability_test_id of each mapping
+        """
+        return self.capability_links_to_remove
+
+    def has_changes(self) -> bool:
+        """
+        Checks if the database needs any change
+
+        Returns:
+            bool: True if anything needs to be inserted, updated or removed
+        """
+        return any([self.tests_to_insert, self.tests_to_update, self.tests_to_deactivate, self.capabilities_to_insert, self.capability_links_to_add, self.capability_links_to_remove])
+
+    def get_summary(self) -> list[str]:
+        """
+        Gets a summary of the changes, with one line per change under a line counting them
+
+        Returns:
+            list[str]: the summary lines
+        """
+        summary = [f"Tests to insert: {len(self.tests_to_insert)}"]
+        summary.extend(f"  + {test.get_test_suite()}::{test.get_test_name()}" for test in self.tests_to_insert)
+        summary.append(f"Tests to update: {len(self.tests_to_update)}")
+        summary.extend(f"  ~ {test.get_test_suite()}::{test.get_test_name()}" for test in self.tests_to_update)
+        summary.append(f"Tests to set inactive: {len(self.tests_to_deactivate)}")
+        summary.extend(f"  - {test.get_test_suite()}::{test.get_test_name()}" for test in self.tests_to_deactivate)
+        summary.append(f"Capabilities to insert: {len(self.capabilities_to_insert)}")
+        summary.extend(f"  + {capability_marker}" for capability_marker in self.capabilities_to_insert)
+        summary.append(f"Capability mappings to add: {len(self.capability_links_to_add)}")
+        summary.extend(f"  + {test.get_test_suite()}::{test.get_test_name()} -> {capability_marker}" for test, capability_marker in self.capability_links_to_add)
+        summary.append(f"Capability mappings to remove: {len(self.capability_links_to_remove)}")
+        summary.extend(f"  - {test.get_test_suite()}::{test.get_test_name()} -> {capability_marker}" for test, capability_marker, _ in self.capability_links_to_remove)
+        return summary
@@ -0,0 +1,67 @@
+from typing import List, Optional
+
+
+class BatchCommandResult:
+    """
+    This class holds the result of one of the commands sent with SSHConnection.send_batch.
+    """
+
+    def __init__(self, cmd: str, output: List[str], return_code: Optional[int], duration: float):
+        """
+        Constructor
+
+        Args:
+            cmd (str): The command that was run.
+            output (List[str]): The output of the command, as a list of lines (same format as SSHConnection.send).
+            return_code (Optional[int]): The return code of the command.
+            duration (float): The time it took the command to run on the remote host, in seconds.
+        """
+        self.cmd = cmd
+        self.output = output
+        self.return_code = return_code
+        self.duration = duration
+
+    def get_cmd(self) -> str:
+        """
+        Getter for the command that was run.
+
+        Returns:
+            str: The command.
+        """
+        return self.cmd
+
+    def get_output(self) -> List[str]:
+        """
+        Getter for the output of the command.
+
+        Returns:
+            List[str]: The output lines, with their line breaks.
+        """
+        return self.output
+
+    def get_return_code(self) -> Optional[int]:
+        """
+        Getter for the return code of the command.
+
+        Returns:
+            Optional[int]: The return code, or None if the command didn't run (e.g. the batch was interrupted).
+        """
+        return self.return_code
+
+    def get_duration(self) -> float:
+        """
+        Getter for the time it took the command to run on the remote host.
+
+        Returns:
+            float: The duration in seconds.
+        """
+        return self.duration
+
+    def __str__(self) -> str:
+        """
+        Return the string representation of this result.
+
+        Returns:
+            str: The command, its return code and duration.
+        """
+        return f"'{self.cmd}' returned {self.return_code} in {self.duration:.3f}s"
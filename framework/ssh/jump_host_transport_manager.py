@@ -0,0 +1,221 @@
+import threading
+import time
+
+import paramiko
+from paramiko.channel import Channel
+from paramiko.client import SSHClient
+
+from config.host.objects.host_configuration import HostConfiguration
+from framework.logging.automation_logger import get_logger
+
+
+class JumpHostTransportManagerClass:
+    """
+    This class shares a single SSH transport per jump host between all the users of that jump host.
+
+    SSHConnection, SSHTunnel and SSHTunnelRestClient open 'direct-tcpip' channels on the shared transport instead of
+    doing their own SSH handshake with the gateway. The transports are reference counted: a transport is closed when its
+    last user releases it, and it is reconnected automatically if it drops while it is still in use.
+    """
+
+    def __init__(self):
+        self.jump_host_clients = {}  # jump host key -> SSHClient
+        self.reference_counts = {}  # jump host key -> number of users
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def _get_key(jump_host: HostConfiguration) -> tuple:
+        """
+        Gets the key identifying the transport of this jump host.
+
+        Args:
+            jump_host (HostConfiguration): The jump host configuration.
+
+        Returns:
+            tuple: (host, ssh port, user name)
+        """
+        return jump_host.get_host(), jump_host.get_ssh_port(), jump_host.get_credentials().get_user_name()
+
+    @staticmethod
+    def _connect(jump_host: HostConfiguration, timeout: int = 30, retries: int = 3, retry_delay: int = 5) -> SSHClient:
+        """
+        Connect to the jump host using SSH.
+
+        Retries on transient failures such as 'Error reading SSH protocol banner'.
+
+        Args:
+            jump_host (HostConfiguration): The jump host configuration.
+            timeout (int): The timeout for establishing the connection, in seconds.
+            retries (int): Number of connection attempts before giving up. Default is 3.
+            retry_delay (int): Seconds to wait between attempts. Default is 5.
+
+        Returns:
+            SSHClient: The connected jump host SSH client.
+        """
+        host = jump_host.get_host()
+        jump_host_ssh_port = jump_host.get_ssh_port()
+
+        last_exception = None
+        for attempt in range(1, retries + 1):
+            jump_client = SSHClient()
+            jump_client.set_missing_host_key_policy(paramiko.AutoAddPolicy)
+            try:
+                jump_client.connect(
+                    host,
+                    username=jump_host.get_credentials().get_user_name(),
+                    password=jump_host.get_credentials().get_password(),
+                    timeout=timeout,
+                    allow_agent=True,
+                    look_for_keys=True,
+                    port=jump_host_ssh_port,
+                )
+                return jump_client
+            except BaseException as exception:
+                jump_client.close()
+                last_exception = exception
+                get_logger().log_error(f"Failed to Connect to Jump-Host {host} (attempt {attempt}/{retries}): {exception}")
+                if attempt < retries:
+                    get_logger().log_info(f"Retrying jump host connection in {retry_delay}s...")
+                    time.sleep(retry_delay)
+
+        get_logger().log_error(f"Could not connect to gateway {host}:{jump_host_ssh_port} : {last_exception}")
+        raise BaseException("Failed to connect to Jump-Host")
+
+    def _get_live_client(self, jump_host: HostConfiguration, timeout: int = 30) -> SSHClient:
+        """
+        Gets the shared client of this jump host, (re)connecting it if its transport is not active.
+
+        Args:
+            jump_host (HostConfiguration): The jump host configuration.
+            timeout (int): The timeout for establishing the connection, in seconds.
+
+        Returns:
+            SSHClient: The connected jump host SSH client.
+        """
+        key = self._get_key(jump_host)
+        with self.lock:
+            jump_client = self.jump_host_clients.get(key)
+            if jump_client and jump_client.get_transport() and jump_client.get_transport().is_active():
+                return jump_client
+
+            if jump_client:
+                get_logger().log_info(f"Transport to Jump-Host {jump_host.get_host()} is no longer active. Reconnecting.")
+                jump_client.close()
+
+            jump_client = self._connect(jump_host, timeout=timeout)
+            self.jump_host_clients[key] = jump_client
+            return jump_client
+
+    def acquire(self, jump_host: HostConfiguration, timeout: int = 30) -> paramiko.Transport:
+        """
+        Registers a new user of the jump host and returns its shared transport.
+
+        Every call to acquire must be matched by a call to release.
+
+        Args:
+            jump_host (HostConfiguration): The jump host configuration.
+            timeout (int): The timeout for establishing the connection, in seconds.
+
+        Returns:
+            paramiko.Transport: The shared transport to the jump host.
+        """
+        key = self._get_key(jump_host)
+        with self.lock:
+            jump_client = self._get_live_client(jump_host, timeout=timeout)
+            self.reference_counts[key] = self.reference_counts.get(key, 0) + 1
+            return jump_client.get_transport()
+
+    def get_transport(self, jump_host: HostConfiguration, timeout: int = 30) -> paramiko.Transport:
+        """
+        Gets the live shared transport of a jump host that was already acquired, reconnecting it if it dropped.
+
+        Args:
+            jump_host (HostConfiguration): The jump host configuration.
+            timeout (int): The timeout for establishing the connection, in seconds.
+
+        Returns:
+            paramiko.Transport: The shared transport to the jump host.
+        """
+        return self._get_live_client(jump_host, timeout=timeout).get_transport()
+
+    def release(self, jump_host: HostConfiguration) -> None:
+        """
+        Unregisters a user of the jump host. The transport is closed once it has no users left.
+
+        Args:
+            jump_host (HostConfiguration): The jump host configuration.
+        """
+        key = self._get_key(jump_host)
+        with self.lock:
+            reference_count = self.reference_counts.get(key, 0) - 1
+            if reference_count > 0:
+                self.reference_counts[key] = reference_count
+                return
+
+            self.reference_counts.pop(key, None)
+            jump_client = self.jump_host_clients.pop(key, None)
+            if jump_client:
+                try:
+                    jump_client.close()
+                except Exception:
+                    pass
+
+    def open_channel(self, jump_host: HostConfiguration, host: str, port: int, timeout: int = 30) -> Channel:
+        """
+        Opens a 'direct-tcpip' channel to host:port through the shared transport of the jump host.
+
+        If the transport dropped, it is reconnected once before giving up.
+
+        Args:
+            jump_host (HostConfiguration): The jump host configuration.
+            host (str): The host to reach from the jump host.
+            port (int): The port to reach from the jump host.
+            timeout (int): The timeout for opening the channel, in seconds.
+
+        Returns:
+            Channel: The channel to host:port.
+
+        Raises:
+            ChannelException: If the jump host could not reach host:port, e.g. because it is rebooting.
+            SSHException: If the channel could not be opened on a live transport.
+        """
+        transport = self._get_live_client(jump_host, timeout=timeout).get_transport()
+        try:
+            return transport.open_channel("direct-tcpip", (host, port), ("", 0), timeout=timeout)
+        except paramiko.ChannelException:
+            # The target refused or couldn't be reached; the shared transport is fine and other users still need it.
+            raise
+        except paramiko.SSHException as exception:
+            if transport.is_active():
+                raise
+            get_logger().log_info(f"Failed to open a channel to {host}:{port} through Jump-Host {jump_host.get_host()}. Reconnecting. Exception: {exception}")
+            transport = self._get_live_client(jump_host, timeout=timeout).get_transport()
+            return transport.open_channel("direct-tcpip", (host, port), ("", 0), timeout=timeout)
+
+    def get_reference_count(self, jump_host: HostConfiguration) -> int:
+        """
+        Getter for the number of users of the jump host transport.
+
+        Args:
+            jump_host (HostConfiguration): The jump host configuration.
+
+        Returns:
+            int: The number of users of the jump host transport.
+        """
+        return self.reference_counts.get(self._get_key(jump_host), 0)
+
+    def close_all(self) -> None:
+        """
+        Closes all the jump host transports, regardless of their number of users.
+        """
+        with self.lock:
+            for jump_client in self.jump_host_clients.values():
+                try:
+                    jump_client.close()
+                except Exception:
+                    pass
+            self.jump_host_clients.clear()
+            self.reference_counts.clear()
+
+
+JumpHostTransportManager = JumpHostTransportManagerClass()
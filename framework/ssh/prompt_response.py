@@ -1,20 +1,25 @@
+import re
+
+
 class PromptResponse:
     """
-    This class is a holder for a Prompt's text content and the associated
-    response that we want to send.
+    This class is a holder for a Prompt's text content and the associated response that we want to send.
     """
 
-    def __init__(self, prompt_substring, prompt_response=None):
+    def __init__(self, prompt_substring: str, prompt_response: str = None, is_regex: bool = False):
         """
         Constructor
+
         Args:
-            prompt_substring: Substring indicating that we have the right prompt.
-            prompt_response: Answer that we send when we encounter this prompt.
-                             If set to None, that means that we don't want to respond to the prompt.
+            prompt_substring (str): Substring indicating that we have the right prompt.
+            prompt_response (str): Answer that we send when we encounter this prompt.
+                If set to None, that means that we don't want to respond to the prompt.
+            is_regex (bool): True if prompt_substring is a regular expression instead of a plain substring.
+                A regex prompt is matched within a line of output.
         """
-
         self.prompt_substring = prompt_substring
         self.prompt_response = prompt_response
+        self.prompt_pattern = re.compile(prompt_substring) if is_regex else None
 
         # Store the full ssh output up to this prompt. [Since the last prompt]
         self.complete_output = ""
@@ -22,34 +27,57 @@ class PromptResponse:
     def get_prompt_substring(self) -> str:
         """
         Getter for prompt substring
-        Returns (str): prompt substring
 
+        Returns:
+            str: prompt substring
         """
         return self.prompt_substring
 
     def get_prompt_response(self) -> str:
         """
         Getter for the prompt response
-        Returns (str): prompt response
 
+        Returns:
+            str: prompt response
         """
         return self.prompt_response
 
-    def set_complete_output(self, complete_output: str):
+    def is_found_in(self, output: str, search_start: int = 0) -> bool:
         """
-        Setter for the complete output.
+        Check if the prompt appears in the output, searching only from search_start onwards.
+
+        The search goes back far enough before search_start to find a prompt split across two reads, so callers
+        accumulating output can pass the length of the output they already searched.
+
         Args:
-            complete_output: The full ssh output up to this prompt. [Since the last prompt]
+            output (str): The output received since the last prompt.
+            search_start (int): The index up to which the output was already searched without a match.
 
-        Returns:c None
+        Returns:
+            bool: True if the prompt is in the output.
+        """
+        if self.prompt_pattern:
+            # Regex prompts can be of any length, so search again from the start of the line being received.
+            line_start = output.rfind("\n", 0, search_start) + 1
+            return self.prompt_pattern.search(output, line_start) is not None
+
+        overlap_start = max(0, search_start - len(self.prompt_substring) + 1)
+        return output.find(self.prompt_substring, overlap_start) != -1
+
+    def set_complete_output(self, complete_output: str) -> None:
+        """
+        Setter for the complete output.
 
+        Args:
+            complete_output (str): The full ssh output up to this prompt. [Since the last prompt]
         """
         self.complete_output = complete_output
 
     def get_complete_output(self) -> str:
         """
         Getter for the complete ssh output that led to this prompt.
-        Returns (str): The complete ssh output that led to this prompt. [Since the last prompt]
 
+        Returns:
+            str: The complete ssh output that led to this prompt. [Since the last prompt]
         """
         return self.complete_output
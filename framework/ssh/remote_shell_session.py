@@ -0,0 +1,195 @@
+import socket
+import time
+import uuid
+from typing import List, Optional
+
+from paramiko.channel import Channel
+from paramiko.client import SSHClient
+
+from framework.logging.automation_logger import get_logger
+from framework.ssh.shell_environment_profile import ShellEnvironmentProfile
+
+
+class RemoteShellSession:
+    """
+    This class holds a long-lived non-interactive shell on the remote host, set up for one environment profile.
+
+    Commands are written to the stdin of the shell and their output is delimited by a sentinel line which carries the
+    return code of the command. Each command runs in a subshell with its stdin closed, so that 'cd', 'export' or
+    commands reading stdin don't affect the following commands, while the environment set up by the profile is kept.
+    """
+
+    def __init__(self, client: SSHClient, profile: ShellEnvironmentProfile, password: str = None):
+        """
+        Constructor
+
+        Args:
+            client (SSHClient): The connected client on which the shell is opened.
+            profile (ShellEnvironmentProfile): The environment profile of this shell.
+            password (str): The password used for sudo, if the profile runs as root.
+        """
+        self.client = client
+        self.profile = profile
+        self.password = password
+        self.channel: Optional[Channel] = None
+        self.sentinel = f"__STX_SHELL_DONE_{uuid.uuid4().hex}__".encode()
+
+    def is_open(self) -> bool:
+        """
+        Check if the shell is still running.
+
+        Returns:
+            bool: True if the shell can accept commands.
+        """
+        return self.channel is not None and not self.channel.closed and not self.channel.exit_status_ready()
+
+    def open(self, timeout: int = 30) -> None:
+        """
+        Start the shell and run the setup commands of the profile.
+
+        Args:
+            timeout (int): Timeout in seconds for the shell to start and each setup command to complete.
+        """
+        self.channel = self.client.get_transport().open_session(timeout=timeout)
+        self.channel.set_combine_stderr(True)
+        if self.profile.is_as_sudo():
+            # sudo only prompts when it needs the password, and the shell announces itself once it runs, so the
+            # password is only ever sent in answer to the prompt and never reaches the shell.
+            session_id = uuid.uuid4().hex
+            sudo_prompt = f"__STX_SUDO_PROMPT_{session_id}__"
+            shell_ready = f"__STX_SHELL_READY_{session_id}__"
+            self.channel.exec_command(f"sudo -S -p '{sudo_prompt}' bash --noprofile --norc -c 'echo {shell_ready}; exec bash --noprofile --norc'")
+            self._wait_for_sudo_shell(sudo_prompt.encode(), shell_ready.encode(), timeout)
+        else:
+            self.channel.exec_command("bash --noprofile --norc")
+
+        self._run("true", timeout, in_subshell=False)
+        get_logger().log_debug(f"Started persistent shell for profile '{self.profile.get_name()}'")
+        for setup_command in self.profile.get_setup_commands():
+            self._run(setup_command, timeout, in_subshell=False)
+
+    def _wait_for_sudo_shell(self, sudo_prompt: bytes, shell_ready: bytes, timeout: int) -> None:
+        """
+        Answer the password prompt of sudo, if it prompts, and wait for the root shell to start.
+
+        Args:
+            sudo_prompt (bytes): The prompt sudo was given.
+            shell_ready (bytes): The line the shell prints once it runs.
+            timeout (int): Timeout in seconds for the shell to start.
+
+        Raises:
+            PermissionError: If sudo prompts again, because it refused the password.
+        """
+        buffer = b""
+        is_password_sent = False
+        end_time = time.time() + timeout
+        while shell_ready not in buffer:
+            prompt_index = buffer.find(sudo_prompt)
+            if prompt_index != -1:
+                if is_password_sent:
+                    self.close()
+                    raise PermissionError(f"sudo refused the password of persistent shell '{self.profile.get_name()}'")
+                self.channel.sendall(f"{self.password}\n".encode())
+                is_password_sent = True
+                buffer = buffer[prompt_index + len(sudo_prompt) :]
+                continue
+            buffer += self._receive(end_time, timeout)
+
+    def run(self, cmd: str, timeout: int = 30) -> tuple[List[str], int]:
+        """
+        Run the command in the shell, starting the shell first if needed.
+
+        Args:
+            cmd (str): The command to run, without the prefix of the profile.
+            timeout (int): Timeout in seconds for the command to complete.
+
+        Returns:
+            tuple[List[str], int]: The output lines of the command (with line breaks, like readlines()) and its return code.
+        """
+        if not self.is_open():
+            self.open(timeout)
+        return self._run(cmd, timeout, in_subshell=True)
+
+    def _run(self, cmd: str, timeout: int, in_subshell: bool) -> tuple[List[str], int]:
+        """
+        Write the command to the shell and read its output up to the sentinel line.
+
+        Args:
+            cmd (str): The command to run.
+            timeout (int): Timeout in seconds for the command to complete.
+            in_subshell (bool): True to run the command in a subshell, False to run it in the shell itself (setup commands).
+
+        Returns:
+            tuple[List[str], int]: The output lines of the command and its return code.
+
+        Raises:
+            TimeoutError: If the sentinel line isn't received within the timeout.
+            ConnectionError: If the shell exits before the sentinel line is received.
+        """
+        sentinel = self.sentinel.decode()
+        if in_subshell:
+            script = f"( {cmd}\n) < /dev/null\n"
+        else:
+            script = f"{cmd}\n"
+        script += f"printf '\\n%s %s\\n' '{sentinel}' \"$?\"\n"
+        self.channel.sendall(script.encode())
+
+        marker = b"\n" + self.sentinel + b" "
+        buffer = b""
+        search_start = 0
+        end_time = time.time() + timeout
+        while True:
+            marker_index = buffer.find(marker, search_start)
+            if marker_index != -1:
+                end_of_line = buffer.find(b"\n", marker_index + len(marker))
+                if end_of_line != -1:
+                    break
+            else:
+                # Only the new bytes, plus enough overlap for a marker split across two reads, need to be searched again.
+                search_start = max(0, len(buffer) - len(marker))
+
+            buffer += self._receive(end_time, timeout)
+
+        return_code = int(buffer[marker_index + len(marker) : end_of_line].strip() or -1)
+        output = buffer[:marker_index].decode("utf-8", errors="replace")
+        return output.splitlines(keepends=True), return_code
+
+    def _receive(self, end_time: float, timeout: int) -> bytes:
+        """
+        Read the next bytes of output of the shell.
+
+        Args:
+            end_time (float): The time by which the current command must complete.
+            timeout (int): The timeout of the current command, for the error message.
+
+        Returns:
+            bytes: The bytes read, empty if none came before a read timed out.
+
+        Raises:
+            TimeoutError: If the end time is reached.
+            ConnectionError: If the shell exits.
+        """
+        remaining_time = end_time - time.time()
+        if remaining_time <= 0:
+            self.close()
+            raise TimeoutError(f"Command did not complete within {timeout} seconds in persistent shell '{self.profile.get_name()}'")
+        self.channel.settimeout(remaining_time)
+        try:
+            data = self.channel.recv(32768)
+        except socket.timeout:
+            return b""
+        if not data:
+            self.close()
+            raise ConnectionError(f"Persistent shell '{self.profile.get_name()}' exited unexpectedly")
+        return data
+
+    def close(self) -> None:
+        """
+        Stop the shell.
+        """
+        if self.channel:
+            try:
+                self.channel.close()
+            except Exception:
+                pass
+            self.channel = None
@@ -1,10 +1,9 @@
 import os
-import stat
 
 from framework.logging.automation_logger import get_logger
 from framework.ssh.secure_transfer_file.secure_transfer_file_enum import TransferDirection
 from framework.ssh.secure_transfer_file.secure_transfer_file_input_object import SecureTransferFileInputObject
-from framework.validation.validation import validate_equals_with_retry
+from framework.ssh.secure_transfer_file.sftp_transfer_engine import SFTPTransferEngine
 from keywords.python.string import String
 
 
@@ -56,6 +55,11 @@ class SecureTransferFile:
         # Determines the transfer direction to perform either a 'get' or 'put' operation.
         transfer_direction = self.secure_transfer_file_input_object.transfer_direction
 
+        # The engine checks the size (or sha256) of the transferred file, there is no need to poll for it.
+        transfer_engine = SFTPTransferEngine(sftp_client)
+        resume = self.secure_transfer_file_input_object.get_resume()
+        verify_checksum = self.secure_transfer_file_input_object.get_verify_checksum()
+
         # Transfers the file from remote to local destination.
         if transfer_direction == TransferDirection.FROM_REMOTE_TO_LOCAL:
 
@@ -65,20 +69,17 @@ class SecureTransferFile:
             # Manages forced file transfer.
             force_transfer = self.secure_transfer_file_input_object.get_force()
             if is_file_at_destination():
-                if not force_transfer:
+                if not force_transfer and not resume:
                     get_logger().log_info(f"The file {destination_path} already exists. Try setting the 'force' property of the SecureTransferFileInputObject instance to 'True' if you want to overwrite it.")
                     return False
 
             # Transfers the file from remote to local destination.
             try:
-                sftp_client.get(origin_path, destination_path)
+                transfer_engine.download_file(origin_path, destination_path, resume=resume, verify_checksum=verify_checksum)
             except Exception as ex:
                 get_logger().log_exception(f"Error when trying to transfer the file {origin_path} to destination {destination_path}. Exception: {ex}")
                 raise ex
 
-            # Validate that the file was transferred successfully
-            validate_equals_with_retry(is_file_at_destination, True, f"File {origin_path} is transferred to {destination_path}.", timeout=self.secure_transfer_file_input_object.get_timeout_in_seconds())
-
         # Transfers to remote destination.
         elif transfer_direction == TransferDirection.FROM_LOCAL_TO_REMOTE:
 
@@ -89,26 +90,25 @@ class SecureTransferFile:
             # Manages forced file transfer.
             force_transfer = self.secure_transfer_file_input_object.get_force()
             if is_file_at_destination():
-                if not force_transfer:
+                if not force_transfer and not resume:
                     get_logger().log_info(f"The file {destination_path} already exists. Try setting the 'force' property of the SecureTransferFileInputObject instance to 'True' if you want to overwrite it.")
                     return False
 
             # Transfers the file to remote destination.
             try:
-                sftp_client.put(origin_path, destination_path)
+                transfer_engine.upload_file(origin_path, destination_path, resume=resume, verify_checksum=verify_checksum)
             except Exception as ex:
                 get_logger().log_exception(f"Error when trying to transfer the file {origin_path} to destination {destination_path}. Exception: {ex}")
                 raise ex
 
-            # Validate that the file was transferred successfully
-            validate_equals_with_retry(is_file_at_destination, True, f"File {origin_path} is transferred to {destination_path}.", timeout=self.secure_transfer_file_input_object.get_timeout_in_seconds())
-
         # The property 'transfer_direction' was not properly specified.
         else:
             message = f"Error when trying to transfer the file {origin_path} to destination {destination_path}. Property 'transfer_direction' must be specified as either TransferDirection.FROM_LOCAL_TO_REMOTE or TransferDirection.FROM_REMOTE_TO_LOCAL"
             get_logger().log_exception(message)
             raise ValueError(message)
 
+        return True
+
     def transfer_directory_recursive(self) -> bool:
         """Transfer directory recursively via SFTP.
 
@@ -120,60 +120,23 @@ class SecureTransferFile:
         sftp_client = self.secure_transfer_file_input_object.get_sftp_client()
         transfer_direction = self.secure_transfer_file_input_object.transfer_direction
 
-        if transfer_direction == TransferDirection.FROM_REMOTE_TO_LOCAL:
-            return self._transfer_from_remote_recursive(origin_path, destination_path, sftp_client)
-        elif transfer_direction == TransferDirection.FROM_LOCAL_TO_REMOTE:
-            return self._transfer_to_remote_recursive(origin_path, destination_path, sftp_client)
-        else:
+        if transfer_direction not in (TransferDirection.FROM_REMOTE_TO_LOCAL, TransferDirection.FROM_LOCAL_TO_REMOTE):
             message = f"Invalid transfer direction for recursive transfer: {transfer_direction}"
             get_logger().log_exception(message)
             raise ValueError(message)
 
-    def _transfer_from_remote_recursive(self, remote_path: str, local_path: str, sftp_client) -> bool:
-        """
-        Recursively transfer from remote to local.
-        """
-        try:
-            file_attr = sftp_client.stat(remote_path)
-            if stat.S_ISDIR(file_attr.st_mode):
-                os.makedirs(local_path, exist_ok=True)
-                for item in sftp_client.listdir(remote_path):
-                    self._transfer_from_remote_recursive(f"{remote_path}/{item}", os.path.join(local_path, item), sftp_client)
-            else:
-                os.makedirs(os.path.dirname(local_path), exist_ok=True)
-                transfer_obj = SecureTransferFileInputObject()
-                transfer_obj.set_sftp_client(sftp_client)
-                transfer_obj.set_origin_path(remote_path)
-                transfer_obj.set_destination_path(local_path)
-                transfer_obj.set_transfer_direction(TransferDirection.FROM_REMOTE_TO_LOCAL)
-                transfer_obj.set_force(self.secure_transfer_file_input_object.get_force())
-                SecureTransferFile(transfer_obj).transfer_file()
-            return True
-        except Exception as ex:
-            get_logger().log_exception(f"Error transferring {remote_path} to {local_path}: {ex}")
-            return False
+        # Files that already exist at the destination are skipped unless the transfer is forced (or resumed).
+        transfer_engine = SFTPTransferEngine(sftp_client)
+        overwrite = bool(self.secure_transfer_file_input_object.get_force())
+        resume = self.secure_transfer_file_input_object.get_resume()
+        verify_checksum = self.secure_transfer_file_input_object.get_verify_checksum()
 
-    def _transfer_to_remote_recursive(self, local_path: str, remote_path: str, sftp_client) -> bool:
-        """
-        Recursively transfer from local to remote.
-        """
         try:
-            if os.path.isdir(local_path):
-                try:
-                    sftp_client.mkdir(remote_path)
-                except IOError:
-                    pass  # Directory might already exist
-                for item in os.listdir(local_path):
-                    self._transfer_to_remote_recursive(os.path.join(local_path, item), f"{remote_path}/{item}", sftp_client)
+            if transfer_direction == TransferDirection.FROM_REMOTE_TO_LOCAL:
+                transfer_engine.download_directory(origin_path, destination_path, overwrite=overwrite, resume=resume, verify_checksum=verify_checksum)
             else:
-                transfer_obj = SecureTransferFileInputObject()
-                transfer_obj.set_sftp_client(sftp_client)
-                transfer_obj.set_origin_path(local_path)
-                transfer_obj.set_destination_path(remote_path)
-                transfer_obj.set_transfer_direction(TransferDirection.FROM_LOCAL_TO_REMOTE)
-                transfer_obj.set_force(self.secure_transfer_file_input_object.get_force())
-                SecureTransferFile(transfer_obj).transfer_file()
-            return True
+                transfer_engine.upload_directory(origin_path, destination_path, overwrite=overwrite, resume=resume, verify_checksum=verify_checksum)
         except Exception as ex:
-            get_logger().log_exception(f"Error transferring {local_path} to {remote_path}: {ex}")
+            get_logger().log_exception(f"Error transferring {origin_path} to {destination_path}: {ex}")
             return False
+        return True
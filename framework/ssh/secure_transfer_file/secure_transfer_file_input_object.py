@@ -20,6 +20,8 @@ class SecureTransferFileInputObject:
         self.transfer_direction: TransferDirection = TransferDirection.FROM_LOCAL_TO_REMOTE
         self.timeout_in_seconds: int = 60
         self.force: bool = False
+        self.resume: bool = False
+        self.verify_checksum: bool = False
 
     def set_sftp_client(self, sftp_client: SFTPClient):
         """
@@ -94,3 +96,31 @@ class SecureTransferFileInputObject:
         If True, forces the transfer even if the file already exists in the destination.
         """
         return self.force
+
+    def set_resume(self, resume: bool):
+        """
+        Setter for resume.
+        If True, the bytes of a previous partial transfer of the file are kept and only the rest is transferred.
+        """
+        self.resume = resume
+
+    def get_resume(self) -> bool:
+        """
+        Getter for resume.
+        If True, the bytes of a previous partial transfer of the file are kept and only the rest is transferred.
+        """
+        return self.resume
+
+    def set_verify_checksum(self, verify_checksum: bool):
+        """
+        Setter for verify_checksum.
+        If True, the sha256 of the transferred file is compared with the one of the origin file.
+        """
+        self.verify_checksum = verify_checksum
+
+    def get_verify_checksum(self) -> bool:
+        """
+        Getter for verify_checksum.
+        If True, the sha256 of the transferred file is compared with the one of the origin file.
+        """
+        return self.verify_checksum
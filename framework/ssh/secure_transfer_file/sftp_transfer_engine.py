@@ -0,0 +1,372 @@
+import hashlib
+import os
+import shlex
+import stat
+import threading
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from paramiko.sftp_client import SFTPClient
+
+from framework.logging.automation_logger import get_logger
+from framework.threading.fan_out_executor import FanOutExecutor
+
+# Size of the reads and writes of the local files.
+CHUNK_SIZE = 1024 * 1024
+
+
+class SFTPTransferEngine:
+    """
+    Transfers files and directory trees over SFTP, with pipelined requests, resume and checksum verification.
+
+    Downloads prefetch the whole file, so many read requests are in flight instead of one per round trip, and uploads
+    are pipelined the same way. Directory trees are listed with one request per directory, and their files are
+    transferred concurrently over extra SFTP sessions opened on the same SSH transport.
+
+    Each transfer is verified by comparing the size of both files, or their sha256 when verify_checksum is set, instead
+    of polling for the destination file.
+
+    A resumed transfer continues from the size of the destination file without checking that the bytes already there
+    match the origin file; only verify_checksum detects a destination that was changed in between.
+    """
+
+    def __init__(self, sftp_client: SFTPClient, max_concurrency: int = 4, timeout_per_file: Optional[int] = None):
+        """
+        Constructor.
+
+        Args:
+            sftp_client (SFTPClient): The SFTP session to use, e.g. SSHConnection.get_sftp_client().
+            max_concurrency (int): Maximum number of files transferred at once by the directory transfers.
+            timeout_per_file (Optional[int]): Number of seconds a single file of a directory transfer may take, None for no deadline.
+        """
+        self.sftp_client = sftp_client
+        self.max_concurrency = max_concurrency
+        self.timeout_per_file = timeout_per_file
+        self.lock = threading.Lock()
+        self.worker_clients: Dict[threading.Thread, SFTPClient] = {}
+        self.transferring_threads: Set[threading.Thread] = set()  # the worker threads in the middle of a transfer
+        self.abandoned_threads: Set[threading.Thread] = set()  # the worker threads to close their own session once done
+
+    def download_file(self, remote_path: str, local_path: str, resume: bool = False, verify_checksum: bool = False) -> int:
+        """
+        Download a remote file.
+
+        Args:
+            remote_path (str): Absolute path of the remote file.
+            local_path (str): Path of the local file to write.
+            resume (bool): True to keep the bytes of a previous partial download of this file and only fetch the rest.
+                These bytes are assumed to match the remote file, set verify_checksum to check it.
+            verify_checksum (bool): True to compare the sha256 of both files once the download completes.
+
+        Returns:
+            int: The number of bytes downloaded.
+        """
+        return self._download_file(self.sftp_client, remote_path, local_path, resume, verify_checksum)
+
+    def upload_file(self, local_path: str, remote_path: str, resume: bool = False, verify_checksum: bool = False) -> int:
+        """
+        Upload a local file.
+
+        Args:
+            local_path (str): Path of the local file.
+            remote_path (str): Absolute path of the remote file to write.
+            resume (bool): True to keep the bytes of a previous partial upload of this file and only send the rest.
+                These bytes are assumed to match the local file, set verify_checksum to check it.
+            verify_checksum (bool): True to compare the sha256 of both files once the upload completes.
+
+        Returns:
+            int: The number of bytes uploaded.
+        """
+        return self._upload_file(self.sftp_client, local_path, remote_path, resume, verify_checksum)
+
+    def download_directory(self, remote_dir: str, local_dir: str, overwrite: bool = True, resume: bool = False, verify_checksum: bool = False) -> int:
+        """
+        Download a remote directory tree, transferring its files concurrently.
+
+        Args:
+            remote_dir (str): Absolute path of the remote directory.
+            local_dir (str): Path of the local directory to write the tree to.
+            overwrite (bool): False to skip the files that already exist locally.
+            resume (bool): True to complete the partial downloads of a previous attempt.
+            verify_checksum (bool): True to compare the sha256 of every file once downloaded.
+
+        Returns:
+            int: The number of files downloaded.
+        """
+        files_to_transfer: List[Tuple[str, str]] = []
+        directories = [(remote_dir, local_dir)]
+        while directories:
+            remote_path, local_path = directories.pop()
+            os.makedirs(local_path, exist_ok=True)
+            for attributes in self.sftp_client.listdir_attr(remote_path):
+                remote_item = f"{remote_path}/{attributes.filename}"
+                local_item = os.path.join(local_path, attributes.filename)
+                if stat.S_ISDIR(attributes.st_mode):
+                    directories.append((remote_item, local_item))
+                elif overwrite or resume or not os.path.isfile(local_item):
+                    files_to_transfer.append((remote_item, local_item))
+
+        self._transfer_concurrently(files_to_transfer, self._download_file, resume, verify_checksum)
+        return len(files_to_transfer)
+
+    def upload_directory(self, local_dir: str, remote_dir: str, overwrite: bool = True, resume: bool = False, verify_checksum: bool = False) -> int:
+        """
+        Upload a local directory tree, transferring its files concurrently.
+
+        Args:
+            local_dir (str): Path of the local directory.
+            remote_dir (str): Absolute path of the remote directory to write the tree to.
+            overwrite (bool): False to skip the files that already exist on the remote host.
+            resume (bool): True to complete the partial uploads of a previous attempt.
+            verify_checksum (bool): True to compare the sha256 of every file once uploaded.
+
+        Returns:
+            int: The number of files uploaded.
+        """
+        files_to_transfer: List[Tuple[str, str]] = []
+        for local_path, _, file_names in os.walk(local_dir):
+            relative_path = os.path.relpath(local_path, local_dir)
+            remote_path = remote_dir if relative_path == "." else f"{remote_dir}/{relative_path.replace(os.sep, '/')}"
+            try:
+                existing_names = set(self.sftp_client.listdir(remote_path))
+            except IOError:
+                self.sftp_client.mkdir(remote_path)
+                existing_names = set()
+            for file_name in file_names:
+                if overwrite or resume or file_name not in existing_names:
+                    files_to_transfer.append((os.path.join(local_path, file_name), f"{remote_path}/{file_name}"))
+
+        self._transfer_concurrently(files_to_transfer, self._upload_file, resume, verify_checksum)
+        return len(files_to_transfer)
+
+    def get_remote_sha256(self, remote_path: str) -> str:
+        """
+        Compute the sha256 of a remote file on the remote host.
+
+        Args:
+            remote_path (str): Absolute path of the remote file.
+
+        Returns:
+            str: The hex digest.
+
+        Raises:
+            IOError: If sha256sum failed on the remote host.
+        """
+        channel = self.sftp_client.get_channel().get_transport().open_session()
+        try:
+            channel.exec_command(f"sha256sum -- {shlex.quote(remote_path)}")
+            output = channel.makefile("r").read().decode()
+            if channel.recv_exit_status() != 0 or not output:
+                raise IOError(f"Unable to compute the sha256 of {remote_path}: {output}")
+        finally:
+            channel.close()
+        return output.split()[0]
+
+    def _download_file(self, sftp_client: SFTPClient, remote_path: str, local_path: str, resume: bool, verify_checksum: bool) -> int:
+        """
+        Download a remote file with the given SFTP session.
+
+        Args:
+            sftp_client (SFTPClient): The SFTP session.
+            remote_path (str): Absolute path of the remote file.
+            local_path (str): Path of the local file to write.
+            resume (bool): True to keep the bytes of a previous partial download of this file and only fetch the rest.
+            verify_checksum (bool): True to compare the sha256 of both files once the download completes.
+
+        Returns:
+            int: The number of bytes downloaded.
+        """
+        remote_size = sftp_client.stat(remote_path).st_size
+        local_size = os.path.getsize(local_path) if os.path.isfile(local_path) else None
+        offset = self._get_resume_offset(local_path, local_size, remote_size, resume)
+
+        sha256 = self._hash_local_prefix(local_path, offset) if verify_checksum else None
+        with sftp_client.open(remote_path, "rb") as remote_file, open(local_path, "ab" if offset else "wb") as local_file:
+            remote_file.seek(offset)
+            remote_file.prefetch(remote_size)
+            while True:
+                data = remote_file.read(CHUNK_SIZE)
+                if not data:
+                    break
+                local_file.write(data)
+                if sha256:
+                    sha256.update(data)
+
+        self._verify(remote_path, remote_size, local_path, os.path.getsize(local_path), sha256)
+        return remote_size - offset
+
+    def _upload_file(self, sftp_client: SFTPClient, local_path: str, remote_path: str, resume: bool, verify_checksum: bool) -> int:
+        """
+        Upload a local file with the given SFTP session.
+
+        Args:
+            sftp_client (SFTPClient): The SFTP session.
+            local_path (str): Path of the local file.
+            remote_path (str): Absolute path of the remote file to write.
+            resume (bool): True to keep the bytes of a previous partial upload of this file and only send the rest.
+            verify_checksum (bool): True to compare the sha256 of both files once the upload completes.
+
+        Returns:
+            int: The number of bytes uploaded.
+        """
+        local_size = os.path.getsize(local_path)
+        remote_size = None
+        if resume:
+            try:
+                remote_size = sftp_client.stat(remote_path).st_size
+            except IOError:
+                remote_size = None
+        offset = self._get_resume_offset(remote_path, remote_size, local_size, resume)
+
+        sha256 = self._hash_local_prefix(local_path, offset) if verify_checksum else None
+        with open(local_path, "rb") as local_file, sftp_client.open(remote_path, "r+b" if offset else "wb") as remote_file:
+            remote_file.set_pipelined(True)
+            local_file.seek(offset)
+            remote_file.seek(offset)
+            while True:
+                data = local_file.read(CHUNK_SIZE)
+                if not data:
+                    break
+                remote_file.write(data)
+                if sha256:
+                    sha256.update(data)
+
+        self._verify(remote_path, sftp_client.stat(remote_path).st_size, local_path, local_size, sha256)
+        return local_size - offset
+
+    def close(self) -> None:
+        """
+        Close the extra SFTP sessions opened for the concurrent transfers.
+
+        The session of a worker still in the middle of a transfer, e.g. one that timed out, is closed by that worker once
+        its transfer is over rather than from under it.
+        """
+        with self.lock:
+            for worker_thread, sftp_client in list(self.worker_clients.items()):
+                if worker_thread in self.transferring_threads:
+                    self.abandoned_threads.add(worker_thread)
+                    continue
+                sftp_client.close()
+                del self.worker_clients[worker_thread]
+
+    def _get_worker_sftp_client(self) -> SFTPClient:
+        """
+        Get the SFTP session of the current worker thread, opened on the transport of the main session.
+
+        Returns:
+            SFTPClient: The SFTP session.
+        """
+        worker_thread = threading.current_thread()
+        with self.lock:
+            sftp_client = self.worker_clients.get(worker_thread)
+        if not sftp_client:
+            sftp_client = SFTPClient.from_transport(self.sftp_client.get_channel().get_transport())
+            with self.lock:
+                self.worker_clients[worker_thread] = sftp_client
+        return sftp_client
+
+    def _transfer_concurrently(self, files_to_transfer: List[Tuple[str, str]], transfer_function: Callable, resume: bool, verify_checksum: bool) -> None:
+        """
+        Transfer files in parallel, each worker thread using its own SFTP session.
+
+        Args:
+            files_to_transfer (List[Tuple[str, str]]): The (origin path, destination path) of every file.
+            transfer_function (Callable): _download_file or _upload_file.
+            resume (bool): True to complete the partial transfers of a previous attempt.
+            verify_checksum (bool): True to compare the sha256 of every file once transferred.
+        """
+
+        def transfer(paths: Tuple[str, str]) -> int:
+            """
+            Transfer a single file from a worker thread.
+
+            Args:
+                paths (Tuple[str, str]): The origin and destination paths.
+
+            Returns:
+                int: The number of bytes transferred.
+            """
+            worker_thread = threading.current_thread()
+            with self.lock:
+                self.transferring_threads.add(worker_thread)
+            try:
+                return transfer_function(self._get_worker_sftp_client(), paths[0], paths[1], resume, verify_checksum)
+            finally:
+                with self.lock:
+                    self.transferring_threads.discard(worker_thread)
+                    if worker_thread in self.abandoned_threads:
+                        self.abandoned_threads.discard(worker_thread)
+                        sftp_client = self.worker_clients.pop(worker_thread, None)
+                        if sftp_client:
+                            sftp_client.close()
+
+        if not files_to_transfer:
+            return
+        try:
+            targets = {origin_path: (origin_path, destination_path) for origin_path, destination_path in files_to_transfer}
+            FanOutExecutor(max_concurrency=self.max_concurrency, timeout_per_target=self.timeout_per_file).execute(targets, transfer)
+        finally:
+            self.close()
+
+    @staticmethod
+    def _get_resume_offset(destination_path: str, destination_size: Optional[int], origin_size: int, resume: bool) -> int:
+        """
+        Get the offset to start the transfer from.
+
+        Args:
+            destination_path (str): The destination file.
+            destination_size (Optional[int]): The size of the destination file, or None if it doesn't exist.
+            origin_size (int): The size of the origin file.
+            resume (bool): True to keep the bytes already at the destination.
+
+        Returns:
+            int: The number of bytes to skip, 0 to transfer the whole file.
+        """
+        if not resume or not destination_size or destination_size > origin_size:
+            return 0
+        get_logger().log_info(f"Resuming the transfer to {destination_path} at {destination_size} of {origin_size} bytes")
+        return destination_size
+
+    @staticmethod
+    def _hash_local_prefix(local_path: str, size: int) -> "hashlib._Hash":
+        """
+        Start a sha256 with the first bytes of a local file, which a resumed transfer won't read again.
+
+        Args:
+            local_path (str): Path of the local file.
+            size (int): The number of bytes to hash.
+
+        Returns:
+            hashlib._Hash: The sha256 of the first bytes of the file.
+        """
+        sha256 = hashlib.sha256()
+        if size:
+            with open(local_path, "rb") as local_file:
+                while size > 0:
+                    data = local_file.read(min(CHUNK_SIZE, size))
+                    if not data:
+                        break
+                    sha256.update(data)
+                    size -= len(data)
+        return sha256
+
+    def _verify(self, remote_path: str, remote_size: int, local_path: str, local_size: int, sha256: Optional["hashlib._Hash"]) -> None:
+        """
+        Check that the local and remote files match once transferred.
+
+        Args:
+            remote_path (str): The remote file.
+            remote_size (int): The size of the remote file.
+            local_path (str): The local file.
+            local_size (int): The size of the local file.
+            sha256 (Optional[hashlib._Hash]): The sha256 of the local file, or None to only compare the sizes.
+
+        Raises:
+            IOError: If the files don't match.
+        """
+        if local_size != remote_size:
+            raise IOError(f"{local_path} has {local_size} bytes but {remote_path} has {remote_size} bytes")
+
+        if sha256:
+            remote_sha256 = self.get_remote_sha256(remote_path)
+            if remote_sha256 != sha256.hexdigest():
+                raise IOError(f"The sha256 of {local_path} ({sha256.hexdigest()}) doesn't match the one of {remote_path} ({remote_sha256})")
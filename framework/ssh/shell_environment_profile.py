@@ -0,0 +1,82 @@
+from typing import List
+
+
+class ShellEnvironmentProfile:
+    """
+    This class describes the environment of a persistent remote shell (e.g. openrc sourced, KUBECONFIG exported).
+
+    A command is run in the shell of a profile when it starts with the profile's command prefix (and ends with its
+    command suffix, if any). The prefix and suffix are the ones added by the command wrappers of the keywords, so that the
+    wrapped command can be sent unchanged whether the persistent shell is enabled or not.
+    """
+
+    def __init__(self, name: str, command_prefix: str, setup_commands: List[str], command_suffix: str = "", as_sudo: bool = False):
+        """
+        Constructor
+
+        Args:
+            name (str): Name of the profile, used to identify its shell.
+            command_prefix (str): Prefix added by the command wrapper of this environment, e.g. 'source /etc/platform/openrc;'.
+            setup_commands (List[str]): Commands run once when the shell of this profile is started.
+            command_suffix (str): Suffix added by the command wrapper of this environment, if any.
+            as_sudo (bool): True if the shell of this profile runs as root, for commands sent with send_as_sudo.
+        """
+        self.name = name
+        self.command_prefix = command_prefix
+        self.setup_commands = setup_commands
+        self.command_suffix = command_suffix
+        self.as_sudo = as_sudo
+
+    def get_name(self) -> str:
+        """
+        Getter for the name of this profile.
+
+        Returns:
+            str: The name of the profile.
+        """
+        return self.name
+
+    def get_setup_commands(self) -> List[str]:
+        """
+        Getter for the commands run when the shell of this profile is started.
+
+        Returns:
+            List[str]: The setup commands.
+        """
+        return self.setup_commands
+
+    def is_as_sudo(self) -> bool:
+        """
+        Getter for whether the shell of this profile runs as root.
+
+        Returns:
+            bool: True if the shell runs as root.
+        """
+        return self.as_sudo
+
+    def matches(self, cmd: str) -> bool:
+        """
+        Check if the command was wrapped for the environment of this profile.
+
+        Args:
+            cmd (str): The wrapped command.
+
+        Returns:
+            bool: True if the command can be run in the shell of this profile.
+        """
+        return cmd.startswith(self.command_prefix) and cmd.endswith(self.command_suffix) and len(cmd) > len(self.command_prefix) + len(self.command_suffix)
+
+    def unwrap(self, cmd: str) -> str:
+        """
+        Remove the prefix and suffix of this environment from the wrapped command.
+
+        Args:
+            cmd (str): The wrapped command.
+
+        Returns:
+            str: The command to run in the shell of this profile.
+        """
+        unwrapped_cmd = cmd[len(self.command_prefix) :]
+        if self.command_suffix:
+            unwrapped_cmd = unwrapped_cmd[: -len(self.command_suffix)]
+        return unwrapped_cmd
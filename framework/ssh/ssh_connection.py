@@ -1,17 +1,29 @@
 import codecs
 import re
+import select
 import shlex
+import socket
 import time
-from typing import List, Optional
+import uuid
+import zlib
+from typing import Callable, Generator, List, Optional
 
 import paramiko
+from paramiko.channel import ChannelFile
 from paramiko.client import SSHClient
 from paramiko.sftp_client import SFTPClient
 
 from config.host.objects.host_configuration import HostConfiguration
 from framework.logging.automation_logger import get_logger
+from framework.ssh.batch_command_result import BatchCommandResult
+from framework.ssh.jump_host_transport_manager import JumpHostTransportManager
 from framework.ssh.prompt_response import PromptResponse
-from framework.threading.thread_manager import ThreadManager
+from framework.ssh.remote_shell_session import RemoteShellSession
+from framework.ssh.shell_environment_profile import ShellEnvironmentProfile
+from framework.threading.command_executor import CommandExecutor
+
+# Matches the ANSI terminal control codes, see SSHConnection._strip_ansi_sequences
+ANSI_ESCAPE_PATTERN = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
 
 
 class SSHConnection:
@@ -47,7 +59,7 @@ class SSHConnection:
             proxy_command (str, optional): A ProxyCommand string for connecting through a proxy.
         """
         self.client = SSHClient()
-        self.jump_host_client: Optional[SSHClient] = None
+        self.is_holding_jump_host = False  # True while this connection uses the shared jump host transport
         self.name = name
         self.host = host
         self.user = user
@@ -58,8 +70,22 @@ class SSHConnection:
         self.proxy_command = proxy_command
         self.is_connected = False
 
+        # Long-lived workers used to run every command of this connection with a deadline.
+        self.command_executor = CommandExecutor(f"{name}_SSH")
+
+        # these values are used by the SSHConnectionManager to decide if this connection can be handed out again
+        self.is_poolable = True
+        self.last_used_time = time.time()
+
         self.last_return_code: Optional[int] = None  # The last Return Code
 
+        # SFTP session reused by the file transfers of this connection, see get_sftp_client
+        self.sftp_client: Optional[SFTPClient] = None
+
+        # these values are used when commands are run in persistent shells, see enable_persistent_shell
+        self.shell_profiles: List[ShellEnvironmentProfile] = []
+        self.shell_sessions: dict[str, RemoteShellSession] = {}
+
         # these are values are used for commands that require ssh pass on remote nodes
         self.use_ssh_pass = False
         self.ssh_pass_host = None
@@ -67,54 +93,6 @@ class SSHConnection:
         self.ssh_pass_password = None
         self.output_start_line = -1  # for parsing out lines that come by default when using ssh pass
 
-    def _connect_to_jump_host(self, allow_agent: bool = True, look_for_keys: bool = True, retries: int = 3, retry_delay: int = 5) -> SSHClient:
-        """
-        Connect to the configured jump host using SSH.
-
-        Uses paramiko to establish the SSH session with the jump host, based on
-        credentials provided in the `jump_host` configuration. Retries on transient
-        failures such as 'Error reading SSH protocol banner'.
-
-        Args:
-            allow_agent (bool): Connect to SSH agent (Paramiko arg). Default is True.
-            look_for_keys (bool): Re-use saved private keys (Paramiko arg). Default is True.
-            retries (int): Number of connection attempts before giving up. Default is 3.
-            retry_delay (int): Seconds to wait between attempts. Default is 5.
-
-        Returns:
-            SSHClient: The connected jump host SSH client.
-        """
-        host = self.jump_host.get_host()
-        user_name = self.jump_host.get_credentials().get_user_name()
-        password = self.jump_host.get_credentials().get_password()
-        jump_host_ssh_port = self.jump_host.get_ssh_port()
-
-        last_exception = None
-        for attempt in range(1, retries + 1):
-            jump_client = SSHClient()
-            jump_client.set_missing_host_key_policy(paramiko.AutoAddPolicy)
-            try:
-                jump_client.connect(
-                    host,
-                    username=user_name,
-                    password=password,
-                    timeout=self.timeout,
-                    allow_agent=allow_agent,
-                    look_for_keys=look_for_keys,
-                    port=jump_host_ssh_port,
-                )
-                return jump_client
-            except BaseException as exception:
-                jump_client.close()
-                last_exception = exception
-                get_logger().log_error(f"Failed to Connect to Jump-Host {host} (attempt {attempt}/{retries}): {exception}")
-                if attempt < retries:
-                    get_logger().log_info(f"Retrying jump host connection in {retry_delay}s...")
-                    time.sleep(retry_delay)
-
-        get_logger().log_error(f"Could not connect to gateway {host}:{jump_host_ssh_port} : {last_exception}")
-        raise BaseException("Failed to connect to Jump-Host")
-
     def connect(self, allow_agent: bool = True, look_for_keys: bool = False) -> bool:
         """
         Create an SSH connection to the target host.
@@ -133,9 +111,10 @@ class SSHConnection:
             if self.proxy_command:
                 sock = paramiko.ProxyCommand(self.proxy_command)
             elif self.jump_host:
-                self._close_jump_host()
-                self.jump_host_client = self._connect_to_jump_host(allow_agent, look_for_keys)
-                sock = self.jump_host_client.get_transport().open_channel("direct-tcpip", (self.host, self.ssh_port), ("", 0), timeout=self.timeout)
+                if not self.is_holding_jump_host:
+                    JumpHostTransportManager.acquire(self.jump_host, timeout=self.timeout)
+                    self.is_holding_jump_host = True
+                sock = JumpHostTransportManager.open_channel(self.jump_host, self.host, self.ssh_port, timeout=self.timeout)
 
             self.client.connect(
                 self.host,
@@ -222,6 +201,140 @@ class SSHConnection:
 
         return output
 
+    def send_batch(self, cmds: List[str], command_timeout: int = None, reconnect_timeout: int = None) -> List[BatchCommandResult]:
+        """
+        Sends several commands in a single script on one channel and returns the result of each command.
+
+        This saves a round trip per command for keywords that run many small commands in sequence. Each command runs
+        in its own subshell, so a failing command doesn't stop the following ones. The output of each result has the
+        same format as the one returned by 'send', and get_return_code() returns the return code of the last command.
+
+        Args:
+            cmds (List[str]): The commands to execute, in order.
+            command_timeout (int): Optional timeout in seconds for the whole batch.
+            reconnect_timeout (int): Time in seconds to retry the connection.
+
+        Returns:
+            List[BatchCommandResult]: The result of each command, in the same order as the commands.
+        """
+        return self._execute_command("SEND_BATCH", cmds, command_timeout=command_timeout, reconnect_timeout=reconnect_timeout)
+
+    def send_stream(
+        self,
+        cmd: str,
+        command_timeout: int = None,
+        reconnect_timeout: int = None,
+        line_filter: Callable[[str], bool] = None,
+        max_bytes: int = None,
+        stop_when: Callable[[str], bool] = None,
+        log_output: bool = True,
+        gunzip_output: bool = False,
+    ) -> Generator[str, None, None]:
+        """
+        Sends a command and yields its output lines as they arrive, instead of waiting for the command to complete.
+
+        The lines have the same format as the ones returned by 'send' (decoded, with their line breaks), so parsers
+        taking a list of lines can consume list(send_stream(...)), and parsers iterating over the lines can consume the
+        stream directly. Stopping the iteration early (or hitting max_bytes or stop_when) closes the channel, which stops
+        the remote command. get_return_code() returns the return code of the command once the stream is exhausted, or
+        None if it was stopped before the command completed.
+
+        Like 'send', the connection is retried for up to `reconnect_timeout` seconds if the command can't be started.
+        Once it has started, the command is not retried if the connection drops, since the lines already yielded can't
+        be taken back.
+
+        Args:
+            cmd (str): The command to execute.
+            command_timeout (int): Optional timeout in seconds for the whole command. Defaults to 60 seconds.
+            reconnect_timeout (int): Time in seconds to retry the connection until the command is started.
+            line_filter (Callable[[str], bool]): Only the lines for which this returns True are yielded (and logged).
+            max_bytes (int): Stop reading once this many bytes of output have been received.
+            stop_when (Callable[[str], bool]): Stop reading once a yielded line makes this return True. That line is
+                the last one yielded.
+            log_output (bool): False to not log the yielded lines, e.g. when fetching the content of a whole log file.
+            gunzip_output (bool): True if the command pipes its output through 'gzip', to save bandwidth on large
+                outputs. The output is decompressed as it arrives. Not supported on ssh pass connections.
+
+        Yields:
+            str: The output lines of the command.
+
+        Raises:
+            TimeoutError: If the command did not complete within the timeout.
+            ValueError: If gunzip_output is requested on an ssh pass connection.
+        """
+        if not command_timeout:
+            command_timeout = 60
+        if not reconnect_timeout:
+            reconnect_timeout = 600
+        self.last_used_time = time.time()
+        self.last_return_code = None
+
+        lines_to_skip = 0
+        if self.use_ssh_pass:
+            if gunzip_output:
+                raise ValueError("Compressed output can't be streamed through an ssh pass connection")
+            cmd = f"{self.get_ssh_pass_str()} '{cmd}'"
+            lines_to_skip = max(0, self.output_start_line)
+
+        stdout = self._start_stream_command(cmd, command_timeout, reconnect_timeout)
+        channel = stdout.channel
+        channel.set_combine_stderr(True)
+
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if gunzip_output else None
+        end_time = time.time() + command_timeout
+        bytes_received = 0
+        pending_line = ""
+        is_complete = False
+        try:
+            while True:
+                remaining_time = end_time - time.time()
+                if remaining_time <= 0:
+                    raise TimeoutError(f"Streamed command did not complete within {command_timeout} seconds")
+                channel.settimeout(remaining_time)
+                try:
+                    data = channel.recv(32768)
+                except socket.timeout:
+                    continue
+
+                if data:
+                    bytes_received += len(data)
+                    pending_line += decoder.decode(decompressor.decompress(data) if decompressor else data)
+                else:
+                    pending_line += decoder.decode(b"", final=True)
+
+                # Split on line feeds only, like readlines(). The last line is kept until its line break arrives.
+                parts = pending_line.split("\n")
+                pending_line = parts.pop()
+                lines = [f"{part}\n" for part in parts]
+                if not data and pending_line:
+                    lines.append(pending_line)
+
+                for line in lines:
+                    if lines_to_skip:
+                        lines_to_skip -= 1
+                        continue
+                    if line_filter and not line_filter(line):
+                        continue
+                    if log_output:
+                        get_logger().log_ssh(line.rstrip("\n"))
+                    yield line
+                    if stop_when and stop_when(line):
+                        get_logger().log_debug("Stopped reading the streamed command output: the stop condition was met")
+                        return
+
+                if not data:
+                    is_complete = True
+                    self.last_return_code = channel.recv_exit_status()
+                    return
+
+                if max_bytes and bytes_received >= max_bytes:
+                    get_logger().log_warning(f"Stopped reading the streamed command output after {bytes_received} bytes (max_bytes={max_bytes})")
+                    return
+        finally:
+            if not is_complete:
+                channel.close()
+
     def send_expect_prompts(self, cmd: str, prompts: List[PromptResponse], command_timeout: int = None, reconnect_timeout: int = None) -> str:
         """
         Sends a command, waits for prompts and returns the output.
@@ -239,10 +352,40 @@ class SSHConnection:
         """
         return self._execute_command("SEND_EXPECT_PROMPTS", cmd, command_timeout=command_timeout, reconnect_timeout=reconnect_timeout, prompts=prompts)
 
+    def _start_stream_command(self, cmd: str, command_timeout: int, reconnect_timeout: int) -> ChannelFile:
+        """
+        Starts a streamed command, reconnecting and trying again until it is started or the reconnect timeout is reached.
+
+        Args:
+            cmd (str): The command to start.
+            command_timeout (int): Timeout in seconds for the whole command.
+            reconnect_timeout (int): Time in seconds to retry the connection.
+
+        Returns:
+            ChannelFile: The stdout of the started command.
+        """
+        timeout = time.time() + reconnect_timeout
+        refresh_timeout = 5
+        while True:
+            try:
+                if not self.is_connected and not self.connect():
+                    raise ConnectionError(f"Unable to connect to {self.host}")
+
+                get_logger().log_ssh(cmd)
+                _, stdout, _ = self.client.exec_command(cmd, timeout=command_timeout)
+                return stdout
+
+            except Exception as e:
+                if time.time() + refresh_timeout >= timeout:
+                    raise
+                get_logger().log_info(f"SSH command failed to start. Reconnecting and trying again in {refresh_timeout} seconds. Exception: {str(e)}")
+                time.sleep(refresh_timeout)
+                self.is_connected = False
+
     def _execute_command(
         self,
         action: str,
-        cmd: str,
+        cmd: str | List[str],
         command_timeout: int = None,
         reconnect_timeout: int = None,
         prompts: List[PromptResponse] = None,
@@ -254,8 +397,8 @@ class SSHConnection:
         Waits for reconnect timeout in case of SSH disconnects.
 
         Args:
-            action (str): The action to execute, e.g., SEND, SEND_SUDO, SEND_EXPECT_PROMPTS.
-            cmd (str): The command to run.
+            action (str): The action to execute, e.g., SEND, SEND_SUDO, SEND_EXPECT_PROMPTS, SEND_BATCH.
+            cmd (str | List[str]): The command to run, or the list of commands for SEND_BATCH.
             command_timeout (int): Timeout in seconds for a single command execution.
             reconnect_timeout (int): The time in seconds to wait for SSH connection.
             prompts (List[PromptResponse], optional): Expected prompts, if any.
@@ -271,9 +414,18 @@ class SSHConnection:
 
         timeout = time.time() + reconnect_timeout
         refresh_timeout = 5
-
-        # if we are using ssh pass, we need to wrap the call
-        if self.use_ssh_pass:
+        self.last_used_time = time.time()
+
+        # commands wrapped for one of the persistent shell profiles are run in the shell of that profile
+        shell_profile = None
+        if self.shell_profiles and not self.use_ssh_pass and not get_pty and action in ("SEND", "SEND_SUDO"):
+            shell_profile = self._get_shell_profile(cmd, as_sudo=action == "SEND_SUDO")
+            if shell_profile:
+                action = "SEND_IN_SHELL"
+                cmd = shell_profile.unwrap(cmd)
+
+        # if we are using ssh pass, we need to wrap the call (batches wrap each of their commands)
+        if self.use_ssh_pass and action != "SEND_BATCH":
             if action == "SEND_SUDO":  # if it a sudo call we need further changes to avoid password prompt
                 cmd = f'{self.get_ssh_pass_str()} "echo "{self.ssh_pass_password}" | sudo -S {cmd}"'
                 # since we do not need prompts or to prepend sudo now, change Action to just 'SEND'
@@ -287,25 +439,31 @@ class SSHConnection:
                 if not self.is_connected:
                     self.connect()
 
-                thread_manager = ThreadManager(timeout=command_timeout)
-
                 if action == "SEND":
-                    thread_manager.start_thread("SSH_Command", self._send, cmd, get_pty=get_pty)
+                    output = self.command_executor.execute("SSH_Command", command_timeout, self._send, cmd, get_pty=get_pty)
                 elif action == "SEND_SUDO":
-                    thread_manager.start_thread("SSH_Command", self._send_as_sudo, cmd)
+                    output = self.command_executor.execute("SSH_Command", command_timeout, self._send_as_sudo, cmd)
                 elif action == "SEND_EXPECT_PROMPTS":
-                    thread_manager.start_thread("SSH_Command", self._send_expect_prompts, cmd, prompts)
+                    output = self.command_executor.execute("SSH_Command", command_timeout, self._send_expect_prompts, cmd, prompts)
+                elif action == "SEND_BATCH":
+                    output = self.command_executor.execute("SSH_Command", command_timeout, self._send_batch, cmd)
+                elif action == "SEND_IN_SHELL":
+                    output = self.command_executor.execute("SSH_Command", command_timeout, self._send_in_shell, shell_profile, cmd, command_timeout)
                 else:
                     raise ValueError(f"{action} is not a supported command for an SSHConnection.")
 
-                thread_manager.join_all_threads()
-                output = thread_manager.get_thread_object("SSH_Command").get_result()
-
-                # if we use ssh pass we want to skip the preamble before sending back ouput
-                if self.use_ssh_pass and self.output_start_line != -1:  # if -1 it's the call to get preamble so return whole output
+                # if we use ssh pass we want to skip the preamble before sending back ouput (batches skip it per command)
+                if self.use_ssh_pass and self.output_start_line != -1 and action != "SEND_BATCH":  # if -1 it's the call to get preamble so return whole output
                     output = output[self.output_start_line :]
                 return output
 
+            except TimeoutError as e:
+                # Closing the client releases the worker that is still blocked on the timed out command.
+                get_logger().log_info(f"SSH command exceeded its timeout of {command_timeout} seconds. Reconnecting and trying again in {refresh_timeout} seconds. " f"Exception: {str(e)}")
+                self.client.close()
+                time.sleep(refresh_timeout)
+                self.is_connected = False
+
             except Exception as e:
                 get_logger().log_info(f"SSH command failed to execute. Reconnecting and trying again in {refresh_timeout} seconds. " f"Exception: {str(e)}")
                 time.sleep(refresh_timeout)
@@ -336,6 +494,166 @@ class SSHConnection:
 
         return output
 
+    def _send_batch(self, cmds: List[str], timeout: int = 30) -> List[BatchCommandResult]:
+        """
+        Sends the given commands as one script and splits the output per command.
+
+        Args:
+            cmds (List[str]): The commands to send.
+            timeout (int): The timeout in seconds for the channel operations.
+
+        Returns:
+            List[BatchCommandResult]: The result of each command.
+        """
+        sentinel = f"__STX_BATCH_DONE_{uuid.uuid4().hex}__"
+        remote_cmds = cmds
+        if self.use_ssh_pass:
+            remote_cmds = [f"{self.get_ssh_pass_str()} '{cmd}'" for cmd in cmds]
+
+        for cmd in cmds:
+            get_logger().log_ssh(cmd)
+
+        stdin, stdout, stderr = self.client.exec_command("bash -s", timeout=timeout)
+        stdout.channel.set_combine_stderr(True)
+        stdin.write(self._build_batch_script(remote_cmds, sentinel))
+        stdin.flush()
+        stdin.channel.shutdown_write()
+        raw_output = stdout.read().decode("utf-8", errors="replace")
+        stdout.channel.recv_exit_status()
+
+        results = self._parse_batch_output(cmds, raw_output, sentinel)
+        for result in results:
+            # if we use ssh pass we want to skip the preamble of each command
+            if self.use_ssh_pass and self.output_start_line != -1:
+                result.output = result.output[self.output_start_line :]
+            get_logger().log_ssh(f"[{result}]")
+            for line in result.get_output():
+                get_logger().log_ssh(line.rstrip("\n"))
+
+        self.last_return_code = results[-1].get_return_code() if results else None
+        return results
+
+    @staticmethod
+    def _build_batch_script(cmds: List[str], sentinel: str) -> str:
+        """
+        Builds the script running each command in a subshell, followed by a sentinel line with its return code and duration.
+
+        Args:
+            cmds (List[str]): The commands of the batch.
+            sentinel (str): The unique string marking the end of the output of each command.
+
+        Returns:
+            str: The script to feed to 'bash -s'.
+        """
+        script = ""
+        for cmd in cmds:
+            script += "__stx_start=$(date +%s%N)\n"
+            script += f"( {cmd}\n) < /dev/null\n"
+            script += "__stx_rc=$?\n"
+            script += f"printf '\\n%s %s %s\\n' '{sentinel}' \"$__stx_rc\" \"$(( $(date +%s%N) - __stx_start ))\"\n"
+        return script
+
+    @staticmethod
+    def _parse_batch_output(cmds: List[str], raw_output: str, sentinel: str) -> List[BatchCommandResult]:
+        """
+        Splits the output of a batch script into the result of each command.
+
+        Args:
+            cmds (List[str]): The commands of the batch.
+            raw_output (str): The whole output of the script.
+            sentinel (str): The unique string marking the end of the output of each command.
+
+        Returns:
+            List[BatchCommandResult]: The result of each command. Commands that didn't complete have a return code of None.
+        """
+        results = []
+        marker = f"\n{sentinel} "
+        position = 0
+        for cmd in cmds:
+            marker_index = raw_output.find(marker, position)
+            if marker_index == -1:
+                results.append(BatchCommandResult(cmd, raw_output[position:].splitlines(keepends=True), None, 0.0))
+                position = len(raw_output)
+                continue
+
+            end_of_line = raw_output.find("\n", marker_index + len(marker))
+            if end_of_line == -1:
+                end_of_line = len(raw_output)
+            return_code, duration_ns = (raw_output[marker_index + len(marker) : end_of_line].split() + ["", ""])[:2]
+            output = raw_output[position:marker_index].splitlines(keepends=True)
+            duration = int(duration_ns) / 1e9 if duration_ns.isdigit() else 0.0
+            results.append(BatchCommandResult(cmd, output, int(return_code) if return_code.lstrip("-").isdigit() else None, duration))
+            position = end_of_line + 1
+        return results
+
+    def _send_in_shell(self, shell_profile: ShellEnvironmentProfile, cmd: str, timeout: int) -> List[str]:
+        """
+        Runs the given command in the persistent shell of the profile.
+
+        Args:
+            shell_profile (ShellEnvironmentProfile): The profile whose shell runs the command.
+            cmd (str): The command to run, without the prefix of the profile.
+            timeout (int): The timeout in seconds for command execution.
+
+        Returns:
+            List[str]: The output of the command, as a list of lines.
+        """
+        get_logger().log_ssh(f"[{shell_profile.get_name()}] {cmd}")
+
+        shell_session = self.shell_sessions.get(shell_profile.get_name())
+        if not shell_session or shell_session.client is not self.client:
+            shell_session = RemoteShellSession(self.client, shell_profile, password=self.password)
+            self.shell_sessions[shell_profile.get_name()] = shell_session
+
+        output, self.last_return_code = shell_session.run(cmd, timeout)
+
+        for line in output:
+            clean_line = line.rstrip("\n")
+            get_logger().log_ssh(clean_line)
+
+        return output
+
+    def _get_shell_profile(self, cmd: str, as_sudo: bool) -> Optional[ShellEnvironmentProfile]:
+        """
+        Finds the persistent shell profile that the command was wrapped for.
+
+        Args:
+            cmd (str): The wrapped command.
+            as_sudo (bool): True if the command is sent with sudo.
+
+        Returns:
+            Optional[ShellEnvironmentProfile]: The matching profile, or None if the command must be sent normally.
+        """
+        for shell_profile in self.shell_profiles:
+            if shell_profile.is_as_sudo() == as_sudo and shell_profile.matches(cmd):
+                return shell_profile
+        return None
+
+    def enable_persistent_shell(self, shell_profiles: List[ShellEnvironmentProfile]) -> None:
+        """
+        Run the commands wrapped for one of the given environment profiles in a long-lived shell for that profile.
+
+        The environment of each profile (e.g. openrc, KUBECONFIG) is set up once when its shell starts, instead of for
+        every command. Commands that don't match any profile are still sent on a new channel.
+
+        Args:
+            shell_profiles (List[ShellEnvironmentProfile]): The environment profiles to keep a shell for.
+        """
+        self.shell_profiles = list(shell_profiles)
+
+    def disable_persistent_shell(self) -> None:
+        """
+        Stop the persistent shells and go back to sending every command on a new channel.
+        """
+        self.shell_profiles = []
+        self._close_shell_sessions()
+
+    def _close_shell_sessions(self) -> None:
+        """Stop all the persistent shells of this connection."""
+        for shell_session in self.shell_sessions.values():
+            shell_session.close()
+        self.shell_sessions.clear()
+
     def _send_as_sudo(self, cmd: str) -> str:
         """
         Sends the specified command using sudo and handles the password prompt.
@@ -374,6 +692,7 @@ class SSHConnection:
 
         # Open up a channel to control the SSH connection and send the command.
         channel = self.client.invoke_shell()
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
         self.__send_in_channel(channel, cmd)
 
         # Keep going until we have matched every prompt in order
@@ -384,7 +703,7 @@ class SSHConnection:
 
             while not is_prompt_match:
                 # Read the response from the server.
-                code, output_buffer = self.__read_from_channel(channel, timeout)
+                code, output_buffer = self.__read_from_channel(channel, timeout, decoder)
 
                 if code != 0:
                     get_logger().log_warning(f"Failed to match prompt of {prompt.get_prompt_substring()}")
@@ -393,10 +712,11 @@ class SSHConnection:
                 # Log the current console output.
                 get_logger().log_info(output_buffer.rstrip())
 
-                # Add the currently read buffer to the output
+                # Add the currently read buffer to the output, and only search the new part for the prompt.
+                search_start = len(output_since_last_prompt)
                 output_since_last_prompt += output_buffer
                 prompt.set_complete_output(output_since_last_prompt)
-                is_prompt_match = prompt.get_prompt_substring() in output_since_last_prompt
+                is_prompt_match = prompt.is_found_in(output_since_last_prompt, search_start)
 
                 # If we match the prompt, send the associated response if any.
                 if is_prompt_match and prompt.get_prompt_response():
@@ -430,36 +750,34 @@ class SSHConnection:
         ssh_channel.send(cmd)
         ssh_channel.send("\n")
 
-    def __read_from_channel(self, ssh_channel: paramiko.Channel, timeout: int) -> tuple[int, str]:
+    def __read_from_channel(self, ssh_channel: paramiko.Channel, timeout: int, decoder: codecs.IncrementalDecoder) -> tuple[int, str]:
         """
         Read data from an SSH channel opened via `invoke_shell()`.
 
-        Waits for the channel to be ready and reads the output. Times out if no
+        Waits (without polling) for the channel to be readable and reads the output. Times out if no
         response is received in the given number of seconds.
 
         Args:
             ssh_channel (paramiko.Channel): The SSH channel obtained from
                 `self.client.invoke_shell()`.
             timeout (int): Time in seconds to wait for a response.
+            decoder (codecs.IncrementalDecoder): The decoder of this channel, kept between reads so that
+                multibyte characters split across two reads are decoded properly.
 
         Returns:
             tuple[int, str]: A tuple of return code and string output.
                 - Return code: 0 on success, -1 on timeout or connection closed.
                 - Output: The response string read from the SSH channel.
         """
-        # Setup Variables
-        decoder = codecs.getincrementaldecoder("utf-8")()
-        base_time = time.time()
-
-        # Avoids paramiko hang when recv is not ready yet
-        while not ssh_channel.recv_ready():
-            time.sleep(0.009)  # Avoid spamming the channel. Value taken from paramiko-expect.
-            if time.time() >= (base_time + timeout):
+        # The channel becomes readable when data arrives or when it is closed by the remote end.
+        if not ssh_channel.recv_ready():
+            readable, _, _ = select.select([ssh_channel], [], [], timeout)
+            if not readable:
                 get_logger().log_warning("SSH output read timed out — buffer may be incomplete or prompt unmatched.")
                 return -1, "Timeout Exceeded"
 
         # Read some of the output - increased buffer size for large outputs
-        current_buffer = ssh_channel.recv(8192)
+        current_buffer = ssh_channel.recv(32768)
 
         # If we have an empty buffer, then the SSH session has been closed
         if len(current_buffer) == 0:
@@ -488,25 +806,102 @@ class SSHConnection:
         return self.last_return_code
 
     def _close_jump_host(self) -> None:
-        """Close the jump host SSH client if it exists."""
-        if self.jump_host_client:
+        """Release the shared jump host transport if this connection is using it."""
+        if self.is_holding_jump_host:
             try:
-                self.jump_host_client.close()
+                JumpHostTransportManager.release(self.jump_host)
             except Exception:
                 pass
-            self.jump_host_client = None
+            self.is_holding_jump_host = False
 
     def close(self) -> None:
         """
-        Close the SSH connection and the jump host connection if any.
+        Close the SSH connection and release the shared jump host transport if any.
 
-        This shuts down the underlying Paramiko SSH client(s).
+        This shuts down the underlying Paramiko SSH client and the workers used to execute commands.
 
         Returns:
             None:
         """
+        self._close_shell_sessions()
+        if self.sftp_client:
+            self.sftp_client.close()
+            self.sftp_client = None
         self.client.close()
         self._close_jump_host()
+        self.is_connected = False
+        self.command_executor.shutdown()
+        get_logger().log_debug(f"Closed {self}. Command statistics: {self.command_executor}")
+
+    def is_alive(self) -> bool:
+        """
+        Check if the underlying SSH transport of this connection is still usable.
+
+        Returns:
+            bool: True if the connection is established and its transport is active, False otherwise.
+        """
+        if not self.is_connected:
+            return False
+        transport = self.client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        try:
+            # Cheap round trip to the peer to detect connections that were dropped by a reboot or a swact.
+            transport.send_ignore()
+        except Exception:
+            return False
+        return True
+
+    def get_pool_key(self) -> tuple:
+        """
+        Get the key used by the SSHConnectionManager to share this connection between callers.
+
+        Connections with the same key reach the same host, as the same user, through the same jump host or proxy.
+
+        Returns:
+            tuple: (host, ssh port, user, jump host, jump host port, proxy command)
+        """
+        return self.create_pool_key(self.host, self.ssh_port, self.user, self.jump_host, self.proxy_command)
+
+    @staticmethod
+    def create_pool_key(host: str, ssh_port: int, user: str, jump_host: HostConfiguration = None, proxy_command: str = None) -> tuple:
+        """
+        Create the pool key of a connection with the given settings, without creating the connection.
+
+        Args:
+            host (str): The target host.
+            ssh_port (int): The port used for SSH.
+            user (str): The SSH username.
+            jump_host (HostConfiguration): Configuration for a jump host, if any.
+            proxy_command (str): The ProxyCommand string, if any.
+
+        Returns:
+            tuple: (host, ssh port, user, jump host, jump host port, proxy command)
+        """
+        jump_host_name = None
+        jump_host_port = None
+        if jump_host:
+            jump_host_name = jump_host.get_host()
+            jump_host_port = jump_host.get_ssh_port()
+        return host, ssh_port, user, jump_host_name, jump_host_port, proxy_command
+
+    def get_last_used_time(self) -> float:
+        """
+        Getter for the last time a command was sent on this connection.
+
+        Returns:
+            float: The epoch time at which this connection was last used.
+        """
+        return self.last_used_time
+
+    def get_command_executor(self) -> CommandExecutor:
+        """
+        Getter for the executor that runs the commands of this connection.
+
+        Returns:
+            CommandExecutor: The command executor, which holds the issued, queued and timed out counters.
+        """
+        return self.command_executor
 
     def set_name(self, name: str) -> None:
         """
@@ -527,18 +922,25 @@ class SSHConnection:
         """
         return self.name
 
-    def get_sftp_client(self, reconnect_timeout: int = 600) -> SFTPClient:
+    def get_sftp_client(self, reconnect_timeout: int = 600, fresh_client: bool = False) -> SFTPClient:
         """
         Get an SFTP client for file operations.
 
-        Retries the connection for up to `reconnect_timeout` seconds if disconnected.
+        The SFTP session is opened once and reused by the next calls for as long as it stays open, instead of opening
+        a new SFTP channel for every transfer. Retries the connection for up to `reconnect_timeout` seconds if
+        disconnected.
 
         Args:
             reconnect_timeout (int): The number of seconds to retry connecting.
+            fresh_client (bool): True to open a new SFTP session owned by the caller, e.g. for the workers of a
+                concurrent transfer, which can't share a session.
 
         Returns:
             SFTPClient: A Paramiko SFTP client for performing file operations.
         """
+        if not fresh_client and self.sftp_client and self.is_connected and not self.sftp_client.get_channel().closed:
+            return self.sftp_client
+
         timeout = time.time() + reconnect_timeout
         refresh_timeout = 5
 
@@ -549,6 +951,8 @@ class SSHConnection:
                     self.connect()
                 sftp_client = self.client.open_sftp()
                 if sftp_client:
+                    if not fresh_client:
+                        self.sftp_client = sftp_client
                     return sftp_client
                 else:
                     raise "SFTP Client was None"  # should be caught in the except block which tries to reconnect
@@ -572,6 +976,8 @@ class SSHConnection:
             host_password (str): The password for SSH authentication.
         """
         # setup this ssh connection with ssh pass parameters
+        # commands are now wrapped for another host, so this connection can't be shared anymore.
+        self.is_poolable = False
         self.use_ssh_pass = True
         self.ssh_pass_host = host_name
         self.ssh_pass_username = host_user_name
@@ -620,5 +1026,4 @@ class SSHConnection:
         Returns:
             str: Cleaned string without ANSI sequences.
         """
-        ansi_escape_pattern = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-        return ansi_escape_pattern.sub("", text)
+        return ANSI_ESCAPE_PATTERN.sub("", text)
@@ -1,15 +1,155 @@
 import getpass
 import socket
+import threading
+import time
 from datetime import datetime
+from typing import Callable
 
 from config.host.objects.host_configuration import HostConfiguration
+from framework.logging.automation_logger import get_logger
 from framework.ssh.ssh_connection import SSHConnection
 from framework.ssh.ssh_connection_info import SSHConnectionInfoClass
 
 
 class SSHConnectionManagerClass:
-    def __init__(self):
+    """
+    This class keeps track of all the SSH connections created by the framework.
+
+    Connections to the same (host, port, user, jump host) are pooled: asking for the same connection again from the
+    same thread returns the live connection that was already created instead of doing a new SSH handshake. A pooled
+    connection is checked out for as long as the thread that created it is alive, and is never closed to make room
+    while it is checked out.
+    """
+
+    def __init__(self, idle_timeout: int = 900, max_connections_per_host: int = 4):
+        """
+        Constructor
+
+        Args:
+            idle_timeout (int): Number of seconds after which an unused pooled connection is closed.
+            max_connections_per_host (int): Maximum number of pooled connections kept for the same host, user and jump host.
+        """
         self.ssh_connection_list = {}
+        self.idle_timeout = idle_timeout
+        self.max_connections_per_host = max_connections_per_host
+        self.connection_owner_threads: dict[str, threading.Thread] = {}
+        self.connection_aliases: dict[str, str] = {}  # name asked for -> name of the pooled connection handed out
+        self.lock = threading.RLock()
+
+    def _evict_idle_connections(self) -> None:
+        """
+        Closes and removes the pooled connections that haven't been used for longer than the idle timeout.
+
+        The connections still checked out are kept, however long they have been idle, since their thread may use them
+        again.
+        """
+        now = time.time()
+        for name, connection in list(self.ssh_connection_list.items()):
+            if connection.is_poolable and now - connection.get_last_used_time() > self.idle_timeout and not self._is_checked_out(name):
+                get_logger().log_debug(f"Closing idle SSH connection {name}")
+                self.remove_ssh_connection(name)
+
+    def _get_pooled_connection(self, pool_key: tuple) -> SSHConnection:
+        """
+        Finds a live pooled connection matching the pool key that was created by the current thread.
+
+        Connections are not shared across threads since the return code of the last command is stored on the connection.
+        Connections of this pool key that are no longer alive are removed along the way.
+
+        Args:
+            pool_key (tuple): The pool key, as returned by SSHConnection.get_pool_key().
+
+        Returns:
+            SSHConnection: The pooled connection, or None if there isn't one.
+        """
+        current_thread = threading.current_thread()
+        for name, connection in list(self.ssh_connection_list.items()):
+            if not connection.is_poolable or connection.get_pool_key() != pool_key:
+                continue
+            if not connection.is_alive():
+                self.remove_ssh_connection(name)
+                continue
+            if self.connection_owner_threads.get(name) is current_thread:
+                return connection
+        return None
+
+    def _is_checked_out(self, name: str) -> bool:
+        """
+        Checks if a connection may still be in use, i.e. if the thread that it was handed out to is still alive.
+
+        Args:
+            name (str): Name of the connection in the Manager.
+
+        Returns:
+            bool: True if the connection may still be in use.
+        """
+        owner_thread = self.connection_owner_threads.get(name)
+        return owner_thread is not None and owner_thread.is_alive()
+
+    def _make_room_in_pool(self, pool_key: tuple) -> None:
+        """
+        Closes the least recently used connections of this pool key until a new one can be added without exceeding the cap.
+
+        Only the connections that are no longer checked out are closed: when all of them are, the cap is exceeded
+        until their threads are done with them.
+
+        Args:
+            pool_key (tuple): The pool key, as returned by SSHConnection.get_pool_key().
+        """
+        pooled_connections = [(name, connection) for name, connection in self.ssh_connection_list.items() if connection.is_poolable and connection.get_pool_key() == pool_key]
+        number_to_close = len(pooled_connections) - self.max_connections_per_host + 1
+        if number_to_close <= 0:
+            return
+
+        closable_connections = [(name, connection) for name, connection in pooled_connections if not self._is_checked_out(name)]
+        closable_connections.sort(key=lambda name_and_connection: name_and_connection[1].get_last_used_time())
+        for name, _ in closable_connections[:number_to_close]:
+            get_logger().log_debug(f"Closing SSH connection {name} to stay under {self.max_connections_per_host} connections per host")
+            self.remove_ssh_connection(name)
+        if number_to_close > len(closable_connections):
+            get_logger().log_debug(f"All the SSH connections to {pool_key[0]} are in use, going over {self.max_connections_per_host} connections per host")
+
+    def _add_connection(self, name: str, ssh_connection: SSHConnection) -> None:
+        """
+        Connects the ssh connection and adds it to the list to be managed
+
+        Args:
+            name (str): Name associated with the connection in the Manager.
+            ssh_connection (SSHConnection): The connection to add.
+        """
+        self._make_room_in_pool(ssh_connection.get_pool_key())
+        ssh_connection.connect()
+        self.ssh_connection_list[name] = ssh_connection
+        self.connection_owner_threads[name] = threading.current_thread()
+
+    def _get_or_create_connection(self, name: str, pool_key: tuple, fresh_connection: bool, create_connection: Callable[[str], SSHConnection]) -> SSHConnection:
+        """
+        Gets the pooled connection of this thread for the pool key, or creates, connects and adds a new one.
+
+        Args:
+            name (str): Name associated with the connection in the Manager. A pooled connection handed out under another
+                name can also be found under this one.
+            pool_key (tuple): The pool key of the connection, as returned by SSHConnection.create_pool_key().
+            fresh_connection (bool): True to always create a new connection.
+            create_connection (Callable[[str], SSHConnection]): Creates the connection, given its name.
+
+        Returns:
+            SSHConnection: The ssh connection
+        """
+        with self.lock:
+            self._evict_idle_connections()
+            if not fresh_connection:
+                pooled_connection = self._get_pooled_connection(pool_key)
+                if pooled_connection:
+                    if pooled_connection.get_name() != name and name not in self.ssh_connection_list:
+                        self.connection_aliases[name] = pooled_connection.get_name()
+                    return pooled_connection
+
+            if self.ssh_connection_list.get(name):
+                name = name + "_{}".format(datetime.timestamp(datetime.now()))
+            ssh_connection = create_connection(name)
+            self._add_connection(name, ssh_connection)
+            return ssh_connection
 
     def create_ssh_connection(
         self,
@@ -20,55 +160,64 @@ class SSHConnectionManagerClass:
         ssh_port: int = 22,
         timeout: int = 30,
         jump_host: HostConfiguration = None,
+        fresh_connection: bool = False,
     ) -> SSHConnection:
         """
-        Creates the ssh connection and connects using the host, user and password
-        Adds the connection to the list to be managed
-        Args:
+        Creates the ssh connection and connects using the host, user and password.
 
-            host: the host to connect with
-            user: the user
-            password: the password
-            name: Name associated with the connection in the Manager.
-            ssh_port: The port to use to establish an SSH connection.
-            timeout: The maximum time in seconds the caller wants to wait for the SSH connection to be established.
-            jump_host: jump host configuration if needed
+        Adds the connection to the list to be managed. If a live connection to the same host, port, user and jump host
+        was already created by this thread, it is returned instead, unless fresh_connection is set.
 
-        Returns: The ssh connection
+        Args:
+            host (str): the host to connect with
+            user (str): the user
+            password (str): the password
+            name (str): Name associated with the connection in the Manager.
+            ssh_port (int): The port to use to establish an SSH connection.
+            timeout (int): The maximum time in seconds the caller wants to wait for the SSH connection to be established.
+            jump_host (HostConfiguration): jump host configuration if needed
+            fresh_connection (bool): True to always open a new connection, e.g. for tests that reboot or swact the host,
+                or that change the state of the connection.
 
+        Returns:
+            SSHConnection: The ssh connection
         """
         if not name:
             name = host
-        if self.ssh_connection_list.get(name):
-            name = name + '_{}'.format(datetime.timestamp(datetime.now()))
-        ssh_connection = SSHConnection(name, host, user, password, timeout=timeout, ssh_port=ssh_port, jump_host=jump_host)
-        ssh_connection.connect()
-        self.ssh_connection_list[name] = ssh_connection
-
-        return ssh_connection
+        pool_key = SSHConnection.create_pool_key(host, ssh_port, user, jump_host)
+        return self._get_or_create_connection(
+            name,
+            pool_key,
+            fresh_connection,
+            lambda connection_name: SSHConnection(connection_name, host, user, password, timeout=timeout, ssh_port=ssh_port, jump_host=jump_host),
+        )
 
     def create_ssh_from_info(self, info: SSHConnectionInfoClass, name: str = None) -> SSHConnection:
         """
-        Creates the ssh connection and connects using the SSH Connection Info
-        Adds the connection to the list to be managed
+        Creates the ssh connection and connects using the SSH Connection Info.
+
+        Adds the connection to the list to be managed.
+
         Args:
             info (SSHConnectionInfoClass): Connection information
             name (str): Name associated with the connection in the Manager.
 
-        Returns: The ssh connection
-
+        Returns:
+            SSHConnection: The ssh connection
         """
         return self.create_ssh_connection(info.get_host(), info.get_user(), info.get_password(), name)
 
     def create_local_ssh(self, name: str = None) -> SSHConnection:
         """
         Creates an ssh connection to the local host.
-        Adds the connection to the list to be managed
+
+        Adds the connection to the list to be managed.
+
         Args:
             name (str): Name associated with the connection in the Manager.
 
-        Returns: The ssh connection
-
+        Returns:
+            SSHConnection: The ssh connection
         """
         local_host = socket.gethostname()
         local_user = getpass.getuser()
@@ -85,6 +234,7 @@ class SSHConnectionManagerClass:
         second_jump_username: str = None,
         second_jump_password: str = None,
         timeout: int = 30,
+        fresh_connection: bool = False,
     ) -> SSHConnection:
         """
         Creates a real SSH connection to a target node by proxying through one or two jump hosts.
@@ -96,21 +246,20 @@ class SSHConnectionManagerClass:
         Connection order: RunAgent -> first_jump_host (optional) -> second_jump_host -> target
 
         Args:
-            target_host: The hostname of the target node.
-            target_username: The SSH username for the target node.
-            target_password: The SSH password for the target node.
-            first_jump_host: Optional configuration for the outer jump host (first hop from the run agent).
-            second_jump_host: The IP or hostname of the jump host closest to the target (runs nc to reach it).
-            second_jump_username: The SSH username for the second jump host.
-            second_jump_password: The SSH password for the second jump host.
-            timeout: The maximum time in seconds to wait for the connection.
+            target_host (str): The hostname of the target node.
+            target_username (str): The SSH username for the target node.
+            target_password (str): The SSH password for the target node.
+            first_jump_host (HostConfiguration): Optional configuration for the outer jump host (first hop from the run agent).
+            second_jump_host (str): The IP or hostname of the jump host closest to the target (runs nc to reach it).
+            second_jump_username (str): The SSH username for the second jump host.
+            second_jump_password (str): The SSH password for the second jump host.
+            timeout (int): The maximum time in seconds to wait for the connection.
+            fresh_connection (bool): True to always open a new connection instead of reusing a pooled one.
 
         Returns:
             SSHConnection: A real SSH connection to the target node.
         """
         name = target_host
-        if self.ssh_connection_list.get(name):
-            name = name + '_{}'.format(datetime.timestamp(datetime.now()))
 
         if first_jump_host:
             first_jump_ip = first_jump_host.get_host()
@@ -128,56 +277,93 @@ class SSHConnectionManagerClass:
                 f"{second_jump_username}@{second_jump_host} nc {target_host} 22"
             )
 
-        ssh_connection = SSHConnection(
+        pool_key = SSHConnection.create_pool_key(target_host, 22, target_username, proxy_command=proxy_cmd)
+        return self._get_or_create_connection(
             name,
-            target_host,
-            target_username,
-            target_password,
-            timeout=timeout,
-            proxy_command=proxy_cmd,
+            pool_key,
+            fresh_connection,
+            lambda connection_name: SSHConnection(
+                connection_name,
+                target_host,
+                target_username,
+                target_password,
+                timeout=timeout,
+                proxy_command=proxy_cmd,
+            ),
         )
-        ssh_connection.connect()
-        self.ssh_connection_list[name] = ssh_connection
-
-        return ssh_connection
 
-    def get_ssh_connection(self, name) -> SSHConnection:
+    def get_ssh_connection(self, name: str) -> SSHConnection:
         """
         Getter for the ssh connection
-        Args:
-            name: the name of the ssh connection to get
 
-        Returns: the ssh connection
+        Args:
+            name (str): the name of the ssh connection to get
 
+        Returns:
+            SSHConnection: the ssh connection
         """
-        return self.ssh_connection_list.get(name)
+        return self.ssh_connection_list.get(self.connection_aliases.get(name, name))
 
-    def remove_ssh_connection(self, name):
+    def get_connection_for_current_thread(self, ssh_connection: SSHConnection) -> SSHConnection:
         """
-        Closes the ssh connection and removes it from the list of managed connections
+        Gets a connection to the same host, as the same user, that can be used by the current thread.
+
+        This is used by the workers of a FanOutExecutor which all need to send commands to the same host: each worker gets
+        its own pooled connection instead of racing on the return code of the shared one. Connections that can't be
+        recreated from their pool key (ssh pass or proxy command connections) are returned as is.
+
         Args:
-            name: the name of the connection
+            ssh_connection (SSHConnection): The connection owned by the caller of the fan-out.
 
         Returns:
+            SSHConnection: A connection to the same host owned by the current thread.
+        """
+        if not ssh_connection.is_poolable or ssh_connection.proxy_command:
+            return ssh_connection
+        with self.lock:
+            for name, connection in self.ssh_connection_list.items():
+                if connection is ssh_connection and self.connection_owner_threads.get(name) is threading.current_thread():
+                    return ssh_connection
+
+        return self.create_ssh_connection(
+            ssh_connection.host,
+            ssh_connection.user,
+            ssh_connection.password,
+            name=ssh_connection.get_name(),
+            ssh_port=ssh_connection.ssh_port,
+            timeout=ssh_connection.timeout,
+            jump_host=ssh_connection.jump_host,
+        )
 
+    def remove_ssh_connection(self, name: str) -> None:
         """
-        ssh_connection = self.ssh_connection_list.get(name)
-        if ssh_connection:
-            ssh_connection.close()
-            self.ssh_connection_list.pop(name)
+        Closes the ssh connection and removes it from the list of managed connections
 
-    def remove_all(self):
+        Args:
+            name (str): the name of the connection
+        """
+        with self.lock:
+            name = self.connection_aliases.get(name, name)
+            ssh_connection = self.ssh_connection_list.get(name)
+            if ssh_connection:
+                ssh_connection.close()
+                self.ssh_connection_list.pop(name)
+                self.connection_owner_threads.pop(name, None)
+                self.connection_aliases = {alias: aliased_name for alias, aliased_name in self.connection_aliases.items() if aliased_name != name}
+
+    def remove_all(self) -> None:
         """
         Cycles through all managed connections and closes them, then empties the dict
-        Returns:
-
         """
-        keys = self.ssh_connection_list.keys()
-        for key in keys:
-            connection = self.ssh_connection_list.get(key)
-            connection.close()
-
-        self.ssh_connection_list.clear()
+        with self.lock:
+            keys = self.ssh_connection_list.keys()
+            for key in keys:
+                connection = self.ssh_connection_list.get(key)
+                connection.close()
+
+            self.ssh_connection_list.clear()
+            self.connection_owner_threads.clear()
+            self.connection_aliases.clear()
 
 
 SSHConnectionManager = SSHConnectionManagerClass()
@@ -5,6 +5,8 @@ from sshtunnel import SSHTunnelForwarder
 
 from config.host.objects.host_configuration import HostConfiguration
 from framework.logging.automation_logger import get_logger
+from framework.rest.paramiko_forward_server import _ParamikoForwardServer
+from framework.ssh.jump_host_transport_manager import JumpHostTransportManager
 from framework.ssh.ssh_tunnel_info import SSHTunnelInfo
 
 
@@ -26,7 +28,7 @@ class SSHTunnel:
         self._password: str = password
         self._tunnel_info: SSHTunnelInfo = tunnel_info
         self._jump_host_config: Optional[HostConfiguration] = jump_host_config
-        self._jump_server_tunnel: Optional[SSHTunnelForwarder] = None
+        self._jump_server_tunnel: Optional[_ParamikoForwardServer] = None
         self._tunnel: Optional[SSHTunnelForwarder] = None
         self._lock = threading.Lock()
 
@@ -55,6 +57,8 @@ class SSHTunnel:
     def _create_jump_box_tunnel(self) -> bool:
         """Create a ssh tunnel through the jump server
 
+        The tunnel is a local forwarder opening channels on the jump host transport shared with the SSH connections.
+
         Returns:
             bool: True if successful, or if there is no need to do so
                   False if the creating of the tunnel fails
@@ -63,18 +67,24 @@ class SSHTunnel:
             # DO NOTHING
             return True
 
+        is_jump_host_acquired = False
         try:
-            self._jump_server_tunnel = SSHTunnelForwarder(
-                (self._jump_host_config.get_host(), self._jump_host_config.get_ssh_port()),
-                ssh_username=self._jump_host_config.get_credentials().get_user_name(),
-                ssh_password=self._jump_host_config.get_credentials().get_password(),
-                remote_bind_address=(self._host, self._ssh_port),
-                local_bind_address=(self._tunnel_info.get_local_bind_address(), self._tunnel_info.get_local_ports()[-1]),
+            JumpHostTransportManager.acquire(self._jump_host_config)
+            is_jump_host_acquired = True
+            self._jump_server_tunnel = _ParamikoForwardServer(
+                self._tunnel_info.get_local_ports()[-1],
+                self._host,
+                self._ssh_port,
+                self._jump_host_config,
+                local_bind_address=self._tunnel_info.get_local_bind_address(),
             )
             self._jump_server_tunnel.start()
-            get_logger().log_info(f"SSH tunnel created through jump box:\n{self._jump_server_tunnel!s}")
+            get_logger().log_info(f"SSH tunnel created through jump box: '{self._tunnel_info.get_local_bind_address()}:{self._tunnel_info.get_local_ports()[-1]}' -> '{self._host}:{self._ssh_port}'")
 
         except Exception as e:
+            self._jump_server_tunnel = None
+            if is_jump_host_acquired:
+                JumpHostTransportManager.release(self._jump_host_config)
             get_logger().log_error(f"Failed to create SSH tunnel through jump server:\n{self._jump_host_config!s}\n {e}")
             return False
 
@@ -111,6 +121,7 @@ class SSHTunnel:
             if self._jump_server_tunnel:
                 self._jump_server_tunnel.stop()
                 self._jump_server_tunnel = None
+                JumpHostTransportManager.release(self._jump_host_config)
             if self._tunnel:
                 self._tunnel.stop()
                 self._tunnel = None
@@ -0,0 +1,162 @@
+import concurrent
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from framework.logging.automation_logger import get_logger
+from framework.threading.thread_manager import execute_function_in_named_thread
+from framework.threading.thread_namer import ThreadNamer
+from framework.threading.thread_object import ThreadObject
+
+
+class CommandExecutor:
+    """
+    This class represents a long-lived execution engine used to run commands with a deadline.
+
+    Unlike the ThreadManager, which is meant to fan out a set of operations and be thrown away, the CommandExecutor
+    keeps its worker threads alive between calls so that owners issuing thousands of commands (e.g. an SSHConnection)
+    don't pay the thread pool setup cost every time. It must be shut down explicitly by its owner.
+    """
+
+    def __init__(self, name: str, num_threads: int = 2):
+        """
+        Constructor
+
+        Args:
+            name (str): Name of the executor, used as a prefix for the worker thread names.
+            num_threads (int): Maximum number of worker threads kept alive by this executor.
+        """
+        self.name = name
+        self.num_threads = num_threads
+        self.executor: ThreadPoolExecutor = None
+        self.lock = threading.Lock()
+        self.thread_local = threading.local()
+
+        self.commands_issued = 0
+        self.commands_queued = 0
+        self.commands_timed_out = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Lazily creates the thread pool used by this executor.
+
+        Returns:
+            ThreadPoolExecutor: The thread pool backing this executor.
+        """
+        with self.lock:
+            if not self.executor:
+                self.executor = ThreadPoolExecutor(max_workers=self.num_threads, thread_name_prefix=self.name)
+            return self.executor
+
+    def _run_in_worker(self, thread_object: ThreadObject, function_to_execute: Callable, *args, **kwargs) -> Any:
+        """
+        Wrapper executed in the worker thread around function_to_execute.
+
+        Args:
+            thread_object (ThreadObject): The object representing this command.
+            function_to_execute (Callable): The operation that we want to execute in the worker thread.
+            *args: The list of arguments taken by 'function_to_execute'.
+            **kwargs: The list of kwargs taken by 'function_to_execute'.
+
+        Returns:
+            Any: function_to_execute's return value.
+        """
+        with self.lock:
+            self.commands_queued -= 1
+        self.thread_local.is_worker = True
+        try:
+            return execute_function_in_named_thread(thread_object, function_to_execute, *args, **kwargs)
+        finally:
+            self.thread_local.is_worker = False
+
+    def execute(self, thread_name: str, timeout: float, function_to_execute: Callable, *args, **kwargs) -> Any:
+        """
+        Executes function_to_execute in one of the workers and waits at most 'timeout' seconds for its result.
+
+        If this is called from one of this executor's own workers (e.g. a command that sends another command), the
+        function is executed inline, since the outer call is already bounded by its own deadline.
+
+        Args:
+            thread_name (str): Used to describe this command for logging purposes.
+            timeout (float): Number of seconds to wait for the command to complete.
+            function_to_execute (Callable): The function to execute.
+            *args: The list of arguments to pass to the function_to_execute.
+            **kwargs: The list of kwargs to pass to the function_to_execute.
+
+        Returns:
+            Any: function_to_execute's return value.
+
+        Raises:
+            TimeoutError: If the command did not complete within the timeout.
+        """
+        if getattr(self.thread_local, "is_worker", False):
+            return function_to_execute(*args, **kwargs)
+
+        thread_namer = ThreadNamer()
+        full_thread_name = thread_namer.get_thread_full_name(thread_name)
+        thread_object = ThreadObject(full_thread_name, thread_name)
+
+        executor = self._get_executor()
+        with self.lock:
+            self.commands_issued += 1
+            self.commands_queued += 1
+        future = executor.submit(self._run_in_worker, thread_object, function_to_execute, *args, **kwargs)
+        thread_object.future = future
+
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            with self.lock:
+                self.commands_timed_out += 1
+                if future.cancel():
+                    self.commands_queued -= 1
+            get_logger().log_error(f"Command '{thread_name}' in {self.name} timed out after {timeout} seconds.")
+            raise TimeoutError(f"{self.name} command timeout")
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker threads of this executor. Commands that are still queued are cancelled.
+
+        The executor can still be used after a shutdown, in which case a new set of workers will be created.
+        """
+        with self.lock:
+            executor = self.executor
+            self.executor = None
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_commands_issued(self) -> int:
+        """
+        Getter for the number of commands submitted to this executor.
+
+        Returns:
+            int: The number of commands issued.
+        """
+        return self.commands_issued
+
+    def get_commands_queued(self) -> int:
+        """
+        Getter for the number of commands that are waiting for a free worker.
+
+        Returns:
+            int: The number of commands queued.
+        """
+        return self.commands_queued
+
+    def get_commands_timed_out(self) -> int:
+        """
+        Getter for the number of commands that exceeded their deadline.
+
+        Returns:
+            int: The number of commands timed out.
+        """
+        return self.commands_timed_out
+
+    def __str__(self) -> str:
+        """
+        Return the string representation of this executor and its counters.
+
+        Returns:
+            str: A string identifying this executor.
+        """
+        return f"{self.name}: issued={self.commands_issued}, queued={self.commands_queued}, timed_out={self.commands_timed_out}"
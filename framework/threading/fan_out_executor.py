@@ -0,0 +1,193 @@
+import math
+import threading
+import time
+import traceback
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set
+
+from framework.logging.automation_logger import get_logger
+from framework.threading.fan_out_result import FanOutResult
+from framework.threading.thread_manager import execute_function_in_named_thread
+from framework.threading.thread_namer import ThreadNamer
+from framework.threading.thread_object import ThreadObject
+
+
+class FanOutExecutor:
+    """
+    This class runs the same function against many targets (e.g. one SSHConnection per host) in parallel.
+
+    Each target runs in a thread named after it, so that every log line written on behalf of a target (including the
+    commands sent on its SSHConnection) is prefixed with its name. At most 'max_concurrency' targets run at the same
+    time, and each target gets its own deadline, measured from the moment it starts running rather than from the moment
+    it was queued. A timed out target can't be interrupted, so it keeps its slot until its thread exits: max_concurrency
+    is a real bound on the number of threads at work. The targets still queued once every slot is held by a timed out
+    target are reported as timed out without being started. The results and exceptions of all the targets are gathered
+    before returning, so that one failing host doesn't hide the state of the others.
+
+    Usage:
+        fan_out_executor = FanOutExecutor(max_concurrency=10, timeout_per_target=300)
+        results = fan_out_executor.execute(ssh_connections_by_hostname, keyword.verify_something_on_host)
+    """
+
+    def __init__(self, max_concurrency: int = 8, timeout_per_target: Optional[int] = 600, log_thread_status: bool = False):
+        """
+        Constructor
+
+        Args:
+            max_concurrency (int): Maximum number of targets processed at the same time.
+            timeout_per_target (Optional[int]): Number of seconds a single target may run before it is reported as timed out, None for no deadline.
+            log_thread_status (bool): True if we want to log when targets start and complete.
+        """
+        self.max_concurrency = max_concurrency
+        self.timeout_per_target = timeout_per_target
+        self.log_thread_status = log_thread_status
+        self.lock = threading.Lock()
+
+    def _run_target(self, thread_object: ThreadObject, fan_out_result: FanOutResult, concurrency_slots: threading.Semaphore, start_times: Dict[str, float], cancelled_target_names: Set[str], function_to_execute: Callable, target: Any, *args, **kwargs) -> Any:
+        """
+        Wrapper executed in the worker thread around function_to_execute for a single target.
+
+        The target only starts running (and its deadline only starts counting) once it gets a concurrency slot.
+
+        Args:
+            thread_object (ThreadObject): The object representing the thread of this target.
+            fan_out_result (FanOutResult): The result object of this target.
+            concurrency_slots (threading.Semaphore): The semaphore bounding the number of targets running at once.
+            start_times (Dict[str, float]): Shared map of target name -> time at which the target started running.
+            cancelled_target_names (Set[str]): Shared set of the names of the targets that must not start anymore.
+            function_to_execute (Callable): The function to execute, which takes the target as its first argument.
+            target (Any): The target, e.g. an SSHConnection.
+            *args: The list of arguments to pass to the function_to_execute after the target.
+            **kwargs: The list of kwargs to pass to the function_to_execute.
+
+        Returns:
+            Any: function_to_execute's return value, None if the target was cancelled before it started.
+        """
+        target_name = fan_out_result.get_target_name()
+        while not concurrency_slots.acquire(timeout=1.0):
+            if target_name in cancelled_target_names:
+                return None
+        with self.lock:
+            if target_name in cancelled_target_names:
+                concurrency_slots.release()
+                return None
+            start_times[target_name] = time.monotonic()
+        if self.log_thread_status:
+            get_logger().log_info(f"Starting fan-out target {target_name}")
+
+        original_thread_name = threading.current_thread().name
+        try:
+            return execute_function_in_named_thread(thread_object, function_to_execute, target, *args, **kwargs)
+        finally:
+            fan_out_result.traceback = thread_object.exception
+            threading.current_thread().name = original_thread_name
+            # The slot is only given back once the work is really over, even if the target timed out long ago.
+            concurrency_slots.release()
+
+    def execute(self, targets: Dict[str, Any], function_to_execute: Callable, *args, raise_on_failure: bool = True, **kwargs) -> Dict[str, FanOutResult]:
+        """
+        Runs function_to_execute against every target, with the target as its first argument, and waits for all of them.
+
+        Args:
+            targets (Dict[str, Any]): Map of target name (used as the thread name in the logs) -> target.
+            function_to_execute (Callable): The function to execute, which takes the target as its first argument.
+            *args: The list of arguments to pass to the function_to_execute after the target.
+            raise_on_failure (bool): True to raise an AssertionError if any target failed or timed out.
+            **kwargs: The list of kwargs to pass to the function_to_execute.
+
+        Returns:
+            Dict[str, FanOutResult]: Map of target name -> result, in the same order as the targets.
+
+        Raises:
+            AssertionError: If raise_on_failure is True and at least one target failed or timed out.
+        """
+        fan_out_results = {target_name: FanOutResult(target_name) for target_name in targets}
+        if not targets:
+            return fan_out_results
+
+        start_times: Dict[str, float] = {}
+        future_to_target_name = {}
+        cancelled_target_names = set()  # the queued targets that must not start
+        timed_out_futures = set()
+        timeout_per_target = math.inf if self.timeout_per_target is None else self.timeout_per_target
+        concurrency_slots = threading.Semaphore(self.max_concurrency)
+
+        # One thread per target, waiting for a concurrency slot before it starts.
+        executor = ThreadPoolExecutor(max_workers=len(targets))
+        try:
+            for target_name, target in targets.items():
+                # Pick the name of the Thread from the calling thread, taking nesting into account.
+                thread_object = ThreadObject(ThreadNamer().get_thread_full_name(target_name), target_name)
+                future = executor.submit(self._run_target, thread_object, fan_out_results[target_name], concurrency_slots, start_times, cancelled_target_names, function_to_execute, target, *args, **kwargs)
+                future_to_target_name[future] = target_name
+
+            pending = set(future_to_target_name.keys())
+            while pending:
+                now = time.monotonic()
+
+                # Give up on the targets that have been running for longer than their deadline.
+                for future in list(pending):
+                    target_name = future_to_target_name[future]
+                    start_time = start_times.get(target_name)
+                    if start_time is not None and not future.done() and now - start_time >= timeout_per_target:
+                        pending.remove(future)
+                        fan_out_result = fan_out_results[target_name]
+                        fan_out_result.is_timed_out = True
+                        fan_out_result.duration = now - start_time
+                        fan_out_result.exception = TimeoutError(f"{target_name} did not complete within {self.timeout_per_target} seconds")
+                        get_logger().log_error(f"Fan-out target {target_name} timed out after {self.timeout_per_target} seconds.")
+                        timed_out_futures.add(future)
+
+                # Stop scheduling the queued targets once all the slots are held by timed out targets that are still running.
+                timed_out_futures = {future for future in timed_out_futures if not future.done()}
+                if len(timed_out_futures) >= self.max_concurrency:
+                    with self.lock:
+                        for future in list(pending):
+                            target_name = future_to_target_name[future]
+                            if target_name not in start_times:
+                                cancelled_target_names.add(target_name)
+                                pending.remove(future)
+                                fan_out_result = fan_out_results[target_name]
+                                fan_out_result.is_timed_out = True
+                                fan_out_result.duration = 0.0
+                                fan_out_result.exception = TimeoutError(f"{target_name} did not start, all the {self.max_concurrency} concurrency slots are held by timed out targets")
+                                get_logger().log_error(f"Fan-out target {target_name} was not started, all the concurrency slots are held by timed out targets.")
+                if not pending:
+                    break
+
+                # Wake up when the earliest running target reaches its deadline, or poll while targets are still queued.
+                running_deadlines = [start_times[future_to_target_name[future]] + timeout_per_target for future in pending if future_to_target_name[future] in start_times]
+                wait_timeout = max(0.0, min(running_deadlines) - now) if running_deadlines else 1.0
+                done, pending = futures.wait(pending, timeout=min(wait_timeout, 1.0), return_when=futures.FIRST_COMPLETED)
+
+                for future in done:
+                    target_name = future_to_target_name[future]
+                    fan_out_result = fan_out_results[target_name]
+                    fan_out_result.duration = time.monotonic() - start_times.get(target_name, now)
+                    if fan_out_result.duration >= timeout_per_target:
+                        # The target started while the main thread was waiting, and only completed after its deadline.
+                        fan_out_result.is_timed_out = True
+                        fan_out_result.exception = TimeoutError(f"{target_name} did not complete within {self.timeout_per_target} seconds")
+                        get_logger().log_error(f"Fan-out target {target_name} timed out after {self.timeout_per_target} seconds.")
+                    elif future.exception():
+                        fan_out_result.exception = future.exception()
+                        if not fan_out_result.traceback:
+                            fan_out_result.traceback = "".join(traceback.format_exception(type(future.exception()), future.exception(), future.exception().__traceback__))
+                    else:
+                        fan_out_result.result = future.result()
+                    if self.log_thread_status:
+                        get_logger().log_info(f"Fan-out target {target_name} is done!")
+        finally:
+            # Timed out targets can't be interrupted, their threads are left behind to finish on their own.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        failed_results = [fan_out_result for fan_out_result in fan_out_results.values() if not fan_out_result.is_success()]
+        for fan_out_result in failed_results:
+            get_logger().log_exception(f"Fan-out target {fan_out_result.get_target_name()} failed:\n{fan_out_result.get_traceback() or fan_out_result.get_exception()}")
+
+        if failed_results and raise_on_failure:
+            failed_names = ", ".join(fan_out_result.get_target_name() for fan_out_result in failed_results)
+            raise AssertionError(f"An error was raised for {len(failed_results)} of {len(targets)} targets: {failed_names}")
+
+        return fan_out_results
@@ -0,0 +1,88 @@
+from typing import Any
+
+
+class FanOutResult:
+    """
+    This class holds the outcome of running a function against one of the targets of a FanOutExecutor.
+    """
+
+    def __init__(self, target_name: str):
+        """
+        Constructor
+
+        Args:
+            target_name (str): The name of the target (e.g. the host name).
+        """
+        self.target_name = target_name
+        self.result: Any = None
+        self.exception: BaseException = None
+        self.traceback: str = None
+        self.duration: float = 0.0
+        self.is_timed_out = False
+
+    def get_target_name(self) -> str:
+        """
+        Getter for the name of the target.
+
+        Returns:
+            str: The name of the target.
+        """
+        return self.target_name
+
+    def get_result(self) -> Any:
+        """
+        Getter for the value returned by the function for this target.
+
+        Returns:
+            Any: The returned value, or None if the function failed or timed out.
+        """
+        return self.result
+
+    def get_exception(self) -> BaseException:
+        """
+        Getter for the exception raised by the function for this target.
+
+        Returns:
+            BaseException: The exception, a TimeoutError if the target exceeded its deadline, or None on success.
+        """
+        return self.exception
+
+    def get_traceback(self) -> str:
+        """
+        Getter for the formatted traceback of the exception raised for this target.
+
+        Returns:
+            str: The traceback, or None if no exception was raised.
+        """
+        return self.traceback
+
+    def get_duration(self) -> float:
+        """
+        Getter for the time spent running the function for this target.
+
+        Returns:
+            float: The duration in seconds.
+        """
+        return self.duration
+
+    def is_success(self) -> bool:
+        """
+        Check if the function completed for this target without raising an exception.
+
+        Returns:
+            bool: True if the function succeeded.
+        """
+        return self.exception is None and not self.is_timed_out
+
+    def __str__(self) -> str:
+        """
+        Return the string representation of this result.
+
+        Returns:
+            str: The target name and the outcome.
+        """
+        if self.is_timed_out:
+            return f"{self.target_name}: timed out after {self.duration:.3f}s"
+        if self.exception:
+            return f"{self.target_name}: failed after {self.duration:.3f}s with {type(self.exception).__name__}: {self.exception}"
+        return f"{self.target_name}: succeeded in {self.duration:.3f}s"
@@ -0,0 +1,75 @@
+import json
+import threading
+
+
+class PollingMetricsClass:
+    """
+    Singleton class that records the attempts and time taken by each validation with retry of the run.
+
+    The metrics are kept by validation description, and add up over all the pytest sessions of the process.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.polling_metrics: dict[str, dict] = {}
+
+    def record(self, validation_description: str, attempts: int, elapsed_time: float, outcome: str):
+        """
+        Records a validation with retry.
+
+        Args:
+            validation_description (str): The description of the validation.
+            attempts (int): The number of times the value was checked.
+            elapsed_time (float): The time taken by the validation, in seconds.
+            outcome (str): 'success', 'failure' for a failure value, or 'timeout'.
+        """
+        with self.lock:
+            polling_metric = self.polling_metrics.get(validation_description)
+            if polling_metric is None:
+                polling_metric = {"calls": 0, "attempts": 0, "success": 0, "failure": 0, "timeout": 0, "total_seconds": 0.0, "max_seconds_to_success": 0.0}
+                self.polling_metrics[validation_description] = polling_metric
+            polling_metric["calls"] += 1
+            polling_metric["attempts"] += attempts
+            polling_metric[outcome] += 1
+            polling_metric["total_seconds"] += elapsed_time
+            if outcome == "success":
+                polling_metric["max_seconds_to_success"] = max(polling_metric["max_seconds_to_success"], elapsed_time)
+
+    def get_polling_metrics(self) -> dict[str, dict]:
+        """
+        Getter for the metrics of each validation, the ones with the most time spent polling first.
+
+        Returns:
+            dict[str, dict]: The number of calls, attempts, outcomes, total seconds and maximum seconds to success, by validation description.
+        """
+        with self.lock:
+            return {validation_description: dict(polling_metric) for validation_description, polling_metric in sorted(self.polling_metrics.items(), key=lambda item: item[1]["total_seconds"], reverse=True)}
+
+    def get_summary(self, number_of_validations: int = 20) -> list[str]:
+        """
+        Gets a summary of the validations with the most time spent polling.
+
+        Args:
+            number_of_validations (int): The number of validations to summarize.
+
+        Returns:
+            list[str]: One line per validation.
+        """
+        summary = []
+        for validation_description, polling_metric in list(self.get_polling_metrics().items())[:number_of_validations]:
+            average_attempts = polling_metric["attempts"] / polling_metric["calls"]
+            summary.append(f"{validation_description}: {polling_metric['calls']} calls, {average_attempts:.1f} attempts average, {polling_metric['total_seconds']:.1f}s total, {polling_metric['max_seconds_to_success']:.1f}s max to success, {polling_metric['timeout']} timeouts, {polling_metric['failure']} failures")
+        return summary
+
+    def export(self, file_name: str):
+        """
+        Writes the metrics of each validation to a JSON file.
+
+        Args:
+            file_name (str): The name of the file.
+        """
+        with open(file_name, "w") as file:
+            json.dump(self.get_polling_metrics(), file, indent=4)
+
+
+PollingMetrics = PollingMetricsClass()
@@ -0,0 +1,66 @@
+import random
+
+
+class PollingPolicy:
+    """
+    Class that models how long to sleep between the attempts of a validation with retry.
+
+    The first attempts can be retried quickly, for the states that usually settle in a few seconds. The sleeps then
+    start at polling_sleep_time and grow by backoff_factor at each attempt up to max_polling_sleep_time, with an
+    optional random jitter so that several validations polling the same lab don't all hit it at the same time.
+    The default policy sleeps polling_sleep_time between every attempt.
+    """
+
+    def __init__(
+        self,
+        polling_sleep_time: float = 5,
+        backoff_factor: float = 1.0,
+        max_polling_sleep_time: float | None = None,
+        jitter: float = 0.0,
+        fast_polls: int = 0,
+        fast_polling_sleep_time: float = 1,
+    ):
+        """
+        Constructor
+
+        Args:
+            polling_sleep_time (float): The first and shortest sleep, in seconds, once the fast polls are done, before the jitter.
+            backoff_factor (float): The factor the sleep grows by at each attempt, 1 for a fixed interval.
+            max_polling_sleep_time (float | None): The longest sleep, in seconds, before the jitter. None for no limit.
+            jitter (float): The fraction of the sleep to randomly add or remove, between 0 and 1.
+            fast_polls (int): The number of attempts to retry after fast_polling_sleep_time, before the regular sleeps.
+            fast_polling_sleep_time (float): The sleep, in seconds, after each of the fast polls.
+        """
+        if backoff_factor < 1:
+            raise ValueError(f"The backoff factor must be at least 1, not {backoff_factor}")
+        if not 0 <= jitter <= 1:
+            raise ValueError(f"The jitter must be between 0 and 1, not {jitter}")
+        self.polling_sleep_time = polling_sleep_time
+        self.backoff_factor = backoff_factor
+        self.max_polling_sleep_time = max_polling_sleep_time
+        self.jitter = jitter
+        self.fast_polls = fast_polls
+        self.fast_polling_sleep_time = fast_polling_sleep_time
+
+    def get_sleep_time(self, attempt: int, remaining_time: float) -> float:
+        """
+        Gets the time to sleep for after a failed attempt, without going past the deadline.
+
+        Args:
+            attempt (int): The number of the attempt that failed, starting at 1.
+            remaining_time (float): The number of seconds left before the deadline.
+
+        Returns:
+            float: The number of seconds to sleep for.
+        """
+        if attempt <= self.fast_polls:
+            sleep_time = self.fast_polling_sleep_time
+        else:
+            sleep_time = self.polling_sleep_time * self.backoff_factor ** (attempt - self.fast_polls - 1)
+            if self.max_polling_sleep_time is not None:
+                sleep_time = min(sleep_time, self.max_polling_sleep_time)
+            sleep_time = max(sleep_time, self.polling_sleep_time)
+            # The jitter is applied after the bounds, so that it shortens the sleeps as often as it lengthens them.
+            if self.jitter:
+                sleep_time *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(0.0, min(sleep_time, remaining_time))
@@ -4,8 +4,13 @@ from typing import Any, Callable, Sequence
 
 from framework.exceptions.validation_failure_error import ValidationFailureError
 from framework.logging.automation_logger import get_logger
+from framework.validation.polling_metrics import PollingMetrics
+from framework.validation.polling_policy import PollingPolicy
 from framework.validation.validation_response import ValidationResponse
 
+# Marks that no value was observed yet, as None can be an observed value.
+_NOT_OBSERVED = object()
+
 
 def validate_equals(observed_value: Any, expected_value: Any, validation_description: str) -> None:
     """
@@ -31,45 +36,55 @@ def validate_equals(observed_value: Any, expected_value: Any, validation_descrip
         raise Exception("Validation Failed")
 
 
-def validate_equals_with_retry(
+def validate_with_retry(
     function_to_execute: Callable[[], Any],
-    expected_value: Any,
+    is_valid: Callable[[Any], bool],
+    expected_description: str,
     validation_description: str,
-    timeout: int = 30,
-    polling_sleep_time: int = 5,
+    timeout: float = 30,
+    polling_policy: PollingPolicy | None = None,
     failure_values: Sequence[Any] = (),
 ) -> Any:
     """
-    Validates that function_to_execute will return the expected value in the specified amount of time.
+    Validates that function_to_execute will return a valid value in the specified amount of time.
+
+    This is the polling loop of all the validations with retry. The observed value is only logged when it changes, the
+    sleeps between the attempts follow the polling policy without going past the timeout, and the attempts and time
+    taken are recorded in PollingMetrics for the report of the run.
 
     Args:
-      function_to_execute (Callable[[], Any]): The function to be executed repeatedly, taking no arguments and returning any value.
-      expected_value (Any): The expected return value of the function.
-      validation_description (str): Description of this validation for logging purposes.
-      timeout (int): The maximum time (in seconds) to wait for the match.
-      polling_sleep_time (int): The interval of time to wait between calls to function_to_execute.
-      failure_values (Sequence[Any]): Values that cause immediate ValidationFailureError (fail-fast).
-        Must be a sequence (list, tuple, set). Single value: ['failed'] or ('failed',).
-        Multiple values: ['error', 'failed'] or ('error', 'failed'). Do not pass a plain string.
+        function_to_execute (Callable[[], Any]): The function to be executed repeatedly, taking no arguments and returning any value.
+        is_valid (Callable[[Any], bool]): The check of the value to validate.
+        expected_description (str): What is expected, for logging purposes.
+        validation_description (str): Description of this validation for logging purposes.
+        timeout (float): The maximum time (in seconds) to wait for a valid value.
+        polling_policy (PollingPolicy | None): The sleeps between the calls to function_to_execute. None to sleep 5 seconds between every call.
+        failure_values (Sequence[Any]): Values that cause immediate ValidationFailureError (fail-fast). Must be a sequence, not a plain string.
 
     Returns:
         Any: Returns the value_to_return of the ValidationResponse associated with the function_to_execute.
 
     Raises:
         ValidationFailureError: If the observed value matches any value in failure_values.
-        TimeoutError: If the timeout is reached without finding the expected value.
+        TimeoutError: If the timeout is reached without a valid value.
         TypeError: If failure_values is a raw string instead of a sequence.
 
     """
-    get_logger().log_info(f"Attempting Validation - {validation_description}")
-
     if isinstance(failure_values, (str, bytes, bytearray)):
         raise TypeError("failure_values must be a sequence of values (e.g. ['failed'] or ('failed',)), not a raw string.")
+    if polling_policy is None:
+        polling_policy = PollingPolicy()
 
-    end_time = time.time() + timeout
+    get_logger().log_info(f"Attempting Validation - {validation_description}")
+    get_logger().log_info(f"Expected: {expected_description}")
+    start_time = time.monotonic()
+    end_time = start_time + timeout
+    attempt = 0
+    value_to_validate = last_logged_value = _NOT_OBSERVED
 
     # Attempt the validation
     while True:
+        attempt += 1
 
         # Compute the actual value that we are trying to validate.
         result = function_to_execute()
@@ -82,23 +97,67 @@ def validate_equals_with_retry(
 
         # Check for explicit failure values first (fail-fast)
         if failure_values and value_to_validate in failure_values:
+            PollingMetrics.record(validation_description, attempt, time.monotonic() - start_time, "failure")
             get_logger().log_error(f"Validation Failed - {validation_description}: observed failure value '{value_to_validate}'")
             raise ValidationFailureError(f"{validation_description} encountered failure value '{value_to_validate}' (failure_values={failure_values})")
 
-        if value_to_validate == expected_value:
-            get_logger().log_info(f"Validation Successful - {validation_description}")
+        if is_valid(value_to_validate):
+            PollingMetrics.record(validation_description, attempt, time.monotonic() - start_time, "success")
+            get_logger().log_info(f"Validation Successful - {validation_description} (attempt {attempt}, {time.monotonic() - start_time:.1f}s)")
             return value_to_return
+
+        remaining_time = end_time - time.monotonic()
+        if remaining_time <= 0:
+            break
+
+        sleep_time = polling_policy.get_sleep_time(attempt, remaining_time)
+        if last_logged_value is _NOT_OBSERVED or value_to_validate != last_logged_value:
+            get_logger().log_info(f"Observed: {value_to_validate} - retrying in {sleep_time:.1f}s (attempt {attempt})")
+            last_logged_value = value_to_validate
         else:
-            get_logger().log_info("Validation Failed")
-            get_logger().log_info(f"Expected: {expected_value}")
-            get_logger().log_info(f"Observed: {value_to_validate}")
+            get_logger().log_debug(f"Observed value unchanged - retrying in {sleep_time:.1f}s (attempt {attempt})")
+        sleep(sleep_time)
+
+    PollingMetrics.record(validation_description, attempt, time.monotonic() - start_time, "timeout")
+    get_logger().log_error(f"Validation Failed - {validation_description}")
+    get_logger().log_error(f"Expected: {expected_description}")
+    get_logger().log_error(f"Observed: {value_to_validate} (after {attempt} attempts)")
+    raise TimeoutError(f"Timeout performing validation - {validation_description}")
+
+
+def validate_equals_with_retry(
+    function_to_execute: Callable[[], Any],
+    expected_value: Any,
+    validation_description: str,
+    timeout: int = 30,
+    polling_sleep_time: int = 5,
+    failure_values: Sequence[Any] = (),
+    polling_policy: PollingPolicy | None = None,
+) -> Any:
+    """
+    Validates that function_to_execute will return the expected value in the specified amount of time.
+
+    Args:
+      function_to_execute (Callable[[], Any]): The function to be executed repeatedly, taking no arguments and returning any value.
+      expected_value (Any): The expected return value of the function.
+      validation_description (str): Description of this validation for logging purposes.
+      timeout (int): The maximum time (in seconds) to wait for the match.
+      polling_sleep_time (int): The interval of time to wait between calls to function_to_execute.
+      failure_values (Sequence[Any]): Values that cause immediate ValidationFailureError (fail-fast).
+        Must be a sequence (list, tuple, set). Single value: ['failed'] or ('failed',).
+        Multiple values: ['error', 'failed'] or ('error', 'failed'). Do not pass a plain string.
+      polling_policy (PollingPolicy | None): The sleeps between the calls to function_to_execute, with backoff. None to sleep polling_sleep_time between every call.
 
-            if time.time() < end_time:
-                get_logger().log_info(f"Retrying in {polling_sleep_time}s")
-                sleep(polling_sleep_time)
-                # Move on to the next iteration
-            else:
-                raise TimeoutError(f"Timeout performing validation - {validation_description}")
+    Returns:
+        Any: Returns the value_to_return of the ValidationResponse associated with the function_to_execute.
+
+    Raises:
+        ValidationFailureError: If the observed value matches any value in failure_values.
+        TimeoutError: If the timeout is reached without finding the expected value.
+        TypeError: If failure_values is a raw string instead of a sequence.
+
+    """
+    return validate_with_retry(function_to_execute, lambda value: value == expected_value, str(expected_value), validation_description, timeout, polling_policy or PollingPolicy(polling_sleep_time), failure_values)
 
 
 def validate_not_equals(observed_value: Any, expected_value: Any, validation_description: str) -> None:
@@ -131,6 +190,7 @@ def validate_not_equals_with_retry(
     validation_description: str,
     timeout: int = 30,
     polling_sleep_time: int = 5,
+    polling_policy: PollingPolicy | None = None,
 ) -> Any:
     """Validate that function_to_execute returns a value different from not_expected_value within timeout.
 
@@ -143,6 +203,7 @@ def validate_not_equals_with_retry(
         validation_description (str): Description of this validation for logging purposes.
         timeout (int): The maximum time (in seconds) to wait for the value to change.
         polling_sleep_time (int): The interval of time to wait between calls to function_to_execute.
+        polling_policy (PollingPolicy | None): The sleeps between the calls to function_to_execute, with backoff. None to sleep polling_sleep_time between every call.
 
     Returns:
         Any: The observed value (or value_to_return from ValidationResponse) once it differs from not_expected_value.
@@ -151,35 +212,7 @@ def validate_not_equals_with_retry(
         TimeoutError: If the timeout is reached and the value still equals not_expected_value.
 
     """
-    get_logger().log_info(f"Attempting Validation - {validation_description}")
-    end_time = time.time() + timeout
-
-    while True:
-
-        # Execute the function and unwrap ValidationResponse if returned.
-        result = function_to_execute()
-        if isinstance(result, ValidationResponse):
-            value_to_validate = result.get_value_to_validate()
-            value_to_return = result.get_value_to_return()
-        else:
-            value_to_validate = result
-            value_to_return = result
-
-        # Success: observed value differs from the not-expected value.
-        if value_to_validate != not_expected_value:
-            get_logger().log_info(f"Validation Successful - {validation_description}")
-            return value_to_return
-        else:
-            get_logger().log_info("Validation Failed")
-            get_logger().log_info(f"Not Expected: {not_expected_value}")
-            get_logger().log_info(f"Observed: {value_to_validate}")
-
-            # Retry if time remains, otherwise raise timeout.
-            if time.time() < end_time:
-                get_logger().log_info(f"Retrying in {polling_sleep_time}s")
-                sleep(polling_sleep_time)
-            else:
-                raise TimeoutError(f"Timeout performing validation - {validation_description}")
+    return validate_with_retry(function_to_execute, lambda value: value != not_expected_value, f"Not {not_expected_value}", validation_description, timeout, polling_policy or PollingPolicy(polling_sleep_time))
 
 
 def validate_str_contains(observed_value: str, expected_value: str, validation_description: str) -> None:
@@ -212,6 +245,7 @@ def validate_str_contains_with_retry(
     validation_description: str,
     timeout: int = 30,
     polling_sleep_time: int = 5,
+    polling_policy: PollingPolicy | None = None,
 ) -> object:
     """
     This function will validate if the observed value contains the expected value.
@@ -222,6 +256,7 @@ def validate_str_contains_with_retry(
         validation_description (str): Description of this validation for logging purposes.
         timeout (int): The maximum time (in seconds) to wait for the match.
         polling_sleep_time (int): The interval of time to wait between calls to function_to_execute.
+        polling_policy (PollingPolicy | None): The sleeps between the calls to function_to_execute, with backoff. None to sleep polling_sleep_time between every call.
 
     Returns:
         object: Returns the value_to_return of the ValidationResponse associated with the function_to_execute.
@@ -230,35 +265,7 @@ def validate_str_contains_with_retry(
         Exception: when validate fails
 
     """
-    get_logger().log_info(f"Attempting Validation - {validation_description}")
-    end_time = time.time() + timeout
-
-    # Attempt the validation
-    while True:
-
-        # Compute the actual value that we are trying to validate.
-        result = function_to_execute()
-        if isinstance(result, ValidationResponse):
-            value_to_validate = result.get_value_to_validate()
-            value_to_return = result.get_value_to_return()
-        else:
-            value_to_validate = result
-            value_to_return = result
-
-        if expected_value in value_to_validate:
-            get_logger().log_info(f"Validation Successful - {validation_description}")
-            return value_to_return
-        else:
-            get_logger().log_info("Validation Failed")
-            get_logger().log_info(f"Expected: {expected_value}")
-            get_logger().log_info(f"Observed: {value_to_validate}")
-
-            if time.time() < end_time:
-                get_logger().log_info(f"Retrying in {polling_sleep_time}s")
-                sleep(polling_sleep_time)
-                # Move on to the next iteration
-            else:
-                raise TimeoutError(f"Timeout performing validation - {validation_description}")
+    return validate_with_retry(function_to_execute, lambda value: expected_value in value, f"Contains {expected_value}", validation_description, timeout, polling_policy or PollingPolicy(polling_sleep_time))
 
 
 def validate_list_contains(observed_value: Any, expected_values: Any, validation_description: str) -> None:
@@ -290,6 +297,7 @@ def validate_list_contains_with_retry(
     validation_description: str,
     timeout: int = 30,
     polling_sleep_time: int = 5,
+    polling_policy: PollingPolicy | None = None,
 ) -> object:
     """
     This function will validate if the observed value contains the expected value.
@@ -300,7 +308,7 @@ def validate_list_contains_with_retry(
         validation_description (str): Description of this validation for logging purposes.
         timeout (int): The maximum time (in seconds) to wait for the match.
         polling_sleep_time (int): The interval of time to wait between calls to function_to_execute.
-
+        polling_policy (PollingPolicy | None): The sleeps between the calls to function_to_execute, with backoff. None to sleep polling_sleep_time between every call.
 
     Returns:
         object: Returns the value_to_return of the ValidationResponse associated with the function_to_execute.
@@ -309,35 +317,7 @@ def validate_list_contains_with_retry(
         Exception: when validate fails
 
     """
-    get_logger().log_info(f"Attempting Validation - {validation_description}")
-    end_time = time.time() + timeout
-
-    # Attempt the validation
-    while True:
-
-        # Compute the actual value that we are trying to validate.
-        result = function_to_execute()
-        if isinstance(result, ValidationResponse):
-            value_to_validate = result.get_value_to_validate()
-            value_to_return = result.get_value_to_return()
-        else:
-            value_to_validate = result
-            value_to_return = result
-
-        if value_to_validate in expected_values:
-            get_logger().log_info(f"Validation Successful - {validation_description}")
-            return value_to_return
-        else:
-            get_logger().log_info("Validation Failed")
-            get_logger().log_info(f"Expected: {expected_values}")
-            get_logger().log_info(f"Observed: {value_to_validate}")
-
-            if time.time() < end_time:
-                get_logger().log_info(f"Retrying in {polling_sleep_time}s")
-                sleep(polling_sleep_time)
-                # Move on to the next iteration
-            else:
-                raise TimeoutError(f"Timeout performing validation - {validation_description}")
+    return validate_with_retry(function_to_execute, lambda value: value in expected_values, f"One of {expected_values}", validation_description, timeout, polling_policy or PollingPolicy(polling_sleep_time))
 
 
 def validate_greater_than(observed_value: int, baseline_value: int, validation_description: str) -> None:
@@ -415,6 +395,7 @@ def validate_not_none_with_retry(
     validation_description: str,
     timeout: int = 30,
     polling_sleep_time: int = 5,
+    polling_policy: PollingPolicy | None = None,
 ) -> Any:
     """Validate that function_to_execute returns a non-None value within timeout.
 
@@ -426,6 +407,7 @@ def validate_not_none_with_retry(
         validation_description (str): Description of this validation for logging purposes.
         timeout (int): The maximum time (in seconds) to wait for a non-None value.
         polling_sleep_time (int): The interval of time to wait between calls to function_to_execute.
+        polling_policy (PollingPolicy | None): The sleeps between the calls to function_to_execute, with backoff. None to sleep polling_sleep_time between every call.
 
     Returns:
         Any: The observed value (or value_to_return from ValidationResponse) once it is not None.
@@ -434,35 +416,7 @@ def validate_not_none_with_retry(
         TimeoutError: If the timeout is reached and the value is still None.
 
     """
-    get_logger().log_info(f"Attempting Validation - {validation_description}")
-    end_time = time.time() + timeout
-
-    while True:
-
-        # Execute the function and unwrap ValidationResponse if returned.
-        result = function_to_execute()
-        if isinstance(result, ValidationResponse):
-            value_to_validate = result.get_value_to_validate()
-            value_to_return = result.get_value_to_return()
-        else:
-            value_to_validate = result
-            value_to_return = result
-
-        # Success: observed value is not None.
-        if value_to_validate is not None:
-            get_logger().log_info(f"Validation Successful - {validation_description}")
-            return value_to_return
-        else:
-            get_logger().log_info("Validation Failed")
-            get_logger().log_info("Expected: Not None")
-            get_logger().log_info(f"Observed: {value_to_validate}")
-
-            # Retry if time remains, otherwise raise timeout.
-            if time.time() < end_time:
-                get_logger().log_info(f"Retrying in {polling_sleep_time}s")
-                sleep(polling_sleep_time)
-            else:
-                raise TimeoutError(f"Timeout performing validation - {validation_description}")
+    return validate_with_retry(function_to_execute, lambda value: value is not None, "Not None", validation_description, timeout, polling_policy or PollingPolicy(polling_sleep_time))
 
 
 def validate_is_digit(observed_value: str, validation_description: str) -> None:
@@ -1,6 +1,11 @@
-from typing import Any
+import functools
+import inspect
+import logging
+import time
+from typing import Any, Callable
 
 from framework.logging.automation_logger import get_logger
+from framework.logging.keyword_timings import KeywordTimings
 from framework.rest.rest_response import RestResponse
 from framework.ssh.ssh_connection import SSHConnection
 
@@ -86,40 +91,14 @@ class BaseKeyword:
 
         get_logger().log_keyword(f"{name}({args_string})")
 
-    def __getattribute__(self, name: str) -> Any:
-        """Intercept attribute access on a Keyword object.
-
-        This is a default Python hook that gets called whenever Python tries to access a field or
-        a function in a Keyword object. We are intercepting it here to place the on_every_keyword
-        hook every time that we are calling a function.
+    def __init_subclass__(cls, **kwargs: Any):
+        """Wrap the public methods of a Keyword class with the on_every_keyword hook, once, when the class is created.
 
         Args:
-            name (str): The attribute or function getting accessed.
-
-        Returns:
-          Any: If we are accessing a function, we return the function, wrapped in the
-        on_every_keyword hook. Otherwise, we return the field directly.
-
+            **kwargs (Any): kwargs of the class definition.
         """
-        # Avoid an infinite recursive loop with the wrapper on_every_keyword or pretty_print.
-        if name == "on_every_keyword" or name == "pretty_print":
-            return object.__getattribute__(self, name)
-
-        # Check if 'name' is a function or a field.
-        attribute = object.__getattribute__(self, name)
-        if callable(attribute):
-
-            # attribute is actually a function. Wrap it with on_every_keyword
-            def on_keyword_wrapped_function(*args, **kwargs):
-                self.on_every_keyword(name, *args, **kwargs)
-                return attribute(*args, **kwargs)
-
-            return on_keyword_wrapped_function
-
-        else:
-
-            # attribute is just a field. Return it as-is
-            return attribute
+        super().__init_subclass__(**kwargs)
+        _trace_keyword_methods(cls)
 
     def validate_success_return_code(self, ssh_connection: SSHConnection):
         """
@@ -157,3 +136,56 @@ class BaseKeyword:
         """
         rc = rest_response.get_status_code()
         assert expected_status_code == rc, f"Status code was {rc}"
+
+
+def _trace_keyword_methods(keyword_class: type):
+    """
+    Wrap the public methods defined in a Keyword class with the on_every_keyword hook.
+
+    Static methods, class methods and properties are left as they are, since they are not called on a Keyword object.
+
+    Args:
+        keyword_class (type): The Keyword class.
+    """
+    for name, attribute in list(vars(keyword_class).items()):
+        if name.startswith("_") or name in _UNTRACED_METHODS or not inspect.isfunction(attribute) or getattr(attribute, "__keyword_traced__", False):
+            continue
+        setattr(keyword_class, name, _get_traced_method(keyword_class.__qualname__, name, attribute))
+
+
+def _get_traced_method(class_name: str, name: str, method: Callable) -> Callable:
+    """
+    Wrap a Keyword method with the on_every_keyword hook, and with a timer when the keyword timings are recorded.
+
+    The arguments are only formatted when the keyword log would be written somewhere.
+
+    Args:
+        class_name (str): The name of the Keyword class.
+        name (str): The name of the method.
+        method (Callable): The method.
+
+    Returns:
+        Callable: The wrapped method.
+    """
+    keyword_name = f"{class_name}.{name}"
+
+    @functools.wraps(method)
+    def traced_method(self: BaseKeyword, *args: Any, **kwargs: Any) -> Any:
+        if get_logger().is_level_logged(logging.DEBUG):
+            self.on_every_keyword(name, *args, **kwargs)
+        if not KeywordTimings.is_enabled():
+            return method(self, *args, **kwargs)
+        start_time = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            KeywordTimings.record(keyword_name, time.perf_counter() - start_time)
+
+    traced_method.__keyword_traced__ = True
+    return traced_method
+
+
+# These are called by the hook itself, so wrapping them would recurse.
+_UNTRACED_METHODS = {"on_every_keyword", "pretty_print"}
+
+_trace_keyword_methods(BaseKeyword)
@@ -1,8 +1,32 @@
-def source_openrc(cmd: str):
+from typing import List
+
+from framework.ssh.shell_environment_profile import ShellEnvironmentProfile
+from keywords.k8s.k8s_command_wrapper import K8sConfigExporter
+
+OIDC_ENVIRONMENT = "export KUBECONFIG=$HOME/.kube/config && source /etc/platform/openrc --no_credentials && export OS_USERNAME=$(whoami)"
+
+
+def source_openrc(cmd: str) -> str:
+    """Wrap a command so that it runs with the platform openrc sourced.
+
+    Args:
+        cmd (str): The command to wrap (e.g. 'system host-list').
+
+    Returns:
+        str: The command prefixed with the sourcing of openrc.
+    """
     return f"source /etc/platform/openrc;{cmd}"
 
 
-def source_sudo_openrc(cmd: str):
+def source_sudo_openrc(cmd: str) -> str:
+    """Wrap a command so that it runs with the platform openrc sourced, in a shell that can be started with sudo.
+
+    Args:
+        cmd (str): The command to wrap (e.g. 'software list').
+
+    Returns:
+        str: The command and the sourcing of openrc, in a 'bash -c' call.
+    """
     return f"bash -c 'source /etc/platform/openrc;{cmd}'"
 
 
@@ -23,4 +47,23 @@ def oidc_auth_wrap(cmd: str) -> str:
         str: Full command string ready for OIDC execution.
     """
     dcm_with_arg = cmd.replace("dcmanager ", "dcmanager --stx-auth-type=oidc ", 1)
-    return f"export KUBECONFIG=$HOME/.kube/config && source /etc/platform/openrc --no_credentials && export OS_USERNAME=$(whoami) && {dcm_with_arg}"
+    return f"{OIDC_ENVIRONMENT} && {dcm_with_arg}"
+
+
+def get_platform_shell_profiles() -> List[ShellEnvironmentProfile]:
+    """Get the persistent shell profiles matching the command wrappers of the platform.
+
+    Enabling them on an SSH connection runs the commands wrapped with source_openrc, source_sudo_openrc,
+    oidc_auth_wrap and export_k8s_config in long-lived shells where the environment is only set up once:
+
+        ssh_connection.enable_persistent_shell(get_platform_shell_profiles())
+
+    Returns:
+        List[ShellEnvironmentProfile]: The openrc, sudo openrc, OIDC and KUBECONFIG profiles.
+    """
+    return [
+        ShellEnvironmentProfile("openrc", source_openrc(""), ["source /etc/platform/openrc"]),
+        ShellEnvironmentProfile("sudo_openrc", "bash -c 'source /etc/platform/openrc;", ["source /etc/platform/openrc"], command_suffix="'", as_sudo=True),
+        ShellEnvironmentProfile("oidc", f"{OIDC_ENVIRONMENT} && ", [OIDC_ENVIRONMENT]),
+        K8sConfigExporter.get_default_instance().get_shell_profile(),
+    ]
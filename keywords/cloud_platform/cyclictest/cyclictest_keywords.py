@@ -1,7 +1,9 @@
 import os
 import random
 import time
-from typing import Optional
+from typing import Iterator, Optional
+
+from paramiko import SFTPClient
 
 from config.configuration_manager import ConfigurationManager
 from framework.logging.automation_logger import get_logger
@@ -9,6 +11,7 @@ from framework.ssh.ssh_connection import SSHConnection
 from framework.validation.validation import validate_equals, validate_greater_than, validate_list_contains, validate_str_contains
 from keywords.base_keyword import BaseKeyword
 from keywords.cloud_platform.cyclictest.cyclictest_cpu_monitor import CyclictestCpuMonitor
+from keywords.cloud_platform.cyclictest.objects.cyclictest_histogram_object import CyclictestHistogramObject
 from keywords.cloud_platform.cyclictest.objects.cyclictest_params_object import CyclictestParamsObject
 from keywords.cloud_platform.cyclictest.objects.cyclictest_run_result_object import CyclictestRunResultObject
 from keywords.cloud_platform.cyclictest.objects.cyclictest_statistics_object import CyclictestStatisticsObject
@@ -66,6 +69,9 @@ _START_SENTINEL_INITIAL_WAIT_SECONDS = 10
 _START_SENTINEL_MAX_RETRIES = 5
 _START_SENTINEL_RETRY_INTERVAL_SECONDS = 2
 
+# Size of the reads when streaming the histogram file over SFTP.
+_HISTOGRAM_DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+
 
 class CyclictestKeywords(BaseKeyword):
     """Keywords for running cyclictest and collecting KPI results."""
@@ -154,8 +160,11 @@ class CyclictestKeywords(BaseKeyword):
             get_logger().log_debug(f"Processing hypervisor {hostname}")
             host_ssh = LabConnectionKeywords().get_ssh_for_hostname(hostname)
 
+            # Read platform.conf and the running kernel in a single round trip.
+            platform_conf_result, kernel_result = host_ssh.send_batch(["cat /etc/platform/platform.conf", "uname -a"])
+
             # Step 1 — read platform.conf via output object.
-            platform_conf_raw = "".join(host_ssh.send("cat /etc/platform/platform.conf"))
+            platform_conf_raw = "".join(platform_conf_result.get_output())
             subfunction = PlatformConfOutput(platform_conf_raw).get_subfunction()
             get_logger().log_debug(f"{hostname} subfunction: '{subfunction}'")
 
@@ -165,7 +174,7 @@ class CyclictestKeywords(BaseKeyword):
                 continue
 
             # Step 2 — verify the running kernel via uname -a.
-            kernel_output = "".join(host_ssh.send("uname -a"))
+            kernel_output = "".join(kernel_result.get_output())
             get_logger().log_info(f"KERNEL VERSION on {hostname}: {kernel_output.strip()}")
 
             if kernel_mode in _KERNEL_MODE_FLAGS:
@@ -557,6 +566,7 @@ class CyclictestKeywords(BaseKeyword):
         target: str,
         run_log: str,
         hist_file: str,
+        histofall_mode: bool = True,
     ) -> str:
         """Copy histogram and run-log files from the target host to the local log directory.
 
@@ -564,6 +574,8 @@ class CyclictestKeywords(BaseKeyword):
         required.  If the target is not the active controller the files are
         first transferred to the active controller via
         ``FileKeywords.rsync_to_remote_server``, then downloaded via SFTP.
+        The histogram is parsed while it downloads, and its binary cache is
+        written next to it so that ``calculate_results`` doesn't read it again.
 
         Args:
             host_ssh (SSHConnection): SSH connection to the *target hypervisor*.
@@ -572,6 +584,7 @@ class CyclictestKeywords(BaseKeyword):
             target (str): Target hostname.
             run_log (str): Remote run log path.
             hist_file (str): Remote histogram file path.
+            histofall_mode (bool): True if --histofall was used.
 
         Returns:
             str: Local path to the downloaded histogram file.
@@ -622,7 +635,10 @@ class CyclictestKeywords(BaseKeyword):
                     remote_path = os.path.join(cyclictest_dir, fname)
                     local_path = os.path.join(local_dir, fname)
                     get_logger().log_debug(f"SFTP get: {remote_path} → {local_path}")
-                    sftp.get(remote_path, local_path)
+                    if fname == os.path.basename(hist_file):
+                        self._download_histogram(sftp, remote_path, local_path, histofall_mode)
+                    else:
+                        sftp.get(remote_path, local_path)
         finally:
             sftp.close()
 
@@ -637,6 +653,44 @@ class CyclictestKeywords(BaseKeyword):
         self._ssh_connection.send(f"rm -f {cyclictest_dir}/*.txt")
         return local_hist
 
+    @staticmethod
+    def _download_histogram(sftp: SFTPClient, remote_path: str, local_path: str, histofall_mode: bool) -> None:
+        """Download the histogram file, parsing it as it arrives, then write its binary cache.
+
+        Args:
+            sftp (SFTPClient): SFTP client connected to the host holding the histogram.
+            remote_path (str): Remote histogram file path.
+            local_path (str): Local path to download the histogram to.
+            histofall_mode (bool): True if --histofall was used.
+        """
+
+        def read_lines() -> Iterator[str]:
+            """Copy the remote file chunk by chunk, yielding its lines as they complete.
+
+            Yields:
+                str: The lines of the histogram file.
+            """
+            pending = b""
+            with sftp.open(remote_path, "rb") as remote_file, open(local_path, "wb") as local_file:
+                remote_file.prefetch()
+                while True:
+                    chunk = remote_file.read(_HISTOGRAM_DOWNLOAD_CHUNK_BYTES)
+                    if not chunk:
+                        break
+                    local_file.write(chunk)
+                    *lines, pending = (pending + chunk).split(b"\n")
+                    for line in lines:
+                        yield line.decode(errors="replace")
+            if pending:
+                yield pending.decode(errors="replace")
+
+        try:
+            histogram = CyclictestHistogramObject.from_lines(local_path, read_lines(), histofall_mode=histofall_mode)
+        except ValueError as error:
+            get_logger().log_warning(f"Histogram not cached: {error}")
+            return
+        histogram.save_cache(local_path, histofall_mode=histofall_mode)
+
     def calculate_results(
         self,
         local_hist_file: str,
@@ -704,7 +758,7 @@ class CyclictestKeywords(BaseKeyword):
             duration=duration,
             cpu_monitor=cpu_monitor,
         )
-        local_hist = self.fetch_results(host_ssh, chosen, run_result.get_run_log(), run_result.get_hist_file())
+        local_hist = self.fetch_results(host_ssh, chosen, run_result.get_run_log(), run_result.get_hist_file(), histofall_mode=run_result.is_histofall_mode())
 
         cpu_output.for_host_test = False
         return self.calculate_results(local_hist, histofall_mode=run_result.is_histofall_mode())
@@ -0,0 +1,259 @@
+import os
+import struct
+import sys
+from array import array
+from typing import Iterable, List, Optional
+
+from framework.logging.automation_logger import get_logger
+
+# Cache header: magic, byte order of the arrays (0 little, 1 big), number of threads, number of buckets, then the size
+# and modification time (ns) of the histogram file the cache was built from.
+CACHE_MAGIC = b"CTHIST02"
+CACHE_HEADER = struct.Struct("<8sBBIIqq")
+CACHE_SUFFIX = ".cache"
+
+
+class CyclictestHistogramObject:
+    """Per-thread cyclictest latency histogram stored as compact count arrays.
+
+    The counts of each thread are kept in an unsigned 64-bit array indexed by delay, so a histogram takes a few bytes
+    per bucket no matter how many samples it holds. Histograms from several hypervisors, or from consecutive chunks of
+    a soak run, can be merged and queried again without reading the histogram files.
+    """
+
+    def __init__(self, source: str, num_threads: int = 0):
+        """Initialize an empty histogram.
+
+        Args:
+            source (str): Where the histogram comes from, e.g. the histogram file path.
+            num_threads (int): Number of threads.
+        """
+        self._source = source
+        self._counts: List[array] = [array("Q") for _ in range(num_threads)]
+        self._overflows: array = array("Q", [0] * num_threads)
+
+    def get_source(self) -> str:
+        """Return where the histogram comes from.
+
+        Returns:
+            str: Source of the histogram.
+        """
+        return self._source
+
+    def get_num_threads(self) -> int:
+        """Return the number of threads.
+
+        Returns:
+            int: Thread count.
+        """
+        return len(self._counts)
+
+    def get_thread_counts(self, thread_num: int) -> array:
+        """Return the sample counts of a thread, indexed by delay.
+
+        Args:
+            thread_num (int): Thread index.
+
+        Returns:
+            array: Sample count for each delay.
+        """
+        return self._counts[thread_num]
+
+    def get_thread_overflows(self, thread_num: int) -> int:
+        """Return the overflow count of a thread.
+
+        Args:
+            thread_num (int): Thread index.
+
+        Returns:
+            int: Number of histogram overflows.
+        """
+        return self._overflows[thread_num]
+
+    def add_bucket(self, thread_num: int, delay: int, count: int) -> None:
+        """Add samples to a bucket of a thread.
+
+        Args:
+            thread_num (int): Thread index.
+            delay (int): Latency value.
+            count (int): Number of samples at this latency.
+        """
+        counts = self._counts[thread_num]
+        if delay >= len(counts):
+            counts.extend([0] * (delay + 1 - len(counts)))
+        counts[delay] += count
+
+    def merge(self, other: "CyclictestHistogramObject", append_threads: bool = False) -> "CyclictestHistogramObject":
+        """Add the counts of another histogram to this one.
+
+        Args:
+            other (CyclictestHistogramObject): The histogram to merge in.
+            append_threads (bool): False to add the counts thread by thread, e.g. for consecutive chunks of the same
+                run. True to add the threads of the other histogram as new threads, e.g. for another hypervisor.
+
+        Returns:
+            CyclictestHistogramObject: self, with the merged counts.
+        """
+        first_thread = len(self._counts) if append_threads else 0
+        for thread_num in range(other.get_num_threads()):
+            target_thread = first_thread + thread_num
+            if target_thread >= len(self._counts):
+                self._counts.append(array("Q"))
+                self._overflows.append(0)
+            counts = self._counts[target_thread]
+            other_counts = other.get_thread_counts(thread_num)
+            if len(other_counts) > len(counts):
+                counts.extend([0] * (len(other_counts) - len(counts)))
+            for delay, count in enumerate(other_counts):
+                if count:
+                    counts[delay] += count
+            self._overflows[target_thread] += other.get_thread_overflows(thread_num)
+        self._source = f"{self._source}+{other.get_source()}"
+        return self
+
+    @staticmethod
+    def from_lines(source: str, lines: Iterable[str], histofall_mode: bool = True) -> "CyclictestHistogramObject":
+        """Parse the lines of a cyclictest histogram one at a time.
+
+        Args:
+            source (str): Where the lines come from, e.g. the histogram file path.
+            lines (Iterable[str]): The histogram lines, e.g. an open file.
+            histofall_mode (bool): True if --histofall was used (last column is total).
+
+        Returns:
+            CyclictestHistogramObject: The parsed histogram.
+
+        Raises:
+            ValueError: If the lines contain no histogram data.
+        """
+        histogram: Optional[CyclictestHistogramObject] = None
+        overflow_comps: List[str] = []
+
+        for line in lines:
+            if line.startswith("# Histogram Overflows:"):
+                if not overflow_comps:
+                    overflow_comps = line.split(":", 1)[1].split()
+                continue
+            if not line or not line[0].isdigit():
+                continue
+
+            comps = line.split()
+            if histofall_mode:
+                comps.pop()
+            if histogram is None:
+                histogram = CyclictestHistogramObject(source, len(comps) - 1)
+            delay = int(comps[0])
+            for thread_num, count_str in enumerate(comps[1:]):
+                count = int(count_str)
+                if count > 0:
+                    histogram.add_bucket(thread_num, delay, count)
+
+        if histogram is None:
+            raise ValueError(f"No histogram data found in file: {source}")
+
+        if histofall_mode and overflow_comps:
+            overflow_comps.pop()
+        for thread_num, overflow in enumerate(overflow_comps[: histogram.get_num_threads()]):
+            histogram._overflows[thread_num] = int(overflow)
+        return histogram
+
+    @staticmethod
+    def from_hist_file(filename: str, histofall_mode: bool = True, use_cache: bool = True) -> "CyclictestHistogramObject":
+        """Load a cyclictest histogram file, from its binary cache if it is up to date.
+
+        The file is parsed line by line, and the cache is written next to it for the next analysis.
+
+        Args:
+            filename (str): Path to the local histogram file.
+            histofall_mode (bool): True if --histofall was used (last column is total).
+            use_cache (bool): False to always parse the histogram file.
+
+        Returns:
+            CyclictestHistogramObject: The histogram.
+
+        Raises:
+            FileNotFoundError: If the histogram file does not exist at the given path.
+        """
+        if not os.path.isfile(filename):
+            raise FileNotFoundError(f"Cyclictest histogram file not found: {filename}")
+
+        if use_cache:
+            histogram = CyclictestHistogramObject.load_cache(filename, histofall_mode=histofall_mode)
+            if histogram:
+                return histogram
+
+        with open(filename, "r") as fin:
+            histogram = CyclictestHistogramObject.from_lines(filename, fin, histofall_mode=histofall_mode)
+        if use_cache:
+            histogram.save_cache(filename, histofall_mode=histofall_mode)
+        return histogram
+
+    def save_cache(self, filename: str, histofall_mode: bool = True) -> Optional[str]:
+        """Write the binary cache of this histogram next to the histogram file it was parsed from.
+
+        The cache is only an optimization: if it can't be written, e.g. in a read-only directory, a warning is logged
+        and the histogram file will be parsed again next time.
+
+        Args:
+            filename (str): Path to the local histogram file.
+            histofall_mode (bool): True if the histogram file was parsed with --histofall mode.
+
+        Returns:
+            Optional[str]: Path to the cache file, or None if it couldn't be written.
+        """
+        num_buckets = max((len(counts) for counts in self._counts), default=0)
+        cache_file = filename + CACHE_SUFFIX
+        try:
+            hist_stat = os.stat(filename)
+            with open(cache_file, "wb") as fout:
+                fout.write(CACHE_HEADER.pack(CACHE_MAGIC, 0 if sys.byteorder == "little" else 1, int(histofall_mode), len(self._counts), num_buckets, hist_stat.st_size, hist_stat.st_mtime_ns))
+                self._overflows.tofile(fout)
+                for counts in self._counts:
+                    padded_counts = array("Q", counts)
+                    padded_counts.extend([0] * (num_buckets - len(counts)))
+                    padded_counts.tofile(fout)
+        except OSError as error:
+            get_logger().log_warning(f"Histogram cache {cache_file} not written: {error}")
+            return None
+        return cache_file
+
+    @staticmethod
+    def load_cache(filename: str, histofall_mode: bool = True) -> Optional["CyclictestHistogramObject"]:
+        """Load the binary cache of a histogram file.
+
+        Args:
+            filename (str): Path to the local histogram file.
+            histofall_mode (bool): True if the histogram file is parsed with --histofall mode.
+
+        Returns:
+            Optional[CyclictestHistogramObject]: The cached histogram, or None if there is no cache, if the
+            histogram file changed since the cache was written, or if the cache was written for the other mode.
+        """
+        cache_file = filename + CACHE_SUFFIX
+        if not os.path.isfile(cache_file):
+            return None
+
+        hist_stat = os.stat(filename)
+        with open(cache_file, "rb") as fin:
+            header = fin.read(CACHE_HEADER.size)
+            if len(header) != CACHE_HEADER.size:
+                return None
+            magic, byte_order, cached_histofall_mode, num_threads, num_buckets, hist_size, hist_mtime_ns = CACHE_HEADER.unpack(header)
+            if magic != CACHE_MAGIC or cached_histofall_mode != int(histofall_mode) or hist_size != hist_stat.st_size or hist_mtime_ns != hist_stat.st_mtime_ns:
+                return None
+
+            histogram = CyclictestHistogramObject(filename)
+            try:
+                histogram._overflows.fromfile(fin, num_threads)
+                for _ in range(num_threads):
+                    counts = array("Q")
+                    counts.fromfile(fin, num_buckets)
+                    histogram._counts.append(counts)
+            except EOFError:
+                return None
+
+        if byte_order != (0 if sys.byteorder == "little" else 1):
+            histogram._overflows.byteswap()
+            for counts in histogram._counts:
+                counts.byteswap()
+        return histogram
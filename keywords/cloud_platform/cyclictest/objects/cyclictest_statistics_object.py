@@ -1,7 +1,7 @@
-import statistics
-from typing import List
+from typing import Dict, List, Union
 
 from framework.logging.automation_logger import get_logger
+from keywords.cloud_platform.cyclictest.objects.cyclictest_histogram_object import CyclictestHistogramObject
 from keywords.cloud_platform.cyclictest.objects.cyclictest_thread_data_object import CyclictestThreadDataObject
 
 
@@ -24,6 +24,8 @@ class CyclictestStatisticsObject:
         self._median: int = 0
         self._percentile: int = 0
         self._num_overflows: int = 0
+        self._delays: List[int] = []
+        self._cumulative_counts: List[int] = []
 
     def get_filename(self) -> str:
         """Return the source histogram file path.
@@ -81,16 +83,40 @@ class CyclictestStatisticsObject:
         """
         return self._num_overflows
 
+    def get_thread_data(self) -> List[CyclictestThreadDataObject]:
+        """Return the per-thread data objects.
+
+        Returns:
+            List[CyclictestThreadDataObject]: Per-thread data, by thread index.
+        """
+        return self._thread_data
+
+    def get_percentile_value(self, percentile: Union[float, str]) -> int:
+        """Return the latency at the given percentile of the samples of all threads (nearest rank).
+
+        calculate_statistics() must have been called first.
+
+        Args:
+            percentile (Union[float, str]): Percentile between 0 and 100, e.g. 99.99.
+
+        Returns:
+            int: Latency in ns, or 0 if there are no samples.
+        """
+        return CyclictestThreadDataObject.get_percentile_value_in_buckets(self._delays, self._cumulative_counts, percentile)
+
     def calculate_statistics(self) -> "CyclictestStatisticsObject":
         """Aggregate statistics from all threads.
 
+        The aggregate median is taken from the cumulative counts of the merged histogram buckets, so the samples are
+        never expanded in memory.
+
         Returns:
             CyclictestStatisticsObject: self with aggregated statistics populated.
         """
         accumulator = 0
         maximums = []
         percentiles = []
-        all_elements: List[int] = []
+        merged_histogram: Dict[int, int] = {}
 
         for td in self._thread_data:
             stats = td.calculate_statistics()
@@ -99,65 +125,51 @@ class CyclictestStatisticsObject:
             maximums.append(stats.get_maximum())
             percentiles.append(stats.get_percentile())
             self._num_overflows += stats.get_num_overflows()
-            all_elements.extend(stats.get_elements())
+            for delay, count in stats.get_histogram().items():
+                merged_histogram[delay] = merged_histogram.get(delay, 0) + count
 
+        self._delays, self._cumulative_counts = CyclictestThreadDataObject.build_cumulative_counts(merged_histogram)
         self._average = accumulator // self._num_samples
         self._maximum = max(maximums)
-        self._median = int(statistics.median(all_elements))
+        self._median = CyclictestThreadDataObject.get_median_in_buckets(self._delays, self._cumulative_counts)
         self._percentile = max(percentiles)
 
         get_logger().log_info(f"Cyclictest results — samples:{self._num_samples} avg:{self._average} max:{self._maximum} 6nines:{self._percentile} median:{self._median} overflows:{self._num_overflows}")
         return self
 
+    @staticmethod
+    def from_histogram(histogram: CyclictestHistogramObject) -> "CyclictestStatisticsObject":
+        """Build a statistics object from a (possibly merged) histogram.
+
+        Args:
+            histogram (CyclictestHistogramObject): The per-thread histogram.
+
+        Returns:
+            CyclictestStatisticsObject: statistics object (call calculate_statistics() to compute).
+        """
+        thread_data: List[CyclictestThreadDataObject] = []
+        for thread_num in range(histogram.get_num_threads()):
+            td = CyclictestThreadDataObject(thread_num)
+            for delay, count in enumerate(histogram.get_thread_counts(thread_num)):
+                td.append(delay, count)
+            td.set_num_overflows(histogram.get_thread_overflows(thread_num))
+            thread_data.append(td)
+        return CyclictestStatisticsObject(histogram.get_source(), thread_data)
+
     @staticmethod
     def from_hist_file(filename: str, histofall_mode: bool = True) -> "CyclictestStatisticsObject":
         """Parse a cyclictest histogram file and return a statistics object.
 
+        The file is read line by line, or not at all if its binary cache is up to date.
+
         Args:
             filename (str): Path to the local histogram file.
             histofall_mode (bool): True if --histofall was used (last column is total).
 
         Returns:
             CyclictestStatisticsObject: parsed object (call calculate_statistics() to compute).
-
-        Raises:
-            FileNotFoundError: If the histogram file does not exist at the given path.
-            ValueError: If the histogram file is empty or contains no data lines.
         """
-        try:
-            with open(filename, "r") as fin:
-                lines = fin.readlines()
-        except FileNotFoundError:
-            raise FileNotFoundError(f"Cyclictest histogram file not found: {filename}")
-
-        overflow_lines = [line.strip() for line in lines if line.startswith("# Histogram Overflows:")]
-        data_lines = [line.strip() for line in lines if line and line[0].isdigit()]
-
-        if not data_lines:
-            raise ValueError(f"No histogram data found in file: {filename}")
-
-        thread_data: List[CyclictestThreadDataObject] = []
-        initialized = False
-
-        for line in data_lines:
-            comps = line.split()
-            if histofall_mode:
-                comps.pop()
-            if not initialized:
-                thread_data = [CyclictestThreadDataObject(i) for i in range(len(comps) - 1)]
-                initialized = True
-            delay = int(comps[0])
-            for i, count_str in enumerate(comps[1:]):
-                thread_data[i].append(delay, int(count_str))
-
-        if overflow_lines:
-            overflow_comps = overflow_lines[0].split(":", 1)[1].split()
-            if histofall_mode:
-                overflow_comps.pop()
-            for i, ov in enumerate(overflow_comps):
-                thread_data[i].set_num_overflows(int(ov))
-
-        return CyclictestStatisticsObject(filename, thread_data)
+        return CyclictestStatisticsObject.from_histogram(CyclictestHistogramObject.from_hist_file(filename, histofall_mode=histofall_mode))
 
     def __str__(self) -> str:
         """Return a human-readable representation.
@@ -1,6 +1,9 @@
-from typing import Dict, List
+import bisect
+import itertools
+from fractions import Fraction
+from typing import Dict, Iterator, List, Tuple, Union
 
-from framework.logging.automation_logger import get_logger
+SIX_NINES_PERCENTILE = 99.9999
 
 
 class CyclictestThreadDataObject:
@@ -14,7 +17,8 @@ class CyclictestThreadDataObject:
         """
         self._thread_num = thread_num
         self._data: Dict[int, int] = {}
-        self._elements: List[int] = []
+        self._delays: List[int] = []
+        self._cumulative_counts: List[int] = []
         self._num_overflows: int = 0
         self._num_samples: int = 0
         self._accumulator: int = 0
@@ -77,13 +81,23 @@ class CyclictestThreadDataObject:
         """
         return self._percentile
 
-    def get_elements(self) -> List[int]:
-        """Return the expanded list of all latency samples (delay repeated count times).
+    def get_histogram(self) -> Dict[int, int]:
+        """Return the histogram buckets of this thread.
 
         Returns:
-            List[int]: Flat list of individual latency values.
+            Dict[int, int]: Sample count by latency in ns.
         """
-        return self._elements
+        return dict(self._data)
+
+    def get_elements(self) -> Iterator[int]:
+        """Iterate over all latency samples in ascending order (each delay repeated count times).
+
+        The samples are generated lazily: a long run holds billions of them, so avoid turning this into a list.
+
+        Returns:
+            Iterator[int]: The individual latency values.
+        """
+        return itertools.chain.from_iterable(itertools.repeat(delay, self._data[delay]) for delay in sorted(self._data))
 
     def append(self, delay: int, count: int) -> None:
         """Add a histogram bucket.
@@ -95,41 +109,112 @@ class CyclictestThreadDataObject:
         if count <= 0:
             return
         self._data[delay] = self._data.get(delay, 0) + count
+        self._delays = []
+        self._cumulative_counts = []
+
+    def get_percentile_value(self, percentile: Union[float, str]) -> int:
+        """Return the latency at the given percentile of this thread's samples (nearest rank).
+
+        Args:
+            percentile (Union[float, str]): Percentile between 0 and 100, e.g. 50 or 99.9999.
+
+        Returns:
+            int: Latency in ns, or 0 if the thread has no samples.
+        """
+        if not self._cumulative_counts:
+            self._delays, self._cumulative_counts = CyclictestThreadDataObject.build_cumulative_counts(self._data)
+        return CyclictestThreadDataObject.get_percentile_value_in_buckets(self._delays, self._cumulative_counts, percentile)
+
+    def get_median(self) -> int:
+        """Return the median latency of this thread's samples, like statistics.median() over all of them.
+
+        Returns:
+            int: Median latency in ns, or 0 if the thread has no samples.
+        """
+        if not self._cumulative_counts:
+            self._delays, self._cumulative_counts = CyclictestThreadDataObject.build_cumulative_counts(self._data)
+        return CyclictestThreadDataObject.get_median_in_buckets(self._delays, self._cumulative_counts)
+
+    @staticmethod
+    def build_cumulative_counts(histogram: Dict[int, int]) -> Tuple[List[int], List[int]]:
+        """Sort histogram buckets and compute their cumulative sample counts.
+
+        Args:
+            histogram (Dict[int, int]): Sample count by latency.
 
-    def _calculate_six_nines_percentile(self) -> int:
-        """Calculate the 99.9999% percentile latency.
+        Returns:
+            Tuple[List[int], List[int]]: The ascending delays, and for each of them the number of samples at or below it.
+        """
+        delays = sorted(histogram)
+        return delays, list(itertools.accumulate(histogram[delay] for delay in delays))
+
+    @staticmethod
+    def get_value_at_rank(delays: List[int], cumulative_counts: List[int], rank: int) -> int:
+        """Return the sample at the given position of the sorted samples, without expanding them.
+
+        Args:
+            delays (List[int]): Ascending delays, as returned by build_cumulative_counts().
+            cumulative_counts (List[int]): Cumulative counts, as returned by build_cumulative_counts().
+            rank (int): 0-based position in the sorted samples.
+
+        Returns:
+            int: Latency at this position.
+        """
+        return delays[bisect.bisect_right(cumulative_counts, rank)]
+
+    @staticmethod
+    def get_percentile_value_in_buckets(delays: List[int], cumulative_counts: List[int], percentile: Union[float, str]) -> int:
+        """Return the latency at the given percentile (nearest rank) from cumulative bucket counts.
+
+        The samples above the percentile are thrown away and the largest remaining one is returned: for six nines, the
+        int(total / 1,000,000) largest samples are ignored.
+
+        Args:
+            delays (List[int]): Ascending delays, as returned by build_cumulative_counts().
+            cumulative_counts (List[int]): Cumulative counts, as returned by build_cumulative_counts().
+            percentile (Union[float, str]): Percentile between 0 and 100.
+
+        Returns:
+            int: Latency in ns, or 0 if there are no samples.
+        """
+        if not cumulative_counts:
+            return 0
+        # The percentile is parsed from its decimal representation so that e.g. 99.9 doesn't throw away one less sample.
+        total_count = cumulative_counts[-1]
+        throw_away = int(total_count * (100 - Fraction(str(percentile))) / 100)
+        return CyclictestThreadDataObject.get_value_at_rank(delays, cumulative_counts, max(0, total_count - throw_away - 1))
+
+    @staticmethod
+    def get_median_in_buckets(delays: List[int], cumulative_counts: List[int]) -> int:
+        """Return the median latency from cumulative bucket counts, like int(statistics.median()) over the samples.
+
+        Args:
+            delays (List[int]): Ascending delays, as returned by build_cumulative_counts().
+            cumulative_counts (List[int]): Cumulative counts, as returned by build_cumulative_counts().
 
         Returns:
-            int: Latency at six-nines percentile.
+            int: Median latency in ns, or 0 if there are no samples.
         """
-        total_count = sum(self._data.values())
-        throw_away = int(total_count / 1_000_000)
-        delays: List[int] = []
-        for delay in sorted(self._data.keys()):
-            delays.extend([delay] * self._data[delay])
-        expected = delays[-throw_away - 1]
-        for delay in sorted(self._data.keys(), reverse=True):
-            count = self._data[delay]
-            if throw_away > 0 and throw_away >= count:
-                throw_away -= count
-            else:
-                if expected and delay != expected:
-                    get_logger().log_warning(f"Thread:{self._thread_num} expected:{expected} calculated:{delay}")
-                return delay
-        raise RuntimeError(f"Thread{self._thread_num:02d}: Internal error in percentile calculation")
+        if not cumulative_counts:
+            return 0
+        total_count = cumulative_counts[-1]
+        upper = CyclictestThreadDataObject.get_value_at_rank(delays, cumulative_counts, total_count // 2)
+        if total_count % 2:
+            return upper
+        lower = CyclictestThreadDataObject.get_value_at_rank(delays, cumulative_counts, total_count // 2 - 1)
+        return int((lower + upper) / 2)
 
     def calculate_statistics(self) -> "CyclictestThreadDataObject":
-        """Compute statistics for this thread.
+        """Compute statistics for this thread from the bucket counts.
 
         Returns:
             CyclictestThreadDataObject: self with statistics populated.
         """
-        self._num_samples = sum(self._data.values())
+        self._delays, self._cumulative_counts = CyclictestThreadDataObject.build_cumulative_counts(self._data)
+        self._num_samples = self._cumulative_counts[-1] if self._cumulative_counts else 0
         self._accumulator = sum(d * c for d, c in self._data.items())
-        self._maximum = max(self._data.keys())
-        self._percentile = self._calculate_six_nines_percentile()
-        for delay, count in self._data.items():
-            self._elements.extend([delay] * count)
+        self._maximum = self._delays[-1] if self._delays else 0
+        self._percentile = self.get_percentile_value(SIX_NINES_PERCENTILE)
         return self
 
     def __str__(self) -> str:
@@ -4,6 +4,8 @@ from typing import List
 from config.configuration_manager import ConfigurationManager
 from framework.logging.automation_logger import get_logger
 from framework.ssh.ssh_connection import SSHConnection
+from framework.ssh.ssh_connection_manager import SSHConnectionManager
+from framework.threading.fan_out_executor import FanOutExecutor
 from framework.validation.validation import validate_equals_with_retry
 from keywords.base_keyword import BaseKeyword
 from keywords.cloud_platform.command_wrappers import oidc_auth_wrap, source_openrc
@@ -235,25 +237,33 @@ class DcManagerSubcloudListKeywords(BaseKeyword):
         lab_config = ConfigurationManager.get_lab_config()
         sc_defined_in_ace_config = [sc.get_lab_name() for sc in lab_config.get_subclouds()]
 
-        matching_subclouds = []
+        # Skip subclouds not defined in ACE config, and the ones of another type, before querying their software version
+        candidate_subclouds = {sc.get_name(): sc for sc in subclouds if sc.get_name() in sc_defined_in_ace_config and lab_config.get_subcloud(sc.get_name()).get_lab_type() == lab_type}
 
-        for sc in subclouds:
-            # Skip subclouds not defined in ACE config
-            if sc.get_name() not in sc_defined_in_ace_config:
-                continue
+        # Leave room in the connection pool for the connection of the caller
+        fan_out_executor = FanOutExecutor(max_concurrency=max(1, SSHConnectionManager.max_connections_per_host - 1))
+        software_versions = fan_out_executor.execute(candidate_subclouds, self._get_subcloud_software_version)
 
-            sc_config = lab_config.get_subcloud(sc.get_name())
-            subcloud_show_object = DcManagerSubcloudShowKeywords(self.ssh_connection).get_dcmanager_subcloud_show(sc.get_name()).get_dcmanager_subcloud_show_object()
-            subcloud_version = subcloud_show_object.get_software_version()
-
-            if sc_config.get_lab_type() == lab_type and subcloud_version == version:
-                matching_subclouds.append(sc)
+        matching_subclouds = [sc for sc_name, sc in candidate_subclouds.items() if software_versions[sc_name].get_result() == version]
 
         if not matching_subclouds:
             raise ValueError(f"No healthy subclouds found for type {lab_type} and version {version}.")
 
         return matching_subclouds
 
+    def _get_subcloud_software_version(self, subcloud: DcManagerSubcloudListObject) -> str:
+        """Gets the software version of the subcloud using a connection owned by the calling thread.
+
+        Args:
+            subcloud (DcManagerSubcloudListObject): The subcloud to query.
+
+        Returns:
+            str: The software version of the subcloud.
+        """
+        ssh_connection = SSHConnectionManager.get_connection_for_current_thread(self.ssh_connection)
+        subcloud_show_object = DcManagerSubcloudShowKeywords(ssh_connection).get_dcmanager_subcloud_show(subcloud.get_name()).get_dcmanager_subcloud_show_object()
+        return subcloud_show_object.get_software_version()
+
     def get_healthy_subcloud_by_type_and_release(self, lab_type: str, version: str) -> DcManagerSubcloudListObject:
         """
         Fetch one healthy subcloud by type and software version.
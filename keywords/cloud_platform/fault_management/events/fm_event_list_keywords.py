@@ -28,7 +28,9 @@ class FmEventListKeywords(BaseKeyword):
         """
         limit_flag = f" --limit {limit}" if limit > 0 else ""
         cmd = f"fm event-list --nowrap{limit_flag}"
-        output = self.ssh_connection.send(source_openrc(cmd))
+        # The event list can be very long, only the table rows are kept while it is streamed.
+        output = list(self.ssh_connection.send_stream(source_openrc(cmd), line_filter=lambda line: "|" in line))
+        fm_event_list_output = FmEventListOutput(output)
         self.validate_success_return_code(self.ssh_connection)
 
-        return FmEventListOutput(output)
+        return fm_event_list_output
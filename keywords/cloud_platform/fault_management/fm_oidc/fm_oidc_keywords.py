@@ -248,6 +248,7 @@ class FmOidcKeywords(BaseKeyword):
             name=f"oidc-{username}-via-sysadmin",
             ssh_port=lab_config.get_ssh_port(),
             jump_host=jump_host_config,
+            fresh_connection=True,
         )
         if not ssh or not ssh.is_connected:
             raise KeywordException(f"Failed to create fallback SSH connection for LDAP user {username}")
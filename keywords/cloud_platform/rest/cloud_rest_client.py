@@ -1,3 +1,5 @@
+from typing import Callable
+
 from config.configuration_manager import ConfigurationManager
 from framework.rest.rest_client import RestClient
 from framework.rest.rest_response import RestResponse
@@ -16,7 +18,44 @@ class CloudRestClient:
         else:
             self.rest_client = RestClient()
 
-        self.auth_token = GetAuthTokenKeywords(self.rest_client).get_token()
+        # The token is shared by every CloudRestClient of the process, until it is about to expire
+        self.auth_token_keywords = GetAuthTokenKeywords(self.rest_client)
+        self.auth_token = self.auth_token_keywords.get_cached_token()
+
+    def _run_request(self, send_request: Callable[[dict], RestResponse], auth: bool, content_type: str | None = None) -> RestResponse:
+        """Runs a request with the auth token, renewing the token once if it was refused.
+
+        Args:
+            send_request (Callable[[dict], RestResponse]): Sends the request with the given headers.
+            auth (bool): Whether to include auth token.
+            content_type (str | None): Content-Type header value. None for no Content-Type header.
+
+        Returns:
+            RestResponse: The response from the request.
+        """
+        if not auth:
+            return send_request({})
+
+        rest_response = send_request(self._get_headers(content_type))
+        if rest_response.get_status_code() == 401:
+            # The token was revoked before its expiry, e.g. by a change of credentials
+            self.auth_token = self.auth_token_keywords.get_cached_token(stale_token=self.auth_token)
+            rest_response = send_request(self._get_headers(content_type))
+        return rest_response
+
+    def _get_headers(self, content_type: str | None) -> dict:
+        """Gets the headers of an authenticated request.
+
+        Args:
+            content_type (str | None): Content-Type header value. None for no Content-Type header.
+
+        Returns:
+            dict: The headers.
+        """
+        headers = {"X-Auth-Token": self.auth_token}
+        if content_type:
+            headers["Content-Type"] = content_type
+        return headers
 
     def get(self, url: str, auth: bool = True) -> RestResponse:
         """Runs a get on the url.
@@ -28,9 +67,7 @@ class CloudRestClient:
         Returns:
             RestResponse: The response from the GET request.
         """
-        headers = {"X-Auth-Token": self.auth_token} if auth else {}
-        rest_response = self.rest_client.get(url, headers)
-        return rest_response
+        return self._run_request(lambda headers: self.rest_client.get(url, headers), auth)
 
     def delete(self, url: str, auth: bool = True) -> RestResponse:
         """Runs a delete on the url.
@@ -42,9 +79,7 @@ class CloudRestClient:
         Returns:
             RestResponse: The response from the DELETE request.
         """
-        headers = {"X-Auth-Token": self.auth_token} if auth else {}
-        rest_response = self.rest_client.delete(url, headers)
-        return rest_response
+        return self._run_request(lambda headers: self.rest_client.delete(url, headers), auth)
 
     def post(self, url: str, data: dict | str | None = None, auth: bool = True) -> RestResponse:
         """Runs a post on the url.
@@ -57,9 +92,7 @@ class CloudRestClient:
         Returns:
             RestResponse: The response from the POST request.
         """
-        headers = {"X-Auth-Token": self.auth_token, "Content-Type": "application/json"} if auth else {}
-        rest_response = self.rest_client.post(url, data=data or "{}", headers=headers)
-        return rest_response
+        return self._run_request(lambda headers: self.rest_client.post(url, data=data or "{}", headers=headers), auth, "application/json")
 
     def patch(self, url: str, data: dict | str | None = None, auth: bool = True) -> RestResponse:
         """Runs a patch on the url.
@@ -72,9 +105,7 @@ class CloudRestClient:
         Returns:
             RestResponse: The response from the PATCH request.
         """
-        headers = {"X-Auth-Token": self.auth_token, "Content-Type": "application/json"} if auth else {}
-        rest_response = self.rest_client.patch(url, data=data or {}, headers=headers)
-        return rest_response
+        return self._run_request(lambda headers: self.rest_client.patch(url, data=data or {}, headers=headers), auth, "application/json")
 
     def put(self, url: str, data: dict | str | None = None, auth: bool = True, content_type: str = "application/json") -> RestResponse:
         """Runs a put on the url.
@@ -88,6 +119,4 @@ class CloudRestClient:
         Returns:
             RestResponse: The response from the PUT request.
         """
-        headers = {"X-Auth-Token": self.auth_token, "Content-Type": content_type} if auth else {}
-        rest_response = self.rest_client.put(url, data=data or {}, headers=headers)
-        return rest_response
+        return self._run_request(lambda headers: self.rest_client.put(url, data=data or {}, headers=headers), auth, content_type)
@@ -1,8 +1,10 @@
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
 
 from config.configuration_manager import ConfigurationManager
 from framework.logging.automation_logger import get_logger
 from framework.rest.rest_client import RestClient
+from framework.rest.token_cache import TokenCache
 from keywords.base_keyword import BaseKeyword
 from keywords.cloud_platform.rest.get_rest_url_keywords import GetRestUrlKeywords
 
@@ -15,6 +17,9 @@ class GetAuthTokenKeywords(BaseKeyword):
     to retrieve X-Auth-Token for subsequent API calls.
     """
 
+    PROJECT_NAME = "admin"
+    DOMAIN_NAME = "Default"
+
     def __init__(self, rest_client: RestClient) -> None:
         """
         Initialize the authentication token keywords.
@@ -27,9 +32,10 @@ class GetAuthTokenKeywords(BaseKeyword):
 
         # Get the rest credentials
         rest_credentials = ConfigurationManager.get_lab_config().get_rest_credentials()
+        self.user_name: str = rest_credentials.get_user_name()
 
         # JSON body needed to get auth token
-        self.json_string: str = '{"auth":' '{"identity":{"methods": ["password"],' '"password": {"user": {"domain":' '{"name": "Default"},"name":' f'"{rest_credentials.get_user_name()}","password":"{rest_credentials.get_password()}"' "}}}," '"scope":{"project": {"name":' '"admin","domain": {"name":"Default"}' "}}}}"
+        self.json_string: str = '{"auth":' '{"identity":{"methods": ["password"],' '"password": {"user": {"domain":' '{"name": "Default"},"name":' f'"{self.user_name}","password":"{rest_credentials.get_password()}"' "}}}," '"scope":{"project": {"name":' f'"{self.PROJECT_NAME}","domain": {{"name":"{self.DOMAIN_NAME}"}}' "}}}}"
 
     def get_token(self) -> Optional[str]:
         """
@@ -44,18 +50,51 @@ class GetAuthTokenKeywords(BaseKeyword):
         Raises:
             None: May log errors but does not raise exceptions
         """
+        token, _ = self.get_token_and_expiry()
+        return token
+
+    def get_cached_token(self, stale_token: Optional[str] = None) -> Optional[str]:
+        """
+        Retrieve the authentication token shared by the whole process, requesting it from Keystone only when needed.
+
+        The token is cached by Keystone URL, user, project and domain, and requested again shortly before it expires.
+
+        Args:
+            stale_token (Optional[str]): A token that Keystone refused, to request a new one unless it was already replaced.
+
+        Returns:
+            Optional[str]: Authentication token string if successful, None if failed
+        """
+        keystone_url = GetRestUrlKeywords().get_keystone_url()
+        return TokenCache.get_token((keystone_url, self.user_name, self.PROJECT_NAME, self.DOMAIN_NAME), self.get_token_and_expiry, stale_token)
+
+    def get_token_and_expiry(self) -> Tuple[Optional[str], Optional[datetime]]:
+        """
+        Retrieve authentication token from Keystone API, with the time it expires at.
+
+        Returns:
+            Tuple[Optional[str], Optional[datetime]]: Authentication token string and its expiry if successful, None if failed. The expiry is None if the response has none.
+        """
         # Get the token from Keystone
         response = self.rest_client.post(f"{GetRestUrlKeywords().get_keystone_url()}/auth/tokens", headers=self.headers, data=self.json_string)
 
         # Check if authentication was successful
         if response.get_status_code() != 201:
             get_logger().log_error(f"Authentication failed with status {response.get_status_code()}: {response.response.text}")
-            return None
+            return None, None
 
         # Token is in the response headers
         headers: Dict[str, Any] = response.get_headers()
-        if "X-Subject-Token" in headers:
-            return headers["X-Subject-Token"]
+        if "X-Subject-Token" not in headers:
+            get_logger().log_error("Unable to find X-Subject-Token in response headers")
+            return None, None
 
-        get_logger().log_error("Unable to find X-Subject-Token in response headers")
-        return None
+        # The expiry is in the body, e.g. "2026-10-18T05:00:00.000000Z"
+        try:
+            expires_at = datetime.fromisoformat(response.get_json_content()["token"]["expires_at"])
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+        except (ValueError, KeyError, TypeError):
+            get_logger().log_warning("Unable to find the expiry of the token in the response")
+            expires_at = None
+        return headers["X-Subject-Token"], expires_at
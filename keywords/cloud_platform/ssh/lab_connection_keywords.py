@@ -17,9 +17,12 @@ class LabConnectionKeywords(BaseKeyword):
     Class to hold Lab connection keywords
     """
 
-    def get_active_controller_ssh(self) -> SSHConnection:
+    def get_active_controller_ssh(self, fresh_connection: bool = False) -> SSHConnection:
         """Gets the active controller ssh
 
+        Args:
+            fresh_connection (bool): True to open a new connection instead of reusing the pooled one, e.g. after a swact.
+
         Returns:
             SSHConnection: the ssh for the active controller
         """
@@ -35,14 +38,18 @@ class LabConnectionKeywords(BaseKeyword):
             lab_config.get_admin_credentials().get_password(),
             ssh_port=lab_config.get_ssh_port(),
             jump_host=jump_host_config,
+            fresh_connection=fresh_connection,
         )
 
         return connection
 
-    def get_standby_controller_ssh(self) -> SSHConnection:
+    def get_standby_controller_ssh(self, fresh_connection: bool = False) -> SSHConnection:
         """
         Gets the standby controller ssh
 
+        Args:
+            fresh_connection (bool): True to open a new connection instead of reusing the pooled one, e.g. after a reboot.
+
         Returns:
             SSHConnection: the ssh for the standby controller
         """
@@ -68,16 +75,18 @@ class LabConnectionKeywords(BaseKeyword):
             name=standby_host_name,
             ssh_port=lab_config.get_ssh_port(standby_host_name),
             jump_host=jump_host_config,
+            fresh_connection=fresh_connection,
         )
 
         return connection
 
-    def get_ssh_for_hostname(self, hostname: str) -> SSHConnection:
+    def get_ssh_for_hostname(self, hostname: str, fresh_connection: bool = False) -> SSHConnection:
         """
         Gets the ssh connection for the hostname
 
         Args:
              hostname (str): The name of the host
+             fresh_connection (bool): True to open a new connection instead of reusing the pooled one, e.g. after a reboot.
 
         Returns:
             SSHConnection: the ssh for the hostname
@@ -105,6 +114,7 @@ class LabConnectionKeywords(BaseKeyword):
             name=hostname,
             ssh_port=lab_config.get_ssh_port(hostname),
             jump_host=jump_host_config,
+            fresh_connection=fresh_connection,
         )
         return connection
 
@@ -185,7 +195,8 @@ class LabConnectionKeywords(BaseKeyword):
             SSHConnection: the SSH connection to the node whose name is specified by the argument 'host_name'.
 
         """
-        connection = self.get_active_controller_ssh()
+        # ssh pass changes how every command is sent, so this can't be the pooled active controller connection.
+        connection = self.get_active_controller_ssh(fresh_connection=True)
         connection.set_name(host_name)
         lab_config = ConfigurationManager.get_lab_config()
         credentials = lab_config.get_admin_credentials()
@@ -194,11 +205,12 @@ class LabConnectionKeywords(BaseKeyword):
 
         return connection
 
-    def get_subcloud_ssh(self, subcloud_name: str) -> SSHConnection:
+    def get_subcloud_ssh(self, subcloud_name: str, fresh_connection: bool = False) -> SSHConnection:
         """Gets an SSH connection to the 'Subcloud' node whose name is specified by the argument 'subcloud_name'.
 
         Args:
              subcloud_name (str): The name of the 'subcloud' node.
+             fresh_connection (bool): True to open a new connection instead of reusing the pooled one, e.g. after a swact.
 
         Returns:
             SSHConnection: the SSH connection to the 'subcloud' node whose name is specified by the argument 'subcloud_name'.
@@ -220,6 +232,7 @@ class LabConnectionKeywords(BaseKeyword):
             lab_config.get_admin_credentials().get_password(),
             ssh_port=lab_config.get_ssh_port(),
             jump_host=jump_host_config,
+            fresh_connection=fresh_connection,
         )
 
         return connection
@@ -354,7 +367,7 @@ class LabConnectionKeywords(BaseKeyword):
         Returns:
             bool: True if SSH connection succeeds, False otherwise.
         """
-        connection = self.get_active_controller_ssh()
+        connection = self.get_active_controller_ssh(fresh_connection=True)
         lab_config = ConfigurationManager.get_lab_config()
         connection.setup_ssh_pass(hostname, lab_config.get_admin_credentials().get_user_name(), lab_config.get_admin_credentials().get_password())
         connection.send("echo 'connection_test'")
@@ -3,6 +3,7 @@ import time
 from typing import Any, Dict
 
 from framework.logging.automation_logger import get_logger
+from framework.threading.fan_out_executor import FanOutExecutor
 from framework.validation.validation import validate_equals, validate_equals_with_retry, validate_list_contains, validate_list_contains_with_retry
 from keywords.base_keyword import BaseKeyword
 from keywords.cloud_platform.fault_management.alarms.alarm_list_keywords import AlarmListKeywords
@@ -75,6 +76,8 @@ class PTPVerifyConfigKeywords(BaseKeyword):
         """
         gnss_keywords = GnssKeywords()
 
+        # Gather the (interface, expected GNSS port) pairs to validate on each host, then validate all the hosts in parallel.
+        gnss_checks_by_hostname = {}
         for ts2phc_instance_obj in self.ts2phc_setup_list:
             expected_gnss_port = gnss_keywords.extract_gnss_port(ts2phc_instance_obj.get_instance_parameters())
 
@@ -84,13 +87,27 @@ class PTPVerifyConfigKeywords(BaseKeyword):
 
             if expected_gnss_port == "ttyACM0":
                 get_logger().log_info(f"Skipping CGU debug validation for {expected_gnss_port} - not valid for USB serial device type")
-                return
+                break
 
             for ptp_host_if in ts2phc_instance_obj.get_ptp_interfaces():
                 for host in hosts:
                     interfaces = ptp_host_if.get_interfaces_for_hostname(host.get_host_name())
                     for interface in filter(None, interfaces):  # Skip None or empty values
-                        self.validate_gnss_status_on_hostname(host.get_host_name(), interface, expected_gnss_port)
+                        gnss_checks_by_hostname.setdefault(host.get_host_name(), []).append((interface, expected_gnss_port))
+
+        targets = {hostname: hostname for hostname in gnss_checks_by_hostname}
+        FanOutExecutor().execute(targets, lambda hostname: self._validate_gnss_checks_on_hostname(hostname, gnss_checks_by_hostname[hostname]))
+
+    def _validate_gnss_checks_on_hostname(self, hostname: str, gnss_checks: list) -> None:
+        """
+        Validate the GNSS status of the given interfaces on the hostname, one after the other.
+
+        Args:
+            hostname (str): The name of the host.
+            gnss_checks (list): list of (interface, expected GNSS port) to validate on this host
+        """
+        for interface, expected_gnss_port in gnss_checks:
+            self.validate_gnss_status_on_hostname(hostname, interface, expected_gnss_port)
 
     def verify_sma_status(self, hosts: list) -> None:
         """
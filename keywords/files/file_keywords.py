@@ -2,7 +2,7 @@ import math
 import os
 import shlex
 import shutil
-import time
+import uuid
 from typing import Optional
 
 from jinja2 import Template
@@ -10,9 +10,11 @@ from jinja2 import Template
 from config.configuration_manager import ConfigurationManager
 from framework.exceptions.keyword_exception import KeywordException
 from framework.logging.automation_logger import get_logger
+from framework.ssh.secure_transfer_file.sftp_transfer_engine import SFTPTransferEngine
 from framework.ssh.ssh_connection import SSHConnection
 from framework.validation.validation import validate_equals_with_retry, validate_less_than_or_equal
 from keywords.base_keyword import BaseKeyword
+from keywords.files.objects.remote_file_stream_object import RemoteFileStreamObject
 
 
 class FileKeywords(BaseKeyword):
@@ -47,13 +49,17 @@ class FileKeywords(BaseKeyword):
         self.upload_file(local_path, target_remote_file)
         return target_remote_file
 
-    def download_file(self, remote_file_path: str, local_file_path: str) -> bool:
+    def download_file(self, remote_file_path: str, local_file_path: str, resume: bool = False, verify_checksum: bool = False) -> bool:
         """
         Method to download a file from the remote host on which the SSH connection is established.
 
+        The SFTP session of the connection is reused, and the file is read with pipelined requests.
+
         Args:
             remote_file_path (str): Absolute path of the file to download.
             local_file_path (str): Absolute path (incl file name) to be copied to.
+            resume (bool): Whether to complete a previous partial download instead of starting over.
+            verify_checksum (bool): Whether to compare the sha256 of both files after the download.
 
         Returns:
             bool: True if download is successful, False otherwise.
@@ -62,24 +68,25 @@ class FileKeywords(BaseKeyword):
             KeywordException: if unable to copy file.
         """
         try:
-            sftp_client = self.ssh_connection.get_sftp_client()
-            sftp_client.get(remote_file_path, local_file_path)
+            SFTPTransferEngine(self.ssh_connection.get_sftp_client()).download_file(remote_file_path, local_file_path, resume=resume, verify_checksum=verify_checksum)
         except Exception as e:
             get_logger().log_error(f"Exception while downloading remote file [{remote_file_path}] to [{local_file_path}]. {e}")
             raise KeywordException(f"Exception while downloading remote file [{remote_file_path}] to [{local_file_path}]. {e}")
         return True
 
-    def upload_file(self, local_file_path: str, remote_file_path: str, overwrite: bool = True) -> bool:
+    def upload_file(self, local_file_path: str, remote_file_path: str, overwrite: bool = True, resume: bool = False, verify_checksum: bool = False) -> bool:
         """
         Method to upload a file.
 
         It will upload from the local host to the remote host on which the SSH connection
-        is established.
+        is established. The SFTP session of the connection is reused, and the writes are pipelined.
 
         Args:
             local_file_path (str): Absolute path for the file to be uploaded.
             remote_file_path (str): Absolute path (incl file name) to upload to.
             overwrite (bool): Whether to overwrite if it already exists.
+            resume (bool): Whether to complete a previous partial upload instead of starting over.
+            verify_checksum (bool): Whether to compare the sha256 of both files after the upload.
 
         Returns:
             bool: True if upload is successful, False otherwise.
@@ -88,14 +95,36 @@ class FileKeywords(BaseKeyword):
             KeywordException: if unable to upload file.
         """
         try:
-            if overwrite or not self.file_exists(remote_file_path):
-                sftp_client = self.ssh_connection.get_sftp_client()
-                sftp_client.put(local_file_path, remote_file_path)
+            if overwrite or resume or not self.file_exists(remote_file_path):
+                SFTPTransferEngine(self.ssh_connection.get_sftp_client()).upload_file(local_file_path, remote_file_path, resume=resume, verify_checksum=verify_checksum)
         except Exception as e:
             get_logger().log_error(f"Exception while uploading local file [{local_file_path}] to [{remote_file_path}]. {e}")
             raise KeywordException(f"Exception while uploading local file [{local_file_path}] to [{remote_file_path}]. {e}")
         return True
 
+    def download_directory(self, remote_dir: str, local_dir: str, resume: bool = False, verify_checksum: bool = False, max_concurrency: int = 4) -> int:
+        """
+        Method to download a directory tree from the remote host, several files at a time.
+
+        Args:
+            remote_dir (str): Absolute path of the directory to download.
+            local_dir (str): Absolute path of the local directory to copy the tree to.
+            resume (bool): Whether to complete the partial downloads of a previous attempt.
+            verify_checksum (bool): Whether to compare the sha256 of every file after the download.
+            max_concurrency (int): Maximum number of files downloaded at once.
+
+        Returns:
+            int: The number of downloaded files.
+
+        Raises:
+            KeywordException: if unable to download the directory.
+        """
+        try:
+            return SFTPTransferEngine(self.ssh_connection.get_sftp_client(), max_concurrency=max_concurrency).download_directory(remote_dir, local_dir, resume=resume, verify_checksum=verify_checksum)
+        except Exception as e:
+            get_logger().log_error(f"Exception while downloading remote directory [{remote_dir}] to [{local_dir}]. {e}")
+            raise KeywordException(f"Exception while downloading remote directory [{remote_dir}] to [{local_dir}]. {e}")
+
     def file_exists(self, file_name: str) -> bool:
         """
         Checks if the file exists.
@@ -196,38 +225,95 @@ class FileKeywords(BaseKeyword):
         sftp_client = self.ssh_connection.get_sftp_client()
         return sftp_client.listdir(file_dir)
 
-    def read_large_file(self, file_name: str, grep_pattern: str = None) -> list[str]:
+    def read_large_file(self, file_name: str, grep_pattern: str = None, timeout: int = 1800) -> list[str]:
         """
         Function to read large files and filter.
 
-        We are timing out when reading files over 10000 lines. This function will read the lines in batches.
+        The file is read once, over a single channel, and compressed in transit unless the connection goes through ssh pass.
         The grep pattern will filter lines using grep. If none is specified, all lines are returned.
 
         Args:
             file_name (str): the full path and filename ex. /var/log/user.log.
             grep_pattern (str): the pattern to use to filter lines ex. 'ptp4l\\|phc2sys'.
+            timeout (int): the maximum time in seconds to read the whole file.
 
         Returns:
             list[str]: The output of the file.
         """
-        total_output = []
-        start_line = 1  # start at line 1
-        end_line = 10000  # we can handle 10000 lines without issue
-        end_time = time.time() + 300
+        compress_in_transit = not self.ssh_connection.use_ssh_pass
+        total_output = list(self.stream_file(file_name, grep_pattern, compress_in_transit=compress_in_transit, complete_lines_only=False, timeout=timeout))
+        get_logger().log_info(f"Read {len(total_output)} lines from {file_name}")
+        return total_output
+
+    def stream_file(
+        self,
+        file_name: str,
+        grep_pattern: str = None,
+        start_offset: int = 0,
+        file_id: str = None,
+        tail_bytes: int = None,
+        compress_in_transit: bool = False,
+        complete_lines_only: bool = True,
+        timeout: int = 1800,
+    ) -> RemoteFileStreamObject:
+        """
+        Reads a remote file in a single pass, from a byte offset, yielding its lines as they arrive.
+
+        The end of the read is the size of the file when the read starts, so the lines appended while reading are left
+        for the next read: pass get_end_offset() and get_file_id() of the returned stream as the start_offset and file_id
+        of the next call to only get what was appended in between. The file is read from its beginning if it is not the
+        one identified by file_id anymore (rotated, or replaced e.g. by a swact moving the connection to the other
+        controller), or if it is now shorter than start_offset (truncated).
+
+        Args:
+            file_name (str): the full path and filename ex. /var/log/user.log.
+            grep_pattern (str): the pattern to use to filter lines ex. 'ptp4l\\|phc2sys'.
+            start_offset (int): the byte offset to start reading from, e.g. the end offset of the previous read.
+            file_id (str): the identity of the file start_offset belongs to, i.e. get_file_id() of the previous read.
+                None to only detect a rotation by the file getting shorter.
+            tail_bytes (int): only read the last tail_bytes bytes of the part to read, starting at the first line that
+                begins within them, e.g. to not fetch a whole log the first time it is read. None to read all of it.
+            compress_in_transit (bool): True to gzip the output on the host, for large files over slow links. Not
+                supported through ssh pass.
+            complete_lines_only (bool): True to stop before a last line that is still being written, so that the next
+                read gets it whole. False to also read it, e.g. for files that don't end with a line break.
+            timeout (int): the maximum time in seconds to read the file.
+
+        Returns:
+            RemoteFileStreamObject: The lines of the file, its identity, and the offsets of the part that was read.
 
+        Raises:
+            KeywordException: If the size of the file can't be read.
+        """
+        marker = f"__FILE_STREAM_{uuid.uuid4().hex}__"
         grep_arg = ""
         if grep_pattern:
             grep_arg = f"| grep {grep_pattern}"
 
-        while time.time() < end_time:
-            output = self.ssh_connection.send(f"sed -n '{start_line},{end_line}p' {file_name} {grep_arg}")
-            if not output:  # if we get no more output we are at end of file
-                break
-            total_output.extend(output)
-            start_line = end_line + 1
-            end_line = end_line + 10000
+        rotation_check = "[ $size -lt $offset ]"
+        if file_id is not None:
+            rotation_check = f'[ "$id" != "{file_id}" ] || {rotation_check}'
 
-        return total_output
+        # A last line without line break is left out by ending the read at the start of that line.
+        partial_line_check = ""
+        if complete_lines_only:
+            partial_line_check = 'if [ $size -gt $offset ] && [ -n "$(tail -c +$size $f | head -c 1)" ]; then end=$((size - $(tail -c +$((offset + 1)) $f | head -c $((size - offset)) | tail -n 1 | wc -c))); fi; '
+
+        # A read longer than tail_bytes starts at the first line beginning in its last tail_bytes bytes.
+        tail_check = ""
+        if tail_bytes is not None:
+            tail_check = f'if [ $((end - offset)) -gt {tail_bytes} ]; then offset=$((end - {tail_bytes})); if [ -n "$(tail -c +$offset $f | head -c 1)" ]; then offset=$((offset + $(tail -c +$((offset + 1)) $f | head -n 1 | wc -c))); fi; if [ $offset -gt $end ]; then offset=$end; fi; fi; '
+
+        cmd = f'f={file_name}; offset={start_offset}; size=0; id=missing; if [ -f $f ]; then size=$(stat -c %s $f); id=$(hostname):$(stat -c %i $f); fi; if {rotation_check}; then offset=0; fi; end=$size; {partial_line_check}{tail_check}echo "{marker} $id $offset $end"; if [ $end -gt $offset ]; then tail -c +$((offset + 1)) $f | head -c $((end - offset)) {grep_arg}; fi'
+        if compress_in_transit:
+            cmd = f"{{ {cmd}; }} 2>/dev/null | gzip -c -1"
+
+        lines = self.ssh_connection.send_stream(cmd, command_timeout=timeout, log_output=False, gunzip_output=compress_in_transit)
+        header = next(lines, "").split()
+        if len(header) != 4 or header[0] != marker:
+            raise KeywordException(f"Unable to read the size of {file_name}")
+
+        return RemoteFileStreamObject(file_name, header[1], int(header[2]), int(header[3]), lines)
 
     def read_file(self, file_path: str) -> list[str]:
         """
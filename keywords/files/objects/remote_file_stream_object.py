@@ -0,0 +1,73 @@
+from typing import Iterator
+
+
+class RemoteFileStreamObject:
+    """
+    Lines of a remote file read in a single pass, with the byte offsets of the part that was read.
+
+    Iterating yields the lines as they arrive. Pass get_end_offset() as the start offset of the next read to only get
+    what was appended to the file in between.
+    """
+
+    def __init__(self, file_name: str, file_id: str, start_offset: int, end_offset: int, lines: Iterator[str]):
+        """
+        Constructor
+
+        Args:
+            file_name (str): The full path and filename of the remote file.
+            file_id (str): Identity of the file that was read, '<hostname>:<inode>', or 'missing' if there is no file.
+            start_offset (int): Byte offset the read started from. 0 if the file was rotated, replaced or truncated
+                since the requested offset.
+            end_offset (int): Byte offset the read stops at.
+            lines (Iterator[str]): The lines read between the two offsets.
+        """
+        self.file_name = file_name
+        self.file_id = file_id
+        self.start_offset = start_offset
+        self.end_offset = end_offset
+        self.lines = lines
+
+    def get_file_name(self) -> str:
+        """
+        Getter for the file name
+
+        Returns:
+            str: The full path and filename of the remote file.
+        """
+        return self.file_name
+
+    def get_file_id(self) -> str:
+        """
+        Getter for the identity of the file that was read, to tell on the next read if it was replaced in between
+
+        Returns:
+            str: The hostname and inode of the file, '<hostname>:<inode>', or 'missing' if there is no file.
+        """
+        return self.file_id
+
+    def get_start_offset(self) -> int:
+        """
+        Getter for the byte offset the read started from
+
+        Returns:
+            int: The start offset, 0 if the file was rotated, replaced or truncated since the requested offset.
+        """
+        return self.start_offset
+
+    def get_end_offset(self) -> int:
+        """
+        Getter for the byte offset the read stops at, to resume from on the next read
+
+        Returns:
+            int: The end offset.
+        """
+        return self.end_offset
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterates over the lines as they arrive.
+
+        Returns:
+            Iterator[str]: The lines, with their line breaks.
+        """
+        return self.lines
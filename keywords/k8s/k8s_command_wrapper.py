@@ -5,6 +5,7 @@ to execute kubectl commands.
 """
 
 from config.configuration_manager import ConfigurationManager
+from framework.ssh.shell_environment_profile import ShellEnvironmentProfile
 
 
 class K8sConfigExporter:
@@ -54,6 +55,14 @@ class K8sConfigExporter:
         """
         return f"export KUBECONFIG={self.kubeconfig};{cmd}"
 
+    def get_shell_profile(self) -> ShellEnvironmentProfile:
+        """Get the persistent shell profile matching the commands exported by this instance.
+
+        Returns:
+            ShellEnvironmentProfile: Profile of a shell where KUBECONFIG is exported once.
+        """
+        return ShellEnvironmentProfile(f"kubeconfig:{self.kubeconfig}", self.export(""), [f"export KUBECONFIG={self.kubeconfig}"])
+
 
 def export_k8s_config(cmd: str) -> str:
     """Export KUBECONFIG environment variable and execute kubectl command.
@@ -5,7 +5,6 @@ import re
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 
-from keywords.kpi.kpi_result import KpiResult
 from tabulate import tabulate
 
 from framework.logging.automation_logger import get_logger
@@ -13,6 +12,9 @@ from framework.ssh.ssh_connection import SSHConnection
 from keywords.base_keyword import BaseKeyword
 from keywords.cloud_platform.upgrade.objects.upgrade_event import UpgradeEvent
 from keywords.cloud_platform.upgrade.record_upgrade_event_keywords import RecordUpgradeEventKeywords
+from keywords.kpi.kpi_result import KpiResult
+from keywords.kpi.log_scan_index import LogScanIndex
+from keywords.kpi.log_scan_keywords import LogScanKeywords
 
 
 class LogPatternKpiKeywords(BaseKeyword):
@@ -41,6 +43,7 @@ class LogPatternKpiKeywords(BaseKeyword):
         """
         self.ssh_connection = ssh_connection
         self.max_sequence_duration = max_sequence_duration
+        self.scan_index: Optional[LogScanIndex] = None  # Matches of all the block patterns, see _scan_block_files
 
     def calculate_kpi(self, hostname: str, blocks: List[Dict[str, Any]], start_date: Optional[str] = None, loops: int = 1, max_log_length: int = 180, time_tolerance: float = 1.0, output_file: str = "profile.timing", csv_file: str = "profile.csv", logs_dir: str = "/var/log", verbose: bool = True, pair_mode: bool = False, max_time_delta: float = 500.0) -> Tuple[List[str], List[List]]:
         """
@@ -99,6 +102,10 @@ class LogPatternKpiKeywords(BaseKeyword):
             if loops > 0 and loop_count > loops:
                 break
 
+            # Read every log file once for all the patterns, the blocks of this pass are then resolved on the matches.
+            # The files are scanned again on every pass, to see the lines logged since the previous one.
+            self.scan_index = self._scan_block_files(blocks, logs_dir, pair_mode)
+
             # Calculate timing summary
             # Total time: from first non-excluded block to latest end (KPI timeframe)
             # KPI time: same as total time minus any blackout phases within that timeframe
@@ -397,6 +404,64 @@ class LogPatternKpiKeywords(BaseKeyword):
             if verbose:
                 get_logger().log_info(f"Block '{block['label']}' expanded files: {block['file']}")
 
+    def _get_lpmp_pattern(self, pattern: str) -> Tuple[str, bool]:
+        """Get the pattern to search for in LPMP style, and whether it is a regex.
+
+        Args:
+            pattern (str): Block pattern, regex if it starts with "r'" or contains regex characters
+
+        Returns:
+            Tuple[str, bool]: (pattern without the "r'" prefix, is_regex)
+        """
+        use_regex = pattern.startswith("r'") or any(c in pattern for c in [".", "*", "+", "?", "^", "$", "[", "]", "{", "}", "(", ")", "|", "\\"])
+        if use_regex and pattern.startswith("r'"):
+            return pattern[2:-1], True
+        return pattern, use_regex
+
+    def _scan_block_files(self, blocks: List[Dict], logs_dir: str, pair_mode: bool) -> LogScanIndex:
+        """Scan the files of all the blocks for all the block patterns, in one pass per file.
+
+        Args:
+            blocks (List[Dict]): Block definitions, after variable substitution and wildcard expansion
+            logs_dir (str): Log directory path
+            pair_mode (bool): True if the blocks are resolved in pair mode (LPMP style search)
+
+        Returns:
+            LogScanIndex: The matching lines of every file, by pattern
+        """
+        filenames = []
+        patterns = []
+        for block in blocks:
+            if not block.get("file"):
+                continue
+            filenames.extend([block["file"]] if isinstance(block["file"], str) else block["file"])
+
+            block_patterns = [block["start"], block["stop"]] if "start" in block and "stop" in block else block.get("patterns", [])
+            for pattern in block_patterns:
+                for alt_pattern in pattern if isinstance(pattern, list) else [pattern]:
+                    patterns.append(self._get_lpmp_pattern(alt_pattern) if pair_mode else (alt_pattern, False))
+
+        return LogScanKeywords(self.ssh_connection).scan_files(logs_dir, filenames, patterns)
+
+    def _get_indexed_lines(self, filename: str, pattern: str, is_regex: bool, after_line: int = 0) -> Optional[List[str]]:
+        """Get the lines of a file matching the pattern from the scan index.
+
+        Args:
+            filename (str): Log filename, relative to the log directory
+            pattern (str): Pattern to search for
+            is_regex (bool): True for an extended regex ('grep -E'), False for a literal string ('grep -F')
+            after_line (int): Only return the lines after this line number ('tail -n +<after_line + 1>')
+
+        Returns:
+            Optional[List[str]]: The matching lines, or None if the file or pattern wasn't scanned
+        """
+        if not self.scan_index:
+            return None
+        matches = self.scan_index.get_matches(filename, pattern, is_regex, after_line)
+        if matches is None:
+            return None
+        return [line for _, line in matches]
+
     def _expand_and_sort_log_files(self, logs_dir: str, file_pattern: str, start_date: Optional[datetime], verbose: bool) -> List[str]:
         """Expand wildcard and sort files by date proximity."""
         if "*" not in file_pattern:
@@ -539,18 +604,20 @@ class LogPatternKpiKeywords(BaseKeyword):
         for filename in filenames:
             filepath = f"{logs_dir}/{filename}"
 
-            check_cmd = f"test -f {filepath} && echo 'exists' || echo 'missing'"
-            check_result = self.ssh_connection.send(check_cmd)
-            if not check_result or "missing" in check_result[0]:
-                continue
+            result = self._get_indexed_lines(filename, pattern, is_regex=False)
+            if result is None:
+                check_cmd = f"test -f {filepath} && echo 'exists' || echo 'missing'"
+                check_result = self.ssh_connection.send(check_cmd)
+                if not check_result or "missing" in check_result[0]:
+                    continue
 
-            is_gzipped = filename.endswith(".gz")
-            if is_gzipped:
-                cmd = f"zcat {filepath} 2>/dev/null | grep -F '{pattern}'"
-            else:
-                cmd = f"grep -F '{pattern}' {filepath} 2>/dev/null"
+                is_gzipped = filename.endswith(".gz")
+                if is_gzipped:
+                    cmd = f"zcat {filepath} 2>/dev/null | grep -F '{pattern}'"
+                else:
+                    cmd = f"grep -F '{pattern}' {filepath} 2>/dev/null"
 
-            result = self.ssh_connection.send(cmd)
+                result = self.ssh_connection.send(cmd)
 
             if result:
                 for line in result:
@@ -572,37 +639,31 @@ class LogPatternKpiKeywords(BaseKeyword):
             filenames = [filenames]
 
         # Detect if pattern is regex (starts with 'r' prefix indicator or contains regex chars)
-        use_regex = pattern.startswith("r'") or any(c in pattern for c in [".", "*", "+", "?", "^", "$", "[", "]", "{", "}", "(", ")", "|", "\\"])
+        clean_pattern, use_regex = self._get_lpmp_pattern(pattern)
 
         for filename in filenames:
             filepath = f"{logs_dir}/{filename}"
 
-            # Check if file exists
-            check_cmd = f"test -f {filepath} && echo 'exists' || echo 'missing'"
-            check_result = self.ssh_connection.send(check_cmd)
-            if not check_result or "missing" in check_result[0]:
-                continue
+            result = self._get_indexed_lines(filename, clean_pattern, use_regex)
+            if result is None:
+                # Check if file exists
+                check_cmd = f"test -f {filepath} && echo 'exists' || echo 'missing'"
+                check_result = self.ssh_connection.send(check_cmd)
+                if not check_result or "missing" in check_result[0]:
+                    continue
 
-            if verbose:
-                get_logger().log_info(f"Searching for '{pattern}' in {filename} (regex={use_regex})")
+                if verbose:
+                    get_logger().log_info(f"Searching for '{pattern}' in {filename} (regex={use_regex})")
 
-            # Use grep with or without regex based on pattern type
-            is_gzipped = filename.endswith(".gz")
-            if use_regex:
-                # Remove 'r' prefix if present
-                clean_pattern = pattern[2:-1] if pattern.startswith("r'") else pattern
-                if is_gzipped:
-                    cmd = f"zcat {filepath} 2>/dev/null | grep -E '{clean_pattern}'"
-                else:
-                    cmd = f"grep -E '{clean_pattern}' {filepath} 2>/dev/null"
-            else:
-                # Literal string matching
+                # Use grep with or without regex based on pattern type
+                is_gzipped = filename.endswith(".gz")
+                grep_option = "-E" if use_regex else "-F"
                 if is_gzipped:
-                    cmd = f"zcat {filepath} 2>/dev/null | grep -F '{pattern}'"
+                    cmd = f"zcat {filepath} 2>/dev/null | grep {grep_option} '{clean_pattern}'"
                 else:
-                    cmd = f"grep -F '{pattern}' {filepath} 2>/dev/null"
+                    cmd = f"grep {grep_option} '{clean_pattern}' {filepath} 2>/dev/null"
 
-            result = self.ssh_connection.send(cmd)
+                result = self.ssh_connection.send(cmd)
 
             if result:
                 # Find the FIRST match after start_date (closest to start_date)
@@ -659,35 +720,40 @@ class LogPatternKpiKeywords(BaseKeyword):
 
         for filename in filenames:
             filepath = f"{logs_dir}/{filename}"
-
-            # Check if file exists
-            check_cmd = f"test -f {filepath} && echo 'exists' || echo 'missing'"
-            check_result = self.ssh_connection.send(check_cmd)
-            if not check_result or "missing" in check_result[0]:
-                if verbose:
-                    get_logger().log_info(f"File {filepath} not found, trying next...")
-                continue
-
             current_pos = file_positions.get(filename, 0)
-            if verbose:
-                get_logger().log_info(f"Searching for '{pattern}' in {filename} from position {current_pos}")
 
             # Handle compressed files
             is_gzipped = filename.endswith(".gz")
 
-            # First try: search from current position with timestamp filter
-            if after_timestamp:
-                if is_gzipped:
-                    cmd = f"zcat {filepath} 2>/dev/null | tail -n +{current_pos + 1} | grep -F '{pattern}'"
-                else:
-                    cmd = f"tail -n +{current_pos + 1} {filepath} 2>/dev/null | grep -F '{pattern}'"
+            result = self._get_indexed_lines(filename, pattern, is_regex=False, after_line=current_pos)
+            if result is not None:
+                if not after_timestamp:
+                    result = result[:1]
             else:
-                if is_gzipped:
-                    cmd = f"zcat {filepath} 2>/dev/null | tail -n +{current_pos + 1} | grep -F '{pattern}' | head -1"
+                # Check if file exists
+                check_cmd = f"test -f {filepath} && echo 'exists' || echo 'missing'"
+                check_result = self.ssh_connection.send(check_cmd)
+                if not check_result or "missing" in check_result[0]:
+                    if verbose:
+                        get_logger().log_info(f"File {filepath} not found, trying next...")
+                    continue
+
+                if verbose:
+                    get_logger().log_info(f"Searching for '{pattern}' in {filename} from position {current_pos}")
+
+                # First try: search from current position with timestamp filter
+                if after_timestamp:
+                    if is_gzipped:
+                        cmd = f"zcat {filepath} 2>/dev/null | tail -n +{current_pos + 1} | grep -F '{pattern}'"
+                    else:
+                        cmd = f"tail -n +{current_pos + 1} {filepath} 2>/dev/null | grep -F '{pattern}'"
                 else:
-                    cmd = f"tail -n +{current_pos + 1} {filepath} 2>/dev/null | grep -F '{pattern}' | head -1"
+                    if is_gzipped:
+                        cmd = f"zcat {filepath} 2>/dev/null | tail -n +{current_pos + 1} | grep -F '{pattern}' | head -1"
+                    else:
+                        cmd = f"tail -n +{current_pos + 1} {filepath} 2>/dev/null | grep -F '{pattern}' | head -1"
 
-            result = self.ssh_connection.send(cmd)
+                result = self.ssh_connection.send(cmd)
 
             # Process results with timestamp filtering
             if result:
@@ -717,12 +783,14 @@ class LogPatternKpiKeywords(BaseKeyword):
                 if verbose:
                     get_logger().log_info(f"No match from position {current_pos}, trying from beginning of {filename}")
 
-                if is_gzipped:
-                    cmd = f"zcat {filepath} 2>/dev/null | grep -F '{pattern}'"
-                else:
-                    cmd = f"grep -F '{pattern}' {filepath} 2>/dev/null"
+                result = self._get_indexed_lines(filename, pattern, is_regex=False)
+                if result is None:
+                    if is_gzipped:
+                        cmd = f"zcat {filepath} 2>/dev/null | grep -F '{pattern}'"
+                    else:
+                        cmd = f"grep -F '{pattern}' {filepath} 2>/dev/null"
 
-                result = self.ssh_connection.send(cmd)
+                    result = self.ssh_connection.send(cmd)
 
                 if result:
                     for line in result:
@@ -759,31 +827,37 @@ class LogPatternKpiKeywords(BaseKeyword):
         for filename in filenames:
             filepath = f"{logs_dir}/{filename}"
 
-            # Check if file exists
-            check_cmd = f"test -f {filepath} && echo 'exists' || echo 'missing'"
-            check_result = self.ssh_connection.send(check_cmd)
-            if not check_result or "missing" in check_result[0]:
-                if verbose:
-                    get_logger().log_info(f"File {filepath} not found, trying next...")
-                continue
-
-            if verbose:
-                get_logger().log_info(f"Searching for '{pattern}' in {filename} from position {start_pos}")
-
             # Handle compressed files
             is_gzipped = filename.endswith(".gz")
-            if is_gzipped:
-                if after_timestamp:
-                    cmd = f"zcat {filepath} 2>/dev/null | tail -n +{start_pos + 1} | grep -F '{pattern}'"
-                else:
-                    cmd = f"zcat {filepath} 2>/dev/null | tail -n +{start_pos + 1} | grep -F '{pattern}' | head -1"
+
+            result = self._get_indexed_lines(filename, pattern, is_regex=False, after_line=start_pos)
+            if result is not None:
+                if not after_timestamp:
+                    result = result[:1]
             else:
-                if after_timestamp:
-                    cmd = f"tail -n +{start_pos + 1} {filepath} 2>/dev/null | grep -F '{pattern}'"
+                # Check if file exists
+                check_cmd = f"test -f {filepath} && echo 'exists' || echo 'missing'"
+                check_result = self.ssh_connection.send(check_cmd)
+                if not check_result or "missing" in check_result[0]:
+                    if verbose:
+                        get_logger().log_info(f"File {filepath} not found, trying next...")
+                    continue
+
+                if verbose:
+                    get_logger().log_info(f"Searching for '{pattern}' in {filename} from position {start_pos}")
+
+                if is_gzipped:
+                    if after_timestamp:
+                        cmd = f"zcat {filepath} 2>/dev/null | tail -n +{start_pos + 1} | grep -F '{pattern}'"
+                    else:
+                        cmd = f"zcat {filepath} 2>/dev/null | tail -n +{start_pos + 1} | grep -F '{pattern}' | head -1"
                 else:
-                    cmd = f"tail -n +{start_pos + 1} {filepath} 2>/dev/null | grep -F '{pattern}' | head -1"
+                    if after_timestamp:
+                        cmd = f"tail -n +{start_pos + 1} {filepath} 2>/dev/null | grep -F '{pattern}'"
+                    else:
+                        cmd = f"tail -n +{start_pos + 1} {filepath} 2>/dev/null | grep -F '{pattern}' | head -1"
 
-            result = self.ssh_connection.send(cmd)
+                result = self.ssh_connection.send(cmd)
 
             if result:
                 for line in result:
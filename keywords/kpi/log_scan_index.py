@@ -0,0 +1,77 @@
+"""Index of the log lines matched by a LogScanKeywords scan."""
+
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class LogScanIndex:
+    """Holds every line matched by a log scan, by file and pattern, in file order."""
+
+    def __init__(self, patterns: List[Tuple[str, bool]]):
+        """
+        Initialize LogScanIndex.
+
+        Args:
+            patterns (List[Tuple[str, bool]]): The scanned (pattern, is_regex) pairs. The position of a pair is its pattern id.
+        """
+        self.patterns = patterns
+        self.pattern_ids: Dict[Tuple[str, bool], int] = {pattern: pattern_id for pattern_id, pattern in enumerate(patterns)}
+        self.scanned_files: Set[str] = set()
+        self.missing_files: Set[str] = set()
+        self.matches: Dict[Tuple[str, int], List[Tuple[int, str]]] = {}
+
+    def add_scanned_file(self, filename: str) -> None:
+        """
+        Record that the file was scanned.
+
+        Args:
+            filename (str): The scanned file, relative to the logs directory.
+        """
+        self.scanned_files.add(filename)
+
+    def add_missing_file(self, filename: str) -> None:
+        """
+        Record that the file doesn't exist on the host.
+
+        Args:
+            filename (str): The missing file, relative to the logs directory.
+        """
+        self.missing_files.add(filename)
+
+    def add_match(self, filename: str, pattern_id: int, line_number: int, line: str) -> None:
+        """
+        Record a line of the file that matches a pattern.
+
+        Args:
+            filename (str): The file, relative to the logs directory.
+            pattern_id (int): The id of the matched pattern.
+            line_number (int): The number of the line in the (uncompressed) file, starting at 1.
+            line (str): The matched line, without its line break.
+        """
+        self.matches.setdefault((filename, pattern_id), []).append((line_number, line))
+
+    def get_matches(self, filename: str, pattern: str, is_regex: bool, after_line: int = 0) -> Optional[List[Tuple[int, str]]]:
+        """
+        Get the lines of the file matching the pattern, in file order.
+
+        Args:
+            filename (str): The file, relative to the logs directory.
+            pattern (str): The pattern.
+            is_regex (bool): True if the pattern was scanned as an extended regex, False for a literal string.
+            after_line (int): Only return the lines after this line number (e.g. 'tail -n +<after_line + 1>').
+
+        Returns:
+            Optional[List[Tuple[int, str]]]: The (line number, line) matches, an empty list if the file is missing, or
+            None if this file or pattern wasn't part of the scan.
+        """
+        if filename in self.missing_files:
+            return []
+
+        pattern_id = self.pattern_ids.get((pattern, is_regex))
+        if pattern_id is None or filename not in self.scanned_files:
+            return None
+
+        return [(line_number, line) for line_number, line in self.matches.get((filename, pattern_id), []) if line_number > after_line]
+
+    def get_match_count(self) -> int:
+        """Get the total number of matched lines."""
+        return sum(len(matches) for matches in self.matches.values())
@@ -0,0 +1,150 @@
+"""Server-side scan of log files for many patterns in a single pass."""
+
+import re
+import shlex
+import uuid
+from typing import List, Tuple
+
+from framework.logging.automation_logger import get_logger
+from framework.ssh.ssh_connection import SSHConnection
+from keywords.base_keyword import BaseKeyword
+from keywords.kpi.log_scan_index import LogScanIndex
+
+# A line selected by the single 'grep -n' pass over a file: "<line number>:<line>".
+MATCH_LINE_PATTERN = re.compile(r"^(\d+):(.*)$")
+
+# The characters with a special meaning in an extended regex, escaped to search a literal string in the same pass.
+EXTENDED_REGEX_SPECIAL_CHARACTERS = re.compile(r"([.\[\]()*+?{}|^$\\])")
+
+
+class LogScanKeywords(BaseKeyword):
+    """
+    Scan engine looking for many patterns in many log files with a single SSH command.
+
+    Each file (compressed or not) is read exactly once on the host, by a single 'grep -E -n' for all the patterns, and
+    only the matching lines are sent back with their line number. The patterns matched by each line are then tagged on
+    the host by running each pattern on those lines only, with 'grep -E' or 'grep -F' so that the patterns keep their
+    grep semantics. The caller resolves its queries locally on the returned LogScanIndex instead of running a 'grep'
+    per pattern and per file.
+    """
+
+    def __init__(self, ssh_connection: SSHConnection):
+        """
+        Initialize with SSH connection.
+
+        Args:
+            ssh_connection (SSHConnection): SSH connection to the host holding the logs.
+        """
+        self.ssh_connection = ssh_connection
+
+    def scan_files(self, logs_dir: str, filenames: List[str], patterns: List[Tuple[str, bool]], timeout: int = 1800) -> LogScanIndex:
+        """
+        Scan the files for all the patterns in one pass per file.
+
+        Args:
+            logs_dir (str): Log directory path.
+            filenames (List[str]): The files to scan, relative to logs_dir. '.gz' files are decompressed on the fly.
+            patterns (List[Tuple[str, bool]]): The (pattern, is_regex) pairs to look for. Regex patterns use the extended
+                syntax of 'grep -E', the others are literal strings like 'grep -F'.
+            timeout (int): Timeout in seconds for the whole scan.
+
+        Returns:
+            LogScanIndex: The matching lines of every file, by pattern.
+        """
+        patterns = list(dict.fromkeys(patterns))
+        filenames = list(dict.fromkeys(filenames))
+        scan_index = LogScanIndex(patterns)
+        if not patterns or not filenames:
+            return scan_index
+
+        marker = f"__LOG_SCAN_{uuid.uuid4().hex}__"
+        cmd = self._build_scan_command(logs_dir, filenames, patterns, marker)
+
+        current_file = None
+        file_matches: List[Tuple[int, str]] = []
+        for line in self.ssh_connection.send_stream(cmd, command_timeout=timeout):
+            line = line.rstrip("\n")
+            if line.startswith(marker):
+                _, status, value = line.split(" ", 2)
+                if status == "TAGS":
+                    pattern_id, *match_indexes = value.split()
+                    for match_index in match_indexes:
+                        line_number, matching_line = file_matches[int(match_index) - 1]
+                        scan_index.add_match(current_file, int(pattern_id), line_number, matching_line)
+                    continue
+
+                current_file = value
+                file_matches = []
+                if status == "MISSING":
+                    scan_index.add_missing_file(current_file)
+                else:
+                    scan_index.add_scanned_file(current_file)
+                continue
+
+            match = MATCH_LINE_PATTERN.match(line)
+            if match and current_file:
+                file_matches.append((int(match.group(1)), match.group(2)))
+
+        get_logger().log_info(f"Scanned {len(scan_index.scanned_files)} log files for {len(patterns)} patterns: {scan_index.get_match_count()} matching lines")
+        return scan_index
+
+    @staticmethod
+    def _build_scan_command(logs_dir: str, filenames: List[str], patterns: List[Tuple[str, bool]], marker: str) -> str:
+        """
+        Build the shell script reading every file once, and tagging the matching lines with the patterns they match.
+
+        For each file, the script prints '<marker> FILE <file>' (or '<marker> MISSING <file>'), the matching lines as
+        '<line number>:<line>', then one '<marker> TAGS <pattern id> <match index>...' line per pattern, listing the
+        position (starting at 1) of the matching lines that match this pattern.
+
+        Args:
+            logs_dir (str): Log directory path.
+            filenames (List[str]): The files to scan, relative to logs_dir.
+            patterns (List[Tuple[str, bool]]): The (pattern, is_regex) pairs to look for.
+            marker (str): Prefix of the lines announcing each file and tags, which can't be mistaken for a match line.
+
+        Returns:
+            str: The shell script.
+        """
+        matches_file = f"/tmp/{marker}.matches"
+        lines_file = f"/tmp/{marker}.lines"
+        all_pattern_args = " ".join(f"-e {shlex.quote(LogScanKeywords._get_extended_regex(pattern, is_regex))}" for pattern, is_regex in patterns)
+        quoted_filenames = " ".join(shlex.quote(filename) for filename in filenames)
+        quoted_logs_dir = shlex.quote(logs_dir)
+
+        script_lines = [
+            f"for f in {quoted_filenames}; do",
+            f'  if [ -f {quoted_logs_dir}/"$f" ]; then',
+            f'    echo "{marker} FILE $f"',
+            f'    zcat -f {quoted_logs_dir}/"$f" 2>/dev/null | grep -a -n -E {all_pattern_args} > {matches_file}',
+            f"    cat {matches_file}",
+            f"    cut -d: -f2- {matches_file} > {lines_file}",
+        ]
+        for pattern_id, (pattern, is_regex) in enumerate(patterns):
+            script_lines.append(f'    echo "{marker} TAGS {pattern_id} $(grep -a -n {"-E" if is_regex else "-F"} -e {shlex.quote(pattern)} {lines_file} | cut -d: -f1 | tr "\\n" " ")"')
+        script_lines.extend(
+            [
+                "  else",
+                f'    echo "{marker} MISSING $f"',
+                "  fi",
+                "done",
+                f"rm -f {matches_file} {lines_file}",
+            ]
+        )
+        return "\n".join(script_lines)
+
+    @staticmethod
+    def _get_extended_regex(pattern: str, is_regex: bool) -> str:
+        """
+        Get the extended regex matching the pattern, to look for regex and literal patterns in the same 'grep -E' pass.
+
+        Args:
+            pattern (str): The pattern.
+            is_regex (bool): True if the pattern is an extended regex, False for a literal string.
+
+        Returns:
+            str: The pattern itself if it is a regex, else the literal string with its special characters escaped.
+        """
+        if is_regex:
+            return pattern
+        return EXTENDED_REGEX_SPECIAL_CHARACTERS.sub(r"\\\1", pattern)
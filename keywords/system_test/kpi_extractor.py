@@ -1,9 +1,8 @@
 import datetime
 import re
-from typing import Optional
-import time
 from framework.logging.automation_logger import get_logger
 from framework.ssh.ssh_connection import SSHConnection
+from keywords.system_test.remote_log_tailer import RemoteLogTailer
 
 
 class KpiExtractor:
@@ -50,6 +49,7 @@ class KpiExtractor:
         self.swact_start_pattern = "node-scn"
         self.swact_end_pattern = "service-group-scn\s+\|\s+controller-services\s+\|\s+go-active\s+\|\s+active"
         self.uncontrolled_swact_start_pattern = "service-group-scn\s+\|\s+controller-services\s+\|\s+standby\s+\|\s+go-active"
+        self.log_tailers = {}
 
     def extract_lock_timing(self, host_name: str) -> float:
         """
@@ -202,21 +202,11 @@ class KpiExtractor:
             ValueError: If pattern not found or extraction fails
         """
         pattern = f"{host_name} {self.dor_recovery_pattern}"
-        start_time = time.time()
-        
-        while time.time() - start_time < wait_timeout:
-            cmd = f"grep -a -E '{pattern}' {self.mtc_agent_log} | tail -1"
-            output = self.ssh_connection.send(cmd)
-
-            if output and output[0].strip():
-                match = re.search(r"\(\s*(\d+)\s*secs\)", output[0])
-                if match:
-                    return float(match.group(1))
-            
-            if time.time() - start_time < wait_timeout:
-                get_logger().log_debug(f"DOR recovery pattern '{pattern}' not found yet, waiting {self.check_interval}s...")
-                time.sleep(self.check_interval)
-        
+        seconds_pattern = rf"{pattern}.*\(\s*\d+\s*secs\)"
+        last_match = self._get_log_tailer(self.mtc_agent_log).wait_for_last(seconds_pattern, wait_timeout, self.check_interval)
+        if last_match:
+            return float(re.search(r"\(\s*(\d+)\s*secs\)", last_match[1]).group(1))
+
         raise ValueError(f"DOR recovery pattern not found in logs within {wait_timeout}s: {pattern}")
 
     def extract_worker_reboot_to_available_timing(self, host_name: str) -> float:
@@ -273,75 +263,47 @@ class KpiExtractor:
                 max_timing = timing
         return max_timing
 
-    def _get_timestamp_from_pattern(self, pattern: str, wait_timeout: int = 180) -> datetime.datetime:
+    def _get_log_tailer(self, log_path: str) -> RemoteLogTailer:
         """
-        Get timestamp from log pattern.
+        Get the tailer indexing the given log, creating it on first use.
 
-        Uses tail -1 to get the most recent (last) occurrence.
-        Retries for up to wait_timeout seconds if pattern not found.
+        The tailers are kept for the life of the extractor, so that each wait or extraction only fetches the lines
+        appended to the log since the previous one.
 
         Args:
-            pattern(str): Pattern to search for in logs
-            wait_timeout(int): Maximum time to wait for pattern to appear in logs (seconds)
+            log_path(str): Path of the log file on the target system
 
         Returns:
-            datetime.datetime: Parsed timestamp
-
-        Raises:
-            ValueError: If pattern not found or timestamp parsing fails
+            RemoteLogTailer: The tailer of the log
         """
-        start_time = time.time()
-        
-        while time.time() - start_time < wait_timeout:
-            output = self._search_pattern_in_logs(pattern)
-            
-            if output:
-                timestamp = self._extract_timestamp_from_line(output[0])
-                if timestamp:
-                    return timestamp
-            
-            if time.time() - start_time < wait_timeout:
-                get_logger().log_debug(f"Pattern '{pattern}' not found yet, waiting {self.check_interval}s...")
-                time.sleep(self.check_interval)
-        
-        raise ValueError(f"Pattern not found in logs within {wait_timeout}s: {pattern}")
+        if log_path not in self.log_tailers:
+            self.log_tailers[log_path] = RemoteLogTailer(self.ssh_connection, log_path, self.timestamp_pattern, self.timestamp_format)
+        return self.log_tailers[log_path]
 
-    def _search_pattern_in_logs(self, pattern: str) -> list:
+    def _get_timestamp_from_pattern(self, pattern: str, wait_timeout: int = 180) -> datetime.datetime:
         """
-        Search for pattern in log files.
+        Get timestamp from log pattern.
 
-        Gets only the most recent (last) occurrence using tail -1.
+        Uses the most recent (last) occurrence.
+        Waits for up to wait_timeout seconds if pattern not found.
 
         Args:
-            pattern(str): Pattern to search for
+            pattern(str): Pattern to search for in logs
+            wait_timeout(int): Maximum time to wait for pattern to appear in logs (seconds)
 
         Returns:
-            list: Log lines matching the pattern
-
-        """
-        cmd = f"grep -a -E '{pattern}' {self.mtc_agent_log} | tail -1"
-        output = self.ssh_connection.send(cmd)
-        
-        if output and len(output) > 0 and output[0]:
-            return output
-        return []
+            datetime.datetime: Parsed timestamp
 
-    def _extract_timestamp_from_line(self, log_line: str) -> Optional[datetime.datetime]:
+        Raises:
+            ValueError: If pattern not found or timestamp parsing fails
         """
-        Extract timestamp from a single log line.
+        last_match = self._get_log_tailer(self.mtc_agent_log).wait_for_last(pattern, wait_timeout, self.check_interval)
+        if not last_match:
+            raise ValueError(f"Pattern not found in logs within {wait_timeout}s: {pattern}")
 
-        Args:
-            log_line(str): Log line to extract timestamp from
-
-        Returns:
-            Optional[datetime.datetime]: Extracted timestamp, or None if not found
-
-        """
+        timestamp, log_line = last_match
         get_logger().log_info(f"Found log line: {log_line[:200]}...")
-        match = re.search(self.timestamp_pattern, log_line)
-        if match:
-            return datetime.datetime.strptime(match.group(), self.timestamp_format)
-        return None
+        return timestamp
 
     def extract_swact_timing(self, standby_controller_name: str) -> float:
         """
@@ -410,14 +372,11 @@ class KpiExtractor:
         Raises:
             ValueError: If pattern not found or timestamp parsing fails
         """
-        cmd = f"grep -a -E '{pattern}' {self.sm_customer_log} | tail -1"
-        output = self.ssh_connection.send(cmd)
+        log_tailer = self._get_log_tailer(self.sm_customer_log)
+        log_tailer.refresh()
+        last_match = log_tailer.find_last(pattern)
 
-        if not output or not output[0].strip():
+        if not last_match:
             raise ValueError(f"Pattern not found in sm-customer.log: {pattern}")
 
-        match = re.search(self.timestamp_pattern, output[0])
-        if not match:
-            raise ValueError(f"Timestamp not found in log output for pattern '{pattern}': {output[0]}")
-
-        return datetime.datetime.strptime(match.group(), self.timestamp_format)
\ No newline at end of file
+        return last_match[0]
\ No newline at end of file
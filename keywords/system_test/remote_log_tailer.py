@@ -0,0 +1,252 @@
+"""Incremental tail of a remote log file, indexed locally by timestamp."""
+
+import bisect
+import datetime
+import re
+import shlex
+import time
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from framework.logging.automation_logger import get_logger
+from framework.ssh.ssh_connection import SSHConnection
+from keywords.files.file_keywords import FileKeywords
+
+
+class RemoteLogTailer:
+    """
+    Follows a remote log file and keeps a local, timestamp-sorted index of its lines.
+
+    Each refresh only fetches the bytes appended since the previous one, and every line is parsed once: the lines are
+    kept with their parsed timestamp so that waiting for a pattern, or getting the time of its last occurrence, is
+    answered from the index instead of running a 'grep' on the whole file again. If the file is truncated or replaced
+    (log rotation, or a swact moving the connection to the other controller), the index is rebuilt from the new file.
+    Only the last MAX_FETCH_BYTES of a file are fetched when it is indexed from its beginning, or when more than that
+    was appended since the previous refresh. The byte ranges that were skipped are remembered, and searched with a
+    'grep' on the host when a pattern has no match in the index.
+    """
+
+    MAX_FETCH_BYTES = 10 * 1024 * 1024
+
+    def __init__(self, ssh_connection: SSHConnection, log_path: str, timestamp_pattern: str, timestamp_format: str):
+        """
+        Initialize RemoteLogTailer.
+
+        Args:
+            ssh_connection (SSHConnection): SSH connection to the host writing the log.
+            log_path (str): Path of the log file on the host.
+            timestamp_pattern (str): Regex matching the timestamp of a line. Lines without a timestamp are continuation lines of
+                the previous one, e.g. the lines of a traceback.
+            timestamp_format (str): strptime format of the matched timestamp.
+        """
+        self.ssh_connection = ssh_connection
+        self.log_path = log_path
+        self.timestamp_regex = re.compile(timestamp_pattern)
+        self.timestamp_format = timestamp_format
+
+        # Identity ("<hostname>:<inode>") of the fetched file and number of its bytes already indexed.
+        self.file_id = ""
+        self.offset = 0
+
+        self.timestamps: List[datetime.datetime] = []
+        self.lines: List[str] = []
+        # Index of the line that was indexed last, which the next continuation lines are attached to.
+        self.last_line_index: Optional[int] = None
+
+        # Byte ranges (start, end) of the file that were not fetched, and the last match of each pattern found in them.
+        self.skipped_ranges: List[Tuple[int, int]] = []
+        self.skipped_range_matches: Dict[str, Optional[Tuple[datetime.datetime, str]]] = {}
+
+        # Incremented whenever lines are inserted before the end of the index, which invalidates the cached searches.
+        self.generation = 0
+        self.compiled_patterns: Dict[str, Pattern] = {}
+        self.last_matches: Dict[str, Tuple[int, int, Optional[int]]] = {}
+
+    def refresh(self, timeout: int = 300) -> int:
+        """
+        Fetch the bytes appended to the log since the last refresh and index their lines.
+
+        The last line is only indexed once its line break has been written.
+
+        Args:
+            timeout (int): Timeout in seconds for fetching the new bytes.
+
+        Returns:
+            int: The number of newly indexed lines.
+        """
+        stream = FileKeywords(self.ssh_connection).stream_file(self.log_path, start_offset=self.offset, file_id=self.file_id, tail_bytes=self.MAX_FETCH_BYTES, timeout=timeout)
+        if stream.get_file_id() != self.file_id or stream.get_start_offset() < self.offset:
+            if self.lines:
+                get_logger().log_info(f"{self.log_path} was rotated or replaced, rebuilding its index")
+            self._reset(stream.get_file_id())
+        if stream.get_start_offset() > self.offset:
+            get_logger().log_info(f"Bytes {self.offset} to {stream.get_start_offset()} of {self.log_path} are not indexed, they are only searched on the host when the index has no match")
+            self.skipped_ranges.append((self.offset, stream.get_start_offset()))
+            self.skipped_range_matches.clear()
+            self.last_line_index = None
+
+        indexed_line_count = 0
+        searched_line_count = len(self.lines)
+        for line in stream:
+            line = line.rstrip("\n")
+            if self._add_line(line):
+                indexed_line_count += 1
+            elif self.last_line_index is not None:
+                self.lines[self.last_line_index] += f"\n{line}"
+                # The searches cached before this refresh have seen this line without its continuation.
+                if self.last_line_index < searched_line_count:
+                    self.generation += 1
+
+        self.offset = stream.get_end_offset()
+        return indexed_line_count
+
+    def find_last(self, pattern: str) -> Optional[Tuple[datetime.datetime, str]]:
+        """
+        Get the most recent indexed line matching the pattern, like 'grep -E <pattern> | tail -1'.
+
+        Only the lines indexed since the previous search for the same pattern are searched. If none of the indexed lines
+        match, the parts of the file that were not fetched are searched on the host.
+
+        Args:
+            pattern (str): The regex to look for.
+
+        Returns:
+            Optional[Tuple[datetime.datetime, str]]: The timestamp and the matching line, or None if there isn't one.
+        """
+        compiled_pattern = self.compiled_patterns.get(pattern)
+        if not compiled_pattern:
+            compiled_pattern = re.compile(pattern)
+            self.compiled_patterns[pattern] = compiled_pattern
+
+        generation, searched_line_count, last_match = self.last_matches.get(pattern, (self.generation, 0, None))
+        if generation != self.generation:
+            searched_line_count, last_match = 0, None
+
+        for line_index in range(len(self.lines) - 1, searched_line_count - 1, -1):
+            if compiled_pattern.search(self.lines[line_index]):
+                last_match = line_index
+                break
+        self.last_matches[pattern] = (self.generation, len(self.lines), last_match)
+
+        if last_match is None:
+            return self._find_last_in_skipped_ranges(pattern)
+        return self.timestamps[last_match], self.lines[last_match]
+
+    def wait_for_last(self, pattern: str, wait_timeout: int, check_interval: int) -> Optional[Tuple[datetime.datetime, str]]:
+        """
+        Get the most recent line matching the pattern, refreshing the index until the pattern shows up.
+
+        Args:
+            pattern (str): The regex to look for.
+            wait_timeout (int): Maximum time to wait for the pattern to appear in the log (seconds).
+            check_interval (int): Time between two refreshes (seconds).
+
+        Returns:
+            Optional[Tuple[datetime.datetime, str]]: The timestamp and the matching line, or None if the pattern didn't
+            show up in time.
+        """
+        start_time = time.time()
+        while True:
+            self.refresh()
+            last_match = self.find_last(pattern)
+            if last_match:
+                return last_match
+
+            if time.time() - start_time + check_interval > wait_timeout:
+                return None
+            get_logger().log_debug(f"Pattern '{pattern}' not found yet in {self.log_path}, waiting {check_interval}s...")
+            time.sleep(check_interval)
+
+    def _find_last_in_skipped_ranges(self, pattern: str) -> Optional[Tuple[datetime.datetime, str]]:
+        """
+        Get the most recent line matching the pattern in the parts of the file that were not fetched, with a 'grep' on the host.
+
+        The lines are matched one by one, without their continuation lines, and the matches without a timestamp are
+        ignored.
+
+        Args:
+            pattern (str): The regex to look for.
+
+        Returns:
+            Optional[Tuple[datetime.datetime, str]]: The timestamp and the matching line, or None if there isn't one.
+        """
+        if not self.skipped_ranges:
+            return None
+        if pattern in self.skipped_range_matches:
+            return self.skipped_range_matches[pattern]
+
+        last_match = None
+        for start, end in reversed(self.skipped_ranges):
+            output = self.ssh_connection.send(f"tail -c +{start + 1} {self.log_path} | head -c {end - start} | grep -E -- {shlex.quote(pattern)} | tail -n 100")
+            for line in reversed(output):
+                line = line.rstrip("\n")
+                timestamp = self._parse_timestamp(line)
+                if timestamp:
+                    last_match = timestamp, line
+                    break
+            if last_match:
+                break
+
+        self.skipped_range_matches[pattern] = last_match
+        return last_match
+
+    def _reset(self, file_id: str) -> None:
+        """
+        Forget the indexed lines, to index the given file from its beginning.
+
+        Args:
+            file_id (str): The identity of the file that will be indexed.
+        """
+        self.file_id = file_id
+        self.offset = 0
+        self.timestamps.clear()
+        self.lines.clear()
+        self.last_line_index = None
+        self.skipped_ranges.clear()
+        self.skipped_range_matches.clear()
+        self.generation += 1
+
+    def _parse_timestamp(self, line: str) -> Optional[datetime.datetime]:
+        """
+        Parse the timestamp of a line.
+
+        Args:
+            line (str): The line.
+
+        Returns:
+            Optional[datetime.datetime]: The timestamp, or None if the line has none.
+        """
+        match = self.timestamp_regex.search(line)
+        if not match:
+            return None
+
+        try:
+            return datetime.datetime.strptime(match.group(), self.timestamp_format)
+        except ValueError:
+            return None
+
+    def _add_line(self, line: str) -> bool:
+        """
+        Parse the timestamp of the line and insert it in the index.
+
+        Args:
+            line (str): The line, without its line break.
+
+        Returns:
+            bool: True if the line was indexed, False if it has no timestamp (a continuation line).
+        """
+        timestamp = self._parse_timestamp(line)
+        if not timestamp:
+            return False
+
+        # Lines are nearly always appended in order, the occasional late line is inserted after those of the same time.
+        if self.timestamps and timestamp < self.timestamps[-1]:
+            line_index = bisect.bisect_right(self.timestamps, timestamp)
+            self.timestamps.insert(line_index, timestamp)
+            self.lines.insert(line_index, line)
+            self.generation += 1
+        else:
+            line_index = len(self.lines)
+            self.timestamps.append(timestamp)
+            self.lines.append(line)
+        self.last_line_index = line_index
+        return True
@@ -12,14 +12,18 @@ if __name__ == "__main__":
     Usage Example:
         python3 test_case_scanner.py --database_config_file=path/to_my/database_config_file.py
 
+    Add --dry_run to only log the changes the scan would make to the database.
+
     """
 
     configuration_locations_manager = ConfigurationFileLocationsManager()
     parser = OptionParser()
+    parser.add_option("--dry_run", action="store_true", dest="dry_run", default=False, help="Only log the changes to the database, without making them")
     configuration_locations_manager.set_configs_from_options_parser(parser)
     ConfigurationManager.load_configs(configuration_locations_manager)
+    options, args = parser.parse_args()
 
     repo_root = get_stx_repo_root()
     folders_to_scan = ["testcases"]
     test_scanner_uploader = TestScannerUploader(folders_to_scan)
-    test_scanner_uploader.scan_and_upload_tests(repo_root)
+    test_scanner_uploader.scan_and_upload_tests(repo_root, dry_run=options.dry_run)
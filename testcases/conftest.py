@@ -7,8 +7,11 @@ from config.configuration_file_locations_manager import ConfigurationFileLocatio
 from config.configuration_manager import ConfigurationManager
 from framework.logging import log_banners
 from framework.logging.automation_logger import configure_testcase_log_handler, get_logger, remove_testcase_handler
+from framework.logging.keyword_timings import KeywordTimings
 from framework.options.safe_option_parser import SafeOptionParser
+from framework.rest.rest_session_pool import RestSessionPool
 from framework.runner.objects.run_context_loader import RunContextLoader
+from framework.validation.polling_metrics import PollingMetrics
 
 
 def pytest_addoption(parser: Parser):
@@ -40,6 +43,34 @@ def pytest_sessionstart(session: Any):
     log_configuration()
 
 
+def pytest_sessionfinish(session: Any, exitstatus: int):
+    """
+    This is run once all the test cases of the session are done.
+
+    Args:
+        session (Any): the session
+        exitstatus (int): the exit status of the session
+    """
+    if KeywordTimings.is_enabled():
+        keyword_timings_file = os.path.join(get_logger().get_log_folder(), "keyword_timings.json")
+        KeywordTimings.export(keyword_timings_file)
+        get_logger().log_info(f"Keywords with the most time spent in them, see {keyword_timings_file} for all of them:")
+        for summary_line in KeywordTimings.get_summary():
+            get_logger().log_info(summary_line)
+
+    if PollingMetrics.get_polling_metrics():
+        polling_metrics_file = os.path.join(get_logger().get_log_folder(), "polling_metrics.json")
+        PollingMetrics.export(polling_metrics_file)
+        get_logger().log_info(f"Validations with the most time spent polling, see {polling_metrics_file} for all of them:")
+        for summary_line in PollingMetrics.get_summary():
+            get_logger().log_info(summary_line)
+
+    if RestSessionPool.get_latency_metrics():
+        rest_latencies_file = os.path.join(get_logger().get_log_folder(), "rest_latencies.json")
+        RestSessionPool.export_latency_metrics(rest_latencies_file)
+        get_logger().log_info(f"Latency of the rest calls by endpoint: {rest_latencies_file}")
+
+
 def log_configuration():
     """
     This function will log all the configurations that are loaded
@@ -130,7 +161,7 @@ def log_exception(exception_info: Any):
     for entry in full_traceback:
 
         # Skip over the keyword-wrapping-hook
-        if entry.name == "on_keyword_wrapped_function":
+        if entry.name == "traced_method":
             continue
 
         # Skip over run_engine functions
@@ -0,0 +1,120 @@
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import pytest
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from framework.database.connection.database_connection_manager import DatabaseConnectionManager
+from framework.database.connection.database_connection_pool import DatabaseConnectionPool
+from framework.database.connection.database_operation_manager import DatabaseOperationManager
+from framework.database.operations.test_info_operation import TestInfoOperation as DatabaseTestInfoOperation
+
+
+def _get_mock_connection() -> MagicMock:
+    """
+    Get a mock psycopg2 connection, whose cursors all record their statements in the same mock cursor.
+
+    Returns:
+        MagicMock: The connection.
+    """
+    connection = MagicMock()
+    connection.closed = 0
+    connection.info.transaction_status = TRANSACTION_STATUS_IDLE
+    cursor = connection.cursor.return_value.__enter__.return_value
+    cursor.connection = connection
+    cursor.fetchall.return_value = [(42,)]
+    return connection
+
+
+@pytest.fixture
+def mock_connect():
+    """
+    Patch the connection to the database, and close the pools the test opened.
+
+    Yields:
+        MagicMock: The mock psycopg2.connect, returning a new mock connection on each call.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    with patch("framework.database.connection.database_connection_pool.psycopg2.connect", side_effect=lambda *args, **kwargs: _get_mock_connection()) as connect:
+        yield connect
+    DatabaseConnectionManager.close_connection_pools()
+
+
+def test_execute_query_reuses_connection_and_prepared_statement(mock_connect):
+    """
+    Tests that queries share one pooled connection, pass their parameters separately, and prepare a statement once.
+    """
+    database_operation_manager = DatabaseOperationManager()
+
+    assert database_operation_manager.execute_query("SELECT lab_info_id FROM lab_info where lab_name=%s", ("lab'1",)) == [(42,)]
+    database_operation_manager.execute_query("UPDATE run_content SET run_content_execution_status=%s WHERE run_content_id=%s", ("PASS", 1), expect_results=False, prepare=True)
+    database_operation_manager.execute_query("UPDATE run_content SET run_content_execution_status=%s WHERE run_content_id=%s", ("FAIL", 2), expect_results=False, prepare=True)
+
+    assert mock_connect.call_count == 1
+    cursor = database_operation_manager.database_connection_manager.get_connection_pool().idle_connections[0].cursor.return_value.__enter__.return_value
+    assert [call.args for call in cursor.execute.call_args_list] == [
+        ("SELECT lab_info_id FROM lab_info where lab_name=%s", ("lab'1",)),
+        ("PREPARE automation_statement_0 AS UPDATE run_content SET run_content_execution_status=$1 WHERE run_content_id=$2",),
+        ("EXECUTE automation_statement_0 (%s, %s)", ("PASS", 1)),
+        ("EXECUTE automation_statement_0 (%s, %s)", ("FAIL", 2)),
+    ]
+
+
+def test_transaction_commits_or_rolls_back(mock_connect):
+    """
+    Tests that a transaction is committed when its block completes, and rolled back and raised when it fails.
+    """
+    database_operation_manager = DatabaseOperationManager()
+
+    with database_operation_manager.transaction() as transaction:
+        assert transaction.execute_query("SELECT 1") == [(42,)]
+    connection = database_operation_manager.database_connection_manager.get_connection_pool().idle_connections[0]
+    assert connection.autocommit is False
+    connection.commit.assert_called_once()
+
+    with pytest.raises(ValueError):
+        with database_operation_manager.transaction() as transaction:
+            transaction.execute_query("INSERT INTO lab_info (lab_name) VALUES (%s)", ("lab-1",), expect_results=False)
+            raise ValueError("insert failed")
+    connection.rollback.assert_called_once()
+    assert mock_connect.call_count == 1
+
+
+def test_failed_connections_are_replaced(mock_connect):
+    """
+    Tests that a connection that failed, or that no longer answers after sitting idle, is not handed out again.
+    """
+    database_operation_manager = DatabaseOperationManager()
+    connection_pool = database_operation_manager.database_connection_manager.get_connection_pool()
+
+    with patch.object(DatabaseConnectionPool, "_is_healthy", return_value=True):
+        with pytest.raises(psycopg2.OperationalError):
+            with database_operation_manager.transaction():
+                raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        assert connection_pool.idle_connections == []
+
+        database_operation_manager.execute_query("SELECT 1")
+    assert mock_connect.call_count == 2
+
+    idle_connection = connection_pool.idle_connections[0]
+    idle_connection.cursor.return_value.__enter__.return_value.execute.side_effect = psycopg2.OperationalError("timeout")
+    connection_pool.last_used_times[id(idle_connection)] -= DatabaseConnectionPool.HEALTH_CHECK_IDLE_SECONDS
+    database_operation_manager.execute_query("SELECT 1")
+    assert mock_connect.call_count == 3
+    idle_connection.close.assert_called_once()
+
+
+def test_get_all_tests_raises_on_database_failure(mock_connect):
+    """
+    Tests that a failed lookup of the tests of a repository is raised instead of returning no tests.
+    """
+    connection = _get_mock_connection()
+    connection.cursor.return_value.__enter__.return_value.execute.side_effect = psycopg2.OperationalError("server closed the connection unexpectedly")
+    mock_connect.side_effect = lambda *args, **kwargs: connection
+
+    with patch.object(DatabaseConnectionPool, "_is_healthy", return_value=True):
+        with pytest.raises(psycopg2.OperationalError):
+            DatabaseTestInfoOperation().get_all_tests("starlingx")
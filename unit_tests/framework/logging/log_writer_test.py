@@ -0,0 +1,54 @@
+import gzip
+import logging
+import queue
+from unittest.mock import patch
+
+from framework.logging.automation_logger import AutomationLogger
+from framework.logging.log_writer import LogQueueHandler, LogWriter
+
+
+def test_log_writer_formats_once_and_flushes_removed_files(tmp_path):
+    """
+    Tests that each record is formatted once for all the files, through a bounded queue, and that a removed file holds every record logged before its removal and is closed.
+    """
+    log_queue = queue.Queue(5)
+    log_writer = LogWriter(log_queue, "%(source)s %(levelname)s :: %(message)s", "%(message)s")
+    logger = logging.Logger("log_writer_test", logging.DEBUG)
+    logger.addHandler(LogQueueHandler(log_queue))
+
+    full_log_file = str(tmp_path / "full_logs.txt")
+    test_log_file = str(tmp_path / "001_test_ptp" / "log.txt.gz")
+    (tmp_path / "001_test_ptp").mkdir()
+    log_writer.add_file(full_log_file, logging.DEBUG)
+    log_writer.add_file(test_log_file, logging.INFO, compress=True)
+
+    with patch.object(log_writer.general_formatter, "format", wraps=log_writer.general_formatter.format) as general_format:
+        for line_number in range(100):
+            logger.info(f"ssh output line {line_number}", extra={"source": "SSH"})
+        logger.debug("debug line", extra={"source": "AUT"})
+        logger.error("Traceback line", extra={"source": "EXC"})
+        log_writer.remove_files("test_ptp")
+        assert general_format.call_count == 101
+
+    logger.info("after the test", extra={"source": "AUT"})
+    log_writer.flush()
+
+    with gzip.open(test_log_file, "rt") as test_log:
+        assert test_log.read().splitlines() == [f"SSH INFO :: ssh output line {line_number}" for line_number in range(100)] + ["Traceback line"]
+    with open(full_log_file) as full_log:
+        assert full_log.read().splitlines()[-3:] == ["AUT DEBUG :: debug line", "Traceback line", "AUT INFO :: after the test"]
+    assert log_writer.targets[0].file_name == full_log_file and len(log_writer.targets) == 1
+
+
+def test_automation_logger_records_keep_their_source():
+    """
+    Tests that the records of the AutomationLogger are queued with their source and caller, without being formatted.
+    """
+    log_queue = queue.Queue()
+    logger = AutomationLogger("log_writer_source_test", logging.DEBUG)
+    logger.addHandler(LogQueueHandler(log_queue))
+
+    logger.log_ssh("ls -l")
+
+    record = log_queue.get_nowait()
+    assert (record.source, record.funcName, record.getMessage()) == ("SSH", "test_automation_logger_records_keep_their_source", "ls -l")
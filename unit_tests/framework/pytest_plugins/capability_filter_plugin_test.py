@@ -0,0 +1,55 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from framework.database.objects.testcase import TestCase as DatabaseTestCase
+from framework.pytest_plugins.capability_filter_plugin import CapabilityFilterPlugin
+from framework.pytest_plugins.result_collector import ResultCollector
+from framework.runner.objects.test_capability_matcher import TestCapabilityMatcher as CapabilityMatcher
+from framework.runner.objects.test_executor_summary import TestExecutorSummary as ExecutorSummary
+
+TEST_FILE_CONTENT = """
+import pytest
+
+
+@pytest.mark.p1
+def test_no_capability():
+    pass
+
+
+@pytest.mark.lab_has_ptp
+def test_ptp():
+    assert False
+
+
+@pytest.mark.lab_has_sriov
+def test_sriov():
+    pass
+
+
+def test_not_in_run():
+    pass
+"""
+
+
+def test_single_session_filters_on_collected_markers_and_accounts_per_test(tmp_path):
+    """
+    Tests that one pytest session deselects the tests the lab can't run or that were not asked for, and still gets one summary line per test.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    (tmp_path / "test_single_session.py").write_text(TEST_FILE_CONTENT)
+
+    node_ids = ["test_single_session.py::test_no_capability", "test_single_session.py::test_ptp", "test_single_session.py::test_sriov"]
+    capability_filter_plugin = CapabilityFilterPlugin(str(tmp_path), CapabilityMatcher(MagicMock()), ["lab_has_ptp"], node_ids)
+    test_executor_summary = ExecutorSummary()
+    database_tests = [DatabaseTestCase("test_ptp", "test_single_session.py", "p1", "test_single_session.py", "test_single_session.py::test_ptp")]
+    result_collector = ResultCollector(test_executor_summary, database_tests)
+
+    pytest.main([str(tmp_path), "-p", "no:cacheprovider", "--rootdir", str(tmp_path), "-q"], plugins=[capability_filter_plugin, result_collector])
+
+    assert [test.get_pytest_node_id() for test in capability_filter_plugin.get_tests()] == node_ids[:2]
+    assert test_executor_summary.get_tests_summary() == ["PASSED      test_single_session.py::test_no_capability", "FAILED      test_single_session.py::test_ptp"]
+    assert result_collector.failure_function_name == "test_ptp"
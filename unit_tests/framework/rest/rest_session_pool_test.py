@@ -0,0 +1,91 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from framework.rest.rest_client import RestClient
+from framework.rest.rest_session_pool import RestSessionPoolClass
+
+
+class CountingRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler that counts the connections it gets, and answers 503 to the first request of each path ending in /flaky.
+    """
+
+    protocol_version = "HTTP/1.1"
+    connections = 0
+    flaky_paths: set[str] = set()
+
+    def setup(self):
+        """
+        Counts the connection.
+        """
+        super().setup()
+        CountingRequestHandler.connections += 1
+
+    def do_GET(self):
+        """
+        Answers a GET.
+        """
+        self._answer()
+
+    def do_POST(self):
+        """
+        Answers a POST.
+        """
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._answer()
+
+    def _answer(self):
+        """
+        Answers 503 to the first request of a flaky path, 200 otherwise.
+        """
+        status = 200
+        if self.path.endswith("/flaky") and self.path not in CountingRequestHandler.flaky_paths:
+            CountingRequestHandler.flaky_paths.add(self.path)
+            status = 503
+        self.send_response(status)
+        self.send_header("Set-Cookie", "session=1; Path=/")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, format: str, *args: object):
+        """
+        Keeps the test output quiet.
+
+        Args:
+            format (str): The format of the message.
+            *args (object): The arguments of the message.
+        """
+
+
+def test_rest_client_reuses_connections_and_retries_idempotent_methods():
+    """
+    Tests that the rest calls to a base URL share one kept alive connection without keeping cookies, that only the idempotent methods are retried, and that the latency is recorded per endpoint.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CountingRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    rest_session_pool = RestSessionPoolClass()
+    rest_session_pool.RETRY_BACKOFF_FACTOR = 0
+
+    try:
+        with patch("framework.rest.rest_client.RestSessionPool", rest_session_pool):
+            rest_client = RestClient()
+            for host_id in range(1, 6):
+                response = rest_client.get(f"{base_url}/v1/ihosts/{host_id}")
+                assert response.get_status_code() == 200
+            assert response.get_endpoint() == "GET /v1/ihosts/{id}"
+            assert CountingRequestHandler.connections == 1
+            assert len(rest_session_pool.get_session(base_url).cookies) == 0
+
+            assert rest_client.get(f"{base_url}/v1/get/flaky").get_status_code() == 200
+            assert rest_client.post(f"{base_url}/v1/post/flaky", data="{}").get_status_code() == 503
+    finally:
+        rest_session_pool.close_sessions()
+        server.shutdown()
+        server.server_close()
+
+    latency_metrics = rest_session_pool.get_latency_metrics()
+    assert latency_metrics["GET /v1/ihosts/{id}"]["calls"] == 5
+    assert latency_metrics["POST /v1/post/flaky"]["calls"] == 1
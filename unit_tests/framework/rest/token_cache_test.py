@@ -0,0 +1,43 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from framework.rest.token_cache import TokenCacheClass
+
+
+def test_token_cache():
+    """
+    Tests that a token is requested once for concurrent callers, and again when it is about to expire, refused or invalidated.
+    """
+    token_cache = TokenCacheClass()
+    key = ("https://keystone:5000/v3", "admin", "admin", "Default")
+    requested_tokens = []
+    expires_in = {"delta": timedelta(hours=1)}
+
+    def request_token() -> tuple[str, datetime]:
+        time.sleep(0.05)
+        requested_tokens.append(f"token-{len(requested_tokens)}")
+        return requested_tokens[-1], datetime.now(timezone.utc) + expires_in["delta"]
+
+    tokens = []
+    threads = [threading.Thread(target=lambda: tokens.append(token_cache.get_token(key, request_token))) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert tokens == ["token-0"] * 10
+    assert requested_tokens == ["token-0"]
+
+    # A refused token is replaced once, the callers still holding it get the replacement
+    assert token_cache.get_token(key, request_token, stale_token="token-0") == "token-1"
+    assert token_cache.get_token(key, request_token, stale_token="token-0") == "token-1"
+
+    # A token about to expire is replaced before it does
+    expires_in["delta"] = timedelta(minutes=1)
+    token_cache.invalidate()
+    assert token_cache.get_token(key, request_token) == "token-2"
+    assert token_cache.get_token(key, request_token) == "token-3"
+
+    # A failed request is not cached
+    assert token_cache.get_token(("https://other:5000/v3",), lambda: (None, None)) is None
+    assert token_cache.get_token(("https://other:5000/v3",), request_token) == "token-4"
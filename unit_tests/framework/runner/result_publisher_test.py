@@ -0,0 +1,59 @@
+import json
+import os
+from datetime import datetime
+from unittest.mock import patch
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from framework.database.objects.test_case_result import TestCaseResult as DatabaseTestCaseResult
+from framework.runner.objects.result_publisher import ResultPublisherClass
+
+
+def _publish_results(result_publisher: ResultPublisherClass, test_names: list[str]):
+    """
+    Publish a passing result for each of the given test cases of the test_ptp.py suite.
+
+    Args:
+        result_publisher (ResultPublisherClass): the publisher
+        test_names (list[str]): the names of the test cases
+    """
+    for test_name in test_names:
+        test_case_result = DatabaseTestCaseResult(None, "PASS", datetime(2026, 1, 1, 10), datetime(2026, 1, 1, 11))
+        test_case_result.set_session_id("7c1e5b6a-6b43-4bd3-a8d4-2d0e1dbf2c61")
+        result_publisher.publish(test_case_result, test_name, "test_ptp.py", "ace")
+
+
+def test_results_are_spooled_through_an_outage_and_replayed(tmp_path):
+    """
+    Tests that results are inserted in batches, and kept in the spool while the database is down until a later run replays them.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    module = "framework.runner.objects.result_publisher"
+
+    result_publisher = ResultPublisherClass()
+    result_publisher.set_spool_folder(str(tmp_path))
+    result_publisher.RETRY_INTERVAL_SECONDS = 0.01
+    with patch(f"{module}.TestInfoOperation") as test_info_operation, patch(f"{module}.TestCaseResultOperation") as test_case_result_operation:
+        test_info_operation.return_value.get_info_test_ids.side_effect = ConnectionError("could not translate host name")
+        _publish_results(result_publisher, ["test_ptp_1", "test_ptp_2", "test_ptp_3"])
+        assert result_publisher.flush(timeout=5) == 3
+    assert not test_case_result_operation.return_value.create_test_case_results.called
+    with open(result_publisher.get_spool_file()) as spool_file:
+        assert [json.loads(line)["test_name"] for line in spool_file] == ["test_ptp_1", "test_ptp_2", "test_ptp_3"]
+
+    # A spool file left behind by a run that is no longer alive is taken over by the next run.
+    os.rename(result_publisher.get_spool_file(), os.path.join(tmp_path, "result_spool_999999999.jsonl"))
+    next_result_publisher = ResultPublisherClass()
+    next_result_publisher.set_spool_folder(str(tmp_path))
+    with patch(f"{module}.TestInfoOperation") as test_info_operation, patch(f"{module}.TestCaseResultOperation") as test_case_result_operation:
+        test_info_operation.return_value.get_info_test_ids.return_value = {("test_ptp_1", "test_ptp.py", "ace"): 1, ("test_ptp_2", "test_ptp.py", "ace"): 2, ("test_ptp_4", "test_ptp.py", "ace"): 4}
+        _publish_results(next_result_publisher, ["test_ptp_4"])
+        assert next_result_publisher.flush(timeout=5) == 0
+
+    inserted_results = [test_case_result for call in test_case_result_operation.return_value.create_test_case_results.call_args_list for test_case_result in call.args[0]]
+    assert sorted(test_case_result.get_test_id() for test_case_result in inserted_results) == [1, 2, 4]
+    assert test_case_result_operation.return_value.create_test_case_results.call_count <= 2
+    assert inserted_results[0].get_start_time() == datetime(2026, 1, 1, 10)
+    assert os.listdir(tmp_path) == [os.path.basename(next_result_publisher.get_spool_file())]
+    assert os.path.getsize(next_result_publisher.get_spool_file()) == 0
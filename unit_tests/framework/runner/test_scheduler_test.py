@@ -0,0 +1,41 @@
+from unittest.mock import patch
+
+from framework.database.objects.testcase import TestCase as DatabaseTestCase
+from framework.runner.objects.test_scheduler import TestScheduler as Scheduler
+
+
+def _get_test(test_info_id: int, markers: list[str]) -> DatabaseTestCase:
+    """
+    Get a test of the test_ptp.py suite.
+
+    Args:
+        test_info_id (int): the test_info id of the test
+        markers (list[str]): the capability markers of the test
+
+    Returns:
+        DatabaseTestCase: the test
+    """
+    test = DatabaseTestCase(f"test_ptp_{test_info_id}", "test_ptp.py", "p1", "testcases/ptp/test_ptp.py", f"testcases/ptp/test_ptp.py::test_ptp_{test_info_id}")
+    test.set_test_info_id(test_info_id)
+    test.set_markers(markers)
+    return test
+
+
+def test_create_schedule_balances_labs_longest_first():
+    """
+    Tests that the tests are assigned longest first to the least loaded lab that can run them, and that the tests no lab can run are left out.
+    """
+    with patch("framework.runner.objects.test_scheduler.LabConfig"):
+        test_scheduler = Scheduler(["lab_1.json5", "lab_2.json5"])
+    lab_capabilities = {"lab_1.json5": ["lab_has_ptp"], "lab_2.json5": ["lab_has_ptp", "lab_has_sriov"]}
+    tests = [_get_test(1, []), _get_test(2, ["lab_has_ptp"]), _get_test(3, []), _get_test(4, ["lab_has_sriov"]), _get_test(5, []), _get_test(6, ["lab_has_gnss"]), _get_test(7, [])]
+    test_durations = {1: 100, 2: 300, 3: 200, 4: 400, 5: 100}
+
+    test_schedule = test_scheduler.create_schedule(tests, lab_capabilities, test_durations)
+
+    # Test 7 has no result yet, so it is expected to take the average of the others, 220s.
+    assert [test.get_test_info_id() for test in test_schedule.get_lab_tests("lab_1.json5")] == [2, 7, 1]
+    assert [test.get_test_info_id() for test in test_schedule.get_lab_tests("lab_2.json5")] == [4, 3, 5]
+    assert test_schedule.get_planned_duration("lab_1.json5") == 620
+    assert test_schedule.get_planned_duration("lab_2.json5") == 700
+    assert [test.get_test_info_id() for test in test_schedule.get_unassigned_tests()] == [6]
@@ -0,0 +1,65 @@
+import os
+from unittest.mock import patch
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from framework.scanning.objects.collection_index import CollectionIndex
+
+PLAIN_TEST_FILE_CONTENT = """
+from pytest import mark
+
+
+@mark.p1
+@mark.lab_has_subcloud
+@mark.lab_has_standby_controller
+def test_subcloud_swact():
+    pass
+
+
+def test_no_marker():
+    pass
+"""
+
+PARAMETRIZED_TEST_FILE_CONTENT = """
+import pytest
+
+
+@pytest.mark.p2
+@pytest.mark.parametrize("ip_version", ["ipv4", "ipv6"])
+def test_ping(ip_version):
+    pass
+"""
+
+
+def test_get_tests_reads_markers_without_importing_and_only_rereads_changed_files(tmp_path):
+    """
+    Tests that plain test files are read from their syntax tree, others are collected by pytest, and an unchanged tree is served from the index.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    (tmp_path / "testcases" / "ptp").mkdir(parents=True)
+    (tmp_path / "testcases" / "ptp" / "test_ping.py").write_text(PARAMETRIZED_TEST_FILE_CONTENT)
+    (tmp_path / "testcases" / "test_subcloud.py").write_text(PLAIN_TEST_FILE_CONTENT)
+    (tmp_path / "testcases" / "helpers.py").write_text("def test_helper():\n    pass\n")
+
+    collection_index = CollectionIndex(str(tmp_path))
+    tests = collection_index.get_tests(str(tmp_path / "testcases"))
+
+    assert [(test.get_pytest_node_id(), test.get_test_suite(), test.get_priority(), test.get_markers()) for test in tests] == [
+        ("testcases/ptp/test_ping.py::test_ping[ipv4]", "test_ping.py", "p2", ["parametrize"]),
+        ("testcases/ptp/test_ping.py::test_ping[ipv6]", "test_ping.py", "p2", ["parametrize"]),
+        ("testcases/test_subcloud.py::test_subcloud_swact", "test_subcloud.py", "p1", ["lab_has_standby_controller", "lab_has_subcloud"]),
+        ("testcases/test_subcloud.py::test_no_marker", "test_subcloud.py", None, []),
+    ]
+    assert os.path.isfile(tmp_path / CollectionIndex.INDEX_FILE)
+
+    with patch.object(CollectionIndex, "_collect_with_pytest") as collect_with_pytest, patch.object(CollectionIndex, "_get_tests_from_source", wraps=collection_index._get_tests_from_source) as get_tests_from_source:
+        assert len(CollectionIndex(str(tmp_path)).get_tests(str(tmp_path / "testcases"))) == 4
+        get_tests_from_source.assert_not_called()
+
+        (tmp_path / "testcases" / "test_subcloud.py").write_text(PLAIN_TEST_FILE_CONTENT.replace("@mark.p1\n", ""))
+        os.remove(tmp_path / "testcases" / "ptp" / "test_ping.py")
+        tests = CollectionIndex(str(tmp_path)).get_tests(str(tmp_path / "testcases"))
+        assert [(test.get_test_name(), test.get_priority()) for test in tests] == [("test_subcloud_swact", None), ("test_no_marker", None)]
+        assert get_tests_from_source.call_count == 1
+        collect_with_pytest.assert_not_called()
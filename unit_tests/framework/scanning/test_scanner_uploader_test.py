@@ -0,0 +1,76 @@
+from unittest.mock import patch
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from framework.database.objects.capability import Capability
+from framework.database.objects.testcase import TestCase as DatabaseTestCase
+from framework.scanning.objects.test_scanner_uploader import TestScannerUploader as ScannerUploader
+
+
+def _get_testcase(test_name: str, priority: str, markers: list[str], test_info_id: int = -1, is_active: bool = True) -> DatabaseTestCase:
+    """
+    Get a testcase of the test_ptp.py suite.
+
+    Args:
+        test_name (str): The name of the test.
+        priority (str): The priority of the test.
+        markers (list[str]): The capability markers of the test.
+        test_info_id (int): The id of the test in the database, -1 for a test of the repo.
+        is_active (bool): False for an inactive test of the database.
+
+    Returns:
+        DatabaseTestCase: The testcase.
+    """
+    testcase = DatabaseTestCase(test_name, "test_ptp.py", priority, "testcases/ptp/test_ptp.py", f"testcases/ptp/test_ptp.py::{test_name}")
+    testcase.set_markers(markers)
+    testcase.set_test_info_id(test_info_id)
+    testcase.set_is_active(is_active)
+    return testcase
+
+
+def test_scan_and_upload_tests_syncs_in_bulk():
+    """
+    Tests that the scan is matched to the database by name and suite, and written with one statement per kind of change.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    repo_tests = [
+        _get_testcase("test_unchanged", "p1", ["lab_has_ptp"]),
+        _get_testcase("test_new", "p2", ["lab_has_ptp", "lab_has_gnss"]),
+        _get_testcase("test_reprioritized", "p1", []),
+        _get_testcase("test_reactivated", "p3", ["lab_has_ptp"]),
+        _get_testcase("test_other_folder", "p1", []),
+    ]
+    repo_tests[-1].pytest_node_id = "other/test_ptp.py::test_other_folder"
+    database_tests = [
+        _get_testcase("test_unchanged", "p1", [], 1),
+        _get_testcase("test_reprioritized", "p2", [], 2),
+        _get_testcase("test_reactivated", "p3", [], 3, is_active=False),
+        _get_testcase("test_removed", "p1", [], 4),
+    ]
+
+    scanner_uploader = ScannerUploader(["testcases"])
+    module = "framework.scanning.objects.test_scanner_uploader"
+    with patch.object(ScannerUploader, "scan_for_tests", return_value=repo_tests), patch(f"{module}.TestInfoOperation") as test_info_operation, patch(f"{module}.CapabilityOperation") as capability_operation, patch(f"{module}.TestCapabilityOperation") as test_capability_operation:
+        test_info_operation.return_value.get_all_tests.return_value = database_tests
+        test_info_operation.return_value.insert_tests.return_value = {("test_new", "test_ptp.py"): 5}
+        capability_operation.return_value.get_all_capabilities.return_value = [Capability(10, "lab_has_ptp", "lab_has_ptp")]
+        capability_operation.return_value.insert_capabilities.return_value = [Capability(11, "lab_has_gnss", "lab_has_gnss")]
+        test_capability_operation.return_value.get_capability_markers_for_tests.return_value = [(100, 1, "lab_has_ptp"), (101, 2, "lab_has_ptp")]
+
+        dry_run_report = scanner_uploader.scan_and_upload_tests("/repo", dry_run=True)
+        assert not test_info_operation.return_value.insert_tests.called
+        test_sync_report = scanner_uploader.scan_and_upload_tests("/repo")
+
+    assert dry_run_report.get_summary() == test_sync_report.get_summary()
+    assert [test.get_test_name() for test in test_sync_report.get_tests_to_insert()] == ["test_new"]
+    assert [(test.get_test_name(), test.get_priority()) for test in test_sync_report.get_tests_to_update()] == [("test_reprioritized", "p1"), ("test_reactivated", "p3")]
+    assert [test.get_test_name() for test in test_sync_report.get_tests_to_deactivate()] == ["test_removed"]
+    assert test_sync_report.get_capabilities_to_insert() == ["lab_has_gnss"]
+
+    test_info_operation.return_value.set_tests_inactive.assert_called_once_with([4])
+    test_info_operation.return_value.update_tests.assert_called_once_with(test_sync_report.get_tests_to_update())
+    capability_operation.return_value.insert_capabilities.assert_called_once_with(["lab_has_gnss"])
+    test_capability_operation.return_value.get_capability_markers_for_tests.assert_called_with([1, 2, 3])
+    test_capability_operation.return_value.create_new_mappings.assert_called_once_with([(10, 5), (11, 5), (10, 3)])
+    test_capability_operation.return_value.delete_capability_tests.assert_called_once_with([101])
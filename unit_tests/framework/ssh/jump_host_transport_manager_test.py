@@ -0,0 +1,99 @@
+from unittest.mock import Mock
+
+import paramiko
+import pytest
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from framework.ssh.jump_host_transport_manager import JumpHostTransportManagerClass
+
+
+def create_jump_host() -> Mock:
+    """
+    Creates a stand-in for the HostConfiguration of a jump host.
+
+    Returns:
+        Mock: The jump host configuration.
+    """
+    jump_host = Mock()
+    jump_host.get_host.return_value = "jump.example.com"
+    jump_host.get_ssh_port.return_value = 22
+    jump_host.get_credentials.return_value.get_user_name.return_value = "jump_user"
+    return jump_host
+
+
+@pytest.fixture
+def connections(monkeypatch: pytest.MonkeyPatch) -> list:
+    """
+    Replaces the SSH handshake with the jump host by mock clients.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): pytest monkeypatch fixture.
+
+    Returns:
+        list: The mock clients created, in order.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    created_clients = []
+
+    def mock_connect(jump_host: Mock, timeout: int = 30, retries: int = 3, retry_delay: int = 5) -> Mock:
+        jump_client = Mock()
+        jump_client.get_transport.return_value.is_active.return_value = True
+        created_clients.append(jump_client)
+        return jump_client
+
+    monkeypatch.setattr(JumpHostTransportManagerClass, "_connect", staticmethod(mock_connect))
+    return created_clients
+
+
+def test_acquire_shares_one_transport(connections: list):
+    """
+    Tests that all the users of a jump host share the same transport and that it's closed with the last user.
+    """
+    manager = JumpHostTransportManagerClass()
+    jump_host = create_jump_host()
+
+    first_transport = manager.acquire(jump_host)
+    second_transport = manager.acquire(jump_host)
+    assert first_transport is second_transport
+    assert len(connections) == 1
+    assert manager.get_reference_count(jump_host) == 2
+
+    manager.release(jump_host)
+    connections[0].close.assert_not_called()
+    manager.release(jump_host)
+    connections[0].close.assert_called_once()
+    assert manager.get_reference_count(jump_host) == 0
+
+
+def test_open_channel_reconnects_dropped_transport(connections: list):
+    """
+    Tests that a channel can still be opened after the shared transport dropped.
+    """
+    manager = JumpHostTransportManagerClass()
+    jump_host = create_jump_host()
+    manager.acquire(jump_host)
+    connections[0].get_transport.return_value.is_active.return_value = False
+
+    manager.open_channel(jump_host, "10.0.0.1", 22)
+
+    assert len(connections) == 2
+    connections[1].get_transport.return_value.open_channel.assert_called_once_with("direct-tcpip", ("10.0.0.1", 22), ("", 0), timeout=30)
+    assert manager.get_reference_count(jump_host) == 1
+
+
+def test_open_channel_keeps_transport_when_target_unreachable(connections: list):
+    """
+    Tests that a target the jump host can't reach doesn't close the transport the other users share.
+    """
+    manager = JumpHostTransportManagerClass()
+    jump_host = create_jump_host()
+    manager.acquire(jump_host)
+    connections[0].get_transport.return_value.open_channel.side_effect = paramiko.ChannelException(2, "Connect failed")
+
+    with pytest.raises(paramiko.ChannelException):
+        manager.open_channel(jump_host, "10.0.0.1", 22)
+
+    assert len(connections) == 1
+    connections[0].close.assert_not_called()
@@ -0,0 +1,38 @@
+from framework.ssh.prompt_response import PromptResponse
+
+
+def test_prompt_split_across_reads():
+    """
+    Tests that a prompt split across two reads is found when only the new part of the output is searched.
+    """
+    prompt = PromptResponse("Password:")
+    output = "sudo ls\nPass"
+    assert not prompt.is_found_in(output)
+
+    search_start = len(output)
+    output += "word: "
+    assert prompt.is_found_in(output, search_start)
+
+
+def test_prompt_not_searched_before_search_start():
+    """
+    Tests that the part of the output that was already searched is skipped.
+    """
+    prompt = PromptResponse("@")
+    output = "user@host:~$ cmd\nresult\n"
+
+    assert prompt.is_found_in(output)
+    assert not prompt.is_found_in(output, output.index("\n") + 1)
+
+
+def test_regex_prompt():
+    """
+    Tests that a regex prompt is matched in the line being received, even when it started in a previous read.
+    """
+    prompt = PromptResponse(r"sysadmin@controller-\d:~\$ $", is_regex=True)
+    output = "output\nsysadmin@contr"
+    assert not prompt.is_found_in(output)
+
+    search_start = len(output)
+    output += "oller-1:~$ "
+    assert prompt.is_found_in(output, search_start)
@@ -0,0 +1,111 @@
+from unittest.mock import Mock
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from framework.ssh.remote_shell_session import RemoteShellSession
+from framework.ssh.shell_environment_profile import ShellEnvironmentProfile
+
+
+def create_session_with_output(chunks_before_sentinel: list[bytes], return_code: int) -> RemoteShellSession:
+    """
+    Creates a shell session whose channel returns the given chunks, then the sentinel line split across two reads.
+
+    Args:
+        chunks_before_sentinel (list[bytes]): The output of the command, as read from the channel.
+        return_code (int): The return code reported on the sentinel line.
+
+    Returns:
+        RemoteShellSession: The session, with an open mock channel.
+    """
+    profile = ShellEnvironmentProfile("openrc", "source /etc/platform/openrc;", ["source /etc/platform/openrc"])
+    session = RemoteShellSession(Mock(), profile)
+    session.channel = Mock()
+    session.channel.closed = False
+    session.channel.exit_status_ready.return_value = False
+    sentinel_line = b"\n" + session.sentinel + f" {return_code}\n".encode()
+    session.channel.recv.side_effect = chunks_before_sentinel + [sentinel_line[:10], sentinel_line[10:]]
+    return session
+
+
+def test_run_returns_lines_and_return_code():
+    """
+    Tests that the output before the sentinel is returned as lines, along with the return code of the command.
+    """
+    session = create_session_with_output([b"line 1\nli", b"ne 2\n"], 0)
+
+    output, return_code = session.run("system host-list")
+
+    assert output == ["line 1\n", "line 2\n"]
+    assert return_code == 0
+    written_script = session.channel.sendall.call_args[0][0].decode()
+    assert written_script.startswith("( system host-list\n) < /dev/null\n")
+
+
+def test_run_without_output_and_failure():
+    """
+    Tests that a command without output returns no lines, and that a non-zero return code is reported.
+    """
+    session = create_session_with_output([], 127)
+
+    output, return_code = session.run("missing-command")
+
+    assert output == []
+    assert return_code == 127
+
+
+def test_profile_matches_and_unwraps_wrapped_commands():
+    """
+    Tests that a profile only matches the commands wrapped for it and removes its prefix and suffix.
+    """
+    profile = ShellEnvironmentProfile("sudo_openrc", "bash -c 'source /etc/platform/openrc;", [], command_suffix="'", as_sudo=True)
+
+    assert profile.matches("bash -c 'source /etc/platform/openrc;software list'")
+    assert not profile.matches("source /etc/platform/openrc;software list")
+    assert profile.unwrap("bash -c 'source /etc/platform/openrc;software list'") == "software list"
+
+
+def create_sudo_session(chunks_before_shell_ready: list[bytes]) -> RemoteShellSession:
+    """
+    Creates a sudo shell session whose channel returns the given chunks, then the ready line of the shell and the sentinel line of 'true'.
+
+    The chunks can hold '{prompt}', which is replaced by the prompt sudo was given.
+
+    Args:
+        chunks_before_shell_ready (list[bytes]): The output of sudo before the shell starts.
+
+    Returns:
+        RemoteShellSession: The session, with a mock client.
+    """
+    profile = ShellEnvironmentProfile("sudo", "sudo ", [], as_sudo=True)
+    session = RemoteShellSession(Mock(), profile, password="pass;word")
+    channel = session.client.get_transport.return_value.open_session.return_value
+
+    def recv(size: int) -> bytes:
+        sudo_command = channel.exec_command.call_args[0][0]
+        sudo_prompt = sudo_command.split("'")[1].encode()
+        shell_ready = sudo_command.split("echo ")[1].split(";")[0].encode()
+        chunks = [chunk.replace(b"{prompt}", sudo_prompt) for chunk in chunks_before_shell_ready] + [shell_ready + b"\n", b"\n" + session.sentinel + b" 0\n"]
+        return chunks[channel.recv.call_count - 1]
+
+    channel.recv.side_effect = recv
+    return session
+
+
+def test_sudo_password_is_only_sent_when_prompted():
+    """
+    Tests that the password is sent in answer to the prompt of sudo, and never written to the shell when sudo doesn't prompt.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    prompted_session = create_sudo_session([b"{prompt}"])
+    prompted_session.open()
+    written = [call[0][0] for call in prompted_session.channel.sendall.call_args_list]
+    assert written[0] == b"pass;word\n"
+    assert written[1].startswith(b"true\n")
+
+    session_without_prompt = create_sudo_session([])
+    session_without_prompt.open()
+    written = [call[0][0] for call in session_without_prompt.channel.sendall.call_args_list]
+    assert len(written) == 1
+    assert written[0].startswith(b"true\n")
+    assert b"pass;word" not in written[0]
@@ -0,0 +1,190 @@
+"""Unit tests for SFTPTransferEngine, on a fake SFTP client backed by the local file system."""
+
+import hashlib
+import os
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from paramiko import SFTPAttributes
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from framework.ssh.secure_transfer_file.sftp_transfer_engine import SFTPTransferEngine
+
+
+class FakeRemoteFile:
+    """Local file standing for a remote SFTP file."""
+
+    def __init__(self, path: str, mode: str):
+        """
+        Open the file.
+
+        Args:
+            path (str): The path of the file.
+            mode (str): The mode to open the file with.
+        """
+        self.file = open(path, mode)
+        self.prefetched_size = None
+        self.is_pipelined = False
+
+    def __enter__(self) -> "FakeRemoteFile":
+        """
+        Enter the context.
+
+        Returns:
+            FakeRemoteFile: The file.
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Close the file.
+
+        Args:
+            *args (object): The exception details.
+        """
+        self.file.close()
+
+    def seek(self, offset: int) -> None:
+        """
+        Seek to an offset.
+
+        Args:
+            offset (int): The offset.
+        """
+        self.file.seek(offset)
+
+    def read(self, size: int) -> bytes:
+        """
+        Read bytes.
+
+        Args:
+            size (int): The maximum number of bytes.
+
+        Returns:
+            bytes: The bytes.
+        """
+        return self.file.read(size)
+
+    def write(self, data: bytes) -> None:
+        """
+        Write bytes.
+
+        Args:
+            data (bytes): The bytes.
+        """
+        self.file.write(data)
+
+    def prefetch(self, file_size: int) -> None:
+        """
+        Record the prefetch.
+
+        Args:
+            file_size (int): The size of the file.
+        """
+        self.prefetched_size = file_size
+
+    def set_pipelined(self, is_pipelined: bool) -> None:
+        """
+        Record the pipelining.
+
+        Args:
+            is_pipelined (bool): True if the writes are pipelined.
+        """
+        self.is_pipelined = is_pipelined
+
+
+def _get_fake_sftp_client() -> Mock:
+    """
+    Get a fake SFTP client working on the local file system.
+
+    Returns:
+        Mock: The SFTP client.
+    """
+    sftp_client = Mock()
+    sftp_client.stat.side_effect = os.stat
+    sftp_client.open.side_effect = FakeRemoteFile
+    sftp_client.listdir.side_effect = os.listdir
+    sftp_client.mkdir.side_effect = os.mkdir
+    sftp_client.listdir_attr.side_effect = lambda path: [SFTPAttributes.from_stat(os.stat(os.path.join(path, name)), name) for name in sorted(os.listdir(path))]
+    return sftp_client
+
+
+def test_download_resumes_and_verifies_checksum(tmp_path):
+    """
+    Tests that a partial download is completed from where it stopped, and checked against the remote sha256.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    remote_file = tmp_path / "remote.iso"
+    remote_file.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+    local_file = tmp_path / "local.iso"
+    local_file.write_bytes(remote_file.read_bytes()[:1000])
+
+    transfer_engine = SFTPTransferEngine(_get_fake_sftp_client())
+    remote_sha256 = hashlib.sha256(remote_file.read_bytes()).hexdigest()
+    with patch.object(transfer_engine, "get_remote_sha256", return_value=remote_sha256) as get_remote_sha256:
+        transferred_bytes = transfer_engine.download_file(str(remote_file), str(local_file), resume=True, verify_checksum=True)
+
+    assert transferred_bytes == remote_file.stat().st_size - 1000
+    assert local_file.read_bytes() == remote_file.read_bytes()
+    get_remote_sha256.assert_called_once_with(str(remote_file))
+
+    with patch.object(transfer_engine, "get_remote_sha256", return_value="0" * 64):
+        with pytest.raises(IOError, match="sha256"):
+            transfer_engine.upload_file(str(local_file), str(tmp_path / "uploaded.iso"), verify_checksum=True)
+
+
+def test_directory_transfers_run_concurrently(tmp_path):
+    """
+    Tests that a directory tree is downloaded and uploaded whole, each worker with its own SFTP session.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    remote_dir = tmp_path / "collect"
+    (remote_dir / "controller-0" / "var").mkdir(parents=True)
+    for index in range(6):
+        (remote_dir / "controller-0" / "var" / f"log-{index}.tgz").write_bytes(os.urandom(1000 + index))
+    (remote_dir / "summary.txt").write_text("summary\n")
+
+    sftp_client = _get_fake_sftp_client()
+    worker_client = _get_fake_sftp_client()
+    transfer_engine = SFTPTransferEngine(sftp_client, max_concurrency=3)
+    with patch("framework.ssh.secure_transfer_file.sftp_transfer_engine.SFTPClient.from_transport", return_value=worker_client):
+        assert transfer_engine.download_directory(str(remote_dir), str(tmp_path / "downloaded")) == 7
+        assert transfer_engine.upload_directory(str(tmp_path / "downloaded"), str(tmp_path / "uploaded")) == 7
+
+    for index in range(6):
+        relative_path = os.path.join("controller-0", "var", f"log-{index}.tgz")
+        assert (tmp_path / "uploaded" / relative_path).read_bytes() == (remote_dir / relative_path).read_bytes()
+    assert sftp_client.open.call_count == 0
+    assert worker_client.open.call_count == 14
+    assert worker_client.close.called
+
+
+def test_timed_out_transfer_keeps_its_session(tmp_path):
+    """
+    Tests that the session of a file transfer that timed out is closed by its worker once done, not from under it.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    worker_client = Mock()
+    transfer_done = threading.Event()
+
+    def slow_transfer(sftp_client: Mock, origin_path: str, destination_path: str, resume: bool, verify_checksum: bool) -> int:
+        time.sleep(0.5)
+        sftp_client.close.assert_not_called()
+        transfer_done.set()
+        return 0
+
+    transfer_engine = SFTPTransferEngine(_get_fake_sftp_client(), timeout_per_file=0.1)
+    with patch("framework.ssh.secure_transfer_file.sftp_transfer_engine.SFTPClient.from_transport", return_value=worker_client):
+        with pytest.raises(AssertionError):
+            transfer_engine._transfer_concurrently([("remote.iso", "local.iso")], slow_transfer, False, False)
+
+    worker_client.close.assert_not_called()
+    assert transfer_done.wait(2)
+    time.sleep(0.1)
+    worker_client.close.assert_called_once()
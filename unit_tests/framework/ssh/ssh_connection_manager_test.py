@@ -0,0 +1,163 @@
+import threading
+
+import pytest
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from framework.ssh.ssh_connection import SSHConnection
+from framework.ssh.ssh_connection_manager import SSHConnectionManagerClass
+
+
+@pytest.fixture
+def offline_ssh_connections(monkeypatch: pytest.MonkeyPatch):
+    """
+    Replaces the network operations of the SSHConnection so that connections can be pooled without a lab.
+
+    Args:
+        monkeypatch (pytest.MonkeyPatch): pytest monkeypatch fixture.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+
+    def fake_connect(self, allow_agent: bool = True, look_for_keys: bool = False) -> bool:
+        self.is_connected = True
+        return True
+
+    monkeypatch.setattr(SSHConnection, "connect", fake_connect)
+    monkeypatch.setattr(SSHConnection, "is_alive", lambda self: self.is_connected)
+    monkeypatch.setattr(SSHConnection, "close", lambda self: setattr(self, "is_connected", False))
+
+
+def test_create_ssh_connection_reuses_pooled_connection(offline_ssh_connections):
+    """
+    Tests that asking twice for the same host and user returns the same connection.
+    """
+    manager = SSHConnectionManagerClass()
+    first_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password")
+    second_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password")
+
+    assert first_connection is second_connection
+    assert len(manager.ssh_connection_list) == 1
+
+
+def test_create_ssh_connection_fresh_connection(offline_ssh_connections):
+    """
+    Tests that fresh_connection bypasses the pool.
+    """
+    manager = SSHConnectionManagerClass()
+    first_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password")
+    second_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password", fresh_connection=True)
+
+    assert first_connection is not second_connection
+    assert len(manager.ssh_connection_list) == 2
+
+
+def test_create_ssh_connection_replaces_dead_connection(offline_ssh_connections):
+    """
+    Tests that a pooled connection that is no longer alive is replaced by a new one.
+    """
+    manager = SSHConnectionManagerClass()
+    first_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password")
+    first_connection.is_connected = False
+    second_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password")
+
+    assert first_connection is not second_connection
+    assert list(manager.ssh_connection_list.values()) == [second_connection]
+
+
+def test_create_ssh_connection_skips_ssh_pass_connection(offline_ssh_connections):
+    """
+    Tests that a connection set up to use ssh pass is never handed out by the pool.
+    """
+    manager = SSHConnectionManagerClass()
+    first_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password")
+    first_connection.is_poolable = False
+    second_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password")
+
+    assert first_connection is not second_connection
+
+
+def test_create_ssh_connection_is_not_shared_across_threads(offline_ssh_connections):
+    """
+    Tests that each thread gets its own pooled connection.
+    """
+    manager = SSHConnectionManagerClass()
+    main_thread_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password")
+    other_thread_connections = []
+    thread = threading.Thread(target=lambda: other_thread_connections.append(manager.create_ssh_connection("10.0.0.1", "sysadmin", "password")))
+    thread.start()
+    thread.join()
+
+    assert other_thread_connections[0] is not main_thread_connection
+    assert manager.create_ssh_connection("10.0.0.1", "sysadmin", "password") is main_thread_connection
+
+
+def test_create_ssh_connection_max_connections_per_host(offline_ssh_connections):
+    """
+    Tests that the least recently used connection no longer checked out is closed when the per host cap is reached, and that the connections still checked out are never closed.
+    """
+    manager = SSHConnectionManagerClass(max_connections_per_host=2)
+    worker_connections = []
+    for _ in range(2):
+        thread = threading.Thread(target=lambda: worker_connections.append(manager.create_ssh_connection("10.0.0.1", "sysadmin", "password")))
+        thread.start()
+        thread.join()
+    worker_connections[0].last_used_time = 0
+
+    main_thread_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password")
+    assert not worker_connections[0].is_connected
+    assert worker_connections[1].is_connected
+    assert len(manager.ssh_connection_list) == 2
+
+    fresh_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password", fresh_connection=True)
+    assert not worker_connections[1].is_connected
+    extra_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password", fresh_connection=True)
+    assert main_thread_connection.is_connected and fresh_connection.is_connected and extra_connection.is_connected
+    assert len(manager.ssh_connection_list) == 3
+
+
+def test_create_ssh_connection_pooled_under_another_name(offline_ssh_connections):
+    """
+    Tests that a pooled connection handed out under another name can be found under that name.
+    """
+    manager = SSHConnectionManagerClass()
+    first_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password", name="controller-0")
+    second_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password", name="active_controller")
+
+    assert second_connection is first_connection
+    assert manager.get_ssh_connection("active_controller") is first_connection
+    manager.remove_ssh_connection("active_controller")
+    assert manager.get_ssh_connection("controller-0") is None
+
+
+def test_create_ssh_connection_evicts_idle_connections(offline_ssh_connections):
+    """
+    Tests that pooled connections unused for longer than the idle timeout are closed once they are no longer checked out.
+    """
+    manager = SSHConnectionManagerClass(idle_timeout=60)
+    worker_connections = []
+    thread = threading.Thread(target=lambda: worker_connections.append(manager.create_ssh_connection("10.0.0.1", "sysadmin", "password")))
+    thread.start()
+    thread.join()
+    worker_connections[0].last_used_time -= 120
+
+    main_thread_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password")
+
+    assert main_thread_connection is not worker_connections[0]
+    assert not worker_connections[0].is_connected
+    assert len(manager.ssh_connection_list) == 1
+
+
+def test_create_ssh_connection_keeps_idle_checked_out_connection(offline_ssh_connections):
+    """
+    Tests that an idle connection still checked out by its thread is neither closed nor forgotten by the eviction.
+    """
+    manager = SSHConnectionManagerClass(idle_timeout=60)
+    main_thread_connection = manager.create_ssh_connection("10.0.0.1", "sysadmin", "password", name="controller-0")
+    main_thread_connection.last_used_time -= 120
+
+    manager.create_ssh_connection("10.0.0.2", "sysadmin", "password")
+
+    assert main_thread_connection.is_connected
+    assert manager.get_ssh_connection("controller-0") is main_thread_connection
+    assert manager.create_ssh_connection("10.0.0.1", "sysadmin", "password") is main_thread_connection
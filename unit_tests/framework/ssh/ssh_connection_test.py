@@ -0,0 +1,157 @@
+import gzip
+from unittest.mock import Mock, patch
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from framework.ssh.prompt_response import PromptResponse
+from framework.ssh.ssh_connection import SSHConnection
+
+
+def test_parse_batch_output():
+    """
+    Tests that the output of a batch script is split per command, with the return code and duration of each command.
+    """
+    raw_output = "line 1\nline 2\n\nSENTINEL 0 1500000000\n\nSENTINEL 2 1000\nno line break\nSENTINEL 0 5\n"
+
+    results = SSHConnection._parse_batch_output(["cat file", "false", "printf 'no line break'"], raw_output, "SENTINEL")
+
+    assert [result.get_output() for result in results] == [["line 1\n", "line 2\n"], [], ["no line break"]]
+    assert [result.get_return_code() for result in results] == [0, 2, 0]
+    assert results[0].get_duration() == 1.5
+
+
+def test_parse_batch_output_interrupted():
+    """
+    Tests that the commands that didn't complete in an interrupted batch have no return code.
+    """
+    raw_output = "first\n\nSENTINEL 0 10\npartial output"
+
+    results = SSHConnection._parse_batch_output(["echo first", "long command", "never run"], raw_output, "SENTINEL")
+
+    assert results[0].get_return_code() == 0
+    assert results[1].get_output() == ["partial output"]
+    assert results[1].get_return_code() is None
+    assert results[2].get_output() == []
+    assert results[2].get_return_code() is None
+
+
+def test_build_batch_script_isolates_commands():
+    """
+    Tests that every command of a batch runs in its own subshell, with stdin closed, followed by its sentinel line.
+    """
+    script = SSHConnection._build_batch_script(["cd /tmp", "uname -a"], "SENTINEL")
+
+    assert "( cd /tmp\n) < /dev/null\n" in script
+    assert "( uname -a\n) < /dev/null\n" in script
+    assert script.count("'SENTINEL'") == 2
+
+
+def _get_streaming_connection(chunks: list, exit_status: int = 0) -> tuple[SSHConnection, Mock]:
+    """
+    Gets an SSHConnection whose client returns the given chunks of output.
+
+    Args:
+        chunks (list): The chunks of bytes returned by successive reads of the channel.
+        exit_status (int): The exit status of the command.
+
+    Returns:
+        tuple[SSHConnection, Mock]: The connection and the mocked channel.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+
+    channel = Mock()
+    channel.recv.side_effect = list(chunks) + [b""]
+    channel.recv_exit_status.return_value = exit_status
+    stdout = Mock(channel=channel)
+
+    ssh_connection = SSHConnection("test", "host", "user", "password")
+    ssh_connection.is_connected = True
+    ssh_connection.client = Mock()
+    ssh_connection.client.exec_command.return_value = (Mock(), stdout, Mock())
+    return ssh_connection, channel
+
+
+def test_send_stream_yields_lines_across_chunks():
+    """
+    Tests that lines split across reads, including multibyte characters, are yielded whole and in readlines() format.
+    """
+    ssh_connection, channel = _get_streaming_connection([b"first li", b"ne\nsecond \xc3", b"\xa9\nno line break"], exit_status=3)
+
+    lines = list(ssh_connection.send_stream("cmd"))
+
+    assert lines == ["first line\n", "second é\n", "no line break"]
+    assert ssh_connection.get_return_code() == 3
+    channel.close.assert_not_called()
+
+
+def test_send_stream_filters_and_stops_early():
+    """
+    Tests the line filter and that the channel is closed once the stop condition is met.
+    """
+    ssh_connection, channel = _get_streaming_connection([b"| a |\nskipped\n| b |\n| c |\n"])
+
+    lines = list(ssh_connection.send_stream("cmd", line_filter=lambda line: "|" in line, stop_when=lambda line: "b" in line))
+
+    assert lines == ["| a |\n", "| b |\n"]
+    assert ssh_connection.get_return_code() is None
+    channel.close.assert_called_once()
+
+
+def test_send_stream_gunzip_output():
+    """
+    Tests that compressed output is decompressed as it arrives.
+    """
+    compressed = gzip.compress("first line\nsecond line\n".encode())
+    ssh_connection, _ = _get_streaming_connection([compressed[:10], compressed[10:]])
+
+    lines = list(ssh_connection.send_stream("cmd | gzip -c", gunzip_output=True))
+
+    assert lines == ["first line\n", "second line\n"]
+
+
+def test_send_stream_max_bytes():
+    """
+    Tests that reading stops once max_bytes of output have been received.
+    """
+    ssh_connection, channel = _get_streaming_connection([b"one\n", b"two\n", b"three\n"])
+
+    lines = list(ssh_connection.send_stream("cmd", max_bytes=8))
+
+    assert lines == ["one\n", "two\n"]
+    channel.close.assert_called_once()
+
+
+def test_send_expect_prompts_decodes_across_reads():
+    """
+    Tests that the prompts are matched in order, with multibyte characters and ANSI codes split across reads.
+    """
+    ssh_connection, _ = _get_streaming_connection([])
+    channel = Mock()
+    channel.recv_ready.return_value = True
+    channel.send_ready.return_value = True
+    channel.recv.side_effect = [b"[sudo] pass", b"word for user: ", b"r\xc3", b"\xa9sult \x1b[0m\r\nuser@", b"host:~$ "]
+    ssh_connection.client.invoke_shell.return_value = channel
+
+    output = ssh_connection._send_expect_prompts("sudo cmd", [PromptResponse("assword", "secret"), PromptResponse("@")])
+
+    assert output == ["résult \n", "user@\n"]
+    assert ssh_connection.get_return_code() == 0
+    channel.send.assert_any_call("secret")
+
+
+def test_send_stream_reconnects_until_command_starts():
+    """
+    Tests that a streamed command whose start fails on a dropped connection is started again after reconnecting.
+    """
+    ssh_connection, _ = _get_streaming_connection([b"line\n"])
+    stdout = ssh_connection.client.exec_command.return_value
+    ssh_connection.client.exec_command.side_effect = [EOFError("connection dropped"), stdout]
+    ssh_connection.connect = Mock(return_value=True)
+
+    with patch("framework.ssh.ssh_connection.time.sleep"):
+        lines = list(ssh_connection.send_stream("cmd"))
+
+    assert lines == ["line\n"]
+    assert ssh_connection.client.exec_command.call_count == 2
+    ssh_connection.connect.assert_called_once()
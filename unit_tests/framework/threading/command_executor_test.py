@@ -0,0 +1,53 @@
+import threading
+import time
+
+import pytest
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from framework.threading.command_executor import CommandExecutor
+
+
+def test_command_executor_reuses_workers():
+    """
+    Tests that consecutive commands are executed by the same long-lived worker thread.
+    """
+    command_executor = CommandExecutor("test_executor", num_threads=1)
+
+    first_thread = command_executor.execute("Command", 5, threading.get_ident)
+    second_thread = command_executor.execute("Command", 5, threading.get_ident)
+
+    assert first_thread == second_thread
+    assert first_thread != threading.get_ident()
+    assert command_executor.get_commands_issued() == 2
+    assert command_executor.get_commands_queued() == 0
+    command_executor.shutdown()
+
+
+def test_command_executor_runs_nested_commands_inline():
+    """
+    Tests that a command sent from inside a worker doesn't wait for a second worker.
+    """
+    command_executor = CommandExecutor("test_executor", num_threads=1)
+
+    def outer_command():
+        return command_executor.execute("Inner", 5, lambda: "inner result")
+
+    assert command_executor.execute("Outer", 5, outer_command) == "inner result"
+    assert command_executor.get_commands_issued() == 1
+    command_executor.shutdown()
+
+
+def test_command_executor_timeout():
+    """
+    Tests that a command exceeding its deadline raises a TimeoutError and is counted.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    command_executor = CommandExecutor("test_executor", num_threads=1)
+
+    with pytest.raises(TimeoutError):
+        command_executor.execute("Slow", 0.05, time.sleep, 0.5)
+
+    assert command_executor.get_commands_timed_out() == 1
+    command_executor.shutdown()
@@ -0,0 +1,112 @@
+import threading
+import time
+
+import pytest
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from framework.threading.fan_out_executor import FanOutExecutor
+
+
+def test_fan_out_executor_names_threads_after_targets():
+    """
+    Tests that each target runs in a thread named after it and that the results are returned per target.
+    """
+    fan_out_executor = FanOutExecutor(max_concurrency=2)
+    targets = {"controller-0": 0, "controller-1": 1, "compute-0": 2}
+
+    results = fan_out_executor.execute(targets, lambda target, offset: (threading.current_thread().name, target + offset), 10)
+
+    assert list(results.keys()) == list(targets.keys())
+    for target_name, target in targets.items():
+        assert results[target_name].is_success()
+        assert results[target_name].get_result() == (target_name, target + 10)
+
+
+def test_fan_out_executor_bounds_concurrency():
+    """
+    Tests that no more than max_concurrency targets run at the same time.
+    """
+    lock = threading.Lock()
+    running = [0]
+    max_running = [0]
+
+    def function_to_execute(target):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+
+    FanOutExecutor(max_concurrency=2).execute({f"host-{index}": index for index in range(6)}, function_to_execute)
+
+    assert max_running[0] == 2
+
+
+def test_fan_out_executor_aggregates_failures():
+    """
+    Tests that a failing target doesn't prevent the others from completing, and that all the failures are reported.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+
+    def function_to_execute(target):
+        if target % 2:
+            raise ValueError(f"failure on {target}")
+        return target
+
+    targets = {f"host-{index}": index for index in range(4)}
+    results = FanOutExecutor().execute(targets, function_to_execute, raise_on_failure=False)
+
+    assert [result.get_result() for result in results.values() if result.is_success()] == [0, 2]
+    assert isinstance(results["host-1"].get_exception(), ValueError)
+    assert "failure on 1" in results["host-1"].get_traceback()
+
+    with pytest.raises(AssertionError, match="2 of 4 targets: host-1, host-3"):
+        FanOutExecutor().execute(targets, function_to_execute)
+
+
+def test_fan_out_executor_deadline_per_target():
+    """
+    Tests that a slow target is reported as timed out while the queued targets still get their own deadline.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+
+    fan_out_executor = FanOutExecutor(max_concurrency=1, timeout_per_target=0.2)
+    results = fan_out_executor.execute({"fast-0": 0.05, "fast-1": 0.05, "slow": 1, "fast-2": 0.05}, time.sleep, raise_on_failure=False)
+
+    assert results["fast-0"].is_success()
+    assert results["fast-1"].is_success()
+    assert results["slow"].is_timed_out
+    assert isinstance(results["slow"].get_exception(), TimeoutError)
+    assert results["fast-2"].is_timed_out
+    assert "did not start" in str(results["fast-2"].get_exception())
+
+
+def test_fan_out_executor_timed_out_target_keeps_its_slot():
+    """
+    Tests that a timed out target keeps its concurrency slot while its thread is still running.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    lock = threading.Lock()
+    running = [0]
+    max_running = [0]
+
+    def function_to_execute(duration: float):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        time.sleep(duration)
+        with lock:
+            running[0] -= 1
+
+    fan_out_executor = FanOutExecutor(max_concurrency=2, timeout_per_target=0.2)
+    results = fan_out_executor.execute({"slow": 0.6, "fast-0": 0.05, "fast-1": 0.05, "fast-2": 0.05}, function_to_execute, raise_on_failure=False)
+    time.sleep(0.6)
+
+    assert results["slow"].is_timed_out
+    assert all(results[target_name].is_success() for target_name in ["fast-0", "fast-1", "fast-2"])
+    assert max_running[0] == 2
@@ -1,10 +1,17 @@
+import random
+from unittest.mock import patch
+
 import pytest
 
 from config.configuration_file_locations_manager import (
     ConfigurationFileLocationsManager,
 )
 from config.configuration_manager import ConfigurationManager
+from framework.exceptions.validation_failure_error import ValidationFailureError
+from framework.validation.polling_metrics import PollingMetricsClass
+from framework.validation.polling_policy import PollingPolicy
 from framework.validation.validation import (
+    validate_equals_with_retry,
     validate_not_equals,
     validate_str_contains,
     validate_str_contains_with_retry,
@@ -88,3 +95,67 @@ def test_validate_not_equals_list():
     list2 = ["success", "unsuccessful"]
 
     validate_not_equals(list1, list2, "Test that the lists are not equal")
+
+
+def test_polling_policy_sleep_times():
+    """
+    Tests the fast polls, the backoff within its bounds and the sleeps clamped to the deadline.
+    """
+    polling_policy = PollingPolicy(polling_sleep_time=5, backoff_factor=2, max_polling_sleep_time=30, fast_polls=2, fast_polling_sleep_time=1)
+
+    assert [polling_policy.get_sleep_time(attempt, 1000) for attempt in range(1, 8)] == [1, 1, 5, 10, 20, 30, 30]
+    assert polling_policy.get_sleep_time(5, 12.5) == 12.5
+
+    jittered_policy = PollingPolicy(polling_sleep_time=10, backoff_factor=2, max_polling_sleep_time=60, jitter=0.5)
+    assert all(10 <= jittered_policy.get_sleep_time(2, 1000) <= 30 for _ in range(100))
+
+
+def test_polling_policy_jitter_shortens_first_backoff_sleep():
+    """
+    Tests that the jitter also shortens the sleeps that are at the polling_sleep_time bound.
+    """
+    jittered_policy = PollingPolicy(polling_sleep_time=10, backoff_factor=2, max_polling_sleep_time=60, jitter=0.5)
+
+    with patch("framework.validation.polling_policy.random", random.Random(42)):
+        sleep_times = [jittered_policy.get_sleep_time(1, 1000) for _ in range(100)]
+
+    assert all(5 <= sleep_time <= 15 for sleep_time in sleep_times)
+    assert any(sleep_time < 10 for sleep_time in sleep_times)
+    assert any(sleep_time > 10 for sleep_time in sleep_times)
+
+
+def test_validate_equals_with_retry_polling():
+    """
+    Tests that the polling backs off, never sleeps past the timeout, only logs the observed value when it changes, and records its metrics.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    clock = {"now": 0.0}
+    sleeps = []
+
+    def fake_sleep(sleep_time: float):
+        sleeps.append(sleep_time)
+        clock["now"] += sleep_time
+
+    polling_metrics = PollingMetricsClass()
+    with patch("framework.validation.validation.time") as fake_time, patch("framework.validation.validation.sleep", fake_sleep), patch("framework.validation.validation.PollingMetrics", polling_metrics), patch("framework.validation.validation.get_logger") as get_logger:
+        fake_time.monotonic.side_effect = lambda: clock["now"]
+
+        observed_values = iter(["degraded", "degraded", "degraded", "available"])
+        polling_policy = PollingPolicy(polling_sleep_time=5, backoff_factor=2)
+        assert validate_equals_with_retry(lambda: next(observed_values), "available", "host is available", timeout=60, polling_policy=polling_policy) == "available"
+        assert sleeps == [5, 10, 20]
+        observed_logs = [call.args[0] for call in get_logger.return_value.log_info.call_args_list if call.args[0].startswith("Observed")]
+        assert observed_logs == ["Observed: degraded - retrying in 5.0s (attempt 1)"]
+
+        sleeps.clear()
+        with pytest.raises(TimeoutError):
+            validate_equals_with_retry(lambda: "degraded", "available", "host is available", timeout=12, polling_sleep_time=5)
+        assert sleeps == [5, 5, 2]
+
+        with pytest.raises(ValidationFailureError):
+            validate_equals_with_retry(lambda: "failed", "available", "host is available", failure_values=["failed"])
+
+    polling_metric = polling_metrics.get_polling_metrics()["host is available"]
+    assert (polling_metric["calls"], polling_metric["attempts"], polling_metric["success"], polling_metric["timeout"], polling_metric["failure"]) == (3, 9, 1, 1, 1)
+    assert polling_metric["max_seconds_to_success"] == 35
@@ -0,0 +1,90 @@
+"""Unit tests for the streaming, mergeable and cached cyclictest histogram."""
+
+import os
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from keywords.cloud_platform.cyclictest.objects.cyclictest_histogram_object import CyclictestHistogramObject
+from keywords.cloud_platform.cyclictest.objects.cyclictest_statistics_object import CyclictestStatisticsObject
+
+HIST_FILE_CONTENT = """# Histogram
+000000 000000 000000 000000
+000001 000005 000002 000007
+000002 000001 000004 000005
+000004 000000 000001 000001
+# Total: 000000006 000000007 000000013
+# Min Latencies: 00001 00001
+# Histogram Overflows: 00000 00003 00003
+"""
+
+
+def test_from_hist_file_parses_and_caches(tmp_path):
+    """
+    Tests that the histogram is parsed into per-thread counts, and loaded from its cache afterwards.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    hist_file = tmp_path / "hist-file.txt"
+    hist_file.write_text(HIST_FILE_CONTENT)
+
+    histogram = CyclictestHistogramObject.from_hist_file(str(hist_file))
+    assert histogram.get_num_threads() == 2
+    assert list(histogram.get_thread_counts(0)) == [0, 5, 1]
+    assert list(histogram.get_thread_counts(1)) == [0, 2, 4, 0, 1]
+    assert [histogram.get_thread_overflows(0), histogram.get_thread_overflows(1)] == [0, 3]
+    assert os.path.isfile(f"{hist_file}.cache")
+
+    cached_histogram = CyclictestHistogramObject.load_cache(str(hist_file))
+    assert list(cached_histogram.get_thread_counts(0)) == [0, 5, 1, 0, 0]
+    assert list(cached_histogram.get_thread_counts(1)) == [0, 2, 4, 0, 1]
+    assert cached_histogram.get_thread_overflows(1) == 3
+    assert CyclictestHistogramObject.load_cache(str(hist_file), histofall_mode=False) is None
+    assert CyclictestHistogramObject.from_hist_file(str(hist_file), histofall_mode=False).get_num_threads() == 3
+
+    stats = CyclictestStatisticsObject.from_hist_file(str(hist_file)).calculate_statistics()
+    assert stats.get_num_threads() == 2
+    assert stats.get_maximum() == 4
+    assert stats.get_median() == 1
+    assert stats.get_num_overflows() == 3
+
+    hist_file.write_text(HIST_FILE_CONTENT.replace("000004 000000 000001", "000004 000000 000002"))
+    assert CyclictestHistogramObject.load_cache(str(hist_file)) is None
+
+
+def test_merge_histograms():
+    """
+    Tests that histograms are merged thread by thread for chunks of a run, or as new threads for other hosts.
+    """
+    chunk = CyclictestHistogramObject.from_lines("chunk-0", HIST_FILE_CONTENT.splitlines())
+    other_chunk = CyclictestHistogramObject.from_lines("chunk-1", ["000007 000002 000000 000002"])
+
+    chunk.merge(other_chunk)
+    assert chunk.get_num_threads() == 2
+    assert list(chunk.get_thread_counts(0)) == [0, 5, 1, 0, 0, 0, 0, 2]
+    assert chunk.get_source() == "chunk-0+chunk-1"
+
+    chunk.merge(other_chunk, append_threads=True)
+    assert chunk.get_num_threads() == 4
+    assert list(chunk.get_thread_counts(2)) == [0, 0, 0, 0, 0, 0, 0, 2]
+
+
+def test_cache_is_keyed_on_histofall_mode(tmp_path):
+    """
+    Tests that a cache written in one histofall mode is rejected in the other, and that a cache that can't be written is skipped.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    hist_file = tmp_path / "hist-file.txt"
+    hist_file.write_text(HIST_FILE_CONTENT)
+
+    histogram = CyclictestHistogramObject.from_hist_file(str(hist_file), histofall_mode=False)
+    assert CyclictestHistogramObject.load_cache(str(hist_file), histofall_mode=False).get_num_threads() == 3
+    assert CyclictestHistogramObject.load_cache(str(hist_file), histofall_mode=True) is None
+    assert CyclictestHistogramObject.from_hist_file(str(hist_file), histofall_mode=True).get_num_threads() == 2
+
+    # A directory in the way of the cache file makes writing it fail like a read-only directory would
+    unwritable_hist_file = tmp_path / "unwritable-hist-file.txt"
+    unwritable_hist_file.write_text(HIST_FILE_CONTENT)
+    os.mkdir(f"{unwritable_hist_file}.cache")
+    assert histogram.save_cache(str(unwritable_hist_file), histofall_mode=False) is None
+    assert CyclictestHistogramObject.from_hist_file(str(unwritable_hist_file), histofall_mode=False).get_num_threads() == 3
@@ -0,0 +1,65 @@
+"""Unit tests for the histogram-based cyclictest statistics."""
+
+import random
+import statistics
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from keywords.cloud_platform.cyclictest.objects.cyclictest_statistics_object import CyclictestStatisticsObject
+from keywords.cloud_platform.cyclictest.objects.cyclictest_thread_data_object import CyclictestThreadDataObject
+
+
+def _get_thread_data(thread_num: int, histogram: dict) -> CyclictestThreadDataObject:
+    """
+    Build the data of a thread from its histogram.
+
+    Args:
+        thread_num (int): Thread index.
+        histogram (dict): Sample count by delay.
+
+    Returns:
+        CyclictestThreadDataObject: The thread data.
+    """
+    thread_data = CyclictestThreadDataObject(thread_num)
+    for delay, count in histogram.items():
+        thread_data.append(delay, count)
+    return thread_data
+
+
+def test_statistics_match_expanded_samples():
+    """
+    Tests that the statistics computed from the bucket counts are the ones of the expanded samples.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    random_generator = random.Random(7)
+    histograms = [{delay: random_generator.randint(0, 50) for delay in range(1, 40)} for _ in range(3)]
+    histograms[2] = {1: 3, 2: 1}
+
+    stats = CyclictestStatisticsObject("test.hist", [_get_thread_data(index, histogram) for index, histogram in enumerate(histograms)]).calculate_statistics()
+
+    all_samples = sorted(delay for histogram in histograms for delay, count in histogram.items() for _ in range(count))
+    assert stats.get_median() == int(statistics.median(all_samples))
+    assert stats.get_maximum() == all_samples[-1]
+    assert stats.get_average() == sum(all_samples) // len(all_samples)
+    assert stats.get_percentile_value(50) == all_samples[(len(all_samples) + 1) // 2 - 1]
+    assert stats.get_percentile_value(100) == all_samples[-1]
+
+    for thread_data, histogram in zip(stats.get_thread_data(), histograms):
+        samples = sorted(delay for delay, count in histogram.items() for _ in range(count))
+        assert list(thread_data.get_elements()) == samples
+        assert thread_data.get_median() == int(statistics.median(samples))
+        assert thread_data.get_percentile() == samples[-int(len(samples) / 1_000_000) - 1]
+
+
+def test_six_nines_percentile_throws_away_largest_samples():
+    """
+    Tests that the six-nines percentile ignores one sample per million, even with a single huge bucket.
+    """
+    thread_data = _get_thread_data(0, {10: 2_999_990, 20: 7, 500: 3}).calculate_statistics()
+
+    assert thread_data.get_num_samples() == 3_000_000
+    assert thread_data.get_maximum() == 500
+    assert thread_data.get_percentile() == 20
+    assert thread_data.get_percentile_value(99.9) == 10
+    assert thread_data.get_median() == 10
@@ -0,0 +1,90 @@
+"""Unit tests for the single-pass reads of FileKeywords."""
+
+import gzip
+import subprocess
+from unittest.mock import NonCallableMock
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from keywords.files.file_keywords import FileKeywords
+
+
+def _run_locally(cmd: str, command_timeout: int, log_output: bool, gunzip_output: bool) -> iter:
+    """
+    Run a streamed command in a local shell.
+
+    Args:
+        cmd (str): The command.
+        command_timeout (int): Ignored.
+        log_output (bool): Ignored.
+        gunzip_output (bool): True if the output of the command is compressed.
+
+    Returns:
+        iter: The output lines.
+    """
+    output = subprocess.run(["bash", "-c", cmd], capture_output=True).stdout
+    if gunzip_output:
+        output = gzip.decompress(output)
+    return iter(output.decode().splitlines(keepends=True))
+
+
+def _get_file_keywords() -> FileKeywords:
+    """
+    Get FileKeywords on a mocked SSH connection running the streamed commands in a local shell.
+
+    Returns:
+        FileKeywords: The keywords.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    ssh_connection = NonCallableMock()
+    ssh_connection.use_ssh_pass = False
+    ssh_connection.send_stream.side_effect = _run_locally
+    return FileKeywords(ssh_connection)
+
+
+def test_read_large_file_in_one_pass(tmp_path):
+    """
+    Tests that the whole file is read and filtered with a single compressed command, last line included.
+    """
+    log_file = tmp_path / "user.log"
+    log_file.write_text("".join(f"ptp4l line {index}\nother line {index}\n" for index in range(5000)) + "ptp4l last")
+    file_keywords = _get_file_keywords()
+
+    output = file_keywords.read_large_file(str(log_file), "ptp4l")
+
+    assert file_keywords.ssh_connection.send_stream.call_count == 1
+    assert len(output) == 5001
+    assert output[0] == "ptp4l line 0\n"
+    assert output[-1] == "ptp4l last\n"
+
+
+def test_stream_file_resumes_from_offset(tmp_path):
+    """
+    Tests that a read resumed from the end offset of the previous one only gets the appended lines, whole.
+    """
+    log_file = tmp_path / "user.log"
+    log_file.write_text("line 1\nline 2\nline")
+    file_keywords = _get_file_keywords()
+
+    stream = file_keywords.stream_file(str(log_file))
+    assert list(stream) == ["line 1\n", "line 2\n"]
+    assert stream.get_end_offset() == len("line 1\nline 2\n")
+
+    with open(log_file, "a") as log:
+        log.write(" 3\nline 4\n")
+    stream = file_keywords.stream_file(str(log_file), start_offset=stream.get_end_offset())
+    assert list(stream) == ["line 3\n", "line 4\n"]
+
+    log_file.write_text("rotated\n")
+    stream = file_keywords.stream_file(str(log_file), start_offset=stream.get_end_offset(), file_id=stream.get_file_id())
+    assert stream.get_start_offset() == 0
+    assert list(stream) == ["rotated\n"]
+
+    # A file replaced by a longer one is read from its beginning too
+    new_log_file = tmp_path / "user.log.new"
+    new_log_file.write_text("new line 1\nnew line 2\n")
+    new_log_file.rename(log_file)
+    stream = file_keywords.stream_file(str(log_file), start_offset=stream.get_end_offset(), file_id=stream.get_file_id())
+    assert stream.get_start_offset() == 0
+    assert list(stream) == ["new line 1\n", "new line 2\n"]
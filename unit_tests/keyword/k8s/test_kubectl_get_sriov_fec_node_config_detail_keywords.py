@@ -19,9 +19,6 @@ SAMPLE_VFIO_JSON = '{"apiVersion":"sriovfec.intel.com/v2","kind":"SriovFecNodeCo
 def build_mock_ssh_connection(return_value: str) -> NonCallableMagicMock:
     """Build a non-callable mocked SSH connection.
 
-    A non-callable mock is required because BaseKeyword.__getattribute__ wraps
-    callable attributes with its keyword-logging hook.
-
     Args:
         return_value (str): The value the mocked send() should return.
 
@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock, patch
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from framework.logging.keyword_timings import KeywordTimingsClass
+from keywords.base_keyword import BaseKeyword
+
+
+class PollingKeywords(BaseKeyword):
+    """
+    Keywords to trace.
+    """
+
+    def __init__(self, ssh_connection: MagicMock):
+        """
+        Constructor
+
+        Args:
+            ssh_connection (MagicMock): A callable field, which must not be traced.
+        """
+        self.ssh_connection = ssh_connection
+
+    def get_status(self, node_name: str, attempts: int = 1) -> str:
+        """
+        A public keyword, calling a private helper.
+
+        Args:
+            node_name (str): the node name
+            attempts (int): the number of attempts
+
+        Returns:
+            str: the status
+        """
+        return self._read_status(node_name)
+
+    def _read_status(self, node_name: str) -> str:
+        """
+        A private helper, which is not traced.
+
+        Args:
+            node_name (str): the node name
+
+        Returns:
+            str: the status
+        """
+        return f"{node_name} available"
+
+
+def test_keyword_methods_are_traced_once_per_class():
+    """
+    Tests that public keyword methods are logged and timed, while fields and private helpers are left alone, and that the arguments are not formatted when no log would take them.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    keyword_timings = KeywordTimingsClass()
+    keyword_timings.set_enabled(True)
+    polling_keywords = PollingKeywords(MagicMock())
+
+    with patch.object(BaseKeyword, "on_every_keyword") as on_every_keyword, patch("keywords.base_keyword.KeywordTimings", keyword_timings):
+        polling_keywords.ssh_connection.send("uptime")
+        assert polling_keywords.get_status("controller-0", attempts=3) == "controller-0 available"
+        on_every_keyword.assert_called_once_with("get_status", "controller-0", attempts=3)
+
+        with patch("keywords.base_keyword.get_logger") as get_logger:
+            get_logger.return_value.is_level_logged.return_value = False
+            polling_keywords.get_status("controller-1")
+        on_every_keyword.assert_called_once()
+
+    assert PollingKeywords.get_status.__name__ == "get_status"
+    assert keyword_timings.get_keyword_timings()["PollingKeywords.get_status"]["calls"] == 2
+    assert list(keyword_timings.get_keyword_timings()) == ["PollingKeywords.get_status"]
@@ -0,0 +1,105 @@
+"""Unit tests for LogScanKeywords and the scan index used by LogPatternKpiKeywords."""
+
+import gzip
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import NonCallableMock
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from keywords.kpi.log_pattern_kpi_keywords import LogPatternKpiKeywords
+from keywords.kpi.log_scan_keywords import LogScanKeywords
+
+LOG_LINES = [
+    "sysinv 2024-01-06 12:30:45.123 unlock requested",
+    "2024-01-06T12:30:50.000 mtcAgent: host it's enabling",
+    "2024-01-06T12:31:10.500 mtcAgent: host enabled",
+    "2024-01-06T12:32:00.000 mtcAgent: host enabled again",
+]
+
+
+def _get_local_ssh_connection() -> NonCallableMock:
+    """
+    Get a mocked SSH connection running the streamed commands in a local shell.
+
+    Returns:
+        NonCallableMock: The SSH connection (keywords wrap the callable attributes).
+    """
+    ssh_connection = NonCallableMock()
+    ssh_connection.send_stream.side_effect = lambda cmd, command_timeout: iter(subprocess.run(["bash", "-c", cmd], capture_output=True, text=True).stdout.splitlines(keepends=True))
+    return ssh_connection
+
+
+def _write_logs(logs_dir: Path) -> None:
+    """
+    Write a plain and a compressed copy of the test log.
+
+    Args:
+        logs_dir (Path): The directory in which the logs are written.
+    """
+    (logs_dir / "mtcAgent.log").write_text("\n".join(LOG_LINES) + "\n")
+    with gzip.open(logs_dir / "mtcAgent.log.1.gz", "wt") as compressed_log:
+        compressed_log.write("\n".join(LOG_LINES[:2]) + "\n")
+
+
+def test_scan_files_tags_matches_in_one_pass(tmp_path):
+    """
+    Tests that every file, compressed or not, is scanned for every literal and regex pattern with a single command.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    _write_logs(tmp_path)
+    ssh_connection = _get_local_ssh_connection()
+
+    patterns = [("host enabled", False), ("it's", False), (r"unlock re[a-z]+", True)]
+    scan_index = LogScanKeywords(ssh_connection).scan_files(str(tmp_path), ["mtcAgent.log", "mtcAgent.log.1.gz", "missing.log"], patterns)
+
+    assert ssh_connection.send_stream.call_count == 1
+    assert scan_index.get_matches("mtcAgent.log", "host enabled", False) == [(3, LOG_LINES[2]), (4, LOG_LINES[3])]
+    assert scan_index.get_matches("mtcAgent.log", "host enabled", False, after_line=3) == [(4, LOG_LINES[3])]
+    assert scan_index.get_matches("mtcAgent.log.1.gz", "it's", False) == [(2, LOG_LINES[1])]
+    assert scan_index.get_matches("mtcAgent.log.1.gz", r"unlock re[a-z]+", True) == [(1, LOG_LINES[0])]
+    assert scan_index.get_matches("missing.log", "host enabled", False) == []
+    assert scan_index.get_matches("mtcAgent.log", "not scanned", False) is None
+
+
+def test_blocks_resolved_on_scan_index(tmp_path):
+    """
+    Tests that the patterns of the blocks are resolved on the scan index without any per pattern SSH command.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    _write_logs(tmp_path)
+    ssh_connection = _get_local_ssh_connection()
+
+    kpi_keywords = LogPatternKpiKeywords(ssh_connection)
+    blocks = [{"label": "ENABLE", "file": ["mtcAgent.log.1.gz", "mtcAgent.log"], "start": "unlock requested", "stop": "host enabled"}]
+    kpi_keywords.scan_index = kpi_keywords._scan_block_files(blocks, str(tmp_path), pair_mode=True)
+
+    start_result = kpi_keywords._find_pattern_lpmp_style(str(tmp_path), blocks[0]["file"], "unlock requested", None, False, "ENABLE")
+    stop_result = kpi_keywords._find_pattern_lpmp_style(str(tmp_path), blocks[0]["file"], "host enabled", datetime(2024, 1, 6, 12, 31), False, "ENABLE")
+    sequential_result = kpi_keywords._find_pattern_in_files(str(tmp_path), ["mtcAgent.log"], "host enabled", 2, None, False, True, "ENABLE")
+
+    assert start_result == (datetime(2024, 1, 6, 12, 30, 45, 123000), LOG_LINES[0], "mtcAgent.log.1.gz")
+    assert stop_result == (datetime(2024, 1, 6, 12, 31, 10, 500000), LOG_LINES[2], "mtcAgent.log")
+    assert sequential_result[0] == datetime(2024, 1, 6, 12, 31, 10, 500000)
+    ssh_connection.send.assert_not_called()
+
+
+def test_scan_files_keeps_grep_semantics(tmp_path):
+    """
+    Tests that the regex patterns support the GNU grep extensions, and that the literal patterns match their special characters literally.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    (tmp_path / "sm.log").write_text("host controller-0 go-active\nhost controller-00 disabled\nstate (x.y) active active\nabc\n")
+    ssh_connection = _get_local_ssh_connection()
+
+    patterns = [(r"\bcontroller-0\b\s\w+", True), (r"(active) \1$", True), ("(x.y)", False), ("^abc", False)]
+    scan_index = LogScanKeywords(ssh_connection).scan_files(str(tmp_path), ["sm.log"], patterns)
+
+    assert scan_index.get_matches("sm.log", r"\bcontroller-0\b\s\w+", True) == [(1, "host controller-0 go-active")]
+    assert scan_index.get_matches("sm.log", r"(active) \1$", True) == [(3, "state (x.y) active active")]
+    assert scan_index.get_matches("sm.log", "(x.y)", False) == [(3, "state (x.y) active active")]
+    assert scan_index.get_matches("sm.log", "^abc", False) == []
@@ -0,0 +1,126 @@
+"""Unit tests for RemoteLogTailer and its use by KpiExtractor."""
+
+import subprocess
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock
+
+from config.configuration_file_locations_manager import ConfigurationFileLocationsManager
+from config.configuration_manager import ConfigurationManager
+from keywords.system_test.kpi_extractor import KpiExtractor
+from keywords.system_test.remote_log_tailer import RemoteLogTailer
+
+TIMESTAMP_PATTERN = r"(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3})"
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+
+def _get_local_ssh_connection() -> Mock:
+    """
+    Get a mocked SSH connection running the streamed commands in a local shell.
+
+    Returns:
+        Mock: The SSH connection.
+    """
+    ssh_connection = Mock()
+    ssh_connection.send_stream.side_effect = lambda cmd, command_timeout, log_output, gunzip_output: iter(subprocess.run(["bash", "-c", cmd], capture_output=True, text=True).stdout.splitlines(keepends=True))
+    ssh_connection.send.side_effect = lambda cmd: subprocess.run(["bash", "-c", cmd], capture_output=True, text=True).stdout.splitlines(keepends=True)
+    return ssh_connection
+
+
+def _append(log_file: Path, text: str) -> None:
+    """
+    Append text to the log file.
+
+    Args:
+        log_file (Path): The log file.
+        text (str): The text to append.
+    """
+    with open(log_file, "a") as log:
+        log.write(text)
+
+
+def test_refresh_only_indexes_appended_lines(tmp_path):
+    """
+    Tests that each refresh only fetches the new bytes, and waits for the line break before indexing the last line.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    log_file = tmp_path / "mtcAgent.log"
+    _append(log_file, "2024-01-06T12:30:45.123 controller-1 Lock Action\nno timestamp\n2024-01-06T12:30:50.000 controller-1 locked-dis")
+    log_tailer = RemoteLogTailer(_get_local_ssh_connection(), str(log_file), TIMESTAMP_PATTERN, TIMESTAMP_FORMAT)
+
+    assert log_tailer.refresh() == 1
+    assert log_tailer.find_last("controller-1 locked-disabled-online") is None
+
+    _append(log_file, "abled-online\n2024-01-06T12:30:49.000 controller-1 late line\n")
+    assert log_tailer.refresh() == 2
+    assert log_tailer.offset == log_file.stat().st_size
+    assert log_tailer.find_last("controller-1 locked-disabled-online") == (datetime(2024, 1, 6, 12, 30, 50), "2024-01-06T12:30:50.000 controller-1 locked-disabled-online")
+    assert [line[24:] for line in log_tailer.lines] == ["controller-1 Lock Action\nno timestamp", "controller-1 late line", "controller-1 locked-disabled-online"]
+
+    _append(log_file, "2024-01-06T12:31:00.000 controller-1 Lock Action\n")
+    log_tailer.refresh()
+    assert log_tailer.find_last("controller-1 Lock Action")[0] == datetime(2024, 1, 6, 12, 31)
+    assert log_tailer.find_last("controller-0") is None
+
+
+def test_refresh_rebuilds_index_after_rotation(tmp_path):
+    """
+    Tests that the index is rebuilt from the new file when the log is truncated.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    log_file = tmp_path / "sm-customer.log"
+    _append(log_file, "2024-01-06T12:30:45.123 | node-scn | controller-1 | | swact\n" * 3)
+    log_tailer = RemoteLogTailer(_get_local_ssh_connection(), str(log_file), TIMESTAMP_PATTERN, TIMESTAMP_FORMAT)
+    log_tailer.refresh()
+
+    log_file.write_text("2024-01-06T12:40:00.000 | service-group-scn | controller-services | go-active | active\n")
+    log_tailer.refresh()
+
+    assert len(log_tailer.lines) == 1
+    assert log_tailer.find_last("node-scn") is None
+
+
+def test_refresh_starts_from_bounded_tail(tmp_path):
+    """
+    Tests that a log is only fetched from the first whole line of its tail, and that continuation lines are attached to their line across refreshes.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    log_file = tmp_path / "sm.log"
+    _append(log_file, "2024-01-06T12:29:00.000 Unlock Action\n" + "".join(f"2024-01-06T12:30:{second:02d}.000 old line\n" for second in range(50)) + "2024-01-06T12:31:00.000 Traceback\n")
+    log_tailer = RemoteLogTailer(_get_local_ssh_connection(), str(log_file), TIMESTAMP_PATTERN, TIMESTAMP_FORMAT)
+    log_tailer.MAX_FETCH_BYTES = 80
+
+    assert log_tailer.refresh() == 2
+    assert [line[24:] for line in log_tailer.lines] == ["old line", "Traceback"]
+    assert log_tailer.find_last("Traceback")[1] == "2024-01-06T12:31:00.000 Traceback"
+    assert log_tailer.find_last("KeyError") is None
+    assert log_tailer.skipped_ranges == [(0, log_file.stat().st_size - len("2024-01-06T12:30:49.000 old line\n2024-01-06T12:31:00.000 Traceback\n"))]
+
+    # A match before the fetched tail is found by searching the skipped bytes on the host
+    assert log_tailer.find_last("Unlock Action") == (datetime(2024, 1, 6, 12, 29), "2024-01-06T12:29:00.000 Unlock Action")
+    assert log_tailer.find_last("Unlock Action") == (datetime(2024, 1, 6, 12, 29), "2024-01-06T12:29:00.000 Unlock Action")
+    assert log_tailer.ssh_connection.send.call_count == 2
+
+    _append(log_file, '  File "sm.py", line 1\nKeyError: go-active\n')
+    assert log_tailer.refresh() == 0
+    assert log_tailer.find_last("KeyError")[1] == '2024-01-06T12:31:00.000 Traceback\n  File "sm.py", line 1\nKeyError: go-active'
+
+
+def test_kpi_extractor_answers_timings_from_index(tmp_path):
+    """
+    Tests that the timings are extracted from the indexed lines with one fetch per extraction.
+    """
+    configuration_locations_manager = ConfigurationFileLocationsManager()
+    ConfigurationManager.load_configs(configuration_locations_manager)
+    log_file = tmp_path / "mtcAgent.log"
+    _append(log_file, "2024-01-06T12:30:45.000 controller-1 Unlock Action\n2024-01-06T12:32:15.500 controller-1 is ENABLED ; from unlock\n")
+    ssh_connection = _get_local_ssh_connection()
+    kpi_extractor = KpiExtractor(ssh_connection)
+    kpi_extractor.mtc_agent_log = str(log_file)
+
+    assert kpi_extractor.extract_unlock_timing("controller-1") == 90.5
+    assert kpi_extractor.extract_unlock_to_enabled_timing("controller-1") == 90.5
+    assert ssh_connection.send_stream.call_count == 4